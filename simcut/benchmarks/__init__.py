@@ -0,0 +1 @@
+"""이미지 파이프라인 핫패스 벤치마크 (python -m benchmarks)."""
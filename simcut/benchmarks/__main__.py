@@ -0,0 +1,107 @@
+"""벤치마크 실행기.
+
+    python -m benchmarks --megapixels 1,12,100 -n 5 -o results.json
+    python -m benchmarks --baseline baseline.json --threshold 0.2   # 회귀 시 종료 코드 1
+"""
+from __future__ import annotations
+import argparse
+import os
+import sys
+import tempfile
+from typing import List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks.harness import (  # noqa: E402
+    DEFAULT_THRESHOLD, MIN_REGRESSION_SEC, compare, load_results, measure, write_results,
+)
+from benchmarks.synthetic import MODES  # noqa: E402
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_ERROR = 2
+
+
+def _floats(text: str) -> List[float]:
+    return [float(v) if "." in v else int(v) for v in text.split(",") if v]
+
+
+def _strings(text: str) -> List[str]:
+    return [v.strip() for v in text.split(",") if v.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="simcut 핫패스 벤치마크")
+    parser.add_argument("--megapixels", type=_floats, default=[1, 12], help="원본 화소 수 목록 (MP, 예: 1,12,100)")
+    parser.add_argument("--modes", type=_strings, default=list(MODES), help="이미지 모드 (RGB,RGBA,P)")
+    parser.add_argument("--zooms", type=_floats, default=[0.25, 0.5, 1.0, 2.0, 4.0], help="_rebuild_display 줌 배율")
+    parser.add_argument("--mosaics", type=_floats, default=[0, 10, 100], help="render_to_image 모자이크 도형 수")
+    parser.add_argument("--formats", type=_strings, default=None, help="save 포맷 (기본: 지원 포맷 전체)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--warmup", type=int, default=1, help="측정 전 예열 실행 횟수")
+    parser.add_argument("-k", "--filter", default="", help="케이스 id에 이 문자열이 포함된 것만 실행")
+    parser.add_argument("-o", "--output", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"회귀 판정 비율 (기본: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--min-delta-ms", type=float, default=MIN_REGRESSION_SEC * 1000,
+                        help="이보다 작은 차이는 회귀로 보지 않음 (ms)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])  # noqa: F841 (케이스 실행 동안 유지)
+    from benchmarks.cases import Config, iter_cases
+    from src.utils.constants import SUPPORTED_FORMATS
+
+    config = Config(
+        megapixels=args.megapixels,
+        modes=args.modes,
+        zooms=args.zooms,
+        mosaics=[int(n) for n in args.mosaics],
+        formats=args.formats or SUPPORTED_FORMATS,
+    )
+    results = []
+    errors = 0
+    with tempfile.TemporaryDirectory(prefix="simcut-bench-") as workdir:
+        for case in iter_cases(config, workdir):
+            if args.filter not in case.id:
+                continue
+            try:
+                result = measure(case, repeat=args.repeat, warmup=args.warmup)
+            except Exception as e:
+                # 실패한 케이스도 결과에 남기고 나머지는 계속 측정
+                errors += 1
+                results.append({"id": case.id, "name": case.name, "params": case.params,
+                                "error": f"{type(e).__name__}: {e}"})
+                print(f"{case.id:<60} ERROR {type(e).__name__}: {e}", flush=True)
+                continue
+            results.append(result)
+            print(
+                f"{result['id']:<60} p50 {result['p50'] * 1000:9.2f} ms  "
+                f"p95 {result['p95'] * 1000:9.2f} ms  "
+                f"peak +{result['peak_delta_bytes'] / 1e6:7.1f} MB",
+                flush=True,
+            )
+    if args.output:
+        write_results(args.output, results)
+    if errors:
+        return EXIT_ERROR
+    if not args.baseline:
+        return EXIT_OK
+    regressions = compare(
+        results, load_results(args.baseline), args.threshold, min_delta=args.min_delta_ms / 1000,
+    )
+    for r in regressions:
+        print(
+            f"REGRESSION {r.id}: {r.metric} {r.baseline * 1000:.2f} ms → {r.current * 1000:.2f} ms "
+            f"(x{r.ratio:.2f})",
+            file=sys.stderr,
+        )
+    return EXIT_REGRESSION if regressions else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
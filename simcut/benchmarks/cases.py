@@ -0,0 +1,87 @@
+"""벤치마크 대상 핫패스. QApplication이 만들어진 뒤에 임포트해야 합니다."""
+from __future__ import annotations
+import os
+from dataclasses import dataclass
+from typing import Iterator, Sequence, Tuple
+from PIL import Image
+from benchmarks.harness import Case
+from benchmarks.synthetic import make_image, make_shapes
+from src.core.image_handler import ImageHandler
+from src.core.shape_manager import ShapeManager
+from src.ui.canvas import Canvas, _pil_to_pixmap
+from src.ui.main_window import MainWindow
+from src.utils.constants import SUPPORTED_FORMATS
+
+# 창 크기 기준 캔버스 표시 영역 (MainWindow가 _build_slot에 넘기는 값과 비슷한 크기)
+VIEWPORT = (1200, 800)
+
+_EXTENSIONS = {"PNG": ".png", "JPEG": ".jpg", "WEBP": ".webp", "BMP": ".bmp"}
+
+
+@dataclass(frozen=True)
+class Config:
+    megapixels: Sequence[float] = (1, 12)
+    modes: Sequence[str] = ("RGB", "RGBA", "P")
+    zooms: Sequence[float] = (0.25, 0.5, 1.0, 2.0, 4.0)
+    mosaics: Sequence[int] = (0, 10, 100)
+    formats: Sequence[str] = tuple(SUPPORTED_FORMATS)
+
+
+def _display_size(image: Image.Image, scale: float) -> Tuple[int, int]:
+    return max(1, int(image.width * scale)), max(1, int(image.height * scale))
+
+
+def iter_cases(config: Config, workdir: str) -> Iterator[Case]:
+    """(화소 수, 모드) 조합마다 합성 원본을 하나만 만들어 두고 케이스를 차례로 냅니다.
+
+    다음 조합으로 넘어가면 이전 원본은 해제되므로 100 MP에서도 메모리에 하나만 남습니다.
+    """
+    handler = ImageHandler()
+    window = MainWindow()
+    canvas = Canvas(ShapeManager())
+    for mp in config.megapixels:
+        for mode in config.modes:
+            image = make_image(mp, mode)
+            image.load()
+            base = {"mp": mp, "mode": mode}
+            source = os.path.join(workdir, f"source-{mp}-{mode}.png")
+            image.save(source)
+
+            yield Case("image_handler.load", lambda: handler.load(source), dict(base))
+            yield Case("main_window._build_slot", lambda: window._build_slot(source, VIEWPORT), dict(base))
+            yield Case("main_window._make_thumbnail", lambda: window._make_thumbnail(image), dict(base))
+
+            scale = canvas._calc_scale(image.size, VIEWPORT)
+            display = image.resize(_display_size(image, scale), Image.LANCZOS) if scale != 1.0 else image
+            pixmap = _pil_to_pixmap(display)
+            for zoom in config.zooms:
+                def set_zoom(zoom=zoom) -> None:
+                    canvas.set_slot(image, scale, pixmap, ShapeManager())
+                    canvas._zoom = zoom
+                yield Case(
+                    "canvas._rebuild_display", canvas._rebuild_display,
+                    {**base, "zoom": zoom}, setup=set_zoom,
+                )
+
+            for count in config.mosaics:
+                sm = ShapeManager()
+                sm.extend(make_shapes(count, (pixmap.width(), pixmap.height()), mosaic_ratio=1.0))
+
+                def set_shapes(sm=sm) -> None:
+                    canvas.set_slot(image, scale, pixmap, sm)
+                yield Case(
+                    "canvas.render_to_image", canvas.render_to_image,
+                    {**base, "mosaics": count}, setup=set_shapes,
+                )
+
+            for fmt in config.formats:
+                target = os.path.join(workdir, f"out{_EXTENSIONS[fmt]}")
+                yield Case(
+                    "image_handler.save", lambda fmt=fmt, target=target: handler.save(image, target, fmt),
+                    {**base, "format": fmt},
+                )
+            for name in os.listdir(workdir):
+                os.remove(os.path.join(workdir, name))
+            del image, display, pixmap
+    canvas.deleteLater()
+    window.deleteLater()
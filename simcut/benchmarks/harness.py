@@ -0,0 +1,185 @@
+"""측정 · 결과 비교 도구 (Qt 비의존)."""
+from __future__ import annotations
+import gc
+import json
+import os
+import platform
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+from src.utils.memory import process_rss
+
+RESULTS_VERSION = 1
+DEFAULT_THRESHOLD = 0.2   # 기준보다 20% 이상 느려지면 회귀
+MIN_REGRESSION_SEC = 0.002  # 이보다 작은 차이는 측정 잡음으로 간주
+_SAMPLE_INTERVAL = 0.005
+
+
+def percentile(values: List[float], q: float) -> float:
+    """선형 보간 백분위수 (q: 0~100)."""
+    if not values:
+        raise ValueError("percentile of empty sequence")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class PeakMemory:
+    """with 블록 동안 RSS를 주기적으로 샘플링해 최대값을 기록합니다.
+
+    Pillow · Qt의 네이티브 할당은 tracemalloc에 잡히지 않으므로 프로세스 RSS를 봅니다.
+    """
+
+    def __init__(self, interval: float = _SAMPLE_INTERVAL) -> None:
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.start_bytes = 0
+        self.peak_bytes = 0
+
+    @property
+    def delta_bytes(self) -> int:
+        return max(0, self.peak_bytes - self.start_bytes)
+
+    def _sample(self) -> None:
+        self.peak_bytes = max(self.peak_bytes, process_rss())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._sample()
+
+    def __enter__(self) -> "PeakMemory":
+        self.start_bytes = self.peak_bytes = process_rss()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="bench-rss", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._sample()
+        self._stop.set()
+        self._thread.join()
+
+
+@dataclass
+class Case:
+    """벤치마크 하나. setup은 매 반복 전에 실행되며 측정에서 제외됩니다."""
+    name: str
+    run: Callable[[], Any]
+    params: Dict[str, Any] = field(default_factory=dict)
+    setup: Optional[Callable[[], None]] = None
+
+    @property
+    def id(self) -> str:
+        if not self.params:
+            return self.name
+        return f"{self.name}[{','.join(f'{k}={v}' for k, v in self.params.items())}]"
+
+
+def measure(case: Case, repeat: int = 5, warmup: int = 1) -> Dict[str, Any]:
+    """case를 반복 실행해 시간 백분위수(초)와 최대 메모리를 반환합니다."""
+    for _ in range(warmup):
+        if case.setup:
+            case.setup()
+        case.run()
+    samples = []
+    gc.collect()
+    with PeakMemory() as memory:
+        for _ in range(max(1, repeat)):
+            if case.setup:
+                case.setup()
+            start = time.perf_counter()
+            case.run()
+            samples.append(time.perf_counter() - start)
+    return {
+        "id": case.id,
+        "name": case.name,
+        "params": case.params,
+        "repeat": len(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "mean": sum(samples) / len(samples),
+        "p50": percentile(samples, 50),
+        "p90": percentile(samples, 90),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "peak_rss_bytes": memory.peak_bytes,
+        "peak_delta_bytes": memory.delta_bytes,
+    }
+
+
+def environment() -> Dict[str, str]:
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": str(os.cpu_count() or 1),
+    }
+    try:
+        import PIL
+        info["pillow"] = PIL.__version__
+    except ImportError:
+        pass
+    try:
+        from PyQt6.QtCore import QT_VERSION_STR
+        info["qt"] = QT_VERSION_STR
+    except ImportError:
+        pass
+    return info
+
+
+def write_results(path: str, results: List[Dict[str, Any]]) -> None:
+    data = {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": environment(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def load_results(path: str) -> List[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version", 0) > RESULTS_VERSION:
+        raise ValueError(f"Unsupported results version {data.get('version')}")
+    return data.get("results", [])
+
+
+@dataclass(frozen=True)
+class Regression:
+    id: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+    metric: str = "p50",
+    min_delta: float = MIN_REGRESSION_SEC,
+) -> List[Regression]:
+    """기준 결과보다 metric이 threshold 비율 이상 (그리고 min_delta초 이상) 느려진 항목.
+
+    기준에 없거나 오류로 끝난 항목은 비교하지 않습니다.
+    """
+    reference = {r["id"]: r for r in baseline}
+    regressions = []
+    for result in results:
+        base = reference.get(result["id"])
+        if base is None or metric not in base or metric not in result:
+            continue  # 기준에 없거나 실패한 케이스
+        old, new = base[metric], result[metric]
+        if new > old * (1 + threshold) and new - old > min_delta:
+            regressions.append(Regression(result["id"], metric, old, new))
+    return regressions
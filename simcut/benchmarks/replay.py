@@ -0,0 +1,182 @@
+"""입력 트레이스 재생 벤치마크.
+
+    SIMCUT_RECORD_INPUT=trace.json python -m src.main    # 기록
+    python -m benchmarks.replay trace.json -n 3 -o replay.json
+    python -m benchmarks.replay trace.json --baseline replay.json   # p50 회귀 시 종료 코드 1
+
+이벤트마다 처리 시간(sendEvent ~ 반환)과 그 뒤 다시 그리기(paintEvent) 시간을 재고
+p50/p95/p99를 보고합니다. 기본은 최대 속도로 재생하며 --realtime이면 기록된 간격을 지킵니다.
+"""
+from __future__ import annotations
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+    DEFAULT_THRESHOLD, MIN_REGRESSION_SEC, compare, load_results, percentile, write_results,
+)
+from src.ui.input_trace import (  # noqa: E402
+    InputTrace, decode_arg, decode_event, load_trace, replayable_actions,
+)
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_ERROR = 2
+
+
+def replay(
+    window,
+    trace: InputTrace,
+    realtime: bool = False,
+    resolve: Callable[[str], str] = lambda path: path,
+) -> Dict[str, List[float]]:
+    """trace를 window에 재생하고 구간별 지연(초) 목록을 반환합니다.
+
+    키: "event"(모든 이벤트), "event.<종류>", "paint"(다시 그리기 한 번).
+    """
+    app = QApplication.instance()
+    window.resize(*trace.window_size)
+    window.show()
+    app.processEvents()
+    canvas = window.canvas
+    actions = replayable_actions(window)
+    samples: Dict[str, List[float]] = {"event": [], "paint": []}
+    start = time.perf_counter()
+    for entry in trace.events:
+        if realtime:
+            delay = start + entry.get("t", 0) / 1000 - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        kind = entry["type"]
+        t0 = time.perf_counter()
+        _dispatch(window, entry, actions, resolve)
+        elapsed = time.perf_counter() - t0
+        samples["event"].append(elapsed)
+        samples.setdefault(f"event.{kind}", []).append(elapsed)
+        # 이벤트가 예약한 다시 그리기를 바로 처리해 프레임 시간 측정
+        painted = canvas.paint_count
+        app.processEvents()
+        if canvas.paint_count != painted:
+            samples["paint"].append(canvas.last_paint_seconds)
+    return samples
+
+
+def _dispatch(window, entry: dict, actions: dict, resolve: Callable[[str], str]) -> None:
+    kind = entry["type"]
+    if kind == "open":
+        window.open_paths([resolve(p) for p in entry["paths"]])
+    elif kind == "signal":
+        signal = getattr(getattr(window, entry["source"]), entry["name"])
+        signal.emit(*[decode_arg(a) for a in entry.get("args", [])])
+    elif kind == "action":
+        action = actions.get(entry["name"])
+        if action is not None:
+            action.trigger()
+    else:
+        event = decode_event(entry)
+        if event is not None:
+            QApplication.sendEvent(window.canvas, event)
+
+
+def summarize(samples: Dict[str, List[float]], label: str) -> List[dict]:
+    """구간별 백분위수 (benchmarks 결과 JSON과 같은 형식이라 기준 비교를 그대로 씁니다)."""
+    results = []
+    for key, values in sorted(samples.items()):
+        if not values:
+            continue
+        results.append({
+            "id": f"replay.{key}[trace={label}]",
+            "name": f"replay.{key}",
+            "params": {"trace": label},
+            "repeat": len(values),
+            "min": min(values),
+            "max": max(values),
+            "mean": sum(values) / len(values),
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+        })
+    return results
+
+
+def _resolver(search_dir: Optional[str]) -> Callable[[str], str]:
+    def resolve(path: str) -> str:
+        if os.path.exists(path) or not search_dir:
+            return path
+        candidate = os.path.join(search_dir, os.path.basename(path))
+        return candidate if os.path.exists(candidate) else path
+    return resolve
+
+
+def missing_files(trace: InputTrace, resolve: Callable[[str], str]) -> List[str]:
+    return [
+        p for e in trace.events if e["type"] == "open"
+        for p in e["paths"] if not os.path.exists(resolve(p))
+    ]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.replay", description="입력 트레이스 재생 지연 측정")
+    parser.add_argument("trace", help="SIMCUT_RECORD_INPUT로 기록한 트레이스 JSON")
+    parser.add_argument("-n", "--repeat", type=int, default=1, help="재생 반복 횟수 (매번 새 창)")
+    parser.add_argument("--realtime", action="store_true", help="기록된 이벤트 간격을 지켜 재생")
+    parser.add_argument("--search-dir", help="트레이스의 이미지 경로가 없으면 이 폴더에서 같은 파일명을 찾음")
+    parser.add_argument("-o", "--output", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"회귀 판정 비율 (기본: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--min-delta-ms", type=float, default=MIN_REGRESSION_SEC * 1000,
+                        help="이보다 작은 차이는 회귀로 보지 않음 (ms)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    trace = load_trace(args.trace)
+    resolve = _resolver(args.search_dir)
+    missing = missing_files(trace, resolve)
+    if missing:
+        print("Missing trace images: " + ", ".join(missing), file=sys.stderr)
+        return EXIT_ERROR
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    from src.ui.main_window import MainWindow
+    samples: Dict[str, List[float]] = {}
+    for _ in range(max(1, args.repeat)):
+        window = MainWindow()
+        for key, values in replay(window, trace, args.realtime, resolve).items():
+            samples.setdefault(key, []).extend(values)
+        window.close()
+        window.deleteLater()
+
+    results = summarize(samples, os.path.splitext(os.path.basename(args.trace))[0])
+    for r in results:
+        print(
+            f"{r['name']:<28} n={r['repeat']:<6} p50 {r['p50'] * 1000:8.2f} ms  "
+            f"p95 {r['p95'] * 1000:8.2f} ms  p99 {r['p99'] * 1000:8.2f} ms",
+            flush=True,
+        )
+    if args.output:
+        write_results(args.output, results)
+    if not args.baseline:
+        return EXIT_OK
+    regressions = compare(
+        results, load_results(args.baseline), args.threshold, min_delta=args.min_delta_ms / 1000,
+    )
+    for r in regressions:
+        print(
+            f"REGRESSION {r.id}: {r.metric} {r.baseline * 1000:.2f} ms → {r.current * 1000:.2f} ms "
+            f"(x{r.ratio:.2f})",
+            file=sys.stderr,
+        )
+    return EXIT_REGRESSION if regressions else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
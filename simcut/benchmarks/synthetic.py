@@ -0,0 +1,69 @@
+"""벤치마크용 합성 이미지 · 도형 생성기 (시드 고정, 실행마다 같은 입력)."""
+from __future__ import annotations
+import math
+import random
+from typing import List, Tuple
+from PIL import Image, ImageChops
+from src.core.shape_manager import Shape, ShapeType
+
+MODES = ("RGB", "RGBA", "P")
+
+
+def size_for(megapixels: float, aspect: float = 4 / 3) -> Tuple[int, int]:
+    """지정 화소 수(MP)에 가까운 (가로, 세로) 크기."""
+    height = max(1, int(math.sqrt(megapixels * 1_000_000 / aspect)))
+    return max(1, int(height * aspect)), height
+
+
+def make_image(megapixels: float, mode: str = "RGB", seed: int = 0) -> Image.Image:
+    """그라데이션 + 노이즈 합성 이미지. 사진처럼 압축이 잘 되지 않는 내용입니다."""
+    if mode not in MODES:
+        raise ValueError(f"Unsupported mode '{mode}'. Supported: {MODES}")
+    width, height = size_for(megapixels)
+    gradient = Image.linear_gradient("L").resize((width, height))
+    # effect_noise는 시드를 받지 않으므로 시드별 작은 타일을 만들어 반복
+    rng = random.Random(seed)
+    tile = Image.frombytes("L", (256, 256), rng.randbytes(256 * 256))
+    noise = Image.new("L", (width, height))
+    for y in range(0, height, 256):
+        for x in range(0, width, 256):
+            noise.paste(tile, (x, y))
+    bands = [
+        gradient,
+        ImageChops.add(gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT), noise, scale=2.0),
+        ImageChops.multiply(gradient.transpose(Image.Transpose.ROTATE_180), noise),
+    ]
+    image = Image.merge("RGB", bands)
+    if mode == "RGBA":
+        image.putalpha(ImageChops.invert(gradient))
+    elif mode == "P":
+        # 팔레트는 축소본에서만 계산 (전체 해상도 median cut은 100 MP에서 수십 초)
+        palette = image.resize((256, 192)).quantize(256)
+        image = image.quantize(palette=palette, dither=Image.Dither.NONE)
+    return image
+
+
+def make_shapes(
+    count: int, bounds: Tuple[int, int], mosaic_ratio: float = 0.5, seed: int = 0,
+) -> List[Shape]:
+    """bounds(표시 좌표) 안에 무작위 도형 count개. mosaic_ratio 비율은 모자이크(블러) 도형입니다."""
+    rng = random.Random(seed)
+    bw, bh = bounds
+    shapes = []
+    for i in range(count):
+        w = rng.randint(max(2, bw // 40), max(3, bw // 6))
+        h = rng.randint(max(2, bh // 40), max(3, bh // 6))
+        blur = i < round(count * mosaic_ratio)
+        shapes.append(Shape(
+            shape_type=ShapeType.ELLIPSE if i % 3 == 2 else ShapeType.RECTANGLE,
+            x=rng.randint(0, max(0, bw - w)),
+            y=rng.randint(0, max(0, bh - h)),
+            width=w,
+            height=h,
+            pen_color=None if blur else "#FF0000",
+            pen_width=2,
+            fill_color=None,
+            blur_radius=10 if blur else 0,
+        ))
+    rng.shuffle(shapes)
+    return shapes
@@ -0,0 +1,191 @@
+"""헤드리스 일괄 처리 CLI (PyQt6를 임포트하지 않습니다).
+
+    python -m src.cli recipe.json photos/ extra/*.jpg -o out/ -j 4
+"""
+from __future__ import annotations
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+from src.core.batch_export import encode_target
+from src.core.image_handler import ImageHandler
+from src.core.recipe import Recipe, load_recipe
+from src.utils.constants import APP_NAME, OPEN_FILE_EXTENSIONS
+
+EXIT_OK = 0
+EXIT_FAILED = 1   # 일부 파일 처리 실패
+EXIT_USAGE = 2    # 레시피/입력 오류
+
+
+@dataclass(frozen=True)
+class FileResult:
+    """파일 하나의 처리 결과 (워커 프로세스 → 부모로 전달)."""
+    source: str
+    outputs: tuple = ()
+    error: Optional[str] = None
+    over_budget: tuple = ()
+
+
+def expand_inputs(patterns: Iterable[str], recursive: bool = False) -> List[str]:
+    """파일 · 디렉터리 · glob 패턴을 지원 이미지 경로 목록으로 펼칩니다 (중복 제거, 순서 유지)."""
+    found: List[str] = []
+    seen = set()
+
+    def add(path: str) -> None:
+        key = os.path.abspath(path)
+        if key not in seen and path.lower().endswith(OPEN_FILE_EXTENSIONS):
+            seen.add(key)
+            found.append(path)
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            if recursive:
+                for root, dirs, files in os.walk(pattern):
+                    dirs.sort()
+                    for name in sorted(files):
+                        add(os.path.join(root, name))
+            else:
+                for name in sorted(os.listdir(pattern)):
+                    path = os.path.join(pattern, name)
+                    if os.path.isfile(path):
+                        add(path)
+        elif os.path.isfile(pattern):
+            add(pattern)
+        else:
+            for path in sorted(glob.glob(pattern, recursive=recursive)):
+                if os.path.isfile(path):
+                    add(path)
+    return found
+
+
+def output_path(source: str, out_dir: str, extension: str) -> str:
+    return os.path.join(out_dir, f"{Path(source).stem}.{extension}")
+
+
+def process_file(source: str, recipe: Recipe, out_dir: str) -> FileResult:
+    """이미지 하나에 레시피를 적용하고 모든 출력 포맷으로 저장합니다 (워커에서 실행)."""
+    try:
+        handler = ImageHandler()
+        image = handler.load(source)
+        composite = recipe.apply(image)
+        outputs = []
+        over_budget = []
+        for target in recipe.targets:
+            result = encode_target(composite, target, handler=handler)
+            path = output_path(source, out_dir, target.extension)
+            Path(path).write_bytes(result.data)
+            outputs.append(path)
+            if not result.fits:
+                over_budget.append(path)
+        return FileResult(source, tuple(outputs), None, tuple(over_budget))
+    except Exception as e:
+        return FileResult(source, error=f"{type(e).__name__}: {e}")
+
+
+def run(
+    recipe: Recipe,
+    sources: Sequence[str],
+    out_dir: str,
+    jobs: int = 1,
+    stream=None,
+    as_json: bool = False,
+) -> int:
+    """모든 입력을 처리하며 진행 상황을 한 줄씩 출력합니다. 종료 코드를 반환합니다."""
+    stream = stream or sys.stdout
+    total = len(sources)
+    failed = 0
+
+    def report(done: int, result: FileResult) -> None:
+        if as_json:
+            line = json.dumps({
+                "done": done, "total": total, "source": result.source,
+                "outputs": list(result.outputs), "error": result.error,
+                "over_budget": list(result.over_budget),
+            }, ensure_ascii=False)
+        elif result.error:
+            line = f"[{done}/{total}] FAIL {result.source}: {result.error}"
+        else:
+            line = f"[{done}/{total}] OK {result.source} -> {', '.join(result.outputs)}"
+            if result.over_budget:
+                line += " (크기 제한 초과)"
+        print(line, file=stream, flush=True)
+
+    if jobs <= 1:
+        for done, source in enumerate(sources, start=1):
+            result = process_file(source, recipe, out_dir)
+            failed += result.error is not None
+            report(done, result)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(process_file, s, recipe, out_dir) for s in sources]
+            for done, future in enumerate(as_completed(futures), start=1):
+                result = future.result()
+                failed += result.error is not None
+                report(done, result)
+
+    if not as_json:
+        print(f"완료: {total - failed}/{total}개 성공", file=stream, flush=True)
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+def _find_collisions(sources: Sequence[str], recipe: Recipe, out_dir: str) -> List[str]:
+    """서로 다른 입력이 같은 출력 파일로 저장되는 경우를 찾습니다."""
+    owners = {}
+    collisions = []
+    for source in sources:
+        for target in recipe.targets:
+            path = output_path(source, out_dir, target.extension)
+            if path in owners:
+                collisions.append(f"{owners[path]}, {source} -> {path}")
+            else:
+                owners[path] = source
+    return collisions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description=f"{APP_NAME} 헤드리스 일괄 처리: JSON 레시피(도형 · 블러 · 크롭 · 출력 포맷)를 이미지들에 적용합니다.",
+    )
+    parser.add_argument("recipe", help="레시피 JSON 파일")
+    parser.add_argument("inputs", nargs="+", help="이미지 파일 · 디렉터리 · glob 패턴")
+    parser.add_argument("-o", "--output", required=True, help="출력 디렉터리")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="디렉터리와 ** 패턴을 하위 폴더까지 탐색")
+    parser.add_argument("--json", action="store_true", help="진행 상황을 JSON 줄로 출력")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        recipe = load_recipe(args.recipe)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"레시피 오류: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    sources = expand_inputs(args.inputs, recursive=args.recursive)
+    if not sources:
+        print("처리할 이미지가 없습니다.", file=sys.stderr)
+        return EXIT_USAGE
+    collisions = _find_collisions(sources, recipe, args.output)
+    if collisions:
+        print("출력 파일 이름이 겹칩니다:", file=sys.stderr)
+        for line in collisions:
+            print(f"  {line}", file=sys.stderr)
+        return EXIT_USAGE
+
+    os.makedirs(args.output, exist_ok=True)
+    jobs = max(1, min(args.jobs, len(sources)))
+    return run(recipe, sources, args.output, jobs=jobs, as_json=args.json)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
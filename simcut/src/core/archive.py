@@ -0,0 +1,204 @@
+"""ZIP 묶음 안의 이미지를 풀지 않고 직접 읽고, 내보내기 결과를 ZIP 하나로 씁니다.
+
+멤버는 "묶음.zip!/폴더/이름.png" 형태의 경로로 가리키며, 일반 파일 경로를 받는 곳
+(ImageHandler.load, read_meta, 프로젝트 해시 등)은 open_binary · open_image로 둘 다 다룹니다.
+열린 ZipFile은 (경로, 수정 시각, 크기) 기준으로 몇 개만 캐시합니다 (중앙 디렉터리를 매번 읽지 않음).
+"""
+from __future__ import annotations
+import os
+import threading
+import time
+import zipfile
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import IO, TYPE_CHECKING, Deque, Iterator, List, Optional, Tuple
+from src.utils.constants import ARCHIVE_EXTENSIONS, OPEN_FILE_EXTENSIONS
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+MEMBER_SEPARATOR = "!/"
+# 동시에 열어 둘 묶음 수
+OPEN_ARCHIVES = 8
+# ZipWriter가 쓰기를 기다리며 메모리에 둘 최대 바이트 (넘으면 add가 기다림)
+MAX_PENDING_BYTES = 64 * 1024 * 1024
+# 이미 압축된 포맷은 그대로 저장 (다시 압축해도 작아지지 않고 느리기만 함)
+_STORED_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+_lock = threading.Lock()
+_open: "OrderedDict[Tuple[str, int, int], zipfile.ZipFile]" = OrderedDict()
+
+
+def is_archive(path: str) -> bool:
+    return path.lower().endswith(ARCHIVE_EXTENSIONS) and MEMBER_SEPARATOR not in path
+
+
+def member_path(archive: str, member: str) -> str:
+    return f"{archive}{MEMBER_SEPARATOR}{member}"
+
+
+def split_member(path: str) -> Optional[Tuple[str, str]]:
+    """멤버 경로면 (묶음 경로, 멤버 이름), 일반 경로면 None."""
+    archive, sep, member = path.partition(MEMBER_SEPARATOR)
+    if not sep or not is_archive(archive):
+        return None
+    return archive, member
+
+
+def list_images(archive: str) -> List[str]:
+    """묶음 안 이미지 멤버 경로 (이름 순, 폴더 · macOS 메타데이터 제외). 묶음이 아니면 BadZipFile."""
+    zf = _zip(archive)
+    names = [
+        info.filename for info in zf.infolist()
+        if not info.is_dir()
+        and info.filename.lower().endswith(OPEN_FILE_EXTENSIONS)
+        and not info.filename.startswith("__MACOSX/")
+        and not os.path.basename(info.filename).startswith("._")
+    ]
+    return [member_path(archive, name) for name in sorted(names)]
+
+
+def exists(path: str) -> bool:
+    """일반 파일 또는 묶음 멤버가 있는지."""
+    parts = split_member(path)
+    if parts is None:
+        return os.path.isfile(path)
+    try:
+        _member(*parts)
+        return True
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+def stat(path: str) -> Tuple[int, float]:
+    """(크기, 수정 시각). 멤버는 압축을 푼 크기와 묶음에 기록된 시각입니다."""
+    parts = split_member(path)
+    if parts is None:
+        st = os.stat(path)
+        return st.st_size, st.st_mtime
+    _, info = _member(*parts)
+    return info.file_size, time.mktime(info.date_time + (0, 0, -1))
+
+
+def open_binary(path: str) -> IO[bytes]:
+    """읽기 전용 바이너리 스트림 (멤버는 필요한 만큼만 압축을 풂)."""
+    parts = split_member(path)
+    if parts is None:
+        return open(path, "rb")
+    zf, info = _member(*parts)
+    return zf.open(info)
+
+
+@contextmanager
+def open_image(path: str) -> Iterator[Image.Image]:
+    """Image.open처럼 헤더만 읽은 이미지 (픽셀은 load() 때). with 블록 안에서만 씁니다."""
+    from PIL import Image
+    with open_binary(path) as stream, Image.open(stream) as image:
+        yield image
+
+
+def close_all() -> None:
+    """캐시한 묶음 핸들을 모두 닫습니다."""
+    with _lock:
+        while _open:
+            _open.popitem(last=False)[1].close()
+
+
+def _member(archive: str, member: str) -> Tuple[zipfile.ZipFile, zipfile.ZipInfo]:
+    zf = _zip(archive)
+    try:
+        return zf, zf.getinfo(member)
+    except KeyError:
+        raise FileNotFoundError(f"Not in archive: {member_path(archive, member)}") from None
+
+
+def _zip(archive: str) -> zipfile.ZipFile:
+    path = os.path.abspath(archive)  # realpath는 멤버마다 부르기엔 느림
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _lock:
+        zf = _open.get(key)
+        if zf is not None:
+            _open.move_to_end(key)
+            return zf
+    zf = zipfile.ZipFile(path)  # 여러 스레드가 같은 핸들로 멤버를 읽어도 됨 (zipfile 내부 잠금)
+    with _lock:
+        existing = _open.get(key)
+        if existing is not None:
+            zf.close()
+            return existing
+        _open[key] = zf
+        while len(_open) > OPEN_ARCHIVES:
+            _open.popitem(last=False)[1].close()
+    return zf
+
+
+class ZipWriter:
+    """파일들을 ZIP 하나에 순서대로 기록하는 백그라운드 쓰기 스레드.
+
+    add는 인코딩된 바이트를 큐에 넣기만 하고 (MAX_PENDING_BYTES를 넘으면 기다림),
+    워커가 한 파일에 순차적으로 씁니다. 임시 파일을 만들지 않습니다.
+    """
+
+    def __init__(self, path: str, max_pending_bytes: int = MAX_PENDING_BYTES) -> None:
+        self.path = path
+        self._max_pending = max_pending_bytes
+        self._zip = zipfile.ZipFile(path, "w")
+        self._cond = threading.Condition()
+        self._queue: Deque[Tuple[str, bytes]] = deque()
+        self._pending = 0
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self.written = 0
+        self._thread = threading.Thread(target=self._run, name="simcut-zip-writer", daemon=True)
+        self._thread.start()
+
+    def add(self, name: str, data: bytes) -> None:
+        """name으로 data를 기록하도록 큐에 넣습니다. 워커가 실패했으면 그 오류를 다시 냅니다."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._error is not None or not self._queue or self._pending + len(data) <= self._max_pending
+            )
+            if self._error is not None:
+                raise self._error
+            if self._closed:
+                raise ValueError("ZipWriter is closed")
+            self._queue.append((name, data))
+            self._pending += len(data)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """남은 파일을 모두 쓰고 묶음을 닫습니다. 쓰기 오류가 있었으면 다시 냅니다."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._zip.close()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                name, data = self._queue[0]
+            try:
+                compress = (
+                    zipfile.ZIP_STORED if name.lower().endswith(_STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+                )
+                info = zipfile.ZipInfo(name, time.localtime()[:6])
+                info.compress_type = compress
+                self._zip.writestr(info, data)
+            except BaseException as e:
+                with self._cond:
+                    self._error = e
+                    self._queue.clear()
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._queue.popleft()
+                self._pending -= len(data)
+                self.written += 1
+                self._cond.notify_all()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+from PIL import Image
+from src.core.export_budget import EncodeResult, ExportBudget, encode_within_budget
+from src.core.image_handler import ImageHandler
+
+
+def extension_for(format: str) -> str:
+    """포맷 이름 → 파일 확장자 (JPEG는 jpg)."""
+    ext = format.lower()
+    return "jpg" if ext == "jpeg" else ext
+
+
+@dataclass(frozen=True)
+class ExportTarget:
+    """출력 포맷 하나와 그 포맷 전용 설정."""
+    format: str
+    budget: Optional[ExportBudget] = None
+    options: Dict[str, object] = field(default_factory=dict)  # 고정 인코더 옵션
+
+    @property
+    def extension(self) -> str:
+        return extension_for(self.format)
+
+
+def encode_target(
+    image: Image.Image,
+    target: ExportTarget,
+    search_executor: Optional[Executor] = None,
+    handler: Optional[ImageHandler] = None,
+) -> EncodeResult:
+    """합성 이미지를 대상 포맷으로 메모리에 인코딩합니다."""
+    handler = handler or ImageHandler()
+    fmt = handler.resolve_format("", target.format)
+    if target.budget is not None:
+        return encode_within_budget(
+            image, fmt, target.budget, executor=search_executor, handler=handler,
+        )
+    return EncodeResult(
+        data=handler.encode(image, fmt, **target.options),
+        format=fmt,
+        options=dict(target.options),
+    )
+
+
+def encode_targets(
+    image: Image.Image,
+    targets: Sequence[ExportTarget],
+    executor: Executor,
+    search_executor: Optional[Executor] = None,
+    handler: Optional[ImageHandler] = None,
+) -> List[EncodeResult]:
+    """같은 합성 이미지에서 여러 포맷을 동시에 인코딩합니다 (targets 순서대로 반환).
+
+    크기 제한 탐색은 search_executor를 사용합니다. executor와 같은 풀을 넘기면
+    바깥 작업이 안쪽 작업을 기다리며 교착될 수 있으므로 별도 풀을 사용하세요.
+    """
+    handler = handler or ImageHandler()
+    futures = [
+        executor.submit(encode_target, image, target, search_executor, handler)
+        for target in targets
+    ]
+    return [future.result() for future in futures]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from typing import Optional, Sequence
+from PIL import Image, ImageDraw
+from src.core.resize import ResizeSpec, downscale
+from src.core.shape_manager import Shape, ShapeType
+from src.utils import profiling
+
+
+def composite(
+    image: Image.Image,
+    shapes: Sequence[Shape],
+    scale: float,
+    resize: Optional[ResizeSpec] = None,
+) -> Image.Image:
+    """도형(base_scale 좌표)을 이미지에 합성한 새 PIL Image를 반환합니다.
+
+    resize가 지정되면 원본을 먼저 출력 크기로 줄인 뒤 출력 배율로 합성하므로,
+    모자이크/그리기 비용이 작은 이미지에서만 발생합니다.
+    """
+    with profiling.span("composite", size=image.size, shapes=len(shapes)):
+        return _composite(image, shapes, scale, resize)
+
+
+def _composite(
+    image: Image.Image,
+    shapes: Sequence[Shape],
+    scale: float,
+    resize: Optional[ResizeSpec],
+) -> Image.Image:
+    inv = (1.0 / scale) if scale > 0 else 1.0
+    inv_x = inv_y = inv
+    if resize is not None:
+        out_size = resize.target_size(image.size)
+        if out_size != image.size:
+            inv_x *= out_size[0] / image.width
+            inv_y *= out_size[1] / image.height
+            result = downscale(image, out_size)
+        else:
+            result = image.copy()
+    else:
+        result = image.copy()
+    inv_pen = min(inv_x, inv_y)
+    if shapes and result.mode not in ("RGB", "RGBA"):
+        # 팔레트/흑백 이미지에는 RGBA 블렌딩 그리기를 할 수 없으므로 컬러로 변환
+        result = result.convert("RGBA" if result.has_transparency_data else "RGB")
+
+    for shape in shapes:
+        x = int(shape.x * inv_x)
+        y = int(shape.y * inv_y)
+        w = int(shape.width * inv_x)
+        h = int(shape.height * inv_y)
+        width = max(1, int(shape.pen_width * inv_pen))
+        box = [x, y, x + w, y + h]
+        # 모자이크 처리
+        if shape.blur_radius > 0:
+            clamped = [max(0, box[0]), max(0, box[1]),
+                       min(result.width, box[2]), min(result.height, box[3])]
+            if clamped[2] > clamped[0] and clamped[3] > clamped[1]:
+                region = result.crop(clamped)
+                factor = max(2, int(shape.blur_radius * inv_pen) * 2 // 5)
+                rw, rh = region.size
+                small = region.resize(
+                    (max(1, rw // factor), max(1, rh // factor)), Image.NEAREST,
+                )
+                mosaic = small.resize((rw, rh), Image.NEAREST)
+                if shape.shape_type == ShapeType.ELLIPSE:
+                    mask = Image.new('L', region.size, 0)
+                    ImageDraw.Draw(mask).ellipse(
+                        [0, 0, rw - 1, rh - 1], fill=255,
+                    )
+                    result.paste(mosaic, (clamped[0], clamped[1]), mask)
+                else:
+                    result.paste(mosaic, (clamped[0], clamped[1]))
+        # 윤곽선 (블러 시 fill 무시)
+        draw = ImageDraw.Draw(result, "RGBA")
+        fill = None if shape.blur_radius > 0 else (shape.fill_color or None)
+        outline = shape.pen_color or None
+        if shape.shape_type == ShapeType.RECTANGLE:
+            draw.rectangle(box, fill=fill, outline=outline, width=width)
+        elif shape.shape_type == ShapeType.ELLIPSE:
+            draw.ellipse(box, fill=fill, outline=outline, width=width)
+
+    return result
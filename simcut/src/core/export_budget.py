@@ -0,0 +1,192 @@
+from __future__ import annotations
+import io
+import math
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from PIL import Image, ImageChops, ImageStat
+from src.core.image_handler import ImageHandler
+
+# 한 라운드에 동시에 인코딩할 후보 수
+SEARCH_FANOUT = max(2, min(8, os.cpu_count() or 2))
+
+_JPEG_QUALITIES = list(range(1, 96))     # Pillow 권장 상한 95
+_WEBP_QUALITIES = list(range(1, 101))
+_PNG_COLORS = list(range(2, 257))        # 양자화 팔레트 색상 수
+
+
+@dataclass(frozen=True)
+class ExportBudget:
+    """내보내기 제한. 최대 파일 크기(바이트) 또는 최소 화질(PSNR dB) 중 하나만 지정합니다."""
+    max_bytes: Optional[int] = None
+    min_psnr: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if (self.max_bytes is None) == (self.min_psnr is None):
+            raise ValueError("ExportBudget requires exactly one of max_bytes or min_psnr")
+        if self.max_bytes is not None and self.max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {self.max_bytes}")
+
+
+@dataclass(frozen=True)
+class EncodeResult:
+    """메모리에 인코딩된 최종 결과."""
+    data: bytes
+    format: str
+    options: Dict[str, object] = field(default_factory=dict)
+    fits: bool = True          # 제한을 만족했는지 (불가능하면 가장 근접한 결과)
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    data: bytes
+    options: Dict[str, object]
+    psnr: float
+
+
+def psnr(reference: Image.Image, data: bytes) -> float:
+    """인코딩 결과를 디코딩해 원본 대비 PSNR(dB)을 계산합니다 (무손실이면 inf)."""
+    decoded = Image.open(io.BytesIO(data))
+    mode = "RGBA" if "A" in reference.getbands() else "RGB"
+    ref = reference.convert(mode)
+    dec = decoded.convert(mode)
+    diff = ImageChops.difference(ref, dec)
+    sum2 = ImageStat.Stat(diff).sum2
+    mse = sum(sum2) / (ref.width * ref.height * len(sum2))
+    if mse == 0:
+        return math.inf
+    return 10 * math.log10(255 ** 2 / mse)
+
+
+def encode_within_budget(
+    image: Image.Image,
+    format: str,
+    budget: ExportBudget,
+    executor: Optional[Executor] = None,
+    handler: Optional[ImageHandler] = None,
+) -> EncodeResult:
+    """제한을 만족하는 최적의 인코딩을 찾습니다.
+
+    JPEG/WebP는 quality, PNG는 무손실 최대 압축 후 필요하면 팔레트 색상 수를
+    k-분 탐색합니다. 각 라운드의 후보는 스레드 풀에서 동시에 메모리 버퍼로
+    인코딩되며, 디스크 쓰기는 호출자가 결과(data)로 한 번만 수행합니다.
+    """
+    handler = handler or ImageHandler()
+    fmt = handler.resolve_format("", format)
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=SEARCH_FANOUT) as pool:
+            return _encode(image, fmt, budget, pool, handler)
+    return _encode(image, fmt, budget, executor, handler)
+
+
+def _encode(
+    image: Image.Image,
+    fmt: str,
+    budget: ExportBudget,
+    executor: Executor,
+    handler: ImageHandler,
+) -> EncodeResult:
+    need_psnr = budget.min_psnr is not None
+
+    # 메모리 버퍼 인코딩 (PSNR 제한일 때만 디코딩 비교)
+    def make(source: Image.Image, options: Dict[str, object]) -> _Candidate:
+        data = handler.encode(source, fmt, **options)
+        return _Candidate(data, options, psnr(image, data) if need_psnr else math.inf)
+
+    def accept(candidate: _Candidate) -> bool:
+        if budget.max_bytes is not None:
+            return len(candidate.data) <= budget.max_bytes
+        return candidate.psnr >= budget.min_psnr
+
+    if fmt in ("JPEG", "WEBP"):
+        extra: Dict[str, object] = {"optimize": True} if fmt == "JPEG" else {"method": 4}
+        qualities = _JPEG_QUALITIES if fmt == "JPEG" else _WEBP_QUALITIES
+        # 크기 제한: 만족하는 가장 높은 quality / 화질 제한: 만족하는 가장 낮은 quality
+        values = qualities if not need_psnr else list(reversed(qualities))
+        best, fallback = _search(
+            values, lambda q: make(image, {"quality": q, **extra}), accept, executor,
+        )
+        return _result(fmt, best, fallback)
+
+    if fmt == "PNG":
+        lossless = make(image, {"optimize": True, "compress_level": 9})
+        if not need_psnr and accept(lossless):
+            return _result(fmt, lossless, lossless)
+        source = image
+        if image.mode not in ("RGB", "RGBA"):  # L · LA · P 등 (도형이 없으면 합성 결과가 원본 모드 그대로)
+            has_alpha = "A" in image.getbands() or "transparency" in image.info
+            source = image.convert("RGBA" if has_alpha else "RGB")
+        # RGBA는 FASTOCTREE만 지원
+        method = Image.Quantize.FASTOCTREE if source.mode == "RGBA" else Image.Quantize.MEDIANCUT
+        values = _PNG_COLORS if not need_psnr else list(reversed(_PNG_COLORS))
+
+        def quantized(colors: int) -> _Candidate:
+            candidate = make(
+                source.quantize(colors=colors, method=method),
+                {"optimize": True, "compress_level": 9},
+            )
+            return _Candidate(candidate.data, {**candidate.options, "colors": colors}, candidate.psnr)
+
+        best, fallback = _search(values, quantized, accept, executor)
+        if need_psnr and best is None:
+            # 256색으로도 화질 제한을 못 맞추면 무손실 결과 사용
+            return _result(fmt, lossless, lossless)
+        return _result(fmt, best, fallback)
+
+    # BMP 등 조절 가능한 옵션이 없는 포맷
+    only = make(image, {})
+    return _result(fmt, only if accept(only) else None, only)
+
+
+def _result(fmt: str, best: Optional[_Candidate], fallback: _Candidate) -> EncodeResult:
+    chosen = best if best is not None else fallback
+    return EncodeResult(
+        data=chosen.data, format=fmt, options=dict(chosen.options), fits=best is not None,
+    )
+
+
+def _search(
+    values: Sequence[int],
+    probe: Callable[[int], _Candidate],
+    accept: Callable[[_Candidate], bool],
+    executor: Executor,
+) -> Tuple[Optional[_Candidate], _Candidate]:
+    """values에서 accept가 참인 마지막 위치를 병렬 k-분 탐색으로 찾습니다.
+
+    accept는 values 순서를 따라 참 → 거짓으로 한 번만 바뀐다고 가정합니다.
+    (최적 후보, 만족 후보가 없을 때 쓸 values[0] 후보)를 반환합니다.
+    """
+    cache: Dict[int, _Candidate] = {}
+    lo, hi = 0, len(values) - 1
+    best: Optional[int] = None
+    while lo <= hi:
+        points = _spread(lo, hi, SEARCH_FANOUT)
+        todo = [i for i in points if i not in cache]
+        for i, candidate in zip(todo, executor.map(lambda i: probe(values[i]), todo)):
+            cache[i] = candidate
+        accepted = [i for i in points if accept(cache[i])]
+        if accepted:
+            best = max(accepted)
+            above = [i for i in points if i > best]
+            lo, hi = best + 1, (min(above) - 1 if above else hi)
+        else:
+            hi = min(points) - 1
+    if best is not None:
+        return cache[best], cache[best]
+    if 0 not in cache:
+        cache[0] = probe(values[0])
+    return None, cache[0]
+
+
+def _spread(lo: int, hi: int, count: int) -> List[int]:
+    """[lo, hi] 구간에 고르게 분포한 최대 count개의 인덱스."""
+    span = hi - lo + 1
+    if span <= count:
+        return list(range(lo, hi + 1))
+    step = span / count
+    return sorted({lo + int(step * (k + 0.5)) for k in range(count)})
@@ -0,0 +1,123 @@
+"""폴더 가져오기: 하위 폴더까지 이미지를 찾아 백그라운드에서 묶음으로 알립니다.
+
+전체 탐색이 끝나기를 기다리지 않고, 찾은 파일을 BATCH_INTERVAL마다 (또는 BATCH_SIZE개마다)
+on_batch로 넘깁니다. 각 파일은 헤더만 읽어 크기 · 포맷을 함께 전달합니다 (픽셀은 디코딩하지 않음).
+"""
+from __future__ import annotations
+import os
+import threading
+import time
+from typing import Callable, Iterator, List, Optional, Tuple
+from src.core.image_meta import ImageMeta, read_meta
+from src.utils.constants import OPEN_FILE_EXTENSIONS
+
+BATCH_SIZE = 256
+# 묶음을 보내는 최대 간격 (초). 첫 파일은 찾는 즉시 보냅니다.
+BATCH_INTERVAL = 0.05
+
+# (경로, 메타데이터) 목록
+FolderBatchCallback = Callable[[List[Tuple[str, ImageMeta]]], None]
+# (찾은 파일 수, 읽지 못해 건너뛴 파일 수, 취소 여부)
+FolderDoneCallback = Callable[[int, int, bool], None]
+
+
+def iter_images(root: str, extensions: Tuple[str, ...] = OPEN_FILE_EXTENSIONS) -> Iterator[str]:
+    """root 아래 이미지 경로를 폴더별 이름 순으로 (파일 먼저, 그다음 하위 폴더).
+
+    숨김 폴더와 심볼릭 링크 폴더(순환 방지)는 건너뛰고, 읽을 수 없는 폴더는 무시합니다.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith("."):
+                        subdirs.append(entry.path)
+                elif entry.name.lower().endswith(extensions) and entry.is_file():
+                    yield entry.path
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+class FolderScan:
+    """폴더 하나를 단일 워커 스레드에서 탐색합니다. 콜백은 워커 스레드에서 호출됩니다."""
+
+    def __init__(
+        self,
+        root: str,
+        on_batch: FolderBatchCallback,
+        on_done: Optional[FolderDoneCallback] = None,
+        batch_size: int = BATCH_SIZE,
+        interval: float = BATCH_INTERVAL,
+    ) -> None:
+        self.root = root
+        self._on_batch = on_batch
+        self._on_done = on_done
+        self._batch_size = batch_size
+        self._interval = interval
+        self._cancelled = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.found = 0
+        self.skipped = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="simcut-folder-scan", daemon=True)
+            self._thread.start()
+
+    def cancel(self) -> None:
+        """탐색을 멈춥니다. 이미 보낸 묶음은 그대로 둡니다."""
+        self._cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """탐색이 끝날 때까지 기다립니다 (시작하지 않았으면 바로 True)."""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    # ── 워커 ────────────────────────────────────────────────────
+    def _run(self) -> None:
+        batch: List[Tuple[str, ImageMeta]] = []
+        last_sent = float("-inf")
+        try:
+            for path in iter_images(self.root):
+                if self._cancelled.is_set():
+                    break
+                try:
+                    batch.append((path, read_meta(path)))
+                except Exception:
+                    self.skipped += 1  # 확장자만 맞는 깨진 파일 · 사라진 파일
+                    continue
+                now = time.monotonic()
+                if len(batch) >= self._batch_size or now - last_sent >= self._interval:
+                    self._send(batch)
+                    batch = []
+                    last_sent = now
+            if batch and not self._cancelled.is_set():
+                self._send(batch)
+        finally:
+            if self._on_done is not None:
+                try:
+                    self._on_done(self.found, self.skipped, self._cancelled.is_set())
+                except Exception:
+                    pass
+
+    def _send(self, batch: List[Tuple[str, ImageMeta]]) -> None:
+        self.found += len(batch)
+        try:
+            self._on_batch(batch)
+        except Exception:
+            pass  # 알림 실패가 탐색을 멈추지 않도록 무시
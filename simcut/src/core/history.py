@@ -0,0 +1,139 @@
+from __future__ import annotations
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from src.core.shape_manager import Shape, ShapeManager, ShapeState, shapes_bytes
+
+# 이 개수의 연산마다 전체 상태 체크포인트를 둡니다 (이동 시 재생은 최대 K-1개).
+HISTORY_CHECKPOINT_EVERY = 32
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    """ShapeManager 연산 하나 (리스너 인자 그대로)."""
+    op: str
+    args: tuple = ()
+
+
+class EditHistory:
+    """슬롯 하나의 도형 편집 타임라인.
+
+    위치 n은 처음 n개의 연산을 적용한 상태입니다. K개 연산마다 전체 상태를 보관하므로
+    임의 위치로 이동할 때 가장 가까운 체크포인트에서 K-1개 이하만 재생합니다.
+    과거 위치로 이동한 뒤 새 연산을 기록하면 그 뒤의 기록은 버립니다.
+    """
+
+    def __init__(self, initial: ShapeState = ShapeState(),
+                 checkpoint_every: int = HISTORY_CHECKPOINT_EVERY) -> None:
+        self._every = max(1, checkpoint_every)
+        self._entries: List[HistoryEntry] = []
+        self._checkpoints: Dict[int, ShapeState] = {0: initial}
+        self._position = 0
+        self._coalesce = False
+        # 마지막 mark_clean() 이후 바뀐 가장 앞 항목 인덱스 (패널 부분 갱신용)
+        self.dirty_from: Optional[int] = 0
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    @property
+    def entries(self) -> Tuple[HistoryEntry, ...]:
+        return tuple(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entry(self, index: int) -> HistoryEntry:
+        return self._entries[index]
+
+    def mark_clean(self) -> None:
+        self.dirty_from = None
+
+    def _mark_dirty(self, index: int) -> None:
+        self.dirty_from = index if self.dirty_from is None else min(self.dirty_from, index)
+
+    def record(self, op: str, args: tuple, state: ShapeState) -> None:
+        """연산 하나를 현재 위치 뒤에 기록합니다. state는 연산 적용 후 전체 상태입니다."""
+        if self._position < len(self._entries):
+            self._entries = self._entries[:self._position]
+            self._checkpoints = {k: v for k, v in self._checkpoints.items() if k <= self._position}
+            self._coalesce = False
+            self._mark_dirty(self._position)
+        entry = HistoryEntry(op, args)
+        last = self._entries[-1] if self._entries else None
+        if (self._coalesce and last is not None and op == "replace" and last.op == "replace"
+                and last.args[0] == args[0]):
+            # 드래그처럼 같은 도형을 연속 교체하면 한 항목으로 합침 (결과 상태는 동일)
+            self._entries[-1] = entry
+            if self._position in self._checkpoints:
+                self._checkpoints[self._position] = state
+            self._mark_dirty(self._position - 1)
+            return
+        self._entries.append(entry)
+        self._position += 1
+        self._coalesce = True
+        if self._position % self._every == 0:
+            self._checkpoints[self._position] = state
+        self._mark_dirty(self._position - 1)
+
+    def approx_bytes(self, seen: Optional[Set[int]] = None) -> int:
+        """항목 · 체크포인트가 차지하는 대략적인 메모리 (seen의 공유 도형은 제외)."""
+        seen = set() if seen is None else seen
+        total = sys.getsizeof(self._entries) + sys.getsizeof(self._checkpoints)
+        for entry in self._entries:
+            total += sys.getsizeof(entry) + sys.getsizeof(entry.args)
+            for arg in entry.args:
+                if isinstance(arg, Shape):
+                    total += shapes_bytes((arg,), seen)
+                elif isinstance(arg, ShapeState):
+                    total += shapes_bytes(arg.shapes, seen) + shapes_bytes(arg.undo_stack, seen)
+                elif isinstance(arg, list):
+                    total += sys.getsizeof(arg) + shapes_bytes(arg, seen)
+        for state in self._checkpoints.values():
+            total += sys.getsizeof(state.shapes) + sys.getsizeof(state.undo_stack)
+            total += shapes_bytes(state.shapes, seen) + shapes_bytes(state.undo_stack, seen)
+        return total
+
+    def state_at(self, position: int) -> ShapeState:
+        """위치 position의 상태를 가장 가까운 이전 체크포인트에서 재생해 계산합니다."""
+        if not (0 <= position <= len(self._entries)):
+            raise IndexError(f"History position {position} out of range")
+        base = position - position % self._every
+        while base not in self._checkpoints:
+            base -= self._every
+        state = self._checkpoints[base]
+        if base == position:
+            return state
+        sm = ShapeManager()
+        sm.restore(state)
+        for entry in self._entries[base:position]:
+            _apply(sm, entry)
+        return sm.state()
+
+    def seek(self, position: int) -> ShapeState:
+        """현재 위치를 옮기고 그 상태를 반환합니다 (기록은 그대로 유지)."""
+        state = self.state_at(position)
+        self._position = position
+        self._coalesce = False
+        return state
+
+
+def _apply(sm: ShapeManager, entry: HistoryEntry) -> None:
+    op, args = entry.op, entry.args
+    if op == "add":
+        sm.add(args[0])
+    elif op == "extend":
+        sm.extend(args[0])
+    elif op == "replace":
+        sm.replace(args[0], args[1])
+    elif op == "remove":
+        sm.remove(args[0])
+    elif op == "undo":
+        sm.undo()
+    elif op == "redo":
+        sm.redo()
+    elif op == "clear":
+        sm.clear()
+    elif op == "restore":
+        sm.restore(args[0])
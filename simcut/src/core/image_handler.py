@@ -1,27 +1,64 @@
 from __future__ import annotations
-from PIL import Image
+import io
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+from src.core import archive
+from src.utils import profiling
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 _VALID_FORMATS = {"PNG", "JPEG", "WEBP", "BMP"}
 
 
 class ImageHandler:
     def load(self, path: str) -> Image.Image:
+        """파일 또는 ZIP 멤버 경로("묶음.zip!/이름.png")에서 이미지를 읽습니다."""
         file_path = Path(path)
-        if not file_path.exists():
+        if not archive.exists(path):
             raise FileNotFoundError(f"Image not found: {path}")
-        return Image.open(file_path).copy()
+        # PIL은 앱 시작을 늦추지 않도록 첫 디코딩 때 읽음 (archive.open_image 안에서)
+        with profiling.span("decode", path=file_path.name) as args:
+            with archive.open_image(path) as source:
+                image = source.copy()
+            args["size"] = image.size
+            args["mode"] = image.mode
+        return image
 
-    def save(self, image: Image.Image, path: str, format: Optional[str] = None) -> None:
-        file_path = Path(path)
-        fmt = format or file_path.suffix.lstrip(".").upper()
+    def resolve_format(self, path: str, format: Optional[str] = None) -> str:
+        """저장 포맷을 정규화합니다 (미지정 시 확장자 기준, 미지원 포맷은 ValueError)."""
+        fmt = (format or Path(path).suffix.lstrip(".")).upper()
         if fmt == "JPG":
             fmt = "JPEG"
         if fmt not in _VALID_FORMATS:
             raise ValueError(f"Unsupported format '{fmt}'. Supported: {sorted(_VALID_FORMATS)}")
-        rgb_image = image.convert("RGB") if fmt == "JPEG" else image
-        rgb_image.save(str(file_path), format=fmt)
+        return fmt
+
+    def save(self, image: Image.Image, path: str, format: Optional[str] = None, **options) -> None:
+        """이미지를 저장합니다. options는 Pillow 인코더 옵션 (quality, optimize, method 등)."""
+        file_path = Path(path)
+        fmt = self.resolve_format(path, format)
+        with profiling.span("encode", format=fmt, size=image.size):
+            self._prepare(image, fmt).save(str(file_path), format=fmt, **options)
+
+    def encode(self, image: Image.Image, format: str, **options) -> bytes:
+        """이미지를 메모리 버퍼에 인코딩해 바이트로 반환합니다.
+
+        Image.save는 인코더 옵션을 이미지 객체(encoderinfo)에 기록하므로,
+        여러 스레드에서 같은 이미지를 동시에 인코딩할 수 있도록 별도 객체로 인코딩합니다.
+        """
+        fmt = self.resolve_format("", format)
+        with profiling.span("encode", format=fmt, size=image.size) as args:
+            target = self._prepare(image, fmt)
+            if target is image:
+                target = image.copy()
+            buffer = io.BytesIO()
+            target.save(buffer, format=fmt, **options)
+            args["bytes"] = buffer.tell()
+        return buffer.getvalue()
+
+    def _prepare(self, image: Image.Image, fmt: str) -> Image.Image:
+        return image.convert("RGB") if fmt == "JPEG" else image
 
     def get_info(self, image: Image.Image) -> dict:
         return {
@@ -0,0 +1,129 @@
+"""이미지 메타데이터 (헤더 + os.stat만, 픽셀은 디코딩하지 않음).
+
+MetadataScanner는 경로를 백그라운드 스레드에서 읽어 on_batch로 묶어 알립니다.
+파일 탐색기의 정렬 · 필터 키로 씁니다.
+"""
+from __future__ import annotations
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterable, List, Optional, Tuple
+from src.core import archive
+
+# 정렬 기준 (added는 연 순서 = 슬롯 순서)
+SORT_FIELDS = ("added", "name", "dimensions", "file_size", "format", "modified")
+# 메타데이터가 있어야 정할 수 있는 기준
+META_SORT_FIELDS = frozenset({"dimensions", "file_size", "format", "modified"})
+
+BATCH_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ImageMeta:
+    width: int
+    height: int
+    format: str      # Pillow 포맷 이름 (PNG, JPEG …)
+    file_size: int   # 바이트
+    modified: float  # st_mtime
+
+
+def read_meta(path: str) -> ImageMeta:
+    """헤더만 읽어 크기 · 포맷을 구합니다 (Image.open은 load() 전까지 픽셀을 읽지 않음). ZIP 멤버도 됩니다."""
+    size, modified = archive.stat(path)
+    with archive.open_image(path) as image:
+        width, height = image.size
+        fmt = image.format or ""
+    return ImageMeta(width, height, fmt, size, modified)
+
+
+def sort_key(field: str, name: str, meta: Optional[ImageMeta]) -> tuple:
+    """정렬 키. 메타데이터가 아직 없거나 읽지 못한 파일은 뒤로 보냅니다."""
+    folded = name.casefold()
+    if field == "name":
+        return (folded,)
+    if meta is None:
+        return (1, folded)
+    if field == "dimensions":
+        return (0, meta.width * meta.height, meta.width, folded)
+    if field == "file_size":
+        return (0, meta.file_size, folded)
+    if field == "format":
+        return (0, meta.format, folded)
+    if field == "modified":
+        return (0, meta.modified, folded)
+    raise ValueError(f"Unknown sort field '{field}'. Supported: {SORT_FIELDS}")
+
+
+# (경로, 메타데이터) 목록 — 읽지 못한 파일은 None
+BatchCallback = Callable[[List[Tuple[str, Optional[ImageMeta]]]], None]
+
+
+class MetadataScanner:
+    """경로 메타데이터를 단일 워커 스레드에서 읽습니다.
+
+    결과는 batch_size개씩 또는 큐가 빌 때 on_batch로 전달됩니다 (워커 스레드에서 호출).
+    """
+
+    def __init__(self, on_batch: BatchCallback, batch_size: int = BATCH_SIZE) -> None:
+        self._on_batch = on_batch
+        self._batch_size = batch_size
+        self._cond = threading.Condition()
+        self._queue: Deque[str] = deque()
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, paths: Iterable[str]) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._queue.extend(paths)
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 경로를 모두 읽고 알릴 때까지 기다립니다."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def close(self) -> None:
+        """남은 경로는 버리고 워커를 종료합니다."""
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    # ── 워커 ────────────────────────────────────────────────────
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="simcut-metadata", daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if self._closed:
+                    return
+                count = min(len(self._queue), self._batch_size)
+                paths = [self._queue.popleft() for _ in range(count)]
+                self._busy = True
+            batch = []
+            for path in paths:
+                try:
+                    batch.append((path, read_meta(path)))
+                except Exception:
+                    batch.append((path, None))  # 지원하지 않는 파일 · 사라진 파일
+            try:
+                self._on_batch(batch)
+            except Exception:
+                pass  # 알림 실패가 워커를 멈추지 않도록 무시
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
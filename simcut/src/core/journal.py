@@ -0,0 +1,346 @@
+from __future__ import annotations
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+from src.core.recipe import shape_from_dict, shape_to_dict
+from src.core.save_queue import atomic_write
+from src.core.shape_manager import Shape, ShapeManager, ShapeState
+
+JOURNAL_FILE = "journal.log"
+CHECKPOINT_FILE = "checkpoint.json"
+# 이 개수만큼 기록이 쌓이면 체크포인트로 압축할 때가 됨
+CHECKPOINT_EVERY = 1000
+
+_STOP = object()
+
+
+@dataclass
+class SlotState:
+    """저널로 복원되는 슬롯 하나 (도형은 scale 기준 좌표, crop_box는 원본 파일 기준 px)."""
+    path: str
+    scale: float
+    crop_box: Optional[Tuple[int, int, int, int]] = None
+    shape_manager: ShapeManager = field(default_factory=ShapeManager)
+
+    def to_dict(self) -> dict:
+        return _slot_dict(self.path, self.scale, self.crop_box, self.shape_manager.shapes)
+
+
+def _slot_dict(path: str, scale: float, crop_box, shapes: Sequence[Shape]) -> dict:
+    return {
+        "path": path,
+        "scale": scale,
+        "crop_box": list(crop_box) if crop_box else None,
+        "shapes": [shape_to_dict(s) for s in shapes],
+    }
+
+
+def _slot_from_dict(data: dict) -> SlotState:
+    sm = ShapeManager()
+    sm.extend([shape_from_dict(s) for s in data.get("shapes", [])])
+    crop = data.get("crop_box")
+    return SlotState(
+        path=data["path"],
+        scale=float(data["scale"]),
+        crop_box=tuple(crop) if crop else None,
+        shape_manager=sm,
+    )
+
+
+class EditJournal:
+    """세션별 추가 전용 편집 저널.
+
+    기록 호출은 큐에 넣기만 하고(마이크로초), 직렬화와 파일 쓰기는 백그라운드 스레드가
+    모아서 처리합니다. checkpoint()는 전체 상태를 checkpoint.json으로 원자적으로 쓰고
+    저널을 비웁니다. 기록은 슬롯 인덱스 기준이며 순서대로 재생하면 같은 상태가 됩니다.
+    """
+
+    def __init__(self, directory: str, checkpoint_every: int = CHECKPOINT_EVERY) -> None:
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._checkpoint_every = checkpoint_every
+        self._since_checkpoint = 0
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._generation = 0  # 체크포인트 세대 (저널 첫 줄에 기록)
+        self._log = open(self._dir / JOURNAL_FILE, "a", encoding="utf-8")
+        self._worker = threading.Thread(target=self._run, name="simcut-journal", daemon=True)
+        self._worker.start()
+
+    @property
+    def directory(self) -> str:
+        return str(self._dir)
+
+    @property
+    def needs_checkpoint(self) -> bool:
+        return self._since_checkpoint >= self._checkpoint_every
+
+    # ── 기록 (GUI 스레드) ───────────────────────────────────────
+    def record_slot(self, index: int, path: str, scale: float, crop_box, shapes: Sequence[Shape]) -> None:
+        """슬롯 전체 상태 (index == 슬롯 수이면 추가, 아니면 교체)."""
+        self._put(("slot", index, path, scale, crop_box, list(shapes)))
+
+    def record_shapes(self, index: int, op: str, args: tuple) -> None:
+        """ShapeManager 변경 하나 (ShapeManager 리스너 인자 그대로)."""
+        self._put(("shape", index, op, args))
+
+    def record_delete(self, index: int) -> None:
+        self._put(("delete", index))
+
+    def record_reset(self) -> None:
+        self._put(("reset",))
+
+    def checkpoint(self, slots: Sequence[SlotState]) -> None:
+        """현재 전체 상태를 체크포인트로 쓰고 저널을 비웁니다 (앞선 기록이 모두 쓰인 뒤 적용).
+
+        여기서는 도형 목록만 복사하고 직렬화는 쓰기 스레드에서 합니다 (슬롯이 많아도 GUI를 막지 않음).
+        """
+        self._since_checkpoint = 0
+        snapshot = [(s.path, s.scale, s.crop_box, s.shape_manager.shapes) for s in slots]
+        self._put(("checkpoint", snapshot), count=False)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return self._idle.wait(timeout)
+
+    def close(self, discard: bool = False) -> None:
+        """남은 기록을 쓰고 종료합니다. discard=True(정상 종료)면 세션 폴더를 지웁니다."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._worker.join()
+        self._log.close()
+        if discard:
+            shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _put(self, item: tuple, count: bool = True) -> None:
+        if self._closed:
+            return
+        if count:
+            self._since_checkpoint += 1
+        with self._lock:
+            self._pending += 1
+            self._idle.clear()
+        self._queue.put(item)
+
+    # ── 쓰기 (백그라운드 스레드) ────────────────────────────────
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # 쌓인 기록을 한 번에 모아 쓰기 (write/flush 호출 최소화)
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            lines = []
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                    continue
+                if item[0] == "checkpoint":
+                    self._write_lines(lines)
+                    lines = []
+                    self._write_checkpoint([_slot_dict(*slot) for slot in item[1]])
+                else:
+                    lines.append(_encode(item))
+            self._write_lines(lines)
+            with self._lock:
+                self._pending -= len(batch) - (1 if stop else 0)
+                if self._pending == 0:
+                    self._idle.set()
+            if stop:
+                return
+
+    def _write_lines(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        try:
+            self._log.write("".join(lines))
+            self._log.flush()
+        except (OSError, ValueError):
+            pass  # 저널 실패가 편집을 막지 않도록 무시
+
+    def _write_checkpoint(self, slots: List[dict]) -> None:
+        generation = self._generation + 1
+        data = json.dumps(
+            {"generation": generation, "time": time.time(), "slots": slots}, ensure_ascii=False,
+        )
+        try:
+            def write(tmp_path: str) -> None:
+                Path(tmp_path).write_text(data, encoding="utf-8")
+
+            atomic_write(str(self._dir / CHECKPOINT_FILE), write)
+            # 체크포인트에 반영된 기록은 버리고 새 저널 시작. 교체 직전에 종료되면
+            # 이전 세대 저널이 남으므로 재생 시 세대를 비교해 중복 적용을 막습니다.
+            self._generation = generation
+            self._log.close()
+            self._log = open(self._dir / JOURNAL_FILE, "w", encoding="utf-8")
+            self._log.write(json.dumps({"op": "begin", "generation": generation}) + "\n")
+            self._log.flush()
+        except OSError:
+            pass
+
+
+def _encode(item: tuple) -> str:
+    kind = item[0]
+    if kind == "slot":
+        _, index, path, scale, crop_box, shapes = item
+        record = {"op": "slot", "i": index, **_slot_dict(path, scale, crop_box, shapes)}
+    elif kind == "shape":
+        _, index, op, args = item
+        record = {"op": op, "i": index}
+        if op == "add":
+            record["shape"] = shape_to_dict(args[0])
+        elif op == "extend":
+            record["shapes"] = [shape_to_dict(s) for s in args[0]]
+        elif op == "replace":
+            record["index"] = args[0]
+            record["shape"] = shape_to_dict(args[1])
+        elif op == "remove":
+            record["index"] = args[0]
+        elif op == "restore":
+            record["shapes"] = [shape_to_dict(s) for s in args[0].shapes]
+            record["undo"] = [shape_to_dict(s) for s in args[0].undo_stack]
+    elif kind == "delete":
+        record = {"op": "delete", "i": item[1]}
+    else:
+        record = {"op": "reset"}
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def replay(directory: str) -> List[SlotState]:
+    """체크포인트 + 저널을 재생해 슬롯 상태 목록을 복원합니다.
+
+    충돌로 잘린 마지막 줄이나 인덱스가 맞지 않는 기록은 건너뜁니다.
+    """
+    root = Path(directory)
+    slots: List[SlotState] = []
+    generation = 0
+    checkpoint = root / CHECKPOINT_FILE
+    if checkpoint.exists():
+        try:
+            data = json.loads(checkpoint.read_text(encoding="utf-8"))
+            slots = [_slot_from_dict(s) for s in data.get("slots", [])]
+            generation = data.get("generation", 0)
+        except (ValueError, KeyError, TypeError):
+            slots = []
+    log = root / JOURNAL_FILE
+    if not log.exists():
+        return slots
+    with open(log, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f):
+            try:
+                record = json.loads(line)
+                if number == 0 and record.get("generation", 0) != generation:
+                    return slots  # 체크포인트보다 오래된 저널 (이미 반영됨)
+                if record["op"] == "begin":
+                    continue
+                _apply(slots, record)
+            except (ValueError, KeyError, TypeError, IndexError):
+                continue
+    return slots
+
+
+def _apply(slots: List[SlotState], record: dict) -> None:
+    op = record["op"]
+    if op == "reset":
+        slots.clear()
+        return
+    i = record["i"]
+    if op == "slot":
+        state = _slot_from_dict(record)
+        if i == len(slots):
+            slots.append(state)
+        else:
+            slots[i] = state
+        return
+    if op == "delete":
+        del slots[i]
+        return
+    sm = slots[i].shape_manager
+    if op == "add":
+        sm.add(shape_from_dict(record["shape"]))
+    elif op == "extend":
+        sm.extend([shape_from_dict(s) for s in record["shapes"]])
+    elif op == "replace":
+        sm.replace(record["index"], shape_from_dict(record["shape"]))
+    elif op == "remove":
+        sm.remove(record["index"])
+    elif op == "undo":
+        sm.undo()
+    elif op == "redo":
+        sm.redo()
+    elif op == "clear":
+        sm.clear()
+    elif op == "restore":
+        sm.restore(ShapeState(
+            tuple(shape_from_dict(s) for s in record["shapes"]),
+            tuple(shape_from_dict(s) for s in record.get("undo", [])),
+        ))
+
+
+# ── 세션 폴더 ──────────────────────────────────────────────────
+def new_session_dir(root: str) -> str:
+    return os.path.join(root, f"{int(time.time() * 1000)}-{os.getpid()}")
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        return _pid_alive_windows(pid)  # os.kill(pid, 0)은 Windows에서 프로세스를 종료함
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def _pid_alive_windows(pid: int) -> bool:
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.GetExitCodeProcess.argtypes = (wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD))
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+    if not handle:
+        # 권한이 없으면 살아 있는 다른 사용자 · 상승된 프로세스, 그 밖(잘못된 PID)은 없는 프로세스
+        return ctypes.get_last_error() == 5  # ERROR_ACCESS_DENIED
+    try:
+        code = wintypes.DWORD()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(code)):
+            return True  # 확인할 수 없으면 지우지 않는 쪽으로
+        return code.value == 259  # STILL_ACTIVE
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def orphaned_sessions(root: str) -> List[str]:
+    """비정상 종료로 남은 세션 폴더 (소유 프로세스가 없는 것, 최근 순)."""
+    if not os.path.isdir(root):
+        return []
+    found = []
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        stamp, _, pid = name.partition("-")
+        if not (os.path.isdir(path) and stamp.isdigit() and pid.isdigit()):
+            continue
+        if not _pid_alive(int(pid)):
+            found.append((int(stamp), path))
+    return [path for _, path in sorted(found, reverse=True)]
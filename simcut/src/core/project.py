@@ -0,0 +1,181 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from PIL import Image
+from src.core import archive
+from src.core.recipe import shape_from_dict, shape_to_dict
+from src.core.save_queue import atomic_write
+from src.core.shape_manager import Shape
+
+PROJECT_EXTENSION = ".simcut"
+PROJECT_FILTER = "simcut Project (*.simcut)"
+PROJECT_VERSION = 1
+
+_MANIFEST = "project.json"
+
+
+class ProjectError(ValueError):
+    """프로젝트 파일 형식 오류."""
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with archive.open_binary(path) as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass(frozen=True)
+class SlotRecord:
+    """프로젝트에 저장되는 파일 슬롯 하나 (픽셀 제외).
+
+    shapes는 표시 배율(scale) 좌표, crop_box는 원본 파일 기준 px입니다.
+    """
+    path: str
+    sha256: str
+    scale: float
+    zoom: float = 1.0
+    crop_box: Optional[Tuple[int, int, int, int]] = None
+    shapes: Tuple[Shape, ...] = ()
+    thumbnail: bytes = field(default=b"", repr=False)  # PNG
+    proxy: bytes = field(default=b"", repr=False)      # 표시용 프록시 (JPEG/PNG)
+
+    def to_dict(self, index: int) -> dict:
+        return {
+            "path": self.path,
+            "sha256": self.sha256,
+            "scale": self.scale,
+            "zoom": self.zoom,
+            "crop_box": list(self.crop_box) if self.crop_box else None,
+            "shapes": [shape_to_dict(s) for s in self.shapes],
+            "thumbnail": f"thumbs/{index}.png" if self.thumbnail else None,
+            "proxy": f"proxies/{index}" if self.proxy else None,
+        }
+
+
+@dataclass(frozen=True)
+class Project:
+    slots: Tuple[SlotRecord, ...]
+    current: int = -1
+
+
+def save_project(path: str, project: Project) -> None:
+    """프로젝트를 ZIP 컨테이너(.simcut)로 원자적으로 저장합니다.
+
+    매니페스트(JSON)만 압축하고 이미 압축된 썸네일/프록시는 그대로 저장합니다.
+    """
+    manifest = {
+        "version": PROJECT_VERSION,
+        "current": project.current,
+        "slots": [record.to_dict(i) for i, record in enumerate(project.slots)],
+    }
+
+    def write(tmp_path: str) -> None:
+        with zipfile.ZipFile(tmp_path, "w") as zf:
+            zf.writestr(
+                _MANIFEST, json.dumps(manifest, ensure_ascii=False),
+                compress_type=zipfile.ZIP_DEFLATED,
+            )
+            for i, record in enumerate(project.slots):
+                if record.thumbnail:
+                    zf.writestr(f"thumbs/{i}.png", record.thumbnail)
+                if record.proxy:
+                    zf.writestr(f"proxies/{i}", record.proxy)
+
+    atomic_write(path, write)
+
+
+class ProjectReader:
+    """열린 프로젝트 파일. 매니페스트만 즉시 읽고 썸네일 · 프록시 · 원본 픽셀은 요청 시 읽습니다."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            self._zip = zipfile.ZipFile(path, "r")
+            manifest = json.loads(self._zip.read(_MANIFEST))
+        except (zipfile.BadZipFile, KeyError, ValueError) as e:
+            raise ProjectError(f"Invalid project file {path}: {e}") from None
+        version = manifest.get("version", 0)
+        if version > PROJECT_VERSION:
+            raise ProjectError(f"Unsupported project version {version}")
+        self.current: int = manifest.get("current", -1)
+        self._entries: List[dict] = manifest.get("slots", [])
+        base = os.path.dirname(os.path.abspath(path))
+        records = []
+        for entry in self._entries:
+            src = entry["path"]
+            crop = entry.get("crop_box")
+            records.append(SlotRecord(
+                path=src if os.path.isabs(src) else os.path.join(base, src),
+                sha256=entry.get("sha256", ""),
+                scale=float(entry["scale"]),
+                zoom=float(entry.get("zoom", 1.0)),
+                crop_box=tuple(crop) if crop else None,
+                shapes=tuple(shape_from_dict(s) for s in entry.get("shapes", [])),
+            ))
+        self.records: Tuple[SlotRecord, ...] = tuple(records)
+        self._matches: Dict[int, bool] = {}  # 원본 해시 확인 결과 (파일마다 한 번만 해시)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def close(self) -> None:
+        with self._lock:
+            self._zip.close()
+
+    def _member(self, index: int, key: str) -> bytes:
+        name = self._entries[index].get(key)
+        if not name:
+            return b""
+        with self._lock:  # ZipFile은 스레드 간 동시 읽기를 보장하지 않음
+            return self._zip.read(name)
+
+    def thumbnail(self, index: int) -> bytes:
+        return self._member(index, "thumbnail")
+
+    def proxy(self, index: int) -> bytes:
+        return self._member(index, "proxy")
+
+    def missing_sources(self) -> List[int]:
+        """원본 파일이 없는 슬롯 인덱스 (stat만 수행)."""
+        return [i for i, r in enumerate(self.records) if not archive.exists(r.path)]
+
+    def source_matches(self, index: int) -> bool:
+        """원본 내용이 프로젝트 저장 시점과 같은지. 처음 한 번만 해시합니다 (워커 스레드에서 불러도 됨)."""
+        matches = self._matches.get(index)
+        if matches is None:
+            record = self.records[index]
+            matches = not record.sha256 or file_sha256(record.path) == record.sha256
+            self._matches[index] = matches
+        return matches
+
+    def changed_sources(self, indices: Iterable[int]) -> List[int]:
+        """저장 이후 내용이 바뀐 원본의 슬롯 인덱스 (읽을 수 없는 파일은 제외)."""
+        changed = []
+        for i in indices:
+            try:
+                if not self.source_matches(i):
+                    changed.append(i)
+            except OSError:
+                continue
+        return changed
+
+    def load_pixels(self, index: int) -> Image.Image:
+        """원본을 읽고 저장된 자르기를 적용합니다.
+
+        원본이 저장 이후 바뀌었으면 자르기를 건너뜁니다 (다른 픽셀을 같은 영역으로 자르지 않도록).
+        """
+        record = self.records[index]
+        with archive.open_image(record.path) as source:
+            image = source.copy()
+        if record.crop_box is not None and self.source_matches(index):
+            image = image.crop(record.crop_box)
+        return image
+
@@ -0,0 +1,193 @@
+from __future__ import annotations
+import json
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from PIL import Image
+from src.core import compositor
+from src.core.batch_export import ExportTarget
+from src.core.export_budget import ExportBudget
+from src.core.resize import ResizeSpec
+from src.core.shape_manager import Shape, ShapeType
+
+RECIPE_VERSION = 1
+DEFAULT_BLUR_RADIUS = 10
+
+CropBox = Tuple[int, int, int, int]  # (left, top, right, bottom) 원본 px
+
+
+def clip_box(box: CropBox, size: Tuple[int, int]) -> Optional[CropBox]:
+    """자르기 영역을 size 크기 이미지 안으로 줄입니다. 겹치는 영역이 없으면 None."""
+    left, top, right, bottom = box
+    clipped = (max(0, left), max(0, top), min(size[0], right), min(size[1], bottom))
+    if clipped[2] - clipped[0] < 1 or clipped[3] - clipped[1] < 1:
+        return None
+    return clipped
+
+
+@dataclass(frozen=True)
+class Recipe:
+    """파일에 일괄 적용할 편집 레시피.
+
+    crop은 원본 픽셀 좌표이며 먼저 적용됩니다. shapes는 크롭 이후 이미지의
+    원본 픽셀 좌표(scale 1.0)입니다.
+    """
+    shapes: Tuple[Shape, ...] = ()
+    crop: Optional[CropBox] = None
+    resize: Optional[ResizeSpec] = None
+    targets: Tuple[ExportTarget, ...] = field(default_factory=lambda: (ExportTarget("PNG"),))
+
+    def apply(self, image: Image.Image) -> Image.Image:
+        """크롭 → (크기 조절) → 도형 합성 순서로 레시피를 적용한 새 이미지를 반환합니다."""
+        source = image
+        if self.crop is not None:
+            box = clip_box(self.crop, image.size)
+            if box is None:
+                raise ValueError(f"Crop {self.crop} is outside image {image.size}")
+            source = image.crop(box)
+        return compositor.composite(source, self.shapes, 1.0, self.resize)
+
+    def shapes_at(self, scale: float) -> List[Shape]:
+        """레시피 도형을 표시 배율(base_scale) 좌표로 변환합니다."""
+        return scale_shapes(self.shapes, scale)
+
+    @classmethod
+    def capture(
+        cls,
+        shapes: Sequence[Shape],
+        scale: float,
+        crop: Optional[CropBox] = None,
+    ) -> "Recipe":
+        """슬롯의 도형(base_scale 좌표)과 크롭 상태를 원본 픽셀 기준 레시피로 만듭니다."""
+        inv = (1.0 / scale) if scale > 0 else 1.0
+        return cls(shapes=tuple(scale_shapes(shapes, inv)), crop=crop)
+
+    # ── 직렬화 ──────────────────────────────────────────────────
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "version": RECIPE_VERSION,
+            "shapes": [shape_to_dict(s) for s in self.shapes],
+            "outputs": [_target_to_dict(t) for t in self.targets],
+        }
+        if self.crop is not None:
+            data["crop"] = list(self.crop)
+        if self.resize is not None:
+            data["resize"] = {
+                k: v for k, v in vars(self.resize).items() if v is not None
+            }
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Recipe":
+        """JSON 사전에서 레시피를 만듭니다 (형식 오류는 ValueError)."""
+        if not isinstance(data, dict):
+            raise ValueError("Recipe must be a JSON object")
+        version = data.get("version", RECIPE_VERSION)
+        if version > RECIPE_VERSION:
+            raise ValueError(f"Unsupported recipe version {version}")
+        shapes = [shape_from_dict(s) for s in data.get("shapes", [])]
+        shapes += [_blur_from_entry(b) for b in data.get("blur", [])]
+        crop = data.get("crop")
+        if crop is not None:
+            if len(crop) != 4:
+                raise ValueError(f"crop must be [left, top, right, bottom], got {crop}")
+            crop = tuple(int(v) for v in crop)
+        resize = data.get("resize")
+        if resize is not None:
+            resize = ResizeSpec(**resize)
+        outputs = data.get("outputs")
+        if outputs is None:
+            outputs = [data["output"]] if "output" in data else [{"format": "PNG"}]
+        targets = tuple(_target_from_dict(o) for o in outputs)
+        if not targets:
+            raise ValueError("Recipe needs at least one output")
+        return cls(shapes=tuple(shapes), crop=crop, resize=resize, targets=targets)
+
+
+def scale_shapes(shapes: Sequence[Shape], factor: float) -> List[Shape]:
+    """도형 좌표 · 선 두께 · 블러 반경을 한 번에 factor배 합니다."""
+    if factor == 1.0:
+        return list(shapes)
+    return [
+        replace(
+            s,
+            x=round(s.x * factor), y=round(s.y * factor),
+            width=max(1, round(s.width * factor)),
+            height=max(1, round(s.height * factor)),
+            pen_width=max(1, round(s.pen_width * factor)),
+            blur_radius=max(1, round(s.blur_radius * factor)) if s.blur_radius > 0 else 0,
+        )
+        for s in shapes
+    ]
+
+
+def shape_to_dict(shape: Shape) -> Dict[str, Any]:
+    return {
+        "type": shape.shape_type.value,
+        "x": shape.x, "y": shape.y,
+        "width": shape.width, "height": shape.height,
+        "pen_color": shape.pen_color,
+        "pen_width": shape.pen_width,
+        "fill_color": shape.fill_color,
+        "blur_radius": shape.blur_radius,
+    }
+
+
+def shape_from_dict(data: Dict[str, Any]) -> Shape:
+    try:
+        return Shape(
+            shape_type=ShapeType(data.get("type", ShapeType.RECTANGLE.value)),
+            x=int(data["x"]), y=int(data["y"]),
+            width=int(data["width"]), height=int(data["height"]),
+            pen_color=data.get("pen_color"),
+            pen_width=int(data.get("pen_width", 1)),
+            fill_color=data.get("fill_color"),
+            blur_radius=int(data.get("blur_radius", 0)),
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid shape entry {data}: {e}") from None
+
+
+def _blur_from_entry(entry: Any) -> Shape:
+    """blur 항목: [x, y, w, h] 또는 {x, y, width, height, radius?, type?} → 윤곽선 없는 블러 도형."""
+    if isinstance(entry, (list, tuple)):
+        if len(entry) != 4:
+            raise ValueError(f"blur region must be [x, y, width, height], got {entry}")
+        entry = dict(zip(("x", "y", "width", "height"), entry))
+    return shape_from_dict({
+        "type": entry.get("type", ShapeType.RECTANGLE.value),
+        "x": entry.get("x"), "y": entry.get("y"),
+        "width": entry.get("width"), "height": entry.get("height"),
+        "pen_color": None,
+        "pen_width": 1,
+        "fill_color": None,
+        "blur_radius": entry.get("radius", DEFAULT_BLUR_RADIUS),
+    })
+
+
+def _target_to_dict(target: ExportTarget) -> Dict[str, Any]:
+    data: Dict[str, Any] = {"format": target.format, **target.options}
+    if target.budget is not None and target.budget.max_bytes is not None:
+        data["max_bytes"] = target.budget.max_bytes
+    if target.budget is not None and target.budget.min_psnr is not None:
+        data["min_psnr"] = target.budget.min_psnr
+    return data
+
+
+def _target_from_dict(data: Dict[str, Any]) -> ExportTarget:
+    if "format" not in data:
+        raise ValueError(f"Output entry needs a format: {data}")
+    options = {k: v for k, v in data.items() if k not in ("format", "max_bytes", "min_psnr")}
+    budget = None
+    if "max_bytes" in data or "min_psnr" in data:
+        budget = ExportBudget(max_bytes=data.get("max_bytes"), min_psnr=data.get("min_psnr"))
+    return ExportTarget(format=str(data["format"]).upper(), budget=budget, options=options)
+
+
+def load_recipe(path: str) -> Recipe:
+    with open(path, "r", encoding="utf-8") as f:
+        return Recipe.from_dict(json.load(f))
+
+
+def save_recipe(recipe: Recipe, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(recipe.to_dict(), f, ensure_ascii=False, indent=2)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+import os
+import shutil
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Optional
+from src.core.image_handler import ImageHandler
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# (경로, 오류) — 오류가 None이면 성공
+CompleteCallback = Callable[[str, Optional[BaseException]], None]
+
+
+@dataclass
+class _SaveJob:
+    path: str
+    write: Callable[[str], None]      # 임시 파일 경로에 내용을 기록
+    after: Optional[Future] = None    # 교체 전에 완료돼야 하는 선행 작업
+    on_done: Optional[Callable[[], None]] = None
+
+
+def atomic_write(path: str, write: Callable[[str], None]) -> None:
+    """같은 폴더의 임시 파일에 기록 → fsync → os.replace 로 원자적으로 교체합니다."""
+    target = Path(path)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{target.name}.", suffix=".tmp", dir=str(target.parent),
+    )
+    os.close(fd)
+    try:
+        write(tmp_path)
+        if target.exists():
+            shutil.copymode(str(target), tmp_path)
+        with open(tmp_path, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, str(target))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_dir(target.parent)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """디렉터리 엔트리(rename)까지 디스크에 반영합니다 (지원하지 않는 OS는 무시)."""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class SaveQueue:
+    """백그라운드 쓰기 큐. 같은 경로의 대기 중인 저장은 최신 요청 하나로 합쳐집니다."""
+
+    def __init__(self, on_complete: Optional[CompleteCallback] = None) -> None:
+        self._on_complete = on_complete
+        self._handler = ImageHandler()
+        self._cond = threading.Condition()
+        self._order: Deque[str] = deque()
+        self._pending: Dict[str, _SaveJob] = {}
+        self._in_flight: Optional[str] = None
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ── 작업 등록 ────────────────────────────────────────────────
+    def save_image(
+        self,
+        image: Image.Image,
+        path: str,
+        format: Optional[str] = None,
+        after: Optional[Future] = None,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """이미지를 path에 인코딩해 저장하도록 예약합니다 (포맷 오류는 즉시 ValueError)."""
+        fmt = self._handler.resolve_format(path, format)
+        self.submit(
+            path,
+            lambda tmp: self._handler.save(image, tmp, format=fmt),
+            after=after,
+            on_done=on_done,
+        )
+
+    def copy_file(
+        self,
+        source: str,
+        path: str,
+        after: Optional[Future] = None,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """source 파일의 바이트로 path를 교체하도록 예약합니다."""
+        self.submit(
+            path,
+            lambda tmp: shutil.copyfile(source, tmp),
+            after=after,
+            on_done=on_done,
+        )
+
+    def submit(
+        self,
+        path: str,
+        write: Callable[[str], None],
+        after: Optional[Future] = None,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        job = _SaveJob(path=path, write=write, after=after, on_done=on_done)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("SaveQueue is closed")
+            superseded = self._pending.get(path)
+            if superseded is None:
+                self._order.append(path)
+            self._pending[path] = job
+            self._ensure_thread()
+            self._cond.notify_all()
+        if superseded is not None and superseded.on_done is not None:
+            superseded.on_done()
+
+    # ── 상태 조회 / 대기 ─────────────────────────────────────────
+    def is_pending(self, path: str) -> bool:
+        """path에 대해 아직 끝나지 않은(대기 또는 쓰는 중) 저장이 있는지 반환합니다."""
+        with self._cond:
+            return path in self._pending or self._in_flight == path
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 모든 저장이 끝날 때까지 기다립니다."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and self._in_flight is None, timeout,
+            )
+
+    def close(self) -> None:
+        """남은 저장을 모두 마친 뒤 워커를 종료합니다."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    # ── 워커 ────────────────────────────────────────────────────
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="simcut-save-writer", daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._order or self._closed)
+                if not self._order:
+                    return
+                path = self._order.popleft()
+                job = self._pending.pop(path)
+                self._in_flight = path
+            error: Optional[BaseException] = None
+            try:
+                if job.after is not None:
+                    job.after.result()
+                atomic_write(job.path, job.write)
+            except Exception as e:
+                error = e
+            try:
+                if job.on_done is not None:
+                    job.on_done()
+                if self._on_complete is not None:
+                    self._on_complete(job.path, error)
+            except Exception:
+                pass  # 알림 실패가 워커를 멈추지 않도록 무시
+            finally:
+                with self._cond:
+                    self._in_flight = None
+                    self._cond.notify_all()
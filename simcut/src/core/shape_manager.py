@@ -1,7 +1,8 @@
 from __future__ import annotations
+import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import Callable, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 
 class ShapeType(Enum):
@@ -22,18 +23,67 @@ class Shape:
     blur_radius: int = 0
 
 
+def shapes_bytes(shapes: Iterable[Shape], seen: Optional[Set[int]] = None) -> int:
+    """도형들이 차지하는 대략적인 메모리. seen에 있는 도형(공유 참조)은 다시 세지 않습니다."""
+    seen = set() if seen is None else seen
+    total = 0
+    for shape in shapes:
+        if id(shape) in seen:
+            continue
+        seen.add(id(shape))
+        total += sys.getsizeof(shape) + sys.getsizeof(shape.__dict__)
+    return total
+
+
+class ShapeState(NamedTuple):
+    """ShapeManager 전체 상태 (도형 + 다시 실행 스택). 불변이므로 그대로 공유합니다."""
+    shapes: Tuple[Shape, ...] = ()
+    undo_stack: Tuple[Shape, ...] = ()
+
+
+# 변경 알림: (manager, 연산 이름, 인자 튜플) — 편집 저널 기록용
+ChangeListener = Callable[["ShapeManager", str, tuple], None]
+
+
 class ShapeManager:
     def __init__(self) -> None:
         self._shapes: List[Shape] = []
         self._undo_stack: List[Shape] = []
+        self._listener: Optional[ChangeListener] = None
+
+    def set_listener(self, listener: Optional[ChangeListener]) -> None:
+        """도형 변경(add/extend/undo/redo/replace/remove/clear/restore)마다 호출될 콜백을 지정합니다."""
+        self._listener = listener
+
+    def _notify(self, op: str, *args) -> None:
+        if self._listener is not None:
+            self._listener(self, op, args)
 
     @property
     def shapes(self) -> List[Shape]:
         return list(self._shapes)
 
+    def state(self) -> ShapeState:
+        return ShapeState(tuple(self._shapes), tuple(self._undo_stack))
+
+    def restore(self, state: ShapeState) -> None:
+        """전체 상태를 한 번에 교체합니다 (히스토리 이동용, 알림도 한 번)."""
+        self._shapes = list(state.shapes)
+        self._undo_stack = list(state.undo_stack)
+        self._notify("restore", state)
+
     def add(self, shape: Shape) -> None:
         self._shapes = [*self._shapes, shape]
         self._undo_stack = []
+        self._notify("add", shape)
+
+    def extend(self, shapes: List[Shape]) -> None:
+        """여러 도형을 한 번에 추가합니다 (불변 방식)."""
+        if not shapes:
+            return
+        self._shapes = [*self._shapes, *shapes]
+        self._undo_stack = []
+        self._notify("extend", list(shapes))
 
     def undo(self) -> None:
         if not self._shapes:
@@ -41,6 +91,7 @@ class ShapeManager:
         removed = self._shapes[-1]
         self._shapes = self._shapes[:-1]
         self._undo_stack = [*self._undo_stack, removed]
+        self._notify("undo")
 
     def redo(self) -> None:
         if not self._undo_stack:
@@ -48,12 +99,14 @@ class ShapeManager:
         restored = self._undo_stack[-1]
         self._undo_stack = self._undo_stack[:-1]
         self._shapes = [*self._shapes, restored]
+        self._notify("redo")
 
     def replace(self, index: int, shape: Shape) -> None:
         """지정 인덱스의 도형을 새 도형으로 교체합니다 (불변 방식)."""
         if not (0 <= index < len(self._shapes)):
             raise IndexError(f"Shape index {index} out of range")
         self._shapes = [*self._shapes[:index], shape, *self._shapes[index + 1:]]
+        self._notify("replace", index, shape)
 
     def remove(self, index: int) -> None:
         """지정 인덱스의 도형을 삭제합니다 (불변 방식)."""
@@ -61,7 +114,9 @@ class ShapeManager:
             raise IndexError(f"Shape index {index} out of range")
         self._shapes = [*self._shapes[:index], *self._shapes[index + 1:]]
         self._undo_stack = []
+        self._notify("remove", index)
 
     def clear(self) -> None:
         self._shapes = []
         self._undo_stack = []
+        self._notify("clear")
@@ -0,0 +1,138 @@
+from __future__ import annotations
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+from src.core.image_handler import ImageHandler
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# PNG로 무손실 저장 가능한 모드 (그 외 모드는 TIFF로 저장)
+_PNG_MODES = {"1", "L", "LA", "I", "I;16", "P", "RGB", "RGBA"}
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """디스크로 내보낸 저장 전 상태의 핸들 (픽셀은 메모리에 두지 않음)."""
+    source_path: str
+    image_path: str              # 슬롯 픽셀 복원용 파일
+    backup_path: Optional[str]   # 덮어쓰기 전 원본 파일 바이트 사본 (synced일 때만)
+    future: Future
+
+    def wait(self) -> None:
+        """스필 작업이 끝날 때까지 대기합니다 (실패 시 예외 전파)."""
+        self.future.result()
+
+
+class SnapshotStore:
+    """세션 임시 폴더에 저장 전 스냅샷을 비동기로 기록합니다.
+
+    모든 쓰기/삭제 작업은 단일 워커 스레드에서 순서대로 실행됩니다.
+    """
+
+    def __init__(self, root: Optional[str] = None) -> None:
+        self._root = root
+        self._dir: Optional[Path] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._counter = 0
+        self._lock = threading.Lock()
+        self._handler = ImageHandler()
+
+    @property
+    def directory(self) -> Optional[Path]:
+        return self._dir
+
+    def spill(self, image: Image.Image, source_path: str, synced: bool) -> Snapshot:
+        """저장 전 상태를 스필합니다.
+
+        synced가 True면 이미지가 원본 파일과 같으므로 파일 바이트만 복사하고,
+        아니면 픽셀을 무손실 압축 파일로 기록합니다 (원본 사본 없음).
+        """
+        session_dir = self._ensure_dir()
+        with self._lock:
+            self._counter += 1
+            stem = f"{self._counter:06d}"
+        backup_path: Optional[str] = None
+        if synced and os.path.isfile(source_path):
+            backup_path = str(session_dir / f"{stem}-orig{Path(source_path).suffix}")
+            image_path = backup_path
+        else:
+            fmt = "PNG" if image.mode in _PNG_MODES else "TIFF"
+            image_path = str(session_dir / f"{stem}.{fmt.lower()}")
+        future = self._submit(
+            self._write, image, source_path, backup_path, image_path,
+        )
+        return Snapshot(
+            source_path=source_path,
+            image_path=image_path,
+            backup_path=backup_path,
+            future=future,
+        )
+
+    def load(self, snapshot: Snapshot) -> Image.Image:
+        """스필이 끝나길 기다린 뒤 스냅샷 픽셀을 불러옵니다."""
+        snapshot.wait()
+        return self._handler.load(snapshot.image_path)
+
+    @staticmethod
+    def disk_bytes(snapshot: Snapshot) -> int:
+        """스냅샷 파일이 차지하는 디스크 크기 (아직 쓰는 중이면 지금까지 쓴 만큼)."""
+        total = 0
+        for path in {snapshot.image_path, snapshot.backup_path}:
+            if path is not None and os.path.exists(path):
+                total += os.path.getsize(path)
+        return total
+
+    def discard(self, snapshot: Snapshot) -> None:
+        """스냅샷 파일을 삭제합니다 (대기 중인 쓰기 이후에 실행)."""
+        if self._executor is None:
+            return
+        self._submit(self._remove, snapshot.image_path, snapshot.backup_path)
+
+    def close(self) -> None:
+        """워커를 종료하고 세션 임시 폴더를 삭제합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+
+    # ── 내부 헬퍼 ────────────────────────────────────────────────
+    def _ensure_dir(self) -> Path:
+        if self._dir is None:
+            self._dir = Path(tempfile.mkdtemp(prefix="simcut-session-", dir=self._root))
+        return self._dir
+
+    def _submit(self, fn, *args) -> Future:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="simcut-snapshot",
+            )
+        return self._executor.submit(fn, *args)
+
+    def _write(
+        self,
+        image: Image.Image,
+        source_path: str,
+        backup_path: Optional[str],
+        image_path: str,
+    ) -> None:
+        if backup_path is not None:
+            shutil.copyfile(source_path, backup_path)
+        if image_path != backup_path:
+            if image_path.endswith(".png"):
+                image.save(image_path, format="PNG", compress_level=1)
+            else:
+                image.save(image_path, format="TIFF", compression="tiff_deflate")
+
+    @staticmethod
+    def _remove(*paths: Optional[str]) -> None:
+        for path in paths:
+            if path is not None and os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from src.core.image_handler import ImageHandler
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+_Key = Tuple[str, int, int]  # (실제 경로, mtime_ns, 파일 크기)
+
+
+def image_bytes(image: Image.Image) -> int:
+    """디코딩된 이미지의 대략적인 메모리 크기."""
+    return image.width * image.height * len(image.getbands())
+
+
+class SourceCache:
+    """디코딩된 원본 이미지의 LRU 캐시 (스레드 안전).
+
+    파일 경로와 mtime/크기를 키로 사용하므로 파일이 바뀌면 자동으로 다시 디코딩합니다.
+    같은 파일을 동시에 요청하면 디코딩은 한 번만 수행됩니다.
+    반환된 이미지는 여러 작업이 공유하므로 수정하지 말아야 합니다.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES, handler: Optional[ImageHandler] = None) -> None:
+        self._max_bytes = max_bytes
+        self._handler = handler or ImageHandler()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_Key, Image.Image]" = OrderedDict()
+        self._loading: Dict[_Key, Future] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: str) -> Image.Image:
+        real = os.path.realpath(path)
+        st = os.stat(real)
+        key = (real, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._loading[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not owner:
+            return future.result()
+
+        try:
+            image = self._handler.load(real)
+            image.load()
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._loading[key]
+            self._store(key, image)
+        future.set_result(image)
+        return image
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _store(self, key: _Key, image: Image.Image) -> None:
+        # 같은 경로의 이전 버전은 더 이상 쓰이지 않으므로 제거
+        for old in [k for k in self._entries if k[0] == key[0]]:
+            self._bytes -= image_bytes(self._entries.pop(old))
+        size = image_bytes(image)
+        if size > self._max_bytes:
+            return
+        self._entries[key] = image
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= image_bytes(evicted)
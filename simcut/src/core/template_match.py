@@ -0,0 +1,154 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import numpy as np
+from PIL import Image
+
+# 축소 프록시의 긴 변 상한 (px). 전역 탐색은 이 크기에서만 수행합니다.
+PROXY_LONG_EDGE = 512
+# 프록시에서 템플릿의 짧은 변이 이보다 작아지지 않도록 축소 배율을 제한합니다.
+MIN_PROXY_TEMPLATE = 12
+# 전체 해상도 정밀 탐색 시 프록시 최고점 주변 여유 (프록시 px 단위)
+REFINE_MARGIN = 2
+DEFAULT_THRESHOLD = 0.8
+
+_EPS = 1e-6
+
+
+@dataclass(frozen=True)
+class Match:
+    """원본 픽셀 좌표의 일치 영역과 정규화 상호상관 점수 (-1 ~ 1)."""
+    x: int
+    y: int
+    width: int
+    height: int
+    score: float
+
+
+def _gray(image: Image.Image, factor: int = 1) -> np.ndarray:
+    gray = image.convert("L")
+    if factor > 1:
+        gray = gray.reduce(factor)
+    return np.asarray(gray, dtype=np.float64)
+
+
+def _window_sums(a: np.ndarray, h: int, w: int) -> np.ndarray:
+    """모든 h×w 창의 합 (적분 영상, valid 위치만)."""
+    ii = np.zeros((a.shape[0] + 1, a.shape[1] + 1), dtype=np.float64)
+    ii[1:, 1:] = a.cumsum(axis=0).cumsum(axis=1)
+    return ii[h:, w:] - ii[:-h, w:] - ii[h:, :-w] + ii[:-h, :-w]
+
+
+def _template_spectrum(template: np.ndarray, shape: Tuple[int, int]) -> Tuple[np.ndarray, float]:
+    """평균을 뺀 템플릿의 켤레 스펙트럼과 노름 (영상 크기 shape 기준)."""
+    t = template - template.mean()
+    return np.conj(np.fft.rfft2(t, s=shape)), float(np.sqrt((t * t).sum()))
+
+
+def ncc(
+    image: np.ndarray,
+    template: np.ndarray,
+    spectrum: Optional[Tuple[np.ndarray, float]] = None,
+) -> np.ndarray:
+    """FFT 기반 정규화 상호상관 맵. 결과 크기는 (H-h+1, W-w+1)입니다.
+
+    템플릿이 영상보다 크면 빈 배열, 밝기 변화가 없는 창은 0점입니다.
+    spectrum은 같은 영상 크기에 대해 미리 계산한 _template_spectrum 결과입니다.
+    """
+    H, W = image.shape
+    h, w = template.shape
+    if h > H or w > W or h == 0 or w == 0:
+        return np.zeros((0, 0))
+    t_spectrum, t_norm = spectrum or _template_spectrum(template, image.shape)
+    if t_norm < _EPS:
+        return np.zeros((H - h + 1, W - w + 1))
+    # 원형 상관: 템플릿이 경계를 넘지 않는 valid 영역만 사용하므로 패딩이 필요 없습니다.
+    corr = np.fft.irfft2(np.fft.rfft2(image) * t_spectrum, s=image.shape)[:H - h + 1, :W - w + 1]
+    n = h * w
+    s1 = _window_sums(image, h, w)
+    s2 = _window_sums(image * image, h, w)
+    denom = np.sqrt(np.maximum(s2 - s1 * s1 / n, 0.0)) * t_norm
+    score = np.zeros_like(corr)
+    np.divide(corr, denom, out=score, where=denom > _EPS * n)
+    return score
+
+
+def _peak(score: np.ndarray) -> Tuple[int, int, float]:
+    y, x = np.unravel_index(int(np.argmax(score)), score.shape)
+    return int(x), int(y), float(score[y, x])
+
+
+class TemplateMatcher:
+    """템플릿 하나를 여러 이미지에서 찾습니다 (프록시 전역 탐색 → 최고점 주변 전체 해상도 정밀 탐색).
+
+    템플릿 배열은 한 번만 준비하므로 같은 인스턴스를 여러 스레드에서 공유할 수 있습니다.
+    """
+
+    def __init__(self, template: Image.Image) -> None:
+        self._size = template.size
+        self._full = _gray(template)
+        self._proxies: dict[int, np.ndarray] = {}
+        self._spectra: dict[tuple, Tuple[np.ndarray, float]] = {}
+        self._template = template
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self._size
+
+    def _proxy_factor(self, image_size: Tuple[int, int]) -> int:
+        by_image = -(-max(image_size) // PROXY_LONG_EDGE)
+        by_template = min(self._size) // MIN_PROXY_TEMPLATE
+        return max(1, min(by_image, by_template))
+
+    def _proxy_template(self, factor: int) -> np.ndarray:
+        proxy = self._proxies.get(factor)
+        if proxy is None:
+            proxy = _gray(self._template, factor)
+            self._proxies = {**self._proxies, factor: proxy}
+        return proxy
+
+    def _proxy_spectrum(self, factor: int, shape: Tuple[int, int]) -> Tuple[np.ndarray, float]:
+        # 같은 크기의 이미지가 연속되는 경우가 많으므로 템플릿 스펙트럼을 재사용
+        key = (factor, shape)
+        spectrum = self._spectra.get(key)
+        if spectrum is None:
+            spectrum = _template_spectrum(self._proxy_template(factor), shape)
+            self._spectra = {**self._spectra, key: spectrum}
+        return spectrum
+
+    def find(self, image: Image.Image, threshold: float = DEFAULT_THRESHOLD) -> Optional[Match]:
+        """가장 잘 맞는 위치를 반환합니다 (점수가 threshold 미만이면 None)."""
+        tw, th = self._size
+        if tw > image.width or th > image.height:
+            return None
+        factor = self._proxy_factor(image.size)
+        px, py = 0, 0
+        if factor > 1:
+            proxy = _gray(image, factor)
+            template = self._proxy_template(factor)
+            if template.shape[0] > proxy.shape[0] or template.shape[1] > proxy.shape[1]:
+                return None
+            score = ncc(proxy, template, self._proxy_spectrum(factor, proxy.shape))
+            if score.size == 0:
+                return None
+            px, py, _ = _peak(score)
+        # 전체 해상도: 프록시 최고점 주변만 탐색
+        margin = REFINE_MARGIN * factor if factor > 1 else max(image.size)
+        left = max(0, px * factor - margin)
+        top = max(0, py * factor - margin)
+        right = min(image.width, px * factor + tw + margin)
+        bottom = min(image.height, py * factor + th + margin)
+        region = image.crop((left, top, right, bottom))
+        score = ncc(_gray(region), self._full)
+        if score.size == 0:
+            return None
+        x, y, best = _peak(score)
+        if best < threshold:
+            return None
+        return Match(left + x, top + y, tw, th, best)
+
+
+def find_template(
+    image: Image.Image, template: Image.Image, threshold: float = DEFAULT_THRESHOLD,
+) -> Optional[Match]:
+    return TemplateMatcher(template).find(image, threshold)
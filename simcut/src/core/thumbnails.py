@@ -0,0 +1,115 @@
+"""탐색기 썸네일을 백그라운드에서 만듭니다 (Qt 비의존).
+
+아직 보지 않은 슬롯(폴더 가져오기 · ZIP · 감시 폴더)의 썸네일은 원본 전체를 디코딩해야 하므로
+(PNG는 줄여 읽는 모드가 없음) GUI 스레드 대신 워커 스레드에서 만들고 묶어서 알립니다.
+요청은 최근 것부터 처리하고, MAX_PENDING을 넘으면 오래된 요청(스크롤로 지나간 행)을 버립니다.
+"""
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Hashable, List, Optional, Tuple
+from src.core import archive
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# 대기 요청 상한 (보이는 행 + 미리 만드는 행보다 넉넉하게)
+MAX_PENDING = 64
+# 만든 썸네일을 묶어 알리는 최대 간격 (초). 큐가 비면 바로 알립니다.
+BATCH_INTERVAL = 0.05
+
+CropBox = Tuple[int, int, int, int]
+# (요청 값, RGBA 썸네일) 목록
+ThumbnailCallback = Callable[[List[Tuple[Any, "Image.Image"]]], None]
+
+
+def make_thumbnail(path: str, size: Tuple[int, int], crop: Optional[CropBox] = None) -> Image.Image:
+    """파일 또는 ZIP 멤버를 size 안에 맞춘 RGBA 썸네일로 (JPEG은 줄여서 디코딩, crop이 있으면 그 영역만)."""
+    from PIL import Image
+    with archive.open_image(path) as image:
+        source = image.crop(crop) if crop is not None else image
+        source.thumbnail(size, Image.LANCZOS)
+        return source.convert("RGBA")
+
+
+class ThumbnailLoader:
+    """썸네일을 단일 워커 스레드에서 만듭니다. on_batch는 워커 스레드에서 호출됩니다.
+
+    같은 key의 요청이 대기 중이면 새로 쌓지 않고 순서만 앞당깁니다. 읽지 못한 파일은 알리지 않습니다.
+    """
+
+    def __init__(
+        self,
+        on_batch: ThumbnailCallback,
+        size: Tuple[int, int],
+        max_pending: int = MAX_PENDING,
+        interval: float = BATCH_INTERVAL,
+    ) -> None:
+        self._on_batch = on_batch
+        self._size = size
+        self._max_pending = max_pending
+        self._interval = interval
+        self._cond = threading.Condition()
+        self._pending: "OrderedDict[Hashable, Tuple[Any, str, Optional[CropBox]]]" = OrderedDict()
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def request(self, key: Hashable, value: Any, path: str, crop: Optional[CropBox] = None) -> None:
+        """path(crop이 있으면 그 영역)의 썸네일을 만들어 (value, 썸네일)로 알리도록 요청합니다."""
+        with self._cond:
+            if self._closed:
+                return
+            self._pending[key] = (value, path, crop)
+            self._pending.move_to_end(key)
+            while len(self._pending) > self._max_pending:
+                self._pending.popitem(last=False)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="simcut-thumbnails", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 요청을 모두 처리해 알릴 때까지 기다립니다 (테스트 · 스크립트용)."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self) -> None:
+        """남은 요청은 버리고 워커를 종료합니다."""
+        with self._cond:
+            self._closed = True
+            self._pending.clear()
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    # ── 워커 ────────────────────────────────────────────────────
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if self._closed:
+                    return
+                self._busy = True
+            batch = []
+            started = time.monotonic()
+            while True:
+                with self._cond:
+                    if not self._pending or self._closed or (batch and time.monotonic() - started >= self._interval):
+                        break
+                    _, (value, path, crop) = self._pending.popitem(last=True)  # 최근 요청(보이는 행) 먼저
+                try:
+                    batch.append((value, make_thumbnail(path, self._size, crop)))
+                except Exception:
+                    continue  # 지원하지 않는 파일 · 사라진 파일
+            try:
+                if batch:
+                    self._on_batch(batch)
+            except Exception:
+                pass  # 알림 실패가 워커를 멈추지 않도록 무시
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
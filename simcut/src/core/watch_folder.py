@@ -0,0 +1,245 @@
+"""감시 폴더: 새로 생긴 이미지를 다 쓰일 때까지 기다렸다가 알립니다 (Qt 비의존).
+
+파일 시스템 알림(notify)을 받거나 POLL_SECONDS마다 폴더를 다시 훑어 새 파일을 찾고,
+크기 · 수정 시각이 SETTLE_SECONDS 동안 그대로인 파일만 받아들입니다 (쓰는 중인 파일 제외).
+받아들인 파일은 워커 스레드에서 헤더와 썸네일을 읽어 on_arrival로 묶어 넘기고,
+process가 있으면 별도 스레드에서 파일마다 실행합니다 (레시피 적용 · 내보내기 등).
+"""
+from __future__ import annotations
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+from src.core.image_meta import ImageMeta
+from src.utils.constants import OPEN_FILE_EXTENSIONS
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# 크기 · 수정 시각이 이 시간 동안 그대로면 다 쓴 파일로 봅니다 (초)
+SETTLE_SECONDS = 0.3
+# 알림이 오지 않는 환경(네트워크 드라이브 등)을 위해 다시 훑는 간격 (초)
+POLL_SECONDS = 2.0
+# 다 쓴 것처럼 보였지만 읽지 못한 (또는 비어 있는) 파일을 다시 시도하는 횟수
+MAX_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class Arrival:
+    """받아들인 새 파일 (썸네일은 thumbnail_size에 맞춘 RGBA)."""
+    path: str
+    meta: ImageMeta
+    thumbnail: Image.Image
+
+
+@dataclass
+class _Pending:
+    size: int
+    mtime: int
+    since: float      # 지금 크기 · 시각을 처음 본 때 (time.monotonic)
+    attempts: int = 0
+
+
+def read_arrival(
+    path: str, thumbnail_size: Tuple[int, int], crop: Optional[Tuple[int, int, int, int]] = None,
+) -> Arrival:
+    """헤더와 썸네일을 읽습니다. 아직 쓰는 중인 (잘린) 파일이면 썸네일 디코딩에서 예외가 납니다.
+
+    crop이 있으면 그 영역(이미지 밖은 잘라냄)의 썸네일을 만듭니다. meta는 원본 파일 기준입니다.
+    """
+    stat = os.stat(path)
+    from PIL import Image
+    from src.core.recipe import clip_box
+    with Image.open(path) as image:
+        meta = ImageMeta(image.width, image.height, image.format or "", stat.st_size, stat.st_mtime)
+        box = clip_box(crop, image.size) if crop is not None else None
+        source = image.crop(box) if box is not None else image
+        source.thumbnail(thumbnail_size, Image.LANCZOS)
+        thumbnail = source.convert("RGBA")
+    return Arrival(path, meta, thumbnail)
+
+
+class FolderWatcher:
+    """폴더 하나(하위 폴더 제외)를 감시합니다. 콜백은 워커 스레드에서 호출됩니다.
+
+    include_existing가 False면 시작할 때 이미 있던 파일은 알리지 않습니다.
+    crop이 있으면 썸네일을 그 영역으로 만듭니다 (자르기 레시피를 적용할 슬롯용).
+    """
+
+    def __init__(
+        self,
+        root: str,
+        on_arrival: Callable[[List[Arrival]], None],
+        thumbnail_size: Tuple[int, int] = (120, 80),
+        settle: float = SETTLE_SECONDS,
+        poll: float = POLL_SECONDS,
+        include_existing: bool = False,
+        process: Optional[Callable[[str], Any]] = None,
+        on_processed: Optional[Callable[[str, Any], None]] = None,
+        crop: Optional[Tuple[int, int, int, int]] = None,
+    ) -> None:
+        self.root = root
+        self._on_arrival = on_arrival
+        self._thumbnail_size = thumbnail_size
+        self._settle = settle
+        self._poll = poll
+        self._include_existing = include_existing
+        self._process = process
+        self._on_processed = on_processed
+        self._crop = crop
+        self._cond = threading.Condition()
+        self._dirty = True
+        self._closed = False
+        self._scans = 0    # 끝난 훑기 횟수 (wait_idle용)
+        self._known: Set[str] = set()
+        self._pending: Dict[str, _Pending] = {}
+        self._empty: Dict[str, int] = {}  # 계속 비어 있어 제외한 파일 -> 수정 시각 (바뀌면 다시 대기)
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.skipped = 0   # 끝내 읽지 못한 파일 수
+
+    def start(self) -> None:
+        if self._thread is None:
+            if self._process is not None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simcut-watch-process")
+            self._thread = threading.Thread(target=self._run, name="simcut-watch", daemon=True)
+            self._thread.start()
+
+    def notify(self) -> None:
+        """폴더가 바뀌었다는 알림 (QFileSystemWatcher 등). 바로 다시 훑습니다."""
+        with self._cond:
+            self._dirty = True
+            self._cond.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """지금 이후 한 번 더 훑고, 쓰는 중인 파일이 없어질 때까지 기다립니다 (테스트 · 스크립트용).
+
+        process 작업은 기다리지 않습니다.
+        """
+        with self._cond:
+            target = self._scans + 2  # 진행 중인 훑기는 이 호출 이전 상태일 수 있음
+            self._dirty = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: self._closed or (self._scans >= target and not self._pending), timeout,
+            )
+
+    def close(self) -> None:
+        """감시를 멈춥니다. 진행 중인 process 작업은 마치고 대기 중인 작업은 버립니다."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    # ── 워커 ────────────────────────────────────────────────────
+    def _run(self) -> None:
+        first = True
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._dirty or self._closed, self._next_timeout())
+                if self._closed:
+                    return
+                self._dirty = False
+            ready = self._scan(baseline=first and not self._include_existing)
+            first = False
+            arrivals = self._ingest(ready)
+            if arrivals:
+                try:
+                    self._on_arrival(arrivals)
+                except Exception:
+                    pass  # 알림 실패가 감시를 멈추지 않도록 무시
+                for arrival in arrivals:
+                    self._submit(arrival.path)
+            with self._cond:
+                self._scans += 1
+                self._cond.notify_all()
+
+    def _next_timeout(self) -> float:
+        """다음 훑기까지: 가장 먼저 안정될 대기 파일의 시각, 없으면 POLL 간격."""
+        if not self._pending:
+            return self._poll
+        due = min(p.since for p in self._pending.values()) + self._settle
+        return min(self._poll, max(0.01, due - time.monotonic()))
+
+    def _scan(self, baseline: bool) -> List[str]:
+        """폴더를 훑어 대기 목록을 갱신하고, 크기가 안정된 파일을 이름 순으로 반환합니다."""
+        now = time.monotonic()
+        seen = set()
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    path = entry.path
+                    if path in self._known or not entry.name.lower().endswith(OPEN_FILE_EXTENSIONS):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    if path in self._empty:
+                        if stat.st_size == 0 and stat.st_mtime_ns == self._empty[path]:
+                            continue
+                        del self._empty[path]  # 내용이 생김
+                    if baseline:
+                        self._known.add(path)
+                        continue
+                    seen.add(path)
+                    pending = self._pending.get(path)
+                    if pending is None or (pending.size, pending.mtime) != (stat.st_size, stat.st_mtime_ns):
+                        attempts = pending.attempts if pending is not None else 0
+                        self._pending[path] = _Pending(stat.st_size, stat.st_mtime_ns, now, attempts)
+        except OSError:
+            return []  # 폴더가 잠시 사라짐 (다음 훑기에서 다시 시도)
+        for path in [p for p in self._pending if p not in seen]:
+            del self._pending[path]  # 사라진 파일 (임시 파일 이름 바꾸기 등)
+        return sorted(path for path, pending in self._pending.items() if now - pending.since >= self._settle)
+
+    def _ingest(self, paths: List[str]) -> List[Arrival]:
+        """안정된 파일을 읽습니다. 비어 있거나 읽지 못한 파일은 SETTLE 뒤 MAX_ATTEMPTS번까지 다시 봅니다."""
+        arrivals = []
+        for path in paths:
+            pending = self._pending[path]
+            if pending.size > 0:
+                try:
+                    arrivals.append(read_arrival(path, self._thumbnail_size, self._crop))
+                except Exception:
+                    pass
+                else:
+                    self._known.add(path)
+                    del self._pending[path]
+                    continue
+            pending.attempts += 1
+            pending.since = time.monotonic()
+            if pending.attempts < MAX_ATTEMPTS:
+                continue  # 잠깐 멈췄다가 이어 쓰는 중일 수 있음
+            del self._pending[path]
+            if pending.size == 0:
+                self._empty[path] = pending.mtime  # 빈 파일: 내용이 생길 때까지 제외 (계속 다시 훑지 않도록)
+            else:
+                self.skipped += 1
+                self._known.add(path)
+        return arrivals
+
+    def _submit(self, path: str) -> None:
+        if self._executor is None:
+            return
+
+        def run() -> None:
+            try:
+                result = self._process(path)
+            except Exception as e:
+                result = e
+            if self._on_processed is not None:
+                try:
+                    self._on_processed(path, result)
+                except Exception:
+                    pass
+
+        self._executor.submit(run)
@@ -1,16 +1,108 @@
+import os
 import sys
-from PyQt6.QtWidgets import QApplication
-from src.ui.main_window import MainWindow
-from src.utils.constants import APP_NAME
-from src.utils.theme import APP_STYLESHEET
+from src.utils import profiling, startup
+
+# 첫 파일을 열기 전에 백그라운드에서 미리 읽어 둘 모듈 (첫 프레임 이후)
+_WARM_MODULES = (
+    "PIL.Image", "src.core.compositor", "src.core.resize", "src.core.export_budget",
+    "src.core.recipe", "src.ui.export_options",
+)
 
 
 def main() -> None:
+    timer = startup.StartupTimer()
+    report_path = os.environ.get(startup.STARTUP_ENV)
+    if report_path:
+        timer.trace_imports()
+    profile_path = os.environ.get(profiling.PROFILE_ENV)
+    if profile_path:
+        # 시작 과정부터 기록하고 종료 시 Chrome 트레이스로 저장
+        profiling.start()
+    from src.ui import single_instance
+    paths = single_instance.file_arguments(sys.argv[1:])
+    single = not os.environ.get(single_instance.NEW_INSTANCE_ENV)
+    if single and single_instance.forward_to_running(paths):
+        # 실행 중인 창이 파일을 엽니다 (QApplication · Pillow 초기화 없이 종료)
+        return
+    from PyQt6.QtCore import QEvent, QObject, QStandardPaths, QTimer
+    from PyQt6.QtWidgets import QApplication
+    from src.utils.constants import APP_NAME
+    from src.utils.theme import APP_STYLESHEET
     app = QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
     app.setStyleSheet(APP_STYLESHEET)
-    window = MainWindow()
+    timer.mark("qt_app")
+    server = None
+    if single:
+        # 창을 만들기 전에 서버를 엽니다. 동시에 시작한 다른 실행이 먼저 열었으면 그쪽으로 넘기고 종료
+        server = single_instance.InstanceServer(app)
+        if not server.listen() and single_instance.forward_to_running(paths):
+            return
+    from src.ui.main_window import MainWindow
+    timer.mark("import_ui")
+    data_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+    window = MainWindow(recovery_dir=os.path.join(data_dir, "recovery"), defer_startup=True)
+    timer.mark("build_window")
+
+    class FirstPaint(QObject):
+        """창의 첫 페인트 직후 한 번: 미뤄 둔 초기화 · 복구 확인을 이어서 실행합니다."""
+
+        def eventFilter(self, obj, event) -> bool:
+            if event.type() == QEvent.Type.Paint:
+                obj.removeEventFilter(self)
+                timer.mark("first_paint")
+                QTimer.singleShot(0, after_first_paint)
+            return False
+
+    def after_first_paint() -> None:
+        window.finish_startup()
+        timer.mark("deferred_init")
+        startup.warm_imports(_WARM_MODULES)
+        if report_path:
+            timer.stop_tracing()
+            timer.write_report(report_path)
+        window.offer_recovery()
+        if paths:
+            window.open_paths(paths)
+
+    def receive(forwarded) -> None:
+        if forwarded:
+            window.open_paths(forwarded)
+        if window.isMinimized():
+            window.showNormal()
+        window.raise_()
+        window.activateWindow()
+
+    if server is not None:
+        # 받은 메시지는 이벤트 루프가 돌기 시작한 뒤에 전달됨
+        server.paths_received.connect(receive)
+        app.aboutToQuit.connect(server.close)
+    first_paint = FirstPaint(window)
+    window.installEventFilter(first_paint)
     window.show()
+    timer.mark("show")
+
+    from src.ui.input_trace import RECORD_ENV
+    from src.utils.stall_watchdog import StallWatchdog, threshold_from_env
+    threshold = threshold_from_env()
+    if threshold > 0:
+        # GUI 스레드 멈춤 감시: 이벤트 루프가 돌면 QTimer가 심장 박동을 보냄
+        os.makedirs(data_dir, exist_ok=True)
+        watchdog = StallWatchdog(os.path.join(data_dir, "stalls.log"), threshold=threshold)
+        heartbeat = QTimer(app)
+        heartbeat.timeout.connect(watchdog.beat)
+        heartbeat.start(int(watchdog.interval * 1000))
+        watchdog.start()
+        app.aboutToQuit.connect(watchdog.stop)
+    trace_path = os.environ.get(RECORD_ENV)
+    if trace_path:
+        # 입력 기록 (benchmarks/replay.py로 재생해 상호작용 지연을 측정)
+        from src.ui.input_trace import InputRecorder, save_trace
+        recorder = InputRecorder(window)
+        recorder.start()
+        app.aboutToQuit.connect(lambda: save_trace(trace_path, recorder.stop()))
+    if profile_path:
+        app.aboutToQuit.connect(lambda: profiling.is_enabled() and profiling.stop(profile_path))
     sys.exit(app.exec())
 
 
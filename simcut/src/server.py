@@ -0,0 +1,244 @@
+"""상주형 로컬 자동화 서버 (JSON-RPC 2.0 over HTTP, PyQt6를 임포트하지 않습니다).
+
+    python -m src.server --port 8765 --workers 4
+
+요청마다 프로세스를 새로 띄우는 대신 Python · Pillow를 한 번만 초기화하고,
+디코딩된 원본을 LRU 캐시에 보관해 같은 입력의 반복 작업을 바로 처리합니다.
+127.0.0.1에만 바인딩하고, 브라우저 페이지가 보낸 요청을 막기 위해
+Content-Type: application/json(CORS 사전 요청 강제) · Host 헤더 · 실행마다 새로 만드는 토큰
+(Authorization: Bearer …)을 확인합니다.
+"""
+from __future__ import annotations
+import argparse
+import base64
+import json
+import hmac
+import os
+import secrets
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from src.cli import output_path
+from src.core.batch_export import encode_target
+from src.core.recipe import Recipe, load_recipe
+from src.core.source_cache import DEFAULT_CACHE_BYTES, SourceCache
+from src.utils.constants import APP_NAME
+
+DEFAULT_PORT = 8765
+
+# JSON-RPC 2.0 오류 코드
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class RenderService:
+    """렌더/내보내기 작업 처리기. HTTP와 무관하게 직접 호출할 수도 있습니다."""
+
+    def __init__(self, workers: Optional[int] = None, cache_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        self.cache = SourceCache(cache_bytes)
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers or os.cpu_count() or 1, thread_name_prefix="simcut-render",
+        )
+        self._lock = threading.Lock()
+        self.requests = 0
+        self._methods: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "ping": self.ping,
+            "render": self.render,
+            "export": self.export,
+            "stats": self.stats,
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    # ── JSON-RPC ────────────────────────────────────────────────
+    def handle(self, payload: Any) -> Any:
+        """JSON-RPC 요청(또는 배치 배열)을 처리합니다. 배치 항목은 워커 풀에서 동시에 실행됩니다."""
+        if isinstance(payload, list):
+            if not payload:
+                return _error(None, INVALID_REQUEST, "Empty batch")
+            futures = [self._pool.submit(self._dispatch, item) for item in payload]
+            responses = [f.result() for f in futures]
+            return [r for r in responses if r is not None]
+        return self._pool.submit(self._dispatch, payload).result()
+
+    def _dispatch(self, request: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" \
+                or not isinstance(request.get("method"), str):
+            return _error(None, INVALID_REQUEST, "Invalid JSON-RPC request")
+        req_id = request.get("id")
+        is_notification = "id" not in request
+        with self._lock:
+            self.requests += 1
+        try:
+            method = self._methods.get(request["method"])
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Unknown method '{request['method']}'")
+            params = request.get("params", {})
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params must be an object")
+            result = method(params)
+        except RpcError as e:
+            response = _error(req_id, e.code, str(e))
+        except (ValueError, TypeError, KeyError) as e:
+            response = _error(req_id, INVALID_PARAMS, f"{type(e).__name__}: {e}")
+        except Exception as e:
+            response = _error(req_id, SERVER_ERROR, f"{type(e).__name__}: {e}")
+        else:
+            response = {"jsonrpc": "2.0", "id": req_id, "result": result}
+        return None if is_notification else response
+
+    # ── 메서드 ──────────────────────────────────────────────────
+    def ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"name": APP_NAME, "pid": os.getpid()}
+
+    def stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"requests": self.requests, "cache": self.cache.stats()}
+
+    def render(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """params: source, recipe → 출력 포맷별 인코딩 결과(base64)를 반환합니다."""
+        recipe = _recipe_param(params)
+        composite = recipe.apply(self.cache.get(params["source"]))
+        outputs = []
+        for target in recipe.targets:
+            result = encode_target(composite, target)
+            outputs.append({
+                "format": result.format,
+                "size": result.size,
+                "fits": result.fits,
+                "options": result.options,
+                "data": base64.b64encode(result.data).decode("ascii"),
+            })
+        return {"outputs": outputs}
+
+    def export(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """params: source, recipe, output_dir → CLI와 같은 이름(stem.ext)으로 저장합니다."""
+        recipe = _recipe_param(params)
+        source = params["source"]
+        out_dir = params["output_dir"]
+        composite = recipe.apply(self.cache.get(source))
+        os.makedirs(out_dir, exist_ok=True)
+        outputs = []
+        for target in recipe.targets:
+            result = encode_target(composite, target)
+            path = output_path(source, out_dir, target.extension)
+            Path(path).write_bytes(result.data)
+            outputs.append({"path": path, "format": result.format, "size": result.size, "fits": result.fits})
+        return {"outputs": outputs}
+
+
+def _recipe_param(params: Dict[str, Any]) -> Recipe:
+    """recipe 파라미터: 레시피 객체(JSON) 또는 레시피 파일 경로."""
+    recipe = params.get("recipe", {})
+    if isinstance(recipe, str):
+        return load_recipe(recipe)
+    return Recipe.from_dict(recipe)
+
+
+def _error(req_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": req_id, "error": {"code": code, "message": message}}
+
+
+class _RpcHandler(BaseHTTPRequestHandler):
+    server: "RenderServer"
+
+    def do_POST(self) -> None:
+        refusal = self._refusal()
+        if refusal is not None:
+            self.send_error(*refusal)
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except (ValueError, UnicodeDecodeError) as e:
+            response: Any = _error(None, PARSE_ERROR, f"Parse error: {e}")
+        else:
+            response = self.server.service.handle(payload)
+        if response is None or response == []:
+            self.send_response(204)
+            self.end_headers()
+            return
+        body = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _refusal(self) -> Optional[tuple]:
+        """요청을 거절할 (상태 코드, 이유). 받아들이면 None."""
+        port = self.server.port
+        if self.headers.get("Host", "") not in (f"127.0.0.1:{port}", f"localhost:{port}"):
+            return 403, "Unexpected Host"  # DNS 리바인딩
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type != "application/json":
+            return 415, "Content-Type must be application/json"  # 사전 요청 없는 단순 요청
+        expected = f"Bearer {self.server.token}"
+        if not hmac.compare_digest(self.headers.get("Authorization", "").encode(), expected.encode()):
+            return 401, "Missing or invalid token"
+        return None
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class RenderServer(ThreadingHTTPServer):
+    """localhost 전용 HTTP JSON-RPC 서버. 연결마다 스레드를 두고 실제 작업은 서비스 풀에서 실행합니다."""
+    daemon_threads = True
+
+    def __init__(
+        self, service: RenderService, port: int = DEFAULT_PORT, quiet: bool = False, token: Optional[str] = None,
+    ) -> None:
+        super().__init__(("127.0.0.1", port), _RpcHandler)
+        self.service = service
+        self.quiet = quiet
+        self.token = token or secrets.token_urlsafe(24)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server",
+        description=f"{APP_NAME} 로컬 자동화 서버 (JSON-RPC 2.0 over HTTP, 127.0.0.1 전용)",
+    )
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본: {DEFAULT_PORT})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 스레드 수")
+    parser.add_argument("--cache-mb", type=int, default=DEFAULT_CACHE_BYTES // (1024 * 1024),
+                        help="디코딩된 원본 캐시 크기 (MB)")
+    parser.add_argument("--token", default=os.environ.get("SIMCUT_SERVER_TOKEN"),
+                        help="요청 토큰 (기본: SIMCUT_SERVER_TOKEN, 없으면 실행마다 새로 만듦)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="요청 로그 끄기")
+    args = parser.parse_args(argv)
+
+    service = RenderService(workers=args.workers, cache_bytes=args.cache_mb * 1024 * 1024)
+    server = RenderServer(service, port=args.port, quiet=args.quiet, token=args.token)
+    print(f"{APP_NAME} server listening on http://127.0.0.1:{server.port}", flush=True)
+    print(f"token: {server.token}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,23 @@
 from __future__ import annotations
-from typing import Optional, Tuple, Dict
+import time
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Callable, Deque, List, Optional, Tuple, Dict
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtGui import QPainter, QPixmap, QColor, QPen, QBrush, QImage, QPainterPath
 from PyQt6.QtCore import Qt, QRect, QRectF, QPoint, pyqtSignal
-from PIL import Image, ImageDraw
 from src.core.shape_manager import ShapeManager, Shape, ShapeType
 from src.core.image_handler import ImageHandler
+from src.utils import profiling
 from src.utils.constants import (
     DEFAULT_PEN_COLOR, DEFAULT_PEN_WIDTH, CANVAS_BG_COLOR,
     MIN_PEN_WIDTH, MAX_PEN_WIDTH
 )
 
+if TYPE_CHECKING:
+    # Pillow · 합성 모듈은 첫 이미지를 다룰 때 읽습니다 (앱 시작 시간 단축)
+    from PIL import Image
+    from src.core.resize import ResizeSpec
+
 # 리사이즈 핸들 크기 (px)
 HANDLE_SIZE = 8
 # 도형 최소 크기 (리사이즈 하한)
@@ -22,13 +29,23 @@ MIN_CROP_SIZE = 20
 MIN_ZOOM = 0.25
 MAX_ZOOM = 4.0
 ZOOM_STEP = 1.15  # 휠 한 칸당 15% 변경
+# 모자이크 결과 캐시 항목 수 (드래그 중 다른 블러 도형은 매 프레임 다시 계산하지 않음)
+MOSAIC_CACHE_SIZE = 64
+MOSAIC_CACHE_BYTES = 128 * 1024 * 1024
+# 성능 HUD의 FPS 계산 구간 (초)
+FPS_WINDOW = 1.0
 
 
 def _pil_to_pixmap(image: Image.Image) -> QPixmap:
-    rgba = image.convert("RGBA")
-    data = rgba.tobytes("raw", "RGBA")
-    qimg = QImage(data, rgba.width, rgba.height, QImage.Format.Format_RGBA8888)
-    return QPixmap.fromImage(qimg)
+    with profiling.span("pil_to_pixmap", size=image.size, mode=image.mode):
+        # 투명도가 없는 이미지는 알파 없는 픽스맵으로 (hasAlphaChannel로 프록시 포맷을 고름)
+        if "A" in image.getbands() or "transparency" in image.info:
+            converted, mode, fmt = image.convert("RGBA"), "RGBA", QImage.Format.Format_RGBA8888
+        else:
+            converted, mode, fmt = image.convert("RGB"), "RGB", QImage.Format.Format_RGB888
+        data = converted.tobytes("raw", mode)
+        qimg = QImage(data, converted.width, converted.height, converted.width * len(mode), fmt)
+        return QPixmap.fromImage(qimg)
 
 
 class Canvas(QWidget):
@@ -45,6 +62,8 @@ class Canvas(QWidget):
         super().__init__(parent)
         self._shape_manager = shape_manager
         self._image: Optional[Image.Image] = None
+        # 프로젝트에서 연 슬롯: 전체 해상도는 처음 필요할 때 읽음 (표시는 프록시 픽스맵)
+        self._image_loader: Optional[Callable[[], Image.Image]] = None
         self._pixmap: Optional[QPixmap] = None
         self._handler = ImageHandler()
         self._base_scale: float = 1.0
@@ -73,6 +92,20 @@ class Canvas(QWidget):
         self._pen_width: int = DEFAULT_PEN_WIDTH
         self._fill_color: Optional[str] = None
 
+        # 페인트 계측 (입력 재생 · 성능 측정용)
+        self._paint_count = 0
+        self._last_paint_seconds = 0.0
+        self._last_rebuild_seconds = 0.0
+        self._frame_times: Deque[float] = deque(maxlen=240)
+        self._mosaic_cache: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self._mosaic_source = 0   # 캐시가 가리키는 표시 픽스맵 cacheKey
+        self._mosaic_bytes = 0
+        self._mosaic_hits = 0
+        self._mosaic_misses = 0
+        # 성능 HUD (View › Performance HUD)
+        self._hud_visible = False
+        self._hud_provider: Optional[Callable[[], List[str]]] = None
+
         self.setAcceptDrops(True)
         self.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
         self.setStyleSheet(f"background: {CANVAS_BG_COLOR};")
@@ -80,6 +113,17 @@ class Canvas(QWidget):
     # ── 읽기 전용 속성 ──────────────────────────────────────────
     @property
     def image(self) -> Optional[Image.Image]:
+        return self._full_image()
+
+    @property
+    def has_image(self) -> bool:
+        return self._image is not None or self._image_loader is not None
+
+    def _full_image(self) -> Optional[Image.Image]:
+        """전체 해상도 원본 (지연 로더가 있으면 처음 필요할 때 읽습니다)."""
+        if self._image is None and self._image_loader is not None:
+            self._image = self._image_loader()
+            self._image_loader = None
         return self._image
 
     @property
@@ -191,13 +235,19 @@ class Canvas(QWidget):
 
     def _rebuild_display(self) -> None:
         """현재 줌 레벨에 맞게 디스플레이 픽스맵을 재생성합니다."""
-        if self._image is None:
+        image = self._full_image()
+        if image is None:
             return
         eff = self._base_scale * self._zoom
-        display_w = max(1, int(self._image.width * eff))
-        display_h = max(1, int(self._image.height * eff))
-        display_img = self._image.resize((display_w, display_h), Image.LANCZOS)
-        self._pixmap = _pil_to_pixmap(display_img)
+        display_w = max(1, int(image.width * eff))
+        display_h = max(1, int(image.height * eff))
+        start = time.perf_counter()
+        with profiling.span("rebuild_display", zoom=self._zoom, size=image.size):
+            with profiling.span("resize", size=image.size, to=(display_w, display_h)):
+                from PIL import Image
+                display_img = image.resize((display_w, display_h), Image.LANCZOS)
+            self._pixmap = _pil_to_pixmap(display_img)
+        self._last_rebuild_seconds = time.perf_counter() - start
         self.setFixedSize(display_w, display_h)
         self.update()
 
@@ -214,10 +264,12 @@ class Canvas(QWidget):
     # ── 이미지 로드 ─────────────────────────────────────────────
     def load_image(self, path: str, max_size: Optional[Tuple[int, int]] = None) -> None:
         self._image = self._handler.load(path)
+        self._image_loader = None
         self._base_scale = self._calc_scale(self._image.size, max_size)
         self._zoom = 1.0
         display_w = int(self._image.width * self._base_scale)
         display_h = int(self._image.height * self._base_scale)
+        from PIL import Image
         display_img = (
             self._image.resize((display_w, display_h), Image.LANCZOS)
             if self._base_scale != 1.0 else self._image
@@ -231,14 +283,19 @@ class Canvas(QWidget):
 
     def set_slot(
         self,
-        image: Image.Image,
+        image: Optional[Image.Image],
         scale: float,
         pixmap: QPixmap,
         shape_manager: ShapeManager,
         zoom: float = 1.0,
+        image_loader: Optional[Callable[[], Image.Image]] = None,
     ) -> None:
-        """멀티 파일 전환: 캔버스를 다른 파일 슬롯으로 교체합니다."""
+        """멀티 파일 전환: 캔버스를 다른 파일 슬롯으로 교체합니다.
+
+        image 대신 image_loader를 주면 픽스맵으로 먼저 표시하고 원본은 필요할 때 읽습니다.
+        """
         self._image = image
+        self._image_loader = image_loader if image is None else None
         self._base_scale = scale
         self._zoom = zoom
         self._shape_manager = shape_manager
@@ -275,6 +332,7 @@ class Canvas(QWidget):
     def clear_image(self) -> None:
         """이미지를 제거하고 초기 상태로 되돌립니다."""
         self._image = None
+        self._image_loader = None
         self._pixmap = None
         self._selected_index = None
         self._draw_start = None
@@ -286,6 +344,38 @@ class Canvas(QWidget):
         self.update()
         self.zoom_changed.emit(self._zoom)
 
+    def deselect(self) -> None:
+        """도형 선택만 해제합니다 (다시 그리기는 호출자가 한 번에)."""
+        if self._selected_index is None:
+            return
+        self._selected_index = None
+        self._resize_handle = None
+        self._is_dragging = False
+        self.selection_changed.emit(None)
+
+    # ── 캐시 (리소스 검사기) ────────────────────────────────────
+    @property
+    def display_pixmap(self) -> Optional[QPixmap]:
+        """현재 표시 중인 픽스맵 (줌 배율이 1이 아니면 슬롯 픽스맵과 별개)."""
+        return self._pixmap
+
+    @property
+    def mosaic_cache_bytes(self) -> int:
+        return self._mosaic_bytes
+
+    def clear_mosaic_cache(self) -> int:
+        """모자이크 캐시를 비우고 해제한 바이트 수를 반환합니다."""
+        freed = self._mosaic_bytes
+        self._mosaic_cache.clear()
+        self._mosaic_bytes = 0
+        return freed
+
+    def release_image(self, loader: Callable[[], Image.Image]) -> None:
+        """원본 참조를 내려놓고 다음에 필요할 때 loader로 다시 읽습니다."""
+        if self._image is not None:
+            self._image = None
+            self._image_loader = loader
+
     def clear_shapes(self) -> None:
         self._shape_manager.clear()
         self._selected_index = None
@@ -304,48 +394,16 @@ class Canvas(QWidget):
         self.update()
 
     # ── 도형 합성 내보내기 ──────────────────────────────────────
-    def render_to_image(self) -> Optional[Image.Image]:
-        """모든 도형을 원본 이미지에 합성한 PIL Image를 반환합니다."""
-        if self._image is None:
+    def render_to_image(self, resize: Optional[ResizeSpec] = None) -> Optional[Image.Image]:
+        """모든 도형을 원본 이미지에 합성한 PIL Image를 반환합니다.
+
+        resize가 지정되면 먼저 출력 크기로 축소한 뒤 도형을 합성합니다.
+        """
+        image = self._full_image()
+        if image is None:
             return None
-        result = self._image.copy()
-        inv = (1.0 / self._base_scale) if self._base_scale > 0 else 1.0
-        for shape in self._shape_manager.shapes:
-            x = int(shape.x * inv)
-            y = int(shape.y * inv)
-            w = int(shape.width * inv)
-            h = int(shape.height * inv)
-            width = max(1, int(shape.pen_width * inv))
-            box = [x, y, x + w, y + h]
-            # 모자이크 처리
-            if shape.blur_radius > 0:
-                clamped = [max(0, box[0]), max(0, box[1]),
-                           min(result.width, box[2]), min(result.height, box[3])]
-                if clamped[2] > clamped[0] and clamped[3] > clamped[1]:
-                    region = result.crop(clamped)
-                    factor = max(2, int(shape.blur_radius * inv) * 2 // 5)
-                    rw, rh = region.size
-                    small = region.resize(
-                        (max(1, rw // factor), max(1, rh // factor)), Image.NEAREST,
-                    )
-                    mosaic = small.resize((rw, rh), Image.NEAREST)
-                    if shape.shape_type == ShapeType.ELLIPSE:
-                        mask = Image.new('L', region.size, 0)
-                        ImageDraw.Draw(mask).ellipse(
-                            [0, 0, rw - 1, rh - 1], fill=255,
-                        )
-                        result.paste(mosaic, (clamped[0], clamped[1]), mask)
-                    else:
-                        result.paste(mosaic, (clamped[0], clamped[1]))
-            # 윤곽선 (블러 시 fill 무시)
-            draw = ImageDraw.Draw(result, "RGBA")
-            fill = None if shape.blur_radius > 0 else (shape.fill_color or None)
-            outline = shape.pen_color or None
-            if shape.shape_type == ShapeType.RECTANGLE:
-                draw.rectangle(box, fill=fill, outline=outline, width=width)
-            elif shape.shape_type == ShapeType.ELLIPSE:
-                draw.ellipse(box, fill=fill, outline=outline, width=width)
-        return result
+        from src.core import compositor
+        return compositor.composite(image, self._shape_manager.shapes, self._base_scale, resize)
 
     def apply_style_to_selected(
         self,
@@ -406,8 +464,83 @@ class Canvas(QWidget):
         return None
 
     # ── 페인트 ──────────────────────────────────────────────────
+    @property
+    def paint_count(self) -> int:
+        return self._paint_count
+
+    @property
+    def last_paint_seconds(self) -> float:
+        return self._last_paint_seconds
+
+    # ── 성능 HUD ────────────────────────────────────────────────
+    @property
+    def hud_visible(self) -> bool:
+        return self._hud_visible
+
+    @hud_visible.setter
+    def hud_visible(self, visible: bool) -> None:
+        self._hud_visible = visible
+        self.update()
+
+    def set_hud_provider(self, provider: Optional[Callable[[], List[str]]]) -> None:
+        """HUD에 덧붙일 줄을 돌려주는 콜백 (슬롯 메모리 등 캔버스 밖 정보)."""
+        self._hud_provider = provider
+
+    @property
+    def fps(self) -> float:
+        """최근 FPS_WINDOW초 동안의 페인트 횟수 기준 FPS."""
+        if len(self._frame_times) < 2:
+            return 0.0
+        now = time.perf_counter()
+        recent = [t for t in self._frame_times if now - t <= FPS_WINDOW]
+        if len(recent) < 2:
+            return 0.0
+        return (len(recent) - 1) / max(recent[-1] - recent[0], 1e-6)
+
+    def hud_lines(self) -> List[str]:
+        lines = [
+            f"paint {self._last_paint_seconds * 1000:.1f} ms · {self.fps:.0f} fps",
+            f"rebuild {self._last_rebuild_seconds * 1000:.1f} ms",
+        ]
+        if self._pixmap is not None:
+            shown = f"{self._pixmap.width()}×{self._pixmap.height()}"
+            if self._image is not None:
+                w, h = self._image.size
+                lines.append(f"display {shown} / source {w}×{h} ({self._pixmap.width() / max(1, w):.0%})")
+            else:
+                lines.append(f"display {shown} (proxy, source not loaded)")
+        total = self._mosaic_hits + self._mosaic_misses
+        if total:
+            lines.append(f"mosaic cache {self._mosaic_hits / total:.0%} ({self._mosaic_hits}/{total})")
+        if self._hud_provider is not None:
+            lines.extend(self._hud_provider())
+        return lines
+
+    def _draw_hud(self, painter: QPainter) -> None:
+        lines = self.hud_lines()
+        # 스크롤 영역 안에서도 보이는 영역 왼쪽 위에 고정
+        origin = self.visibleRegion().boundingRect().topLeft()
+        metrics = painter.fontMetrics()
+        line_h = metrics.height()
+        width = max(metrics.horizontalAdvance(line) for line in lines) + 12
+        box = QRect(origin.x() + 6, origin.y() + 6, width, line_h * len(lines) + 8)
+        painter.fillRect(box, QColor(0, 0, 0, 170))
+        painter.setPen(QColor("#7CFC9A"))
+        for i, line in enumerate(lines):
+            painter.drawText(box.x() + 6, box.y() + 4 + metrics.ascent() + i * line_h, line)
+
     def paintEvent(self, event) -> None:
-        painter = QPainter(self)
+        start = time.perf_counter()
+        with profiling.span("paint", shapes=len(self._shape_manager.shapes), zoom=self._zoom):
+            painter = QPainter(self)
+            self._paint(painter)
+            if self._hud_visible:
+                self._draw_hud(painter)
+        self._paint_count += 1
+        self._frame_times.append(time.perf_counter())
+        self._last_paint_seconds = time.perf_counter() - start
+
+    def _paint(self, painter: QPainter) -> None:
         if self._pixmap:
             painter.drawPixmap(0, 0, self._pixmap)
         z = self._zoom
@@ -427,8 +560,7 @@ class Canvas(QWidget):
         )
         # 블러 처리
         if shape.blur_radius > 0 and self._pixmap:
-            clipped = self._pixmap.copy(rect)
-            blurred = self._apply_mosaic(clipped, shape.blur_radius)
+            blurred = self._cached_mosaic(rect, shape.blur_radius)
             painter.save()
             path = QPainterPath()
             if shape.shape_type == ShapeType.ELLIPSE:
@@ -453,6 +585,28 @@ class Canvas(QWidget):
         elif shape.shape_type == ShapeType.ELLIPSE:
             painter.drawEllipse(rect)
 
+    def _cached_mosaic(self, rect: QRect, radius: int) -> QPixmap:
+        """표시 픽스맵의 rect 영역 모자이크 (표시 픽스맵이 바뀌면 캐시를 비움)."""
+        source = self._pixmap.cacheKey()
+        if source != self._mosaic_source:
+            self._mosaic_cache.clear()
+            self._mosaic_bytes = 0
+            self._mosaic_source = source
+        key = (rect.x(), rect.y(), rect.width(), rect.height(), radius)
+        cached = self._mosaic_cache.get(key)
+        if cached is not None:
+            self._mosaic_cache.move_to_end(key)
+            self._mosaic_hits += 1
+            return cached
+        self._mosaic_misses += 1
+        blurred = self._apply_mosaic(self._pixmap.copy(rect), radius)
+        self._mosaic_cache[key] = blurred
+        self._mosaic_bytes += blurred.width() * blurred.height() * 4
+        while len(self._mosaic_cache) > MOSAIC_CACHE_SIZE or self._mosaic_bytes > MOSAIC_CACHE_BYTES:
+            _, evicted = self._mosaic_cache.popitem(last=False)
+            self._mosaic_bytes -= evicted.width() * evicted.height() * 4
+        return blurred
+
     def _apply_mosaic(self, pixmap: QPixmap, radius: int) -> QPixmap:
         """QPixmap을 모자이크(픽셀화) 처리합니다."""
         img = pixmap.toImage()
@@ -724,7 +878,8 @@ class Canvas(QWidget):
     # ── 자르기 ──────────────────────────────────────────────────
     def _apply_crop(self, display_rect: QRect) -> None:
         """크롭 영역을 적용하여 이미지를 잘라냅니다."""
-        if self._image is None:
+        image = self._full_image()
+        if image is None:
             return
         eff = self._base_scale * self._zoom
         if eff <= 0:
@@ -732,14 +887,14 @@ class Canvas(QWidget):
         # 디스플레이 좌표 → 원본 픽셀 좌표
         left = max(0, int(display_rect.x() / eff))
         top = max(0, int(display_rect.y() / eff))
-        right = min(self._image.width, int((display_rect.x() + display_rect.width()) / eff))
-        bottom = min(self._image.height, int((display_rect.y() + display_rect.height()) / eff))
+        right = min(image.width, int((display_rect.x() + display_rect.width()) / eff))
+        bottom = min(image.height, int((display_rect.y() + display_rect.height()) / eff))
         if right - left < 2 or bottom - top < 2:
             return
         crop_left_bs = int(left * self._base_scale)
         crop_top_bs = int(top * self._base_scale)
         self.crop_performed.emit({
-            'image': self._image.crop((left, top, right, bottom)),
+            'image': image.crop((left, top, right, bottom)),
             'crop_box': (left, top, right, bottom),
             'crop_box_base_scale': (crop_left_bs, crop_top_bs),
         })
@@ -774,7 +929,7 @@ class Canvas(QWidget):
     def keyPressEvent(self, event) -> None:
         if self._crop_mode:
             if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-                if self._crop_rect and self._image:
+                if self._crop_rect and self.has_image:
                     self._apply_crop(self._crop_rect)
             elif event.key() == Qt.Key.Key_Escape:
                 self.crop_mode = False
@@ -787,7 +942,7 @@ class Canvas(QWidget):
 
     # ── 마우스 휠 (줌) ────────────────────────────────────────────
     def wheelEvent(self, event) -> None:
-        if self._image is None:
+        if not self.has_image:
             return
         delta = event.angleDelta().y()
         if delta > 0:
@@ -0,0 +1,170 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+from PyQt6.QtWidgets import (
+    QWidget, QHBoxLayout, QVBoxLayout, QComboBox, QSpinBox,
+    QDialog, QDialogButtonBox, QFormLayout,
+)
+from src.core.export_budget import ExportBudget
+from src.core.resize import ResizeSpec
+
+# 예산 모드 (콤보 데이터)
+BUDGET_NONE = "none"
+BUDGET_SIZE = "size"
+BUDGET_QUALITY = "quality"
+
+# 크기 조절 모드 (콤보 데이터)
+RESIZE_NONE = "none"
+RESIZE_LONG_EDGE = "long_edge"
+RESIZE_PERCENT = "percent"
+RESIZE_EXACT = "exact"
+
+
+class BudgetOptions(QWidget):
+    """내보내기 크기/화질 제한 입력 (없음 · 최대 파일 크기 KB · 최소 화질 PSNR dB)."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+
+        self._mode_combo = QComboBox()
+        self._mode_combo.addItem("제한 없음", BUDGET_NONE)
+        self._mode_combo.addItem("최대 파일 크기", BUDGET_SIZE)
+        self._mode_combo.addItem("최소 화질 (PSNR)", BUDGET_QUALITY)
+        self._mode_combo.currentIndexChanged.connect(self._on_mode_changed)
+        layout.addWidget(self._mode_combo)
+
+        self._value_spin = QSpinBox()
+        self._value_spin.setRange(1, 1_000_000)
+        self._value_spin.setValue(500)
+        self._value_spin.setSuffix(" KB")
+        self._value_spin.setEnabled(False)
+        layout.addWidget(self._value_spin)
+
+    def set_mode(self, mode: str, value: int) -> None:
+        index = self._mode_combo.findData(mode)
+        if index >= 0:
+            self._mode_combo.setCurrentIndex(index)
+        self._value_spin.setValue(value)
+
+    def budget(self) -> Optional[ExportBudget]:
+        """선택된 제한을 ExportBudget으로 반환합니다 (제한 없음이면 None)."""
+        mode = self._mode_combo.currentData()
+        if mode == BUDGET_SIZE:
+            return ExportBudget(max_bytes=self._value_spin.value() * 1024)
+        if mode == BUDGET_QUALITY:
+            return ExportBudget(min_psnr=float(self._value_spin.value()))
+        return None
+
+    def _on_mode_changed(self) -> None:
+        mode = self._mode_combo.currentData()
+        self._value_spin.setEnabled(mode != BUDGET_NONE)
+        if mode == BUDGET_SIZE:
+            self._value_spin.setRange(1, 1_000_000)
+            self._value_spin.setSuffix(" KB")
+            self._value_spin.setValue(500)
+        elif mode == BUDGET_QUALITY:
+            self._value_spin.setRange(10, 60)
+            self._value_spin.setSuffix(" dB")
+            self._value_spin.setValue(38)
+
+
+class ResizeOptions(QWidget):
+    """내보내기 크기 조절 입력 (원본 · 긴 변 px · 비율 % · 지정 크기)."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+
+        self._mode_combo = QComboBox()
+        self._mode_combo.addItem("원본 크기", RESIZE_NONE)
+        self._mode_combo.addItem("긴 변", RESIZE_LONG_EDGE)
+        self._mode_combo.addItem("비율", RESIZE_PERCENT)
+        self._mode_combo.addItem("지정 크기", RESIZE_EXACT)
+        self._mode_combo.currentIndexChanged.connect(self._on_mode_changed)
+        layout.addWidget(self._mode_combo)
+
+        self._value_spin = QSpinBox()
+        self._value_spin.setRange(1, 20000)
+        self._value_spin.setValue(1600)
+        self._value_spin.setSuffix(" px")
+        self._value_spin.setEnabled(False)
+        layout.addWidget(self._value_spin)
+
+        self._height_spin = QSpinBox()
+        self._height_spin.setRange(1, 20000)
+        self._height_spin.setValue(900)
+        self._height_spin.setSuffix(" px")
+        self._height_spin.setVisible(False)
+        layout.addWidget(self._height_spin)
+
+    def set_mode(self, mode: str, value: int, height: int = 0) -> None:
+        index = self._mode_combo.findData(mode)
+        if index >= 0:
+            self._mode_combo.setCurrentIndex(index)
+        self._value_spin.setValue(value)
+        if height:
+            self._height_spin.setValue(height)
+
+    def resize_spec(self) -> Optional[ResizeSpec]:
+        """선택된 크기 조절을 ResizeSpec으로 반환합니다 (원본 크기면 None)."""
+        mode = self._mode_combo.currentData()
+        if mode == RESIZE_LONG_EDGE:
+            return ResizeSpec(long_edge=self._value_spin.value())
+        if mode == RESIZE_PERCENT:
+            return ResizeSpec(percent=float(self._value_spin.value()))
+        if mode == RESIZE_EXACT:
+            return ResizeSpec(width=self._value_spin.value(), height=self._height_spin.value())
+        return None
+
+    def _on_mode_changed(self) -> None:
+        mode = self._mode_combo.currentData()
+        self._value_spin.setEnabled(mode != RESIZE_NONE)
+        self._height_spin.setVisible(mode == RESIZE_EXACT)
+        if mode == RESIZE_PERCENT:
+            self._value_spin.setRange(1, 100)
+            self._value_spin.setSuffix(" %")
+            self._value_spin.setValue(50)
+        elif mode in (RESIZE_LONG_EDGE, RESIZE_EXACT):
+            self._value_spin.setRange(1, 20000)
+            self._value_spin.setSuffix(" px")
+            self._value_spin.setValue(1600)
+
+
+@dataclass(frozen=True)
+class ExportSettings:
+    """내보내기 파이프라인 설정."""
+    budget: Optional[ExportBudget] = None
+    resize: Optional[ResizeSpec] = None
+
+
+class ExportOptionsDialog(QDialog):
+    """단일 내보내기용 옵션 다이얼로그."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("내보내기 옵션")
+        self.setMinimumWidth(340)
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        self._resize = ResizeOptions()
+        form.addRow("크기 조절:", self._resize)
+        self._budget = BudgetOptions()
+        form.addRow("크기 제한:", self._budget)
+        layout.addLayout(form)
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def settings(self) -> ExportSettings:
+        return ExportSettings(
+            budget=self._budget.budget(),
+            resize=self._resize.resize_spec(),
+        )
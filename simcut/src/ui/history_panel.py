@@ -0,0 +1,85 @@
+from __future__ import annotations
+from typing import Optional
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget
+from PyQt6.QtCore import Qt, pyqtSignal
+from src.core.history import EditHistory, HistoryEntry
+from src.utils.theme import FILE_EXPLORER_STYLE, FILE_EXPLORER_TITLE_STYLE
+
+_OP_LABELS = {
+    "add": "도형 추가",
+    "replace": "도형 수정",
+    "remove": "도형 삭제",
+    "undo": "실행 취소",
+    "redo": "다시 실행",
+    "clear": "모두 지우기",
+    "restore": "상태 복원",
+}
+
+
+def entry_label(entry: HistoryEntry) -> str:
+    if entry.op == "extend":
+        return f"도형 {len(entry.args[0])}개 추가"
+    return _OP_LABELS.get(entry.op, entry.op)
+
+
+class HistoryPanel(QWidget):
+    """현재 슬롯의 편집 타임라인. 항목을 클릭하면 그 시점으로 이동을 요청합니다.
+
+    0행은 시작 상태, n행은 n번째 연산 직후 상태입니다.
+    """
+
+    position_requested = pyqtSignal(int)
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setMinimumWidth(140)
+        self.setMaximumWidth(200)
+        self.setStyleSheet(FILE_EXPLORER_STYLE)
+        self._history: Optional[EditHistory] = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 8, 6, 6)
+        layout.setSpacing(6)
+        title = QLabel("편집 기록")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title.setStyleSheet(FILE_EXPLORER_TITLE_STYLE)
+        layout.addWidget(title)
+        self._list = QListWidget()
+        self._list.itemClicked.connect(lambda item: self.position_requested.emit(self._list.row(item)))
+        layout.addWidget(self._list)
+
+    def set_history(self, history: Optional[EditHistory]) -> None:
+        self._history = history
+        self._list.clear()
+        if history is not None:
+            history.dirty_from = 0
+        self.refresh()
+
+    def refresh(self) -> None:
+        """바뀐 항목부터만 다시 채우고 현재 위치를 표시합니다 (숨겨져 있으면 건너뜀)."""
+        history = self._history
+        if history is None or self.isHidden():
+            return
+        if history.dirty_from is not None:
+            start = history.dirty_from + 1  # 0행은 시작 상태
+            while self._list.count() > start:
+                self._list.takeItem(self._list.count() - 1)
+            if self._list.count() == 0:
+                self._list.addItem("시작")
+            self._list.addItems([
+                f"{i + 1}. {entry_label(history.entry(i))}"
+                for i in range(self._list.count() - 1, len(history))
+            ])
+            history.mark_clean()
+        self._list.blockSignals(True)
+        self._list.setCurrentRow(history.position)
+        self._list.blockSignals(False)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.refresh()
+
+    def count(self) -> int:
+        return self._list.count()
+
+    def current_row(self) -> int:
+        return self._list.currentRow()
@@ -0,0 +1,208 @@
+"""입력 기록 · 재생용 트레이스.
+
+캔버스의 마우스 · 휠 · 키 이벤트와 메인 윈도우 수준의 조작(메뉴 액션, 도구 전환,
+파일 전환, 파일 열기)을 시간순으로 기록합니다. 재생은 benchmarks/replay.py가 담당합니다.
+
+    SIMCUT_RECORD_INPUT=trace.json python -m src.main
+"""
+from __future__ import annotations
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from PyQt6.QtCore import QEvent, QObject, QPoint, QPointF, Qt
+from PyQt6.QtGui import QAction, QKeyEvent, QMouseEvent, QWheelEvent
+from src.core.shape_manager import ShapeType
+from src.utils.constants import DIALOG_ACTION_PROPERTY
+
+TRACE_VERSION = 1
+# 이 환경 변수에 경로를 주면 앱 실행 동안 입력을 기록하고 종료 시 저장합니다.
+RECORD_ENV = "SIMCUT_RECORD_INPUT"
+
+_MOUSE_TYPES = {
+    QEvent.Type.MouseButtonPress: "mouse_press",
+    QEvent.Type.MouseButtonRelease: "mouse_release",
+    QEvent.Type.MouseButtonDblClick: "mouse_double",
+    QEvent.Type.MouseMove: "mouse_move",
+}
+_KEY_TYPES = {
+    QEvent.Type.KeyPress: "key_press",
+    QEvent.Type.KeyRelease: "key_release",
+}
+# 기록할 위젯 시그널: (MainWindow 속성, 시그널 이름)
+_SIGNALS = (
+    ("toolbar", "tool_changed"),
+    ("toolbar", "crop_mode_toggled"),
+    ("file_explorer", "file_selected"),
+)
+
+
+@dataclass
+class InputTrace:
+    """기록된 입력. 좌표는 캔버스 위젯 기준, t는 기록 시작 후 ms입니다."""
+    window_size: Tuple[int, int] = (900, 660)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {"version": TRACE_VERSION, "window_size": list(self.window_size), "events": self.events}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "InputTrace":
+        version = data.get("version", 0)
+        if version > TRACE_VERSION:
+            raise ValueError(f"Unsupported trace version {version}")
+        width, height = data.get("window_size", (900, 660))
+        return cls((int(width), int(height)), list(data.get("events", [])))
+
+
+def save_trace(path: str, trace: InputTrace) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trace.to_dict(), f, ensure_ascii=False)
+
+
+def load_trace(path: str) -> InputTrace:
+    with open(path, "r", encoding="utf-8") as f:
+        return InputTrace.from_dict(json.load(f))
+
+
+def _encode_arg(value: Any) -> Any:
+    return value.value if isinstance(value, ShapeType) else value
+
+
+def decode_arg(value: Any) -> Any:
+    """tool_changed 인자: 도형 종류 문자열 → ShapeType (None은 선택 도구)."""
+    if isinstance(value, str):
+        return ShapeType(value)
+    return value
+
+
+def encode_event(event: QEvent) -> Optional[Dict[str, Any]]:
+    """캔버스 입력 이벤트 → 트레이스 항목 (기록 대상이 아니면 None)."""
+    kind = event.type()
+    if kind in _MOUSE_TYPES:
+        pos = event.position()
+        return {
+            "type": _MOUSE_TYPES[kind], "x": pos.x(), "y": pos.y(),
+            "button": event.button().value, "buttons": event.buttons().value,
+            "modifiers": event.modifiers().value,
+        }
+    if kind == QEvent.Type.Wheel:
+        pos = event.position()
+        return {
+            "type": "wheel", "x": pos.x(), "y": pos.y(),
+            "dx": event.angleDelta().x(), "dy": event.angleDelta().y(),
+            "buttons": event.buttons().value, "modifiers": event.modifiers().value,
+        }
+    if kind in _KEY_TYPES:
+        return {
+            "type": _KEY_TYPES[kind], "key": event.key(), "text": event.text(),
+            "modifiers": event.modifiers().value, "auto": event.isAutoRepeat(),
+        }
+    return None
+
+
+def decode_event(entry: Dict[str, Any]) -> Optional[QEvent]:
+    """트레이스 항목 → 캔버스에 보낼 QEvent (위젯 이벤트가 아니면 None)."""
+    kind = entry["type"]
+    modifiers = Qt.KeyboardModifier(entry.get("modifiers", 0))
+    if kind in _MOUSE_TYPES.values():
+        qtype = next(t for t, name in _MOUSE_TYPES.items() if name == kind)
+        pos = QPointF(entry["x"], entry["y"])
+        return QMouseEvent(
+            qtype, pos, pos, Qt.MouseButton(entry["button"]),
+            Qt.MouseButton(entry["buttons"]), modifiers,
+        )
+    if kind == "wheel":
+        pos = QPointF(entry["x"], entry["y"])
+        return QWheelEvent(
+            pos, pos, QPoint(0, 0), QPoint(entry["dx"], entry["dy"]),
+            Qt.MouseButton(entry["buttons"]), modifiers, Qt.ScrollPhase.NoScrollPhase, False,
+        )
+    if kind in _KEY_TYPES.values():
+        qtype = next(t for t, name in _KEY_TYPES.items() if name == kind)
+        return QKeyEvent(qtype, entry["key"], modifiers, entry.get("text", ""), entry.get("auto", False))
+    return None
+
+
+def replayable_actions(window) -> Dict[str, QAction]:
+    """메뉴 액션 중 대화상자를 띄우지 않는 것 (이름 → QAction, DIALOG_ACTION_PROPERTY로 표시한 액션 제외)."""
+    actions = {}
+    for menu_action in window.menuBar().actions():
+        menu = menu_action.menu()
+        if menu is None:
+            continue
+        for action in menu.actions():
+            text = action.text()
+            if text and not action.isSeparator() and not action.property(DIALOG_ACTION_PROPERTY):
+                actions[text] = action
+    return actions
+
+
+class InputRecorder(QObject):
+    """MainWindow의 입력을 기록합니다. start() 후 stop()이 InputTrace를 반환합니다.
+
+    기록 시작 시 열려 있던 파일은 t=0의 open · 파일 선택 항목으로 남깁니다.
+    """
+
+    def __init__(self, window) -> None:
+        super().__init__(window)
+        self._window = window
+        self._events: List[Dict[str, Any]] = []
+        self._start = 0.0
+        self._connections: List[Tuple[Any, Any]] = []
+        self._recording = False
+
+    @property
+    def recording(self) -> bool:
+        return self._recording
+
+    def start(self) -> None:
+        if self._recording:
+            return
+        window = self._window
+        self._events = []
+        self._start = time.perf_counter()
+        self._recording = True
+        paths = [slot.path for slot in window._file_slots]
+        if paths:
+            self._add({"type": "open", "paths": paths})
+            self._add({"type": "signal", "source": "file_explorer", "name": "file_selected",
+                       "args": [window._current_slot_index]})
+        window.canvas.installEventFilter(self)
+        self._connect(window.paths_opened, lambda paths: self._add({"type": "open", "paths": paths}))
+        for source, name in _SIGNALS:
+            signal = getattr(getattr(window, source), name)
+            self._connect(signal, self._signal_recorder(source, name))
+        for text, action in replayable_actions(window).items():
+            self._connect(action.triggered, lambda _=False, text=text: self._add({"type": "action", "name": text}))
+
+    def stop(self) -> InputTrace:
+        if self._recording:
+            self._window.canvas.removeEventFilter(self)
+            for signal, slot in self._connections:
+                signal.disconnect(slot)
+            self._connections = []
+            self._recording = False
+        size = self._window.size()
+        return InputTrace((size.width(), size.height()), list(self._events))
+
+    def _connect(self, signal, slot) -> None:
+        signal.connect(slot)
+        self._connections.append((signal, slot))
+
+    def _signal_recorder(self, source: str, name: str):
+        def record(*args) -> None:
+            self._add({"type": "signal", "source": source, "name": name,
+                       "args": [_encode_arg(a) for a in args]})
+        return record
+
+    def _add(self, entry: Dict[str, Any]) -> None:
+        entry["t"] = round((time.perf_counter() - self._start) * 1000, 3)
+        self._events.append(entry)
+
+    def eventFilter(self, obj, event) -> bool:
+        if obj is self._window.canvas:
+            entry = encode_event(event)
+            if entry is not None:
+                self._add(entry)
+        return False
@@ -1,43 +1,243 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QScrollArea, QLabel, QFileDialog, QMessageBox, QSplitter,
-    QComboBox, QDialog, QDialogButtonBox, QFormLayout,
+    QDialog, QDialogButtonBox, QFormLayout,
     QProgressDialog, QCheckBox, QPushButton,
 )
 from PyQt6.QtGui import QKeySequence, QAction, QPixmap
-from PyQt6.QtCore import Qt
-from PIL import Image
+from PyQt6.QtCore import Qt, pyqtSignal, QBuffer, QByteArray, QIODevice
 from src.ui.canvas import Canvas, _pil_to_pixmap
 from src.ui.toolbar import Toolbar
 from src.ui.file_explorer import FileExplorer
-from src.core.shape_manager import ShapeManager, Shape
+from src.core import archive
+from src.core.shape_manager import ShapeManager, Shape, shapes_bytes
+from src.core.history import EditHistory
 from src.core.image_handler import ImageHandler
+from src.core.snapshot_store import SnapshotStore, Snapshot
+from src.core.save_queue import SaveQueue
+from src.core.source_cache import image_bytes
+from src.core.thumbnails import ThumbnailLoader
+from src.utils import profiling
+from src.utils.memory import format_bytes, process_rss
 from src.utils.constants import (
-    APP_NAME, OPEN_FILE_FILTER, SAVE_FILE_FILTER, SUPPORTED_FORMATS,
+    APP_NAME, ARCHIVE_FILE_FILTER, DIALOG_ACTION_PROPERTY, OPEN_ANY_FILTER, OPEN_FILE_FILTER,
+    SAVE_FILE_FILTER, SUPPORTED_FORMATS,
 )
 
+if TYPE_CHECKING:
+    # 대화상자 · 내보내기 · 프로젝트 · 저널 모듈과 Pillow는 처음 쓸 때 읽습니다 (앱 시작 시간 단축)
+    from PIL import Image
+    from src.core.export_budget import EncodeResult, ExportBudget
+    from src.core.folder_scan import FolderScan
+    from src.core.journal import EditJournal
+    from src.core.project import ProjectReader
+    from src.core.recipe import Recipe
+    from src.core.resize import ResizeSpec
+    from src.core.watch_folder import Arrival
+    from src.ui.export_options import ExportSettings
+    from src.ui.history_panel import HistoryPanel
+    from src.ui.resource_inspector import ResourceInspector, ResourceReport
+    from src.ui.watch_folder import FolderWatch
+
 # 파일 탐색기 썸네일 크기
 _THUMB_W = 120
 _THUMB_H = 80
 
 
+class _ProjectSource:
+    """프로젝트에서 연 슬롯의 지연 로더 (표시 프록시 · 전체 해상도 원본)."""
+
+    def __init__(self, reader: ProjectReader, index: int) -> None:
+        self.reader = reader
+        self.index = index
+
+    def load_image(self) -> Image.Image:
+        return self.reader.load_pixels(self.index)
+
+    def load_pixmap(self) -> QPixmap:
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(self.reader.proxy(self.index)):
+            # 프록시가 없으면 원본에서 생성
+            record = self.reader.records[self.index]
+            image = self.load_image()
+            size = (max(1, int(image.width * record.scale)), max(1, int(image.height * record.scale)))
+            from PIL import Image
+            pixmap = _pil_to_pixmap(image.resize(size, Image.LANCZOS) if size != image.size else image)
+        return pixmap
+
+
+class _FileSource:
+    """파일에서 읽는 슬롯의 지연 로더 (리소스 검사기에서 캐시를 비운 뒤 다시 읽음).
+
+    crop_box가 있으면 읽은 뒤 그 영역으로 자릅니다 (자르기 레시피를 적용한 감시 폴더 슬롯).
+    """
+
+    def __init__(
+        self, handler: ImageHandler, path: str, scale: float, crop_box: Optional[tuple] = None,
+    ) -> None:
+        self.handler = handler
+        self.path = path
+        self.scale = scale
+        self.crop_box = crop_box
+
+    def load_image(self) -> Image.Image:
+        image = self.handler.load(self.path)
+        return image.crop(self.crop_box) if self.crop_box is not None else image
+
+    def load_pixmap(self) -> QPixmap:
+        image = self.load_image()
+        size = (max(1, int(image.width * self.scale)), max(1, int(image.height * self.scale)))
+        from PIL import Image
+        return _pil_to_pixmap(image.resize(size, Image.LANCZOS) if size != image.size else image)
+
+
 @dataclass
 class _FileSlot:
-    """파일 하나에 해당하는 이미지/스케일/픽스맵/도형 세트."""
+    """파일 하나에 해당하는 이미지/스케일/픽스맵/도형 세트.
+
+    source가 있으면 image · pixmap을 None으로 만들고 처음 접근할 때 읽습니다.
+    """
     path: str
     image: Image.Image
     scale: float
     pixmap: QPixmap
     shape_manager: ShapeManager
     zoom: float = 1.0
+    synced: bool = True  # image가 path 파일 내용과 일치하는지 (자르기 후 False)
+    crop_box: Optional[tuple] = None  # 파일 기준 누적 자르기 영역 (left, top, right, bottom) px
+    source: Optional[_ProjectSource | _FileSource] = None
+    sha256: Optional[str] = None  # 프로젝트 저장 시 재사용하는 원본 해시
+    history: Optional[EditHistory] = None  # 도형 편집 타임라인 (_track_slot에서 생성)
+
+    @property
+    def pixels_loaded(self) -> bool:
+        return self.__dict__.get("_image") is not None
+
+    def peek_image(self) -> Image.Image:
+        """읽어 둔 원본, 없으면 source에서 새로 읽되 슬롯에 남기지 않습니다 (워커 스레드에서 불러도 됨)."""
+        image = self.__dict__.get("_image")
+        if image is None and self.source is not None:
+            image = self.source.load_image()
+        return image
+
+
+def _lazy_slot_field(name: str, load: str) -> property:
+    key = f"_{name}"
+
+    def get(self: _FileSlot):
+        value = self.__dict__.get(key)
+        if value is None and self.source is not None:
+            value = getattr(self.source, load)()
+            self.__dict__[key] = value
+        return value
+
+    def set(self: _FileSlot, value) -> None:
+        self.__dict__[key] = value
+
+    return property(get, set)
+
+
+# dataclass __init__이 만든 대입(self.image = ...)도 이 속성을 거칩니다
+_FileSlot.image = _lazy_slot_field("image", "load_image")
+_FileSlot.pixmap = _lazy_slot_field("pixmap", "load_pixmap")
+
+
+@dataclass
+class _PreSaveState:
+    """저장 되돌리기용 이전 상태. 픽셀은 디스크 스냅샷 핸들로만 보관합니다."""
+    snapshot: Snapshot
+    scale: float
+    shape_manager: ShapeManager
+    zoom: float
+    synced: bool
+    crop_box: Optional[tuple]
+
+
+def _describe_options(result: EncodeResult) -> str:
+    """상태바 표시용 인코딩 옵션 요약."""
+    if "quality" in result.options:
+        return f"quality {result.options['quality']}"
+    if "colors" in result.options:
+        return f"{result.options['colors']} colors"
+    return "lossless" if result.format == "PNG" else result.format
+
+
+def _pixmap_bytes(pixmap: QPixmap, fmt: str) -> bytes:
+    """QPixmap을 PNG/JPG 바이트로 인코딩합니다 (프로젝트 저장용)."""
+    if pixmap is None or pixmap.isNull():
+        return b""
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    pixmap.save(buffer, fmt, 90 if fmt == "JPG" else -1)
+    buffer.close()
+    return bytes(data)
+
+
+def _qpixmap_bytes(pixmap: Optional[QPixmap]) -> int:
+    """QPixmap이 차지하는 대략적인 메모리."""
+    if pixmap is None or pixmap.isNull():
+        return 0
+    return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+
+
+def _compose_crop(outer: Optional[tuple], inner: tuple) -> tuple:
+    """이미 잘린 이미지(outer 기준)에서 다시 자른 영역을 파일 기준 좌표로 합성합니다."""
+    if outer is None:
+        return tuple(inner)
+    left, top = outer[0], outer[1]
+    return (left + inner[0], top + inner[1], left + inner[2], top + inner[3])
+
+
+def _crop_shapes(shapes: List[Shape], left: int, top: int, width: int, height: int) -> List[Shape]:
+    """도형을 자르기 원점 기준으로 이동하고 영역에 맞게 잘라냅니다 (base_scale 좌표, 영역 밖 도형 제거)."""
+    result = []
+    for shape in shapes:
+        new_x = shape.x - left
+        new_y = shape.y - top
+        if (new_x + shape.width > 0 and new_y + shape.height > 0
+                and new_x < width and new_y < height):
+            clamped_x = max(0, new_x)
+            clamped_y = max(0, new_y)
+            clamped_w = min(new_x + shape.width, width) - clamped_x
+            clamped_h = min(new_y + shape.height, height) - clamped_y
+            if clamped_w > 2 and clamped_h > 2:
+                result.append(Shape(
+                    shape_type=shape.shape_type,
+                    x=clamped_x, y=clamped_y,
+                    width=clamped_w, height=clamped_h,
+                    pen_color=shape.pen_color,
+                    pen_width=shape.pen_width,
+                    fill_color=shape.fill_color,
+                    blur_radius=shape.blur_radius,
+                ))
+    return result
 
 
 class MainWindow(QMainWindow):
-    def __init__(self) -> None:
+    # 저장 큐 워커 스레드 → GUI 스레드 완료 알림 (path, error)
+    _save_finished = pyqtSignal(str, object)
+    # open_paths 호출 시 (경로 목록) — 입력 기록용
+    paths_opened = pyqtSignal(list)
+    # 폴더 가져오기 워커 → GUI 스레드 (탐색, (경로, 메타데이터) 묶음) / (탐색, 찾은 수, 건너뛴 수, 취소 여부)
+    _folder_batch = pyqtSignal(object, list)
+    _folder_done = pyqtSignal(object, int, int, bool)
+    # 프로젝트 원본 해시 확인 워커 → GUI 스레드 (리더, 내용이 바뀐 슬롯 인덱스)
+    _project_checked = pyqtSignal(object, list)
+    # 썸네일 워커 → GUI 스레드 [(슬롯, RGBA 썸네일)]
+    _thumbnails_ready = pyqtSignal(list)
+
+    def __init__(self, recovery_dir: Optional[str] = None, defer_startup: bool = False) -> None:
+        """defer_startup이면 편집 저널 등 첫 화면에 필요 없는 초기화를 finish_startup()까지 미룹니다."""
         super().__init__()
         self.setWindowTitle(APP_NAME)
         self.setMinimumSize(900, 660)
@@ -46,13 +246,53 @@ class MainWindow(QMainWindow):
         self._current_slot_index: int = -1
         self._pre_crop_slot: Optional[_FileSlot] = None
         self._pre_crop_slot_index: int = -1
-        self._pre_save_slots: dict[int, _FileSlot] = {}
+        self._pre_save_slots: dict[int, _PreSaveState] = {}
+        self._snapshots = SnapshotStore()
+        self._save_queue = SaveQueue(on_complete=self._save_finished.emit)
+        self._save_finished.connect(self._on_save_finished)
         self._clipboard_shape: Optional[Shape] = None
+        self._recipe: Optional[Recipe] = None
+        self._recipe_source: Optional[ShapeManager] = None  # 레시피를 복사한 슬롯 (같은 파일의 다른 슬롯과 구분)
+        self._project_readers: List[ProjectReader] = []
+        # id(ShapeManager) → 슬롯 인덱스 (도형 편집마다 슬롯을 훑지 않도록)
+        self._manager_slots: dict[int, int] = {}
+        self._folder_scan: Optional[FolderScan] = None
+        self._folder_watch: Optional[FolderWatch] = None
+        self._watch_recipe: Optional[Recipe] = None
+        self._watch_arrivals = 0
+        self._folder_started = 0.0
+        self._folder_batch.connect(self._on_folder_batch)
+        self._folder_done.connect(self._on_folder_done)
+        self._project_check: Optional[threading.Thread] = None
+        self._project_checked.connect(self._on_project_checked)
+        self._thumbnails = ThumbnailLoader(self._thumbnails_ready.emit, (_THUMB_W, _THUMB_H))
+        self._thumbnails_ready.connect(self._on_thumbnails)
+        # 편집 저널 (크래시 복구용). recovery_dir이 없으면 기록하지 않습니다.
+        self._recovery_dir = recovery_dir
+        self._journal: Optional[EditJournal] = None
+        self._startup_finished = False
+        self._seeking_history = False  # 타임라인 이동 중 (히스토리에 기록하지 않음)
+        # 편집 기록 패널 · 리소스 검사기는 처음 열 때 생성
+        self._history_panel: Optional[HistoryPanel] = None
+        self._resource_inspector: Optional[ResourceInspector] = None
         # 기본 ShapeManager (파일 로드 전 캔버스용)
         self._default_sm = ShapeManager()
         self._setup_menubar()
         self._setup_central()
         self._setup_statusbar()
+        if not defer_startup:
+            self.finish_startup()
+
+    def finish_startup(self) -> None:
+        """미뤄 둔 초기화: 편집 저널을 열고 그 전에 연 슬롯을 기록합니다 (두 번째 호출부터 무시)."""
+        if self._startup_finished:
+            return
+        self._startup_finished = True
+        if self._recovery_dir:
+            from src.core.journal import EditJournal, new_session_dir
+            self._journal = EditJournal(new_session_dir(self._recovery_dir))
+            for index in range(len(self._file_slots)):
+                self._track_slot(index)
 
     # ── 공개 속성 ────────────────────────────────────────────────
     @property
@@ -71,6 +311,21 @@ class MainWindow(QMainWindow):
     def file_count(self) -> int:
         return len(self._file_slots)
 
+    def closeEvent(self, event) -> None:
+        # 대기 중인 저장을 마친 뒤 세션 스냅샷 임시 폴더 정리
+        self._save_queue.close()
+        self._snapshots.close()
+        self._explorer.stop_scanning()
+        self._thumbnails.close()
+        self._cancel_folder_scan()
+        self.stop_watching()
+        self._close_project_readers()
+        archive.close_all()
+        if self._journal is not None:
+            # 정상 종료: 세션 저널 삭제
+            self._journal.close(discard=True)
+        super().closeEvent(event)
+
     # ── 메뉴바 ──────────────────────────────────────────────────
     def _setup_menubar(self) -> None:
         mb = self.menuBar()
@@ -80,14 +335,36 @@ class MainWindow(QMainWindow):
         open_action = QAction("Open…", self)
         open_action.setShortcut(QKeySequence("Ctrl+O"))
         open_action.triggered.connect(self._open_file)
+        open_folder_action = QAction("Open Folder…", self)
+        open_folder_action.setShortcut(QKeySequence("Ctrl+Alt+O"))
+        open_folder_action.triggered.connect(self._open_folder)
         export_action = QAction("Export…", self)
         export_action.setShortcut(QKeySequence("Ctrl+Shift+S"))
         export_action.triggered.connect(self._export_file)
+        export_options_action = QAction("Export with Options…", self)
+        export_options_action.setShortcut(QKeySequence("Ctrl+Alt+S"))
+        export_options_action.triggered.connect(self._export_file_with_options)
         batch_export_action = QAction("Batch Export…", self)
         batch_export_action.setShortcut(QKeySequence("Ctrl+Shift+E"))
         batch_export_action.triggered.connect(self._batch_export)
+        self._watch_action = QAction("Watch Folder…", self)
+        self._watch_action.setCheckable(True)
+        self._watch_action.setShortcut(QKeySequence("Ctrl+Alt+W"))
+        self._watch_action.toggled.connect(self._set_watching)
+        open_project_action = QAction("Open Project…", self)
+        open_project_action.setShortcut(QKeySequence("Ctrl+Shift+O"))
+        open_project_action.triggered.connect(lambda: self._open_project())
+        save_project_action = QAction("Save Project…", self)
+        save_project_action.setShortcut(QKeySequence("Ctrl+Shift+P"))
+        save_project_action.triggered.connect(lambda: self._save_project())
         file_menu.addAction(open_action)
+        file_menu.addAction(open_folder_action)
+        file_menu.addAction(self._watch_action)
+        file_menu.addAction(open_project_action)
+        file_menu.addAction(save_project_action)
+        file_menu.addSeparator()
         file_menu.addAction(export_action)
+        file_menu.addAction(export_options_action)
         file_menu.addAction(batch_export_action)
 
         # Edit
@@ -109,6 +386,30 @@ class MainWindow(QMainWindow):
         edit_menu.addSeparator()
         edit_menu.addAction(copy_action)
         edit_menu.addAction(paste_action)
+        edit_menu.addSeparator()
+        copy_recipe_action = QAction("Copy Recipe", self)
+        copy_recipe_action.setShortcut(QKeySequence("Ctrl+Shift+C"))
+        copy_recipe_action.triggered.connect(self._copy_recipe)
+        apply_selected_action = QAction("Apply Recipe to Selected", self)
+        apply_selected_action.setShortcut(QKeySequence("Ctrl+Shift+V"))
+        apply_selected_action.triggered.connect(
+            lambda: self._apply_recipe_to(self._explorer.selected_indices())
+        )
+        apply_all_action = QAction("Apply Recipe to All", self)
+        apply_all_action.triggered.connect(
+            lambda: self._apply_recipe_to(range(len(self._file_slots)))
+        )
+        save_recipe_action = QAction("Save Recipe…", self)
+        save_recipe_action.triggered.connect(self._save_recipe)
+        edit_menu.addAction(copy_recipe_action)
+        edit_menu.addAction(apply_selected_action)
+        edit_menu.addAction(apply_all_action)
+        edit_menu.addAction(save_recipe_action)
+        edit_menu.addSeparator()
+        propagate_action = QAction("Find Selected in Other Files", self)
+        propagate_action.setShortcut(QKeySequence("Ctrl+Shift+F"))
+        propagate_action.triggered.connect(self._propagate_selected_shape)
+        edit_menu.addAction(propagate_action)
 
         # View
         view_menu = mb.addMenu("View")
@@ -124,12 +425,42 @@ class MainWindow(QMainWindow):
         view_menu.addAction(zoom_in_action)
         view_menu.addAction(zoom_out_action)
         view_menu.addAction(zoom_reset_action)
+        view_menu.addSeparator()
+        self._history_action = QAction("Edit History", self)
+        self._history_action.setCheckable(True)
+        self._history_action.setShortcut(QKeySequence("Ctrl+H"))
+        self._history_action.toggled.connect(self._set_history_visible)
+        view_menu.addAction(self._history_action)
+        self._profile_action = QAction("Record Profile", self)
+        self._profile_action.setCheckable(True)
+        self._profile_action.setChecked(profiling.is_enabled())
+        self._profile_action.setShortcut(QKeySequence("Ctrl+Alt+P"))
+        self._profile_action.toggled.connect(self._toggle_profiling)
+        view_menu.addAction(self._profile_action)
+        hud_action = QAction("Performance HUD", self)
+        hud_action.setCheckable(True)
+        hud_action.setShortcut(QKeySequence("Ctrl+Alt+H"))
+        hud_action.toggled.connect(lambda on: setattr(self._canvas, "hud_visible", on))
+        view_menu.addAction(hud_action)
+        inspector_action = QAction("Resource Inspector…", self)
+        inspector_action.setShortcut(QKeySequence("Ctrl+Alt+R"))
+        inspector_action.triggered.connect(self._show_resource_inspector)
+        view_menu.addAction(inspector_action)
+
+        # 대화상자를 띄우는 액션 (입력 트레이스 재생에서 제외). Record Profile은 끌 때 저장 위치를 물음
+        for action in (
+            open_action, open_folder_action, self._watch_action, open_project_action, save_project_action,
+            export_action, export_options_action, batch_export_action, save_recipe_action,
+            self._profile_action, inspector_action,
+        ):
+            action.setProperty(DIALOG_ACTION_PROPERTY, True)
 
     # ── 중앙 위젯 ───────────────────────────────────────────────
     def _setup_central(self) -> None:
         self._canvas = Canvas(self._default_sm)
         self._toolbar = Toolbar()
         self._explorer = FileExplorer()
+        self._explorer.set_thumbnail_provider(self._slot_thumbnail)
 
         # 도구바 행 (도형 도구 + 속성이 통합됨)
         tool_row = QWidget()
@@ -161,6 +492,7 @@ class MainWindow(QMainWindow):
         splitter.setStretchFactor(0, 1)   # 캔버스 영역이 늘어남
         splitter.setStretchFactor(1, 0)   # 탐색기는 고정 폭 유지
         splitter.setSizes([700, 160])
+        self._splitter = splitter
 
         # 전체 레이아웃
         container = QWidget()
@@ -191,6 +523,7 @@ class MainWindow(QMainWindow):
         self._explorer.file_selected.connect(self._switch_to_file)
         self._explorer.file_delete_requested.connect(self._delete_file)
         self._canvas.selection_changed.connect(self._on_selection_changed)
+        self._canvas.set_hud_provider(self._hud_lines)
 
     # ── 상태바 ──────────────────────────────────────────────────
     def _setup_statusbar(self) -> None:
@@ -204,10 +537,12 @@ class MainWindow(QMainWindow):
         scale = self._canvas._calc_scale(image.size, max_size)
         display_w = int(image.width * scale)
         display_h = int(image.height * scale)
-        display_img = (
-            image.resize((display_w, display_h), Image.LANCZOS)
-            if scale != 1.0 else image
-        )
+        with profiling.span("resize", size=image.size, to=(display_w, display_h)):
+            from PIL import Image
+            display_img = (
+                image.resize((display_w, display_h), Image.LANCZOS)
+                if scale != 1.0 else image
+            )
         pixmap = _pil_to_pixmap(display_img)
         return _FileSlot(
             path=path,
@@ -219,9 +554,39 @@ class MainWindow(QMainWindow):
 
     def _make_thumbnail(self, image: Image.Image) -> QPixmap:
         """파일 탐색기용 썸네일 QPixmap을 생성합니다."""
-        thumb = image.copy()
-        thumb.thumbnail((_THUMB_W, _THUMB_H), Image.LANCZOS)
-        return _pil_to_pixmap(thumb)
+        with profiling.span("thumbnail", size=image.size):
+            thumb = image.copy()
+            from PIL import Image
+            thumb.thumbnail((_THUMB_W, _THUMB_H), Image.LANCZOS)
+            return _pil_to_pixmap(thumb)
+
+    def _slot_thumbnail(self, index: int) -> Optional[QPixmap]:
+        """탐색기 캐시에 없는 썸네일: 표시 픽스맵을 줄여 만듭니다 (원본을 디코딩하지 않음).
+
+        아직 보지 않은 슬롯 (폴더 가져오기 · ZIP 등)은 워커가 파일에서 줄여 만들어 나중에 전달하고
+        None을 반환합니다 (원본을 슬롯에 남기지 않고 GUI 스레드를 막지 않음).
+        """
+        if not (0 <= index < len(self._file_slots)):
+            return None
+        slot = self._file_slots[index]
+        if isinstance(slot.source, _FileSource) and slot.__dict__.get("_pixmap") is None:
+            self._thumbnails.request(id(slot), slot, slot.path, slot.source.crop_box)
+            return None
+        pixmap = slot.pixmap
+        if pixmap is None or pixmap.isNull():
+            return None
+        with profiling.span("thumbnail", slot=index, size=(pixmap.width(), pixmap.height())):
+            return pixmap.scaled(
+                _THUMB_W, _THUMB_H,
+                Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation,
+            )
+
+    def _on_thumbnails(self, batch: list) -> None:
+        """워커가 만든 썸네일을 (그 사이 삭제되지 않은) 슬롯의 탐색기 행에 반영합니다."""
+        for slot, image in batch:
+            index = self._slot_index_of(slot.shape_manager)
+            if index >= 0:
+                self._explorer.update_thumbnail(index, _pil_to_pixmap(image))
 
     def _switch_to_file(self, index: int) -> None:
         """파일 탐색기에서 파일 선택 시 캔버스를 전환합니다."""
@@ -239,8 +604,17 @@ class MainWindow(QMainWindow):
             self._file_slots[self._current_slot_index].zoom = self._canvas.zoom
         self._current_slot_index = index
         slot = self._file_slots[index]
-        self._canvas.set_slot(slot.image, slot.scale, slot.pixmap, slot.shape_manager, slot.zoom)
+        with profiling.span("switch_slot", slot=index, shapes=len(slot.shape_manager.shapes)):
+            if slot.pixels_loaded or slot.source is None:
+                self._canvas.set_slot(slot.image, slot.scale, slot.pixmap, slot.shape_manager, slot.zoom)
+            else:
+                # 프록시로 즉시 표시, 원본은 자르기/내보내기/줌 등 필요할 때 읽음
+                self._canvas.set_slot(
+                    None, slot.scale, slot.pixmap, slot.shape_manager, slot.zoom,
+                    image_loader=lambda: slot.image,
+                )
         self._explorer.set_current(index)
+        self._set_panel_history(slot.history)
         self._toolbar.set_save_undo_enabled(index in self._pre_save_slots)
         self._status_label.setText(slot.path.split("/")[-1])
 
@@ -252,25 +626,33 @@ class MainWindow(QMainWindow):
         self._pre_crop_slot = None
         self._toolbar.set_crop_undo_enabled(False)
         # 저장 되돌리기: 삭제된 인덱스 제거 + 인덱스 재조정
-        new_pre_save: dict[int, _FileSlot] = {}
+        new_pre_save: dict[int, _PreSaveState] = {}
         for k, v in self._pre_save_slots.items():
             if k < index:
                 new_pre_save[k] = v
             elif k > index:
                 new_pre_save[k - 1] = v
+            else:
+                self._snapshots.discard(v.snapshot)
         self._pre_save_slots = new_pre_save
 
         was_current = (index == self._current_slot_index)
 
         # 불변 방식으로 슬롯 제거
         self._file_slots = [*self._file_slots[:index], *self._file_slots[index + 1:]]
+        self._manager_slots = {
+            key: i - (i > index) for key, i in self._manager_slots.items() if i != index
+        }
         self._explorer.remove_file(index)
+        if self._journal is not None:
+            self._journal.record_delete(index)
 
         if not self._file_slots:
             # 모든 파일이 삭제됨
             self._current_slot_index = -1
             self._canvas._shape_manager = self._default_sm
             self._canvas.clear_image()
+            self._set_panel_history(None)
             self._status_label.setText("Ready")
             return
 
@@ -288,39 +670,181 @@ class MainWindow(QMainWindow):
         if self._canvas.crop_mode:
             self._canvas.crop_mode = False
             self._toolbar.exit_crop_mode()
+        self._cancel_folder_scan()
         self._file_slots = []
+        self._manager_slots = {}
         self._current_slot_index = -1
         self._pre_crop_slot = None
+        for state in self._pre_save_slots.values():
+            self._snapshots.discard(state.snapshot)
         self._pre_save_slots = {}
         self._toolbar.set_crop_undo_enabled(False)
         self._toolbar.set_save_undo_enabled(False)
         self._explorer.clear()
+        self._set_panel_history(None)
         self._canvas.clear_image()
         self._canvas._shape_manager = self._default_sm
+        self._close_project_readers()
+        if self._journal is not None:
+            self._journal.record_reset()
         self._status_label.setText("Ready")
 
     # ── 액션 핸들러 ─────────────────────────────────────────────
     def _open_file(self) -> None:
         paths, _ = QFileDialog.getOpenFileNames(
-            self, "Open Image", "", OPEN_FILE_FILTER
+            self, "Open Image", "", f"{OPEN_ANY_FILTER};;{OPEN_FILE_FILTER};;{ARCHIVE_FILE_FILTER}"
         )
-        if not paths:
-            return
-        vp = self._scroll.viewport().size()
-        max_size = (max(vp.width() - 10, 400), max(vp.height() - 10, 300))
+        if paths:
+            self.open_paths(paths)
+
+    def open_paths(self, paths: List[str]) -> int:
+        """이미지 파일들을 슬롯으로 추가하고 마지막 파일로 전환합니다. 추가한 파일 수를 반환합니다.
+
+        ZIP 묶음은 풀지 않고 이미지 멤버마다 슬롯을 만듭니다 (픽셀은 처음 볼 때 읽음).
+        """
+        self.paths_opened.emit(list(paths))
+        max_size = self._display_max_size()
+        opened = 0
         for path in paths:
+            if archive.is_archive(path):
+                opened += self._open_archive(path)
+                continue
             try:
-                slot = self._build_slot(path, max_size)
-                thumb = self._make_thumbnail(slot.image)
+                with profiling.span("open_slot", slot=len(self._file_slots), path=os.path.basename(path)):
+                    slot = self._build_slot(path, max_size)
                 self._file_slots.append(slot)
-                self._explorer.add_file(path, thumb)
+                self._explorer.add_file(path)  # 썸네일은 목록에 보일 때 만듦
+                self._track_slot(len(self._file_slots) - 1)
+                opened += 1
             except Exception as e:
                 QMessageBox.warning(self, "열기 실패", f"이미지를 열 수 없습니다.\n{path}\n{e}")
         if self._file_slots:
             self._switch_to_file(len(self._file_slots) - 1)
+        return opened
+
+    def _open_archive(self, path: str) -> int:
+        """ZIP 묶음의 이미지 멤버를 픽셀을 읽지 않은 슬롯으로 추가합니다. 추가한 수를 반환합니다."""
+        from src.core.image_meta import read_meta
+        try:
+            members = archive.list_images(path)
+        except Exception as e:
+            QMessageBox.warning(self, "열기 실패", f"ZIP 파일을 열 수 없습니다.\n{path}\n{e}")
+            return 0
+        items, failed = [], []
+        with profiling.span("open_archive", path=os.path.basename(path), members=len(members)):
+            for member in members:
+                try:
+                    items.append((member, read_meta(member)))  # 헤더만 (멤버 앞부분만 압축 해제)
+                except Exception:
+                    failed.append(member.partition(archive.MEMBER_SEPARATOR)[2])
+            if items:
+                self._append_lazy_slots(items)
+        if failed:
+            QMessageBox.warning(
+                self, "열기 실패", "ZIP 안의 이미지를 읽을 수 없어 제외했습니다.\n" + "\n".join(failed),
+            )
+        return len(items)
+
+    def _display_max_size(self) -> tuple:
+        """표시 픽스맵의 최대 크기 (캔버스 뷰포트 기준)."""
+        vp = self._scroll.viewport().size()
+        return (max(vp.width() - 10, 400), max(vp.height() - 10, 300))
+
+    def _open_folder(self) -> None:
+        root = QFileDialog.getExistingDirectory(self, "Open Folder")
+        if root:
+            self.open_folder(root)
+
+    def open_folder(self, root: str) -> FolderScan:
+        """root 아래(하위 폴더 포함) 이미지를 백그라운드에서 찾아, 찾는 대로 슬롯으로 추가합니다.
+
+        슬롯은 헤더에서 읽은 크기로만 만들고 픽셀은 처음 볼 때 읽습니다.
+        진행 중인 폴더 가져오기는 취소합니다.
+        """
+        from src.core.folder_scan import FolderScan
+        self._cancel_folder_scan()
+        # 콜백은 start() 이후에만 불리므로 scan을 클로저로 참조해도 됨
+        scan = FolderScan(
+            root,
+            on_batch=lambda batch: self._folder_batch.emit(scan, batch),
+            on_done=lambda found, skipped, cancelled: self._folder_done.emit(scan, found, skipped, cancelled),
+        )
+        self._folder_scan = scan
+        self._folder_started = time.perf_counter()
+        self._status_label.setText(f"폴더 읽는 중: {os.path.basename(root) or root}")
+        scan.start()
+        return scan
+
+    def _cancel_folder_scan(self) -> None:
+        if self._folder_scan is not None:
+            self._folder_scan.cancel()
+            self._folder_scan = None
+
+    def _on_folder_batch(self, scan: FolderScan, batch: list) -> None:
+        if scan is not self._folder_scan:
+            return  # 취소한 탐색이 보낸 묶음
+        with profiling.span("open_folder_batch", files=len(batch)):
+            first = self._append_lazy_slots(batch)
+        if self._current_slot_index < 0:
+            self._switch_to_file(first)
+        self._status_label.setText(f"폴더 읽는 중: {scan.found}개 파일")
+
+    def _append_lazy_slots(self, items: list, thumbnails: Optional[list] = None, crop: Optional[tuple] = None) -> int:
+        """(경로, 메타데이터) 목록을 픽셀을 읽지 않은 슬롯으로 추가합니다. 첫 새 슬롯 인덱스를 반환합니다.
+
+        crop(파일 기준 px)이 있으면 처음 볼 때 그 영역으로 잘라 읽습니다. 이미지와 겹치지 않는 파일은 자르지 않습니다.
+        """
+        from src.core.recipe import clip_box
+        max_size = self._display_max_size()
+        first = len(self._file_slots)
+        for path, meta in items:
+            box = clip_box(crop, (meta.width, meta.height)) if crop is not None else None
+            size = (box[2] - box[0], box[3] - box[1]) if box is not None else (meta.width, meta.height)
+            scale = self._canvas._calc_scale(size, max_size)
+            self._file_slots.append(_FileSlot(
+                path=path,
+                image=None,
+                scale=scale,
+                pixmap=None,
+                shape_manager=ShapeManager(),
+                synced=box is None,
+                crop_box=box,
+                source=_FileSource(self._handler, path, scale, box),
+            ))
+        self._explorer.add_files([path for path, _ in items], [meta for _, meta in items], thumbnails)
+        for index in range(first, len(self._file_slots)):
+            self._track_slot(index)
+        return first
+
+    def _on_folder_done(self, scan: FolderScan, found: int, skipped: int, cancelled: bool) -> None:
+        if scan is not self._folder_scan:
+            return
+        self._folder_scan = None
+        elapsed = (time.perf_counter() - self._folder_started) * 1000
+        message = f"폴더 가져오기: {found}개 파일 ({elapsed:.0f} ms)"
+        if skipped:
+            message += f", 읽을 수 없는 파일 {skipped}개 제외"
+        self._status_label.setText(message)
+        if not found and not cancelled:
+            QMessageBox.information(self, "폴더 열기", f"이미지를 찾지 못했습니다.\n{scan.root}")
 
     def _export_file(self) -> None:
-        if self._canvas.image is None:
+        from src.ui.export_options import ExportSettings
+        self._export_current(ExportSettings())
+
+    def _export_file_with_options(self) -> None:
+        """크기 조절 · 크기/화질 제한 등 옵션을 지정해 내보냅니다."""
+        from src.ui.export_options import ExportOptionsDialog
+        if not self._canvas.has_image:
+            QMessageBox.information(self, "내보내기", "먼저 이미지를 불러오세요.")
+            return
+        dialog = ExportOptionsDialog(self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        self._export_current(dialog.settings())
+
+    def _export_current(self, settings: ExportSettings) -> None:
+        if not self._canvas.has_image:
             QMessageBox.information(self, "내보내기", "먼저 이미지를 불러오세요.")
             return
         path, _ = QFileDialog.getSaveFileName(
@@ -329,32 +853,89 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            composite = self._canvas.render_to_image()
-            self._handler.save(composite, path)
-            self._status_label.setText(f"Exported: {path.split('/')[-1]}")
+            composite = self._canvas.render_to_image(resize=settings.resize)
+            result = self._write_export(composite, path, None, settings.budget)
+            name = path.split('/')[-1]
+            if result is None:
+                self._status_label.setText(f"Exported: {name}")
+            else:
+                self._status_label.setText(
+                    f"Exported: {name} ({result.size / 1024:.0f} KB, {_describe_options(result)})"
+                )
+                if not result.fits:
+                    QMessageBox.warning(
+                        self, "내보내기",
+                        f"지정한 제한을 만족할 수 없어 가장 근접한 결과로 저장했습니다.\n"
+                        f"{name}: {result.size / 1024:.0f} KB",
+                    )
         except Exception as e:
             QMessageBox.warning(self, "내보내기 실패", f"이미지를 저장할 수 없습니다.\n{e}")
             self._status_label.setText("Ready")
 
+    def _write_export(
+        self,
+        composite: Image.Image,
+        path: str,
+        format: Optional[str],
+        budget: Optional[ExportBudget],
+    ) -> Optional[EncodeResult]:
+        """합성 이미지를 내보냅니다. 제한이 있으면 메모리에서 최적 인코딩을 찾은 뒤 한 번만 씁니다."""
+        from src.core.export_budget import encode_within_budget
+        if budget is None:
+            self._handler.save(composite, path, format=format)
+            return None
+        fmt = self._handler.resolve_format(path, format)
+        result = encode_within_budget(
+            composite, fmt, budget, handler=self._handler,
+        )
+        Path(path).write_bytes(result.data)
+        return result
+
     def _save_file(self) -> None:
-        """현재 편집 중인 파일을 원본 경로에 덮어쓰기 저장합니다."""
+        """현재 편집 중인 파일을 원본 경로에 덮어쓰기 저장합니다.
+
+        파일 쓰기는 백그라운드 저장 큐에서 원자적으로 처리되고,
+        UI는 이미 합성한 이미지로 즉시 갱신됩니다.
+        """
         idx = self._current_slot_index
         if not (0 <= idx < len(self._file_slots)):
             QMessageBox.information(self, "저장", "먼저 이미지를 불러오세요.")
             return
         slot = self._file_slots[idx]
+        if archive.split_member(slot.path) is not None:
+            QMessageBox.information(
+                self, "저장", "ZIP 묶음 안의 파일은 덮어쓸 수 없습니다. 내보내기를 사용하세요.",
+            )
+            return
+        snapshot: Optional[Snapshot] = None
         try:
-            # 되돌리기용 이전 상태 저장
-            self._pre_save_slots[idx] = slot
-            # 도형 합성 이미지 생성 및 저장
+            self._handler.resolve_format(slot.path)
+            # 되돌리기용 이전 상태를 디스크로 스필 (픽셀 복사/인코딩은 백그라운드).
+            # 같은 파일의 쓰기가 아직 진행 중이면 디스크 내용이 슬롯과 다를 수 있으므로
+            # 파일 바이트 대신 픽셀을 스필합니다.
+            synced = slot.synced and not self._save_queue.is_pending(slot.path)
+            snapshot = self._snapshots.spill(slot.image, slot.path, synced)
+            # 도형 합성 이미지 생성 → 저장 큐에 등록 (원본 바이트 사본이 끝난 뒤 교체)
             composite = self._render_slot_to_image(slot)
-            self._handler.save(composite, slot.path)
+            self._save_queue.save_image(composite, slot.path, after=snapshot.future)
+            previous = self._pre_save_slots.get(idx)
+            if previous is not None:
+                self._snapshots.discard(previous.snapshot)
+            self._pre_save_slots[idx] = _PreSaveState(
+                snapshot=snapshot,
+                scale=slot.scale,
+                shape_manager=slot.shape_manager,
+                zoom=slot.zoom,
+                synced=slot.synced,
+                crop_box=slot.crop_box,
+            )
             # 저장된 이미지로 슬롯 교체 (도형은 이미 합성됨)
             vp = self._scroll.viewport().size()
             max_size = (max(vp.width() - 10, 400), max(vp.height() - 10, 300))
             new_scale = self._canvas._calc_scale(composite.size, max_size)
             display_w = int(composite.width * new_scale)
             display_h = int(composite.height * new_scale)
+            from PIL import Image
             display_img = (
                 composite.resize((display_w, display_h), Image.LANCZOS)
                 if new_scale != 1.0 else composite
@@ -371,6 +952,7 @@ class MainWindow(QMainWindow):
             self._file_slots = [
                 *self._file_slots[:idx], new_slot, *self._file_slots[idx + 1:]
             ]
+            self._track_slot(idx)
             # 캔버스/썸네일 갱신
             self._canvas.set_slot(
                 new_slot.image, new_slot.scale, new_slot.pixmap,
@@ -379,26 +961,67 @@ class MainWindow(QMainWindow):
             thumb = self._make_thumbnail(composite)
             self._explorer.update_thumbnail(idx, thumb)
             self._toolbar.set_save_undo_enabled(True)
-            self._status_label.setText(f"저장 완료: {slot.path.split('/')[-1]}")
+            self._status_label.setText(f"저장 중: {slot.path.split('/')[-1]}")
         except Exception as e:
+            registered = self._pre_save_slots.get(idx)
+            if snapshot is not None and (registered is None or registered.snapshot is not snapshot):
+                self._snapshots.discard(snapshot)
             QMessageBox.warning(self, "저장 실패", f"이미지를 저장할 수 없습니다.\n{e}")
 
+    def _on_save_finished(self, path: str, error: Optional[BaseException]) -> None:
+        """저장 큐의 쓰기 완료 알림 (GUI 스레드)."""
+        name = path.split("/")[-1]
+        if error is not None:
+            QMessageBox.warning(self, "저장 실패", f"이미지를 저장할 수 없습니다.\n{path}\n{error}")
+            self._status_label.setText("Ready")
+            return
+        self._status_label.setText(f"저장 완료: {name}")
+        self._explorer.rescan(path)  # 파일 크기 · 수정 날짜가 바뀜
+
     def _undo_save(self) -> None:
-        """저장 되돌리기: 저장 전 상태로 복원합니다."""
+        """저장 되돌리기: 디스크 스냅샷에서 저장 전 상태로 복원합니다."""
         idx = self._current_slot_index
         if idx not in self._pre_save_slots:
             return
-        old_slot = self._pre_save_slots[idx]
+        state = self._pre_save_slots[idx]
+        snapshot = state.snapshot
+        path = snapshot.source_path
         try:
-            # 원본 이미지를 파일에 다시 저장
-            self._handler.save(old_slot.image, old_slot.path)
+            # 스냅샷 픽셀 로드 + 파일 복원 예약 (원본 바이트 사본 또는 픽셀 재인코딩)
+            image = self._snapshots.load(snapshot)
+
+            def discard() -> None:
+                self._snapshots.discard(snapshot)
+
+            if snapshot.backup_path is not None:
+                self._save_queue.copy_file(snapshot.backup_path, path, on_done=discard)
+            else:
+                self._save_queue.save_image(image, path, on_done=discard)
         except Exception as e:
             QMessageBox.warning(self, "되돌리기 실패", f"파일을 복원할 수 없습니다.\n{e}")
             return
+        display_w = max(1, int(image.width * state.scale))
+        display_h = max(1, int(image.height * state.scale))
+        from PIL import Image
+        display_img = (
+            image.resize((display_w, display_h), Image.LANCZOS)
+            if state.scale != 1.0 else image
+        )
+        old_slot = _FileSlot(
+            path=path,
+            image=image,
+            scale=state.scale,
+            pixmap=_pil_to_pixmap(display_img),
+            shape_manager=state.shape_manager,
+            zoom=state.zoom,
+            synced=state.synced,
+            crop_box=state.crop_box,
+        )
         # 슬롯 복원
         self._file_slots = [
             *self._file_slots[:idx], old_slot, *self._file_slots[idx + 1:]
         ]
+        self._track_slot(idx)
         self._canvas.set_slot(
             old_slot.image, old_slot.scale, old_slot.pixmap,
             old_slot.shape_manager, old_slot.zoom,
@@ -407,10 +1030,13 @@ class MainWindow(QMainWindow):
         self._explorer.update_thumbnail(idx, thumb)
         del self._pre_save_slots[idx]
         self._toolbar.set_save_undo_enabled(idx in self._pre_save_slots)
-        self._status_label.setText(f"저장 되돌리기 완료: {old_slot.path.split('/')[-1]}")
+        self._status_label.setText(f"저장 되돌리기 완료: {path.split('/')[-1]}")
 
     def _batch_export(self) -> None:
         """선택한 파일에 도형 합성 결과를 일괄 내보내기합니다."""
+        from src.core.batch_export import ExportTarget, encode_targets, extension_for
+        from src.core.export_budget import SEARCH_FANOUT
+        from src.ui.export_options import BudgetOptions, ResizeOptions
         if not self._file_slots:
             QMessageBox.information(self, "일괄 내보내기", "먼저 이미지를 불러오세요.")
             return
@@ -457,16 +1083,25 @@ class MainWindow(QMainWindow):
         toggle_row.addStretch()
         layout.addLayout(toggle_row)
 
-        # 포맷 선택
-        form = QFormLayout()
-        format_combo = QComboBox()
+        # 포맷 선택 (여러 포맷 동시 출력, 포맷별 크기 제한)
+        format_label = QLabel("저장 포맷 (복수 선택 가능):")
+        layout.addWidget(format_label)
+        format_form = QFormLayout()
+        format_rows: List[tuple] = []
         for fmt in SUPPORTED_FORMATS:
-            ext = fmt.lower()
-            if ext == "jpeg":
-                ext = "jpg"
-            format_combo.addItem(f"{fmt} (*.{ext})", fmt)
-        form.addRow("저장 포맷:", format_combo)
+            format_cb = QCheckBox(f"{fmt} (*.{extension_for(fmt)})")
+            format_cb.setChecked(fmt == SUPPORTED_FORMATS[0])
+            fmt_budget = BudgetOptions()
+            format_form.addRow(format_cb, fmt_budget)
+            format_rows.append((fmt, format_cb, fmt_budget))
+        layout.addLayout(format_form)
+
+        form = QFormLayout()
+        resize_options = ResizeOptions()
+        form.addRow("크기 조절:", resize_options)
         layout.addLayout(form)
+        zip_cb = QCheckBox("ZIP 파일 하나로 묶어 저장")
+        layout.addWidget(zip_cb)
 
         # 확인/취소 버튼
         buttons = QDialogButtonBox(
@@ -485,15 +1120,36 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "일괄 내보내기", "선택된 파일이 없습니다.")
             return
 
-        chosen_format = format_combo.currentData()
-        ext = chosen_format.lower()
-        if ext == "jpeg":
-            ext = "jpg"
-
-        # 저장 폴더 선택
-        folder = QFileDialog.getExistingDirectory(self, "일괄 내보내기 폴더 선택")
-        if not folder:
+        targets = [
+            ExportTarget(format=fmt, budget=fmt_budget.budget())
+            for fmt, format_cb, fmt_budget in format_rows if format_cb.isChecked()
+        ]
+        if not targets:
+            QMessageBox.information(self, "일괄 내보내기", "선택된 포맷이 없습니다.")
             return
+        resize = resize_options.resize_spec()
+
+        # 저장 위치 선택: 폴더, 또는 결과를 쓰기 스레드가 순서대로 기록하는 ZIP 하나
+        writer: Optional[archive.ZipWriter] = None
+        if zip_cb.isChecked():
+            destination, _ = QFileDialog.getSaveFileName(self, "일괄 내보내기 ZIP", "", ARCHIVE_FILE_FILTER)
+            if not destination:
+                return
+            if not destination.lower().endswith(".zip"):
+                destination += ".zip"
+            try:
+                writer = archive.ZipWriter(destination)
+            except OSError as e:
+                QMessageBox.warning(self, "일괄 내보내기", f"ZIP 파일을 만들 수 없습니다.\n{e}")
+                return
+            write = writer.add
+        else:
+            destination = QFileDialog.getExistingDirectory(self, "일괄 내보내기 폴더 선택")
+            if not destination:
+                return
+
+            def write(filename: str, data: bytes) -> None:
+                (Path(destination) / filename).write_bytes(data)
 
         # 일괄 내보내기 진행
         total = len(selected_indices)
@@ -504,86 +1160,78 @@ class MainWindow(QMainWindow):
 
         exported_count = 0
         errors: List[str] = []
+        over_budget: List[str] = []
+        # 슬롯마다 한 번 합성 → 포맷별 인코딩을 동시에 실행 → 결과를 한 번에 기록.
+        # 크기 제한 탐색은 교착을 피하기 위해 별도 풀을 사용하며, 두 풀 모두 일괄 작업 전체에서 재사용
+        encode_pool = ThreadPoolExecutor(max_workers=len(targets))
+        search_pool = (
+            ThreadPoolExecutor(max_workers=SEARCH_FANOUT)
+            if any(t.budget is not None for t in targets) else None
+        )
 
-        for order, slot_index in enumerate(selected_indices):
-            if progress.wasCanceled():
-                break
-            progress.setValue(order)
-
-            slot = self._file_slots[slot_index]
-            try:
-                composite = self._render_slot_to_image(slot)
-                original_name = Path(slot.path).stem
-                order_number = order + 1
-                filename = f"{order_number}_modified_{original_name}.{ext}"
-                save_path = str(Path(folder) / filename)
-                self._handler.save(composite, save_path, format=chosen_format)
-                exported_count += 1
-            except Exception as e:
-                errors.append(f"{Path(slot.path).name}: {e}")
+        try:
+            for order, slot_index in enumerate(selected_indices):
+                if progress.wasCanceled():
+                    break
+                progress.setValue(order)
+
+                slot = self._file_slots[slot_index]
+                try:
+                    composite = self._render_slot_to_image(slot, resize)
+                    results = encode_targets(
+                        composite, targets, encode_pool, search_pool, self._handler,
+                    )
+                    original_name = Path(slot.path).stem
+                    order_number = order + 1
+                    for target, result in zip(targets, results):
+                        filename = f"{order_number}_modified_{original_name}.{target.extension}"
+                        write(filename, result.data)
+                        exported_count += 1
+                        if not result.fits:
+                            over_budget.append(f"{filename} ({result.size / 1024:.0f} KB)")
+                except Exception as e:
+                    errors.append(f"{Path(slot.path).name}: {e}")
+        finally:
+            encode_pool.shutdown()
+            if search_pool is not None:
+                search_pool.shutdown()
+            if writer is not None:
+                try:
+                    writer.close()  # 대기 중인 기록을 마침
+                except Exception as e:
+                    errors.append(f"{Path(destination).name}: {e}")
+                    exported_count = writer.written
 
         progress.setValue(total)
 
-        if errors:
-            error_msg = "\n".join(errors)
+        if errors or over_budget:
+            details = ""
+            if errors:
+                details += "\n\n실패한 파일:\n" + "\n".join(errors)
+            if over_budget:
+                details += "\n\n제한 초과 (가장 근접한 결과로 저장):\n" + "\n".join(over_budget)
             QMessageBox.warning(
                 self,
                 "일괄 내보내기 완료",
-                f"{exported_count}개 파일 내보내기 완료.\n\n실패한 파일:\n{error_msg}",
+                f"{exported_count}개 파일 내보내기 완료.{details}",
             )
         else:
             QMessageBox.information(
                 self,
                 "일괄 내보내기 완료",
-                f"{exported_count}개 파일을 '{folder}'에 내보냈습니다.",
+                f"{exported_count}개 파일을 '{destination}'에 내보냈습니다.",
             )
         self._status_label.setText(f"일괄 내보내기 완료: {exported_count}개 파일")
 
-    def _render_slot_to_image(self, slot: _FileSlot) -> Image.Image:
-        """파일 슬롯의 이미지에 도형을 합성하여 반환합니다."""
-        from PIL import ImageDraw
-        from src.core.shape_manager import ShapeType
-
-        result = slot.image.copy()
-        inv = (1.0 / slot.scale) if slot.scale > 0 else 1.0
-
-        for shape in slot.shape_manager.shapes:
-            x = int(shape.x * inv)
-            y = int(shape.y * inv)
-            w = int(shape.width * inv)
-            h = int(shape.height * inv)
-            width = max(1, int(shape.pen_width * inv))
-            box = [x, y, x + w, y + h]
-            # 모자이크 처리
-            if shape.blur_radius > 0:
-                clamped = [max(0, box[0]), max(0, box[1]),
-                           min(result.width, box[2]), min(result.height, box[3])]
-                if clamped[2] > clamped[0] and clamped[3] > clamped[1]:
-                    region = result.crop(clamped)
-                    factor = max(2, int(shape.blur_radius * inv) * 2 // 5)
-                    rw, rh = region.size
-                    small = region.resize(
-                        (max(1, rw // factor), max(1, rh // factor)), Image.NEAREST,
-                    )
-                    mosaic = small.resize((rw, rh), Image.NEAREST)
-                    if shape.shape_type == ShapeType.ELLIPSE:
-                        mask = Image.new('L', region.size, 0)
-                        ImageDraw.Draw(mask).ellipse(
-                            [0, 0, rw - 1, rh - 1], fill=255,
-                        )
-                        result.paste(mosaic, (clamped[0], clamped[1]), mask)
-                    else:
-                        result.paste(mosaic, (clamped[0], clamped[1]))
-            # 윤곽선 (블러 시 fill 무시)
-            draw = ImageDraw.Draw(result, "RGBA")
-            fill = None if shape.blur_radius > 0 else (shape.fill_color or None)
-            outline = shape.pen_color or None
-            if shape.shape_type == ShapeType.RECTANGLE:
-                draw.rectangle(box, fill=fill, outline=outline, width=width)
-            elif shape.shape_type == ShapeType.ELLIPSE:
-                draw.ellipse(box, fill=fill, outline=outline, width=width)
+    def _render_slot_to_image(
+        self, slot: _FileSlot, resize: Optional[ResizeSpec] = None,
+    ) -> Image.Image:
+        """파일 슬롯의 이미지에 도형을 합성하여 반환합니다 (resize 시 축소 후 합성).
 
-        return result
+        아직 읽지 않은 슬롯 (폴더 · ZIP 등)은 잠깐 읽어 합성하고 슬롯에 남기지 않습니다 (일괄 내보내기 메모리 유지).
+        """
+        from src.core import compositor
+        return compositor.composite(slot.peek_image(), slot.shape_manager.shapes, slot.scale, resize)
 
     def _undo(self) -> None:
         if 0 <= self._current_slot_index < len(self._file_slots):
@@ -630,25 +1278,9 @@ class MainWindow(QMainWindow):
 
         # 도형 좌표 조정: 크롭 원점 기준으로 이동, 영역 밖 도형 제거
         new_sm = ShapeManager()
-        for shape in slot.shape_manager.shapes:
-            new_x = shape.x - crop_left_bs
-            new_y = shape.y - crop_top_bs
-            if (new_x + shape.width > 0 and new_y + shape.height > 0
-                    and new_x < crop_w_bs and new_y < crop_h_bs):
-                clamped_x = max(0, new_x)
-                clamped_y = max(0, new_y)
-                clamped_w = min(new_x + shape.width, crop_w_bs) - clamped_x
-                clamped_h = min(new_y + shape.height, crop_h_bs) - clamped_y
-                if clamped_w > 2 and clamped_h > 2:
-                    new_sm.add(Shape(
-                        shape_type=shape.shape_type,
-                        x=clamped_x, y=clamped_y,
-                        width=clamped_w, height=clamped_h,
-                        pen_color=shape.pen_color,
-                        pen_width=shape.pen_width,
-                        fill_color=shape.fill_color,
-                        blur_radius=shape.blur_radius,
-                    ))
+        new_sm.extend(_crop_shapes(
+            slot.shape_manager.shapes, crop_left_bs, crop_top_bs, crop_w_bs, crop_h_bs,
+        ))
 
         # 새 스케일/픽스맵 계산
         vp = self._scroll.viewport().size()
@@ -656,6 +1288,7 @@ class MainWindow(QMainWindow):
         new_scale = self._canvas._calc_scale(cropped_image.size, max_size)
         display_w = int(cropped_image.width * new_scale)
         display_h = int(cropped_image.height * new_scale)
+        from PIL import Image
         display_img = (
             cropped_image.resize((display_w, display_h), Image.LANCZOS)
             if new_scale != 1.0 else cropped_image
@@ -670,12 +1303,15 @@ class MainWindow(QMainWindow):
             pixmap=new_pixmap,
             shape_manager=new_sm,
             zoom=1.0,
+            synced=False,
+            crop_box=_compose_crop(slot.crop_box, crop_box),
         )
         self._file_slots = [
             *self._file_slots[:self._current_slot_index],
             new_slot,
             *self._file_slots[self._current_slot_index + 1:]
         ]
+        self._track_slot(self._current_slot_index)
 
         # 썸네일 갱신
         thumb = self._make_thumbnail(cropped_image)
@@ -702,6 +1338,7 @@ class MainWindow(QMainWindow):
             *self._file_slots[:idx], old_slot,
             *self._file_slots[idx + 1:]
         ]
+        self._track_slot(idx)
         thumb = self._make_thumbnail(old_slot.image)
         self._explorer.update_thumbnail(idx, thumb)
         if idx == self._current_slot_index:
@@ -731,6 +1368,7 @@ class MainWindow(QMainWindow):
 
     def _apply_blur_to_selected(self) -> None:
         """선택된 도형의 블러를 토글합니다."""
+        from src.core.recipe import DEFAULT_BLUR_RADIUS
         if self._canvas._selected_index is None:
             return
         shapes = self._canvas._shape_manager.shapes
@@ -738,7 +1376,7 @@ class MainWindow(QMainWindow):
         if idx >= len(shapes):
             return
         old = shapes[idx]
-        new_blur = 0 if old.blur_radius > 0 else 10
+        new_blur = 0 if old.blur_radius > 0 else DEFAULT_BLUR_RADIUS
         new_shape = Shape(
             shape_type=old.shape_type,
             x=old.x, y=old.y,
@@ -781,3 +1419,733 @@ class MainWindow(QMainWindow):
         self._canvas._selected_index = new_index
         self._canvas.selection_changed.emit(new_shape)
         self._canvas.update()
+
+    # ── 편집 레시피 ─────────────────────────────────────────────
+    def _copy_recipe(self) -> None:
+        """현재 파일의 도형과 자르기 상태를 원본 픽셀 기준 레시피로 저장합니다."""
+        from src.core.recipe import Recipe
+        idx = self._current_slot_index
+        if not (0 <= idx < len(self._file_slots)):
+            return
+        slot = self._file_slots[idx]
+        self._recipe = Recipe.capture(slot.shape_manager.shapes, slot.scale, slot.crop_box)
+        self._recipe_source = slot.shape_manager
+        self._status_label.setText(
+            f"레시피 복사: 도형 {len(self._recipe.shapes)}개"
+            + (", 자르기 포함" if self._recipe.crop is not None else "")
+        )
+
+    def _apply_recipe_to(self, indices, recipe: Optional[Recipe] = None) -> int:
+        """복사한 레시피(또는 recipe)를 지정 파일들에 한 번에 적용합니다. 적용된 파일 수를 반환합니다.
+
+        복사한 레시피는 복사한 슬롯 자신을 건너뜁니다. 자르기가 있으면 기존 도형도 함께 이동/잘라냅니다.
+        아직 읽지 않은 슬롯의 자르기는 처음 볼 때 적용합니다 (선택한 파일을 모두 디코딩하지 않음).
+        """
+        from src.core.recipe import Recipe, clip_box
+        source = None if recipe is not None else self._recipe_source
+        recipe = recipe or self._recipe
+        if recipe is None:
+            self._status_label.setText("먼저 레시피를 복사하세요 (Ctrl+Shift+C)")
+            return 0
+        source_index = self._slot_index_of(source) if source is not None else -1
+        max_size = self._display_max_size()
+        slots = list(self._file_slots)
+        recropped: List[int] = []
+        deferred: List[int] = []
+        applied = 0
+        for i in sorted(set(indices)):
+            if not (0 <= i < len(slots)) or i == source_index:
+                continue
+            slot = slots[i]
+            if recipe.crop is None:
+                slot.shape_manager.extend(recipe.shapes_at(slot.scale))
+                applied += 1
+                continue
+            lazy = not slot.pixels_loaded and slot.source is not None
+            size = self._unloaded_size(i) if lazy else slot.image.size
+            if size is None:
+                continue
+            # 파일 기준 자르기 영역 → 현재 이미지 기준 (이미 잘린 슬롯이면 원점 보정)
+            ox, oy = (slot.crop_box[0], slot.crop_box[1]) if slot.crop_box else (0, 0)
+            left, top, right, bottom = recipe.crop
+            box = clip_box((left - ox, top - oy, right - ox, bottom - oy), size)
+            if box is None:
+                continue
+            crop_box = _compose_crop(slot.crop_box, box)
+            cropped_size = (box[2] - box[0], box[3] - box[1])
+            scale = self._canvas._calc_scale(cropped_size, max_size)
+            kept = _crop_shapes(
+                slot.shape_manager.shapes,
+                int(box[0] * slot.scale), int(box[1] * slot.scale),
+                int(cropped_size[0] * slot.scale), int(cropped_size[1] * slot.scale),
+            )
+            sm = ShapeManager()
+            sm.extend(Recipe.capture(kept, slot.scale).shapes_at(scale) + recipe.shapes_at(scale))
+            if lazy:
+                slots[i] = _FileSlot(
+                    path=slot.path,
+                    image=None,
+                    scale=scale,
+                    pixmap=None,
+                    shape_manager=sm,
+                    zoom=1.0,
+                    synced=False,
+                    crop_box=crop_box,
+                    source=_FileSource(self._handler, slot.path, scale, crop_box),
+                )
+                deferred.append(i)
+            else:
+                image = slot.image.crop(box)
+                from PIL import Image
+                display_img = (
+                    image.resize((max(1, int(image.width * scale)), max(1, int(image.height * scale))), Image.LANCZOS)
+                    if scale != 1.0 else image
+                )
+                slots[i] = _FileSlot(
+                    path=slot.path,
+                    image=image,
+                    scale=scale,
+                    pixmap=_pil_to_pixmap(display_img),
+                    shape_manager=sm,
+                    zoom=1.0,
+                    synced=False,
+                    crop_box=crop_box,
+                )
+            recropped.append(i)
+            applied += 1
+
+        self._file_slots = slots
+        for i in recropped:
+            self._track_slot(i)
+        if self._pre_crop_slot_index in recropped:
+            self._pre_crop_slot = None
+            self._toolbar.set_crop_undo_enabled(False)
+        for i in recropped:
+            if i in deferred:  # 워커가 자른 영역으로 만들어 전달
+                self._thumbnails.request(id(slots[i]), slots[i], slots[i].path, slots[i].crop_box)
+            else:
+                self._explorer.update_thumbnail(i, self._make_thumbnail(slots[i].image))
+        cur = self._current_slot_index
+        if cur in recropped:
+            if self._canvas.crop_mode:
+                self._canvas.crop_mode = False
+                self._toolbar.exit_crop_mode()
+            slot = slots[cur]
+            self._canvas.set_slot(slot.image, slot.scale, slot.pixmap, slot.shape_manager, slot.zoom)
+        else:
+            self._canvas.update()
+        self._status_label.setText(f"레시피 적용: {applied}개 파일")
+        return applied
+
+    def _unloaded_size(self, index: int) -> Optional[tuple]:
+        """읽지 않은 슬롯의 이미지 크기 (자르기 영역 또는 헤더 기준). 원본을 읽을 수 없으면 None."""
+        slot = self._file_slots[index]
+        if slot.crop_box is not None:
+            left, top, right, bottom = slot.crop_box
+            return (right - left, bottom - top)
+        meta = self._explorer.metadata(index)
+        if meta is None:
+            from src.core.image_meta import read_meta
+            try:
+                meta = read_meta(slot.path)  # 헤더만
+            except Exception:
+                return None
+        return (meta.width, meta.height)
+
+    def _save_recipe(self) -> None:
+        """복사한 레시피를 CLI/서버용 JSON 파일로 저장합니다."""
+        from src.core.recipe import save_recipe
+        if self._recipe is None:
+            self._copy_recipe()
+        if self._recipe is None:
+            QMessageBox.information(self, "레시피 저장", "먼저 이미지를 불러오세요.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Save Recipe", "", "Recipe (*.json)")
+        if not path:
+            return
+        try:
+            save_recipe(self._recipe, path)
+            self._status_label.setText(f"레시피 저장: {path.split('/')[-1]}")
+        except OSError as e:
+            QMessageBox.warning(self, "레시피 저장 실패", f"레시피를 저장할 수 없습니다.\n{e}")
+
+    # ── 영역 전파 (템플릿 매칭) ──────────────────────────────────
+    def _propagate_selected_shape(self) -> int:
+        """선택한 도형 영역을 다른 파일에서 찾아 같은 크기의 블러 도형을 추가합니다.
+
+        찾은 파일 수를 반환합니다. 점수가 기준 미만인 파일은 건너뜁니다.
+        """
+        from src.core.recipe import DEFAULT_BLUR_RADIUS, Recipe, scale_shapes
+        idx = self._current_slot_index
+        sel = self._canvas._selected_index
+        if not (0 <= idx < len(self._file_slots)) or sel is None:
+            self._status_label.setText("먼저 찾을 도형을 선택하세요")
+            return 0
+        slot = self._file_slots[idx]
+        shapes = slot.shape_manager.shapes
+        if sel >= len(shapes):
+            return 0
+        shape = shapes[sel]
+        if shape.blur_radius == 0:
+            shape = replace(shape, blur_radius=DEFAULT_BLUR_RADIUS)
+        orig = Recipe.capture([shape], slot.scale).shapes[0]
+        box = (
+            max(0, orig.x), max(0, orig.y),
+            min(slot.image.width, orig.x + orig.width),
+            min(slot.image.height, orig.y + orig.height),
+        )
+        if box[2] - box[0] < 4 or box[3] - box[1] < 4:
+            return 0
+        try:
+            # NumPy는 이 기능에서만 필요하므로 지연 임포트
+            from src.core.template_match import TemplateMatcher
+        except ImportError as e:
+            QMessageBox.warning(self, "영역 찾기", f"NumPy가 필요합니다.\n{e}")
+            return 0
+        matcher = TemplateMatcher(slot.image.crop(box))
+        orig = replace(orig, x=box[0], y=box[1], width=box[2] - box[0], height=box[3] - box[1])
+
+        targets = [i for i in range(len(self._file_slots)) if i != idx]
+        progress = QProgressDialog("다른 파일에서 영역 찾는 중...", "취소", 0, len(targets), self)
+        progress.setWindowTitle("영역 찾기")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        slots = self._file_slots
+        matches = {}
+        failed = 0
+
+        def find(target: _FileSlot):
+            # 보지 않은 슬롯은 워커에서 디코딩하고 픽셀을 슬롯에 남기지 않음
+            return matcher.find(target.peek_image())
+
+        # 디코딩 · FFT · 축소는 GIL을 놓으므로 스레드 풀로 병렬 처리
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            futures = {pool.submit(find, slots[i]): i for i in targets}
+            for done, future in enumerate(as_completed(futures), start=1):
+                try:
+                    matches[futures[future]] = future.result()
+                except Exception:
+                    failed += 1  # 지워졌거나 손상된 파일 · 읽을 수 없는 ZIP 멤버
+                progress.setValue(done)
+                if progress.wasCanceled():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        progress.setValue(len(targets))
+
+        found = 0
+        for i, match in matches.items():
+            if match is None:
+                continue
+            target = slots[i]
+            target.shape_manager.extend(
+                scale_shapes([replace(orig, x=match.x, y=match.y)], target.scale)
+            )
+            found += 1
+        self._canvas.update()
+        message = f"영역 찾기: {found}/{len(targets)}개 파일에 블러 추가"
+        if failed:
+            message += f", 읽을 수 없는 파일 {failed}개 제외"
+        self._status_label.setText(message)
+        return found
+
+    # ── 프로젝트 파일 ───────────────────────────────────────────
+    def _save_project(self, path: Optional[str] = None) -> None:
+        """열린 파일 · 도형 · 자르기 · 줌 · 썸네일 · 표시 프록시를 .simcut 프로젝트로 저장합니다."""
+        from src.core.project import (
+            PROJECT_EXTENSION, PROJECT_FILTER, Project, SlotRecord, file_sha256, save_project,
+        )
+        if not self._file_slots:
+            QMessageBox.information(self, "프로젝트 저장", "먼저 이미지를 불러오세요.")
+            return
+        if path is None:
+            path, _ = QFileDialog.getSaveFileName(self, "Save Project", "", PROJECT_FILTER)
+            if not path:
+                return
+        if not path.endswith(PROJECT_EXTENSION):
+            path += PROJECT_EXTENSION
+        if 0 <= self._current_slot_index < len(self._file_slots):
+            self._file_slots[self._current_slot_index].zoom = self._canvas.zoom
+        try:
+            # 대기 중인 덮어쓰기 저장이 끝난 뒤의 파일 내용으로 해시 계산
+            self._save_queue.flush()
+            slots = self._file_slots
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+                hashes = list(pool.map(
+                    lambda slot: slot.sha256 or file_sha256(slot.path), slots,
+                ))
+            records = []
+            for i, (slot, digest) in enumerate(zip(slots, hashes)):
+                slot.sha256 = digest
+                thumbnail, proxy = self._project_previews(i)
+                records.append(SlotRecord(
+                    path=slot.path,
+                    sha256=digest,
+                    scale=slot.scale,
+                    zoom=slot.zoom,
+                    crop_box=slot.crop_box,
+                    shapes=tuple(slot.shape_manager.shapes),
+                    thumbnail=thumbnail,
+                    proxy=proxy,
+                ))
+            save_project(path, Project(slots=tuple(records), current=self._current_slot_index))
+        except Exception as e:
+            QMessageBox.warning(self, "프로젝트 저장 실패", f"프로젝트를 저장할 수 없습니다.\n{e}")
+            return
+        self._status_label.setText(f"프로젝트 저장: {path.split('/')[-1]}")
+
+    def _project_previews(self, index: int) -> tuple:
+        """프로젝트에 저장할 (썸네일 PNG, 표시 프록시) 바이트. 이미 있는 것만 쓰고 원본을 디코딩하지 않습니다.
+
+        보지 않은 프로젝트 슬롯은 열었던 프로젝트의 바이트를 그대로 옮기고, 그 밖의 보지 않은 슬롯은
+        비워 둡니다 (다시 열면 원본에서 만듦). 투명도가 있는 프록시는 PNG로 저장합니다.
+        """
+        slot = self._file_slots[index]
+        pixmap = slot.__dict__.get("_pixmap")
+        if pixmap is None and isinstance(slot.source, _ProjectSource):
+            source = slot.source
+            return source.reader.thumbnail(source.index), source.reader.proxy(source.index)
+        thumbnail = self._explorer.cached_thumbnail(index)
+        if thumbnail is None and pixmap is not None:
+            thumbnail = self._slot_thumbnail(index)
+        if pixmap is None:
+            return _pixmap_bytes(thumbnail, "PNG"), b""
+        return _pixmap_bytes(thumbnail, "PNG"), _pixmap_bytes(pixmap, "PNG" if pixmap.hasAlphaChannel() else "JPG")
+
+    def _open_project(self, path: Optional[str] = None) -> None:
+        """프로젝트를 엽니다. 탐색기와 현재 캔버스는 저장된 썸네일/프록시로 즉시 표시됩니다."""
+        from src.core.project import PROJECT_FILTER, ProjectError, ProjectReader
+        if path is None:
+            path, _ = QFileDialog.getOpenFileName(self, "Open Project", "", PROJECT_FILTER)
+            if not path:
+                return
+        started = time.perf_counter()
+        try:
+            reader = ProjectReader(path)
+        except (OSError, ProjectError) as e:
+            QMessageBox.warning(self, "프로젝트 열기 실패", f"프로젝트를 열 수 없습니다.\n{path}\n{e}")
+            return
+        self._reset_all()
+        self._project_readers.append(reader)
+        missing = set(reader.missing_sources())
+        current = -1
+        for i, record in enumerate(reader.records):
+            if i in missing:
+                continue
+            if i == reader.current:
+                current = len(self._file_slots)
+            sm = ShapeManager()
+            sm.extend(list(record.shapes))
+            slot = _FileSlot(
+                path=record.path,
+                image=None,
+                scale=record.scale,
+                pixmap=None,
+                shape_manager=sm,
+                zoom=record.zoom,
+                synced=record.crop_box is None,
+                crop_box=record.crop_box,
+                source=_ProjectSource(reader, i),
+                sha256=record.sha256,
+            )
+            thumb = QPixmap()
+            thumb.loadFromData(reader.thumbnail(i))  # 비어 있으면 보일 때 만듦
+            self._file_slots.append(slot)
+            self._explorer.add_file(record.path, thumb)
+            self._track_slot(len(self._file_slots) - 1)
+        if self._file_slots:
+            self._switch_to_file(current if current >= 0 else 0)
+        elapsed = (time.perf_counter() - started) * 1000
+        self._status_label.setText(
+            f"프로젝트 열기: {len(self._file_slots)}개 파일 ({elapsed:.0f} ms)"
+        )
+        # 원본이 저장 이후 바뀌었는지는 백그라운드에서 해시로 확인 (파일마다 한 번)
+        present = [i for i in range(len(reader)) if i not in missing]
+        self._project_check = threading.Thread(
+            target=lambda: self._project_checked.emit(reader, reader.changed_sources(present)),
+            name="simcut-project-check", daemon=True,
+        )
+        self._project_check.start()
+        if missing:
+            names = "\n".join(reader.records[i].path for i in sorted(missing))
+            QMessageBox.warning(self, "프로젝트 열기", f"원본 파일을 찾을 수 없어 제외했습니다.\n{names}")
+
+    def _on_project_checked(self, reader: ProjectReader, changed: List[int]) -> None:
+        """내용이 바뀐 원본: 저장된 자르기 · 프록시를 버리고 파일에서 다시 읽은 뒤 사용자에게 알립니다."""
+        changed = set(changed)
+        names = []
+        for i, slot in enumerate(self._file_slots):
+            source = slot.source
+            if not (isinstance(source, _ProjectSource) and source.reader is reader and source.index in changed):
+                continue
+            names.append(slot.path)
+            slot.sha256 = None  # 다음 프로젝트 저장 때 다시 해시
+            if slot.crop_box is None:
+                continue
+            # load_pixels도 바뀐 원본에는 자르기를 적용하지 않으므로 이미 읽은 픽셀은 그대로 둠
+            slot.crop_box = None
+            slot.synced = True
+            slot.source = _FileSource(self._handler, slot.path, slot.scale)
+            slot.pixmap = None  # 잘린 프록시 대신 파일에서 다시 만듦
+            thumb = self._slot_thumbnail(i)
+            if thumb is not None:
+                self._explorer.update_thumbnail(i, thumb)
+            if i == self._current_slot_index:
+                self._switch_to_file(i)
+        if names:
+            QMessageBox.warning(
+                self, "프로젝트 열기",
+                "원본 파일이 프로젝트 저장 이후 바뀌었습니다. 저장된 자르기는 적용하지 않았고 "
+                "도형 위치가 맞지 않을 수 있습니다.\n" + "\n".join(names),
+            )
+
+    def _close_project_readers(self) -> None:
+        """지연 로딩이 끝나지 않은 슬롯이 없을 때만 프로젝트 파일을 닫습니다."""
+        pending = {
+            id(slot.source.reader) for slot in self._file_slots
+            if isinstance(slot.source, _ProjectSource) and not slot.pixels_loaded
+        }
+        keep = []
+        for reader in self._project_readers:
+            if id(reader) in pending:
+                keep.append(reader)
+            else:
+                reader.close()
+        self._project_readers = keep
+
+    # ── 감시 폴더 ───────────────────────────────────────────────
+    def _set_watching(self, checked: bool) -> None:
+        if not checked:
+            self.stop_watching()
+            return
+        if self._folder_watch is not None:
+            return
+        from src.ui.watch_folder import WatchFolderDialog
+        dialog = WatchFolderDialog(self)
+        settings = dialog.settings() if dialog.exec() == QDialog.DialogCode.Accepted else None
+        if settings is not None:
+            try:
+                self.watch_folder(settings.folder, settings.recipe_path, settings.output_dir)
+                return
+            except (OSError, ValueError) as e:
+                QMessageBox.warning(self, "폴더 감시", f"감시를 시작할 수 없습니다.\n{e}")
+        self._set_watch_checked(False)
+
+    def _set_watch_checked(self, checked: bool) -> None:
+        self._watch_action.blockSignals(True)
+        self._watch_action.setChecked(checked)
+        self._watch_action.blockSignals(False)
+
+    def watch_folder(
+        self, folder: str, recipe_path: Optional[str] = None, output_dir: Optional[str] = None,
+    ) -> FolderWatch:
+        """folder에 새로 생기는 이미지를 다 쓰이는 대로 슬롯으로 추가합니다 (이미 있던 파일은 제외).
+
+        recipe_path가 있으면 새 슬롯에 레시피를 적용하고, output_dir이 있으면 백그라운드에서
+        레시피(없으면 PNG 그대로)를 적용해 내보냅니다. 레시피 형식 오류는 ValueError.
+        """
+        from functools import partial
+        from src.cli import process_file
+        from src.core.recipe import Recipe, load_recipe
+        from src.ui.watch_folder import FolderWatch, same_folder
+        if not os.path.isdir(folder):
+            raise ValueError(f"Not a folder: {folder}")
+        if output_dir and same_folder(output_dir, folder):
+            raise ValueError("Output folder must differ from the watched folder")
+        recipe = load_recipe(recipe_path) if recipe_path else None
+        process = partial(process_file, recipe=recipe or Recipe(), out_dir=output_dir) if output_dir else None
+        self.stop_watching()
+        watch = FolderWatch(
+            folder, (_THUMB_W, _THUMB_H), process=process, parent=self,
+            crop=recipe.crop if recipe is not None else None,
+        )
+        watch.arrived.connect(self._on_watch_arrived)
+        watch.processed.connect(self._on_watch_processed)
+        self._folder_watch = watch
+        self._watch_recipe = recipe
+        self._watch_arrivals = 0
+        self._set_watch_checked(True)
+        self._status_label.setText(f"감시 중: {os.path.basename(folder) or folder}")
+        return watch
+
+    def stop_watching(self) -> None:
+        if self._folder_watch is None:
+            return
+        self._folder_watch.close()
+        self._folder_watch.deleteLater()
+        self._folder_watch = None
+        self._watch_recipe = None
+        self._set_watch_checked(False)
+
+    def _on_watch_arrived(self, arrivals: List[Arrival]) -> None:
+        if self._folder_watch is None or self.sender() is not self._folder_watch:
+            return  # 멈춘 감시가 보낸 알림
+        # 마지막 파일을 보고 있었으면 (또는 아무것도 없으면) 새 파일을 따라감
+        following = self._current_slot_index in (-1, len(self._file_slots) - 1)
+        recipe = self._watch_recipe
+        with profiling.span("watch_arrival", files=len(arrivals)):
+            # 자르기는 처음 볼 때 (썸네일은 감시 스레드에서 자른 영역으로 만듦) — GUI 스레드에서 디코딩하지 않음
+            first = self._append_lazy_slots(
+                [(a.path, a.meta) for a in arrivals],
+                [_pil_to_pixmap(a.thumbnail) for a in arrivals],
+                crop=recipe.crop if recipe is not None else None,
+            )
+            if recipe is not None:
+                for slot in self._file_slots[first:]:
+                    if recipe.crop is None or slot.crop_box is not None:  # 겹치지 않는 자르기는 건너뜀
+                        slot.shape_manager.extend(recipe.shapes_at(slot.scale))
+        if following:
+            self._switch_to_file(len(self._file_slots) - 1)
+        self._watch_arrivals += len(arrivals)
+        self._status_label.setText(
+            f"감시 중: {os.path.basename(self._folder_watch.folder)} — 새 파일 {self._watch_arrivals}개"
+        )
+
+    def _on_watch_processed(self, path: str, result) -> None:
+        """자동 내보내기 결과 (cli.FileResult, 또는 예외)."""
+        name = os.path.basename(path)
+        error = str(result) if isinstance(result, Exception) else result.error
+        if error:
+            self._status_label.setText(f"자동 내보내기 실패: {name}: {error}")
+        else:
+            outputs = ", ".join(os.path.basename(p) for p in result.outputs)
+            self._status_label.setText(f"자동 내보내기: {name} → {outputs}")
+
+    # ── 프로파일링 ──────────────────────────────────────────────
+    def _hud_lines(self) -> List[str]:
+        """성능 HUD용 현재 슬롯 메모리 (원본 + 표시 픽스맵, 읽지 않은 원본은 0)."""
+        if not (0 <= self._current_slot_index < len(self._file_slots)):
+            return []
+        slot = self._file_slots[self._current_slot_index]
+        source = image_bytes(slot.image) if slot.pixels_loaded else 0
+        pixmap = _qpixmap_bytes(slot.__dict__.get("_pixmap"))
+        return [
+            f"slot {format_bytes(source + pixmap)} "
+            f"(source {format_bytes(source)} · pixmap {format_bytes(pixmap)})"
+        ]
+
+    def resource_report(self) -> ResourceReport:
+        """슬롯별 메모리 사용량과 프로세스 RSS (읽지 않은 지연 픽셀은 0)."""
+        from src.ui.resource_inspector import ResourceReport, SlotResources
+        slots = []
+        for i, slot in enumerate(self._file_slots):
+            pixmap = _qpixmap_bytes(slot.__dict__.get("_pixmap"))
+            if i == self._current_slot_index:
+                display = self._canvas.display_pixmap
+                if display is not None and display is not slot.__dict__.get("_pixmap"):
+                    pixmap += _qpixmap_bytes(display)
+            undo = 0
+            if self._pre_crop_slot is not None and self._pre_crop_slot_index == i:
+                old = self._pre_crop_slot
+                undo = (image_bytes(old.image) if old.pixels_loaded else 0) \
+                    + _qpixmap_bytes(old.__dict__.get("_pixmap"))
+            pre_save = self._pre_save_slots.get(i)
+            seen: set = set()
+            shapes = shapes_bytes(slot.shape_manager.shapes, seen)
+            shapes += shapes_bytes(slot.shape_manager.state().undo_stack, seen)
+            if slot.history is not None:
+                shapes += slot.history.approx_bytes(seen)
+            slots.append(SlotResources(
+                index=i,
+                name=os.path.basename(slot.path),
+                source=image_bytes(slot.image) if slot.pixels_loaded else 0,
+                pixmap=pixmap,
+                thumbnail=_qpixmap_bytes(self._explorer.cached_thumbnail(i)),
+                undo=undo,
+                undo_disk=self._snapshots.disk_bytes(pre_save.snapshot) if pre_save else 0,
+                shapes=shapes,
+            ))
+        return ResourceReport(slots, self._canvas.mosaic_cache_bytes, process_rss())
+
+    def drop_slot_caches(self, indices) -> int:
+        """지정 슬롯의 다시 만들 수 있는 픽셀을 해제합니다. 해제한 대략적인 바이트 수를 반환합니다.
+
+        파일 내용과 일치하는 슬롯만 원본 · 표시 픽스맵을 버리고 필요할 때 파일에서 다시 읽습니다.
+        자르기 등으로 파일과 달라진 픽셀, 저장 큐에서 아직 쓰는 중인 파일, 되돌리기 상태는 건드리지 않습니다.
+        현재 슬롯은 화면에 쓰는 픽스맵을 남기고 원본과 모자이크 캐시만 비웁니다.
+        """
+        freed = 0
+        for i in sorted(set(indices)):
+            if not (0 <= i < len(self._file_slots)):
+                continue
+            slot = self._file_slots[i]
+            current = i == self._current_slot_index
+            if current:
+                freed += self._canvas.clear_mosaic_cache()
+            if not slot.synced or slot.crop_box is not None or not archive.exists(slot.path):
+                continue
+            if self._save_queue.is_pending(slot.path):
+                continue  # 디스크는 아직 저장 전 내용 (다시 읽으면 합성한 도형을 잃음)
+            if not isinstance(slot.source, _FileSource):
+                slot.source = _FileSource(self._handler, slot.path, slot.scale)
+            if slot.pixels_loaded:
+                freed += image_bytes(slot.image)
+                slot.image = None
+                if current:
+                    self._canvas.release_image(lambda slot=slot: slot.image)
+            pixmap = slot.__dict__.get("_pixmap")
+            if not current and pixmap is not None:
+                freed += _qpixmap_bytes(pixmap)
+                slot.pixmap = None
+        self._close_project_readers()
+        return freed
+
+    def _show_resource_inspector(self) -> None:
+        from src.ui.resource_inspector import ResourceInspector
+        if self._resource_inspector is None:
+            self._resource_inspector = ResourceInspector(
+                self.resource_report, self.drop_slot_caches, self,
+            )
+        self._resource_inspector.show()
+        self._resource_inspector.raise_()
+
+    def _toggle_profiling(self, active: bool) -> None:
+        """프로파일 기록 시작/종료. 종료 시 Chrome 트레이스(JSON) 저장 위치를 묻습니다."""
+        if active:
+            profiling.start()
+            self._status_label.setText("프로파일 기록 중…")
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Save Profile", "simcut-profile.json", "Chrome Trace (*.json)",
+        )
+        count = profiling.stop(path or None)
+        self._status_label.setText(
+            f"프로파일 저장: {os.path.basename(path)} ({count}개 구간)" if path else "프로파일 기록 취소"
+        )
+
+    # ── 편집 저널 · 크래시 복구 ─────────────────────────────────
+    def _track_slot(self, index: int) -> None:
+        """슬롯 추가/교체를 저널에 기록하고 이후 도형 변경을 구독합니다."""
+        slot = self._file_slots[index]
+        slot.shape_manager.set_listener(self._on_shapes_changed)
+        self._manager_slots[id(slot.shape_manager)] = index
+        if slot.history is None:
+            slot.history = EditHistory(slot.shape_manager.state())
+        if index == self._current_slot_index:
+            self._set_panel_history(slot.history)
+        if self._journal is None:
+            return
+        self._journal.record_slot(
+            index, slot.path, slot.scale, slot.crop_box, slot.shape_manager.shapes,
+        )
+        self._maybe_checkpoint()
+
+    def _on_shapes_changed(self, manager: ShapeManager, op: str, args: tuple) -> None:
+        """ShapeManager 변경 → 편집 타임라인 · 저널 기록 (저널은 큐에 넣기만 함)."""
+        index = self._slot_index_of(manager)
+        if index < 0:
+            return
+        slot = self._file_slots[index]
+        if slot.history is not None and not self._seeking_history:
+            slot.history.record(op, args, manager.state())
+            if index == self._current_slot_index and self._history_panel is not None:
+                self._history_panel.refresh()
+        if self._journal is not None:
+            self._journal.record_shapes(index, op, args)
+            self._maybe_checkpoint()
+
+    def _slot_index_of(self, manager: ShapeManager) -> int:
+        """manager를 가진 슬롯 인덱스 (없으면 -1). 맵이 어긋났으면 (교체된 슬롯 등) 한 번 다시 만듭니다."""
+        index = self._manager_slots.get(id(manager), -1)
+        if 0 <= index < len(self._file_slots) and self._file_slots[index].shape_manager is manager:
+            return index
+        self._manager_slots = {id(slot.shape_manager): i for i, slot in enumerate(self._file_slots)}
+        index = self._manager_slots.get(id(manager), -1)
+        return index if index >= 0 and self._file_slots[index].shape_manager is manager else -1
+
+    def _set_history_visible(self, visible: bool) -> None:
+        if visible and self._history_panel is None:
+            from src.ui.history_panel import HistoryPanel
+            self._history_panel = HistoryPanel()
+            self._history_panel.hide()
+            self._history_panel.position_requested.connect(self._seek_history)
+            self._splitter.addWidget(self._history_panel)
+            self._splitter.setStretchFactor(2, 0)
+            if 0 <= self._current_slot_index < len(self._file_slots):
+                self._history_panel.set_history(self._file_slots[self._current_slot_index].history)
+        if self._history_panel is not None:
+            self._history_panel.setVisible(visible)
+
+    def _set_panel_history(self, history: Optional[EditHistory]) -> None:
+        if self._history_panel is not None:
+            self._history_panel.set_history(history)
+
+    def _seek_history(self, position: int) -> None:
+        """현재 슬롯을 타임라인의 position 시점 상태로 바꾸고 한 번만 다시 그립니다."""
+        if not (0 <= self._current_slot_index < len(self._file_slots)):
+            return
+        slot = self._file_slots[self._current_slot_index]
+        if slot.history is None or not (0 <= position <= len(slot.history)):
+            return
+        state = slot.history.seek(position)
+        self._seeking_history = True
+        try:
+            slot.shape_manager.restore(state)
+        finally:
+            self._seeking_history = False
+        self._canvas.deselect()
+        self._canvas.update()
+        if self._history_panel is not None:
+            self._history_panel.refresh()
+
+    def _maybe_checkpoint(self) -> None:
+        from src.core.journal import SlotState
+        if self._journal is not None and self._journal.needs_checkpoint:
+            self._journal.checkpoint([
+                SlotState(s.path, s.scale, s.crop_box, s.shape_manager)
+                for s in self._file_slots
+            ])
+
+    def offer_recovery(self) -> int:
+        """비정상 종료로 남은 세션이 있으면 복구 여부를 묻습니다. 복구한 파일 수를 반환합니다."""
+        from src.core.journal import orphaned_sessions
+        if not self._recovery_dir:
+            return 0
+        sessions = orphaned_sessions(self._recovery_dir)
+        if not sessions:
+            return 0
+        answer = QMessageBox.question(
+            self, "세션 복구",
+            "이전 세션이 비정상 종료되었습니다.\n마지막 편집 상태를 복구할까요?",
+        )
+        restored = 0
+        if answer == QMessageBox.StandardButton.Yes:
+            restored = self._recover_session(sessions[0])
+        for session in sessions:
+            shutil.rmtree(session, ignore_errors=True)
+        return restored
+
+    def _recover_session(self, directory: str) -> int:
+        """세션 저널을 재생해 슬롯을 복원합니다 (원본이 없는 파일은 건너뜀).
+
+        복원한 슬롯은 폴더 가져오기처럼 픽셀을 읽지 않은 채 추가하고, 처음 볼 때 원본을 읽어 자릅니다.
+        """
+        from src.core.journal import replay
+        states = replay(directory)
+        failed = []
+        first = len(self._file_slots)
+        for state in states:
+            if not archive.exists(state.path):
+                failed.append(state.path)
+                continue
+            self._file_slots.append(_FileSlot(
+                path=state.path,
+                image=None,
+                scale=state.scale,
+                pixmap=None,
+                shape_manager=state.shape_manager,
+                synced=state.crop_box is None,
+                crop_box=state.crop_box,
+                source=_FileSource(self._handler, state.path, state.scale, state.crop_box),
+            ))
+        self._explorer.add_files([slot.path for slot in self._file_slots[first:]])
+        for index in range(first, len(self._file_slots)):
+            self._track_slot(index)
+        if self._file_slots:
+            self._switch_to_file(len(self._file_slots) - 1)
+        self._status_label.setText(f"세션 복구: {len(states) - len(failed)}개 파일")
+        if failed:
+            QMessageBox.warning(
+                self, "세션 복구", "원본 파일을 열 수 없어 제외했습니다.\n" + "\n".join(failed),
+            )
+        return len(states) - len(failed)
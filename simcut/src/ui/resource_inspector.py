@@ -0,0 +1,125 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+    QAbstractItemView, QHeaderView, QPushButton, QWidget,
+)
+from PyQt6.QtCore import Qt, QItemSelectionModel
+from src.utils.memory import format_bytes
+
+
+@dataclass(frozen=True)
+class SlotResources:
+    """슬롯 하나가 붙잡고 있는 메모리 (바이트). undo_disk는 디스크 스냅샷이라 합계에서 제외합니다."""
+    index: int
+    name: str
+    source: int = 0      # 디코딩된 원본 픽셀 (읽지 않았으면 0)
+    pixmap: int = 0      # 표시 픽스맵 (+ 현재 슬롯이면 줌 표시 픽스맵)
+    thumbnail: int = 0   # 파일 탐색기 썸네일
+    undo: int = 0        # 자르기 되돌리기용 이전 슬롯 픽셀
+    undo_disk: int = 0   # 저장 되돌리기 스냅샷 파일
+    shapes: int = 0      # 도형 · 다시 실행 스택 · 편집 타임라인 (근삿값)
+
+    @property
+    def total(self) -> int:
+        return self.source + self.pixmap + self.thumbnail + self.undo + self.shapes
+
+
+@dataclass(frozen=True)
+class ResourceReport:
+    slots: List[SlotResources] = field(default_factory=list)
+    canvas_cache: int = 0  # 캔버스 모자이크 캐시
+    rss: int = 0           # 프로세스 RSS
+
+    @property
+    def total(self) -> int:
+        return sum(s.total for s in self.slots) + self.canvas_cache
+
+
+_COLUMNS = ("파일", "원본", "픽스맵", "썸네일", "되돌리기", "도형", "합계")
+
+
+class ResourceInspector(QDialog):
+    """슬롯별 메모리 사용량 표. 선택한 슬롯의 캐시(다시 읽을 수 있는 픽셀)를 비울 수 있습니다.
+
+    report()는 MainWindow.resource_report, drop(indices)은 MainWindow.drop_slot_caches입니다.
+    """
+
+    def __init__(
+        self,
+        report: Callable[[], ResourceReport],
+        drop: Callable[[List[int]], int],
+        parent: Optional[QWidget] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("리소스 검사기")
+        self.resize(620, 360)
+        self._report = report
+        self._drop = drop
+        self._last: Optional[ResourceReport] = None
+        layout = QVBoxLayout(self)
+        self._table = QTableWidget(0, len(_COLUMNS))
+        self._table.setHorizontalHeaderLabels(_COLUMNS)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._table.verticalHeader().setVisible(False)
+        self._table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self._table)
+        self._summary = QLabel()
+        layout.addWidget(self._summary)
+        buttons = QHBoxLayout()
+        buttons.addStretch(1)
+        refresh_btn = QPushButton("새로 고침")
+        refresh_btn.clicked.connect(self.refresh)
+        self._drop_btn = QPushButton("선택 캐시 비우기")
+        self._drop_btn.clicked.connect(self._drop_selected)
+        buttons.addWidget(refresh_btn)
+        buttons.addWidget(self._drop_btn)
+        layout.addLayout(buttons)
+
+    @property
+    def last_report(self) -> Optional[ResourceReport]:
+        return self._last
+
+    def refresh(self) -> None:
+        report = self._report()
+        self._last = report
+        self._table.setRowCount(len(report.slots))
+        for row, slot in enumerate(report.slots):
+            values = (slot.source, slot.pixmap, slot.thumbnail, slot.undo, slot.shapes, slot.total)
+            name = QTableWidgetItem(slot.name)
+            name.setData(Qt.ItemDataRole.UserRole, slot.index)
+            self._table.setItem(row, 0, name)
+            for col, value in enumerate(values, start=1):
+                text = format_bytes(value)
+                if col == 4 and slot.undo_disk:
+                    text += f" (+디스크 {format_bytes(slot.undo_disk)})"
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self._table.setItem(row, col, item)
+        share = f" ({report.total / report.rss:.0%})" if report.rss else ""
+        self._summary.setText(
+            f"슬롯 합계 {format_bytes(report.total)}{share} / 프로세스 RSS {format_bytes(report.rss)}"
+            f" · 캔버스 캐시 {format_bytes(report.canvas_cache)}"
+        )
+
+    def selected_indices(self) -> List[int]:
+        rows = sorted({index.row() for index in self._table.selectedIndexes()})
+        return [self._table.item(row, 0).data(Qt.ItemDataRole.UserRole) for row in rows]
+
+    def select_rows(self, rows: List[int]) -> None:
+        self._table.clearSelection()
+        model = self._table.selectionModel()
+        flags = QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows
+        for row in rows:
+            model.select(self._table.model().index(row, 0), flags)
+
+    def _drop_selected(self) -> None:
+        freed = self._drop(self.selected_indices())
+        self.refresh()
+        self._summary.setText(f"{format_bytes(freed)} 해제 · " + self._summary.text())
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.refresh()
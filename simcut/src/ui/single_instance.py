@@ -0,0 +1,133 @@
+"""단일 인스턴스: 두 번째 실행은 파일 인자를 실행 중인 창에 넘기고 바로 종료합니다.
+
+실행 중인 인스턴스가 사용자별 QLocalServer를 열어 두고, 새 프로세스는 QApplication을
+만들기 전에 QLocalSocket으로 접속해 경로 목록(JSON 한 줄)을 보냅니다.
+SIMCUT_NEW_INSTANCE=1이면 항상 새 창으로 실행합니다.
+여러 프로세스가 동시에 시작하면 서버는 하나만 열리고, 나머지는 listen이 실패한 뒤 그쪽으로 넘깁니다.
+"""
+from __future__ import annotations
+import getpass
+import json
+import os
+from typing import Iterable, List, Optional
+from PyQt6.QtCore import QDir, QLockFile, QObject, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+from src.utils.constants import APP_NAME
+
+NEW_INSTANCE_ENV = "SIMCUT_NEW_INSTANCE"
+CONNECT_TIMEOUT_MS = 200
+WRITE_TIMEOUT_MS = 1000
+# 남은 소켓 파일을 확인 · 정리하는 동안 잡는 잠금의 최대 대기 시간
+LOCK_TIMEOUT_MS = 2000
+
+
+def server_name() -> str:
+    """사용자별 서버 이름 (같은 사용자의 실행끼리만 합쳐집니다)."""
+    try:
+        user = getpass.getuser()
+    except Exception:  # 사용자 이름을 알 수 없는 환경
+        user = str(os.getuid()) if hasattr(os, "getuid") else "user"
+    return f"{APP_NAME}-{user}"
+
+
+def file_arguments(argv: Iterable[str]) -> List[str]:
+    """명령행 인자 중 존재하는 파일만 절대 경로로 (옵션 · Qt 인자는 제외)."""
+    return [os.path.abspath(a) for a in argv if not a.startswith("-") and os.path.isfile(a)]
+
+
+def _is_live(name: str) -> bool:
+    """name으로 듣고 있는 서버가 있는지 (접속만 해 보고 끊음)."""
+    socket = QLocalSocket()
+    socket.connectToServer(name)
+    live = socket.waitForConnected(CONNECT_TIMEOUT_MS)
+    socket.abort()
+    return live
+
+
+def _lock_path(name: str) -> str:
+    return f"{name}.lock" if os.path.isabs(name) else os.path.join(QDir.tempPath(), f"{name}.lock")
+
+
+def forward_to_running(paths: List[str], name: Optional[str] = None) -> bool:
+    """실행 중인 인스턴스에 경로를 넘깁니다. 넘겼으면 True (이 프로세스는 종료하면 됨)."""
+    socket = QLocalSocket()
+    socket.connectToServer(name or server_name())
+    if not socket.waitForConnected(CONNECT_TIMEOUT_MS):
+        return False
+    socket.write(json.dumps({"paths": list(paths)}).encode("utf-8") + b"\n")
+    sent = socket.waitForBytesWritten(WRITE_TIMEOUT_MS) or socket.bytesToWrite() == 0
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.LocalSocketState.UnconnectedState:
+        socket.waitForDisconnected(WRITE_TIMEOUT_MS)
+    return sent
+
+
+class InstanceServer(QObject):
+    """다른 실행이 보낸 경로 목록을 paths_received로 전달합니다 (빈 목록이면 창만 앞으로)."""
+
+    paths_received = pyqtSignal(list)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._accept)
+        self._buffers = {}
+
+    @property
+    def is_listening(self) -> bool:
+        return self._server.isListening()
+
+    def listen(self, name: Optional[str] = None) -> bool:
+        """서버를 엽니다. 다른 인스턴스가 이미 듣고 있으면 False (그쪽으로 forward_to_running)."""
+        name = name or server_name()
+        # 동시에 시작한 실행끼리 확인 · 열기가 겹치지 않도록 잠금
+        lock = QLockFile(_lock_path(name))
+        if not lock.tryLock(LOCK_TIMEOUT_MS):
+            return False
+        try:
+            # 접근 옵션이 있으면 Unix의 listen은 기존 소켓 파일을 덮어쓰므로 먼저 확인
+            if _is_live(name):
+                return False  # 살아 있는 인스턴스의 이름은 빼앗지 않음
+            if self._server.listen(name):
+                return True
+            # 비정상 종료로 남은 소켓 파일: 접속이 안 되는 것을 확인했으므로 지우고 다시 엽니다
+            QLocalServer.removeServer(name)
+            return self._server.listen(name)
+        finally:
+            lock.unlock()
+
+    def close(self) -> None:
+        self._server.close()
+
+    def _accept(self) -> None:
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b""
+            socket.readyRead.connect(lambda s=socket: self._read(s))
+            socket.disconnected.connect(lambda s=socket: self._finish(s))
+            self._read(socket)
+
+    def _read(self, socket: QLocalSocket) -> None:
+        if socket not in self._buffers or not socket.bytesAvailable():
+            return
+        data = self._buffers[socket] + bytes(socket.readAll())
+        *lines, rest = data.split(b"\n")
+        self._buffers[socket] = rest
+        for line in lines:
+            self._dispatch(line)
+
+    def _finish(self, socket: QLocalSocket) -> None:
+        self._read(socket)
+        rest = self._buffers.pop(socket, b"")
+        if rest.strip():
+            self._dispatch(rest)
+        socket.deleteLater()
+
+    def _dispatch(self, line: bytes) -> None:
+        try:
+            message = json.loads(line.decode("utf-8"))
+            paths = [str(p) for p in message.get("paths", [])]
+        except (ValueError, AttributeError, TypeError):
+            return  # 형식이 맞지 않는 메시지는 무시
+        self.paths_received.emit(paths)
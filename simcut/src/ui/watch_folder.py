@@ -0,0 +1,157 @@
+"""감시 폴더 설정 다이얼로그와 Qt 연결 (QFileSystemWatcher + core.watch_folder.FolderWatcher)."""
+from __future__ import annotations
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+from PyQt6.QtCore import QObject, QCoreApplication, QFileSystemWatcher, pyqtSignal
+from PyQt6.QtWidgets import (
+    QWidget, QHBoxLayout, QVBoxLayout, QLineEdit, QPushButton, QLabel,
+    QDialog, QDialogButtonBox, QFormLayout, QFileDialog,
+)
+from src.core.watch_folder import FolderWatcher
+from src.utils.theme import TEXT_SECONDARY
+
+
+@dataclass(frozen=True)
+class WatchSettings:
+    """감시 폴더 설정. output_dir이 있으면 새 파일마다 레시피(없으면 PNG 그대로)를 적용해 내보냅니다."""
+    folder: str
+    recipe_path: Optional[str] = None
+    output_dir: Optional[str] = None
+
+
+def same_folder(a: str, b: str) -> bool:
+    return os.path.normcase(os.path.realpath(a)) == os.path.normcase(os.path.realpath(b))
+
+
+class FolderWatch(QObject):
+    """FolderWatcher를 파일 시스템 알림에 연결하고 결과를 GUI 스레드 시그널로 전달합니다.
+
+    알림을 걸 수 없는 폴더(addPath 실패)는 POLL_SECONDS마다 훑는 것으로만 감시합니다.
+    """
+
+    arrived = pyqtSignal(list)             # List[Arrival]
+    processed = pyqtSignal(str, object)    # (경로, process 결과 또는 예외)
+
+    def __init__(
+        self,
+        folder: str,
+        thumbnail_size: tuple,
+        process: Optional[Callable[[str], Any]] = None,
+        parent: Optional[QObject] = None,
+        **options,
+    ) -> None:
+        super().__init__(parent)
+        self.folder = folder
+        self._watcher = FolderWatcher(
+            folder,
+            on_arrival=self.arrived.emit,
+            thumbnail_size=thumbnail_size,
+            process=process,
+            on_processed=self.processed.emit,
+            **options,
+        )
+        self._fs = QFileSystemWatcher(self)
+        self.native = self._fs.addPath(folder)
+        self._fs.directoryChanged.connect(lambda _: self._watcher.notify())
+        self._watcher.start()
+
+    @property
+    def skipped(self) -> int:
+        return self._watcher.skipped
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 새 파일을 모두 받아 시그널까지 전달할 때까지 기다립니다 (테스트 · 스크립트용)."""
+        done = self._watcher.wait_idle(timeout)
+        QCoreApplication.sendPostedEvents()  # 워커가 보낸 큐 시그널 전달
+        return done
+
+    def close(self) -> None:
+        self._fs.removePaths(self._fs.directories())
+        self._watcher.close()
+
+
+class WatchFolderDialog(QDialog):
+    """감시할 폴더와 (선택) 자동 적용 레시피 · 내보내기 폴더를 고릅니다."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("폴더 감시")
+        self.setMinimumWidth(420)
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        self._folder = self._path_row(form, "감시 폴더:", self._browse_folder)
+        self._recipe = self._path_row(form, "레시피 (선택):", self._browse_recipe)
+        self._output = self._path_row(form, "내보낼 폴더 (선택):", self._browse_output)
+        layout.addLayout(form)
+        self._error = QLabel()
+        self._error.setStyleSheet(f"color: {TEXT_SECONDARY};")
+        layout.addWidget(self._error)
+        self._buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        self._buttons.accepted.connect(self.accept)
+        self._buttons.rejected.connect(self.reject)
+        layout.addWidget(self._buttons)
+        for field in (self._folder, self._recipe, self._output):
+            field.textChanged.connect(self._validate)
+        self._validate()
+
+    def set_values(self, folder: str, recipe_path: str = "", output_dir: str = "") -> None:
+        self._folder.setText(folder)
+        self._recipe.setText(recipe_path)
+        self._output.setText(output_dir)
+
+    def settings(self) -> WatchSettings:
+        return WatchSettings(
+            folder=self._folder.text().strip(),
+            recipe_path=self._recipe.text().strip() or None,
+            output_dir=self._output.text().strip() or None,
+        )
+
+    def error(self) -> str:
+        """설정 오류 메시지 (없으면 빈 문자열)."""
+        settings = self.settings()
+        if not os.path.isdir(settings.folder):
+            return "감시할 폴더를 고르세요."
+        if settings.recipe_path and not os.path.isfile(settings.recipe_path):
+            return "레시피 파일을 찾을 수 없습니다."
+        if settings.output_dir:
+            if not os.path.isdir(settings.output_dir):
+                return "내보낼 폴더를 찾을 수 없습니다."
+            if same_folder(settings.output_dir, settings.folder):
+                # 내보낸 파일이 다시 새 파일로 들어오거나 원본을 덮어씀
+                return "내보낼 폴더는 감시 폴더와 달라야 합니다."
+        return ""
+
+    def _validate(self) -> None:
+        message = self.error()
+        self._error.setText(message)
+        self._buttons.button(QDialogButtonBox.StandardButton.Ok).setEnabled(not message)
+
+    def _path_row(self, form: QFormLayout, label: str, browse: Callable[[], None]) -> QLineEdit:
+        row = QWidget()
+        box = QHBoxLayout(row)
+        box.setContentsMargins(0, 0, 0, 0)
+        field = QLineEdit()
+        button = QPushButton("찾아보기…")
+        button.clicked.connect(browse)
+        box.addWidget(field, 1)
+        box.addWidget(button)
+        form.addRow(label, row)
+        return field
+
+    def _browse_folder(self) -> None:
+        path = QFileDialog.getExistingDirectory(self, "감시 폴더", self._folder.text())
+        if path:
+            self._folder.setText(path)
+
+    def _browse_recipe(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(self, "레시피", "", "Recipe (*.json)")
+        if path:
+            self._recipe.setText(path)
+
+    def _browse_output(self) -> None:
+        path = QFileDialog.getExistingDirectory(self, "내보낼 폴더", self._output.text())
+        if path:
+            self._output.setText(path)
@@ -3,6 +3,13 @@ APP_NAME = "simcut"
 SUPPORTED_FORMATS = ["PNG", "JPEG", "WEBP", "BMP"]
 
 OPEN_FILE_FILTER = "Images (*.png *.jpg *.jpeg *.webp *.bmp)"
+OPEN_FILE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".bmp")  # OPEN_FILE_FILTER와 동일
+ARCHIVE_EXTENSIONS = (".zip",)
+ARCHIVE_FILE_FILTER = "ZIP (*.zip)"
+# 열기 대화상자: 이미지와 ZIP 묶음을 함께
+OPEN_ANY_FILTER = "Images or ZIP (*.png *.jpg *.jpeg *.webp *.bmp *.zip)"
+# QAction 속성: 대화상자를 띄우는 액션 (입력 트레이스 재생에서 제외)
+DIALOG_ACTION_PROPERTY = "simcut_opens_dialog"
 SAVE_FILE_FILTER = "PNG (*.png);;JPEG (*.jpg *.jpeg);;WebP (*.webp);;BMP (*.bmp)"
 
 DEFAULT_PEN_WIDTH = 2
@@ -0,0 +1,23 @@
+"""프로세스 메모리 조회 · 표시 도우미 (Qt 비의존)."""
+from __future__ import annotations
+import os
+import sys
+
+
+def process_rss() -> int:
+    """현재 RSS. /proc이 없으면 최대 RSS(ru_maxrss)로 대신합니다."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return 0
+
+
+def format_bytes(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
@@ -0,0 +1,154 @@
+"""Chrome 트레이스 형식(chrome://tracing · Perfetto) 프로파일링 구간 기록.
+
+    SIMCUT_PROFILE=profile.json python -m src.main
+
+    with profiling.span("decode", path=path) as args:
+        image = ...
+        args["size"] = image.size   # 구간 종료 시점에 기록될 인자 추가
+
+꺼져 있으면 span()은 공유 no-op 객체를 돌려주므로 비용은 함수 호출 한 번 수준입니다.
+"""
+from __future__ import annotations
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+PROFILE_ENV = "SIMCUT_PROFILE"
+# 기록 구간 상한 (이후는 버리고 개수만 셈)
+MAX_EVENTS = 1_000_000
+
+_enabled = False
+_origin_ns = 0
+_events: List[dict] = []
+_thread_names: Dict[int, str] = {}
+_dropped = 0
+_lock = threading.Lock()
+
+
+class _NullArgs(dict):
+    """꺼져 있을 때 span 인자 대입을 무시하는 공유 dict."""
+
+    def __setitem__(self, key, value) -> None:
+        pass
+
+    def update(self, *args, **kwargs) -> None:
+        pass
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> dict:
+        return _NULL_ARGS
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_ARGS = _NullArgs()
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: Dict[str, Any]) -> None:
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> Dict[str, Any]:
+        self.start = time.perf_counter_ns()
+        return self.args
+
+    def __exit__(self, *exc) -> None:
+        end = time.perf_counter_ns()
+        _record(self.name, self.cat, self.start, end, self.args)
+
+
+def _record(name: str, cat: str, start_ns: int, end_ns: int, args: Dict[str, Any]) -> None:
+    global _dropped
+    if not _enabled:
+        return  # 구간 도중 stop()된 경우
+    tid = threading.get_ident()
+    event = {
+        "name": name,
+        "cat": cat,
+        "ph": "X",
+        "ts": (start_ns - _origin_ns) / 1000,
+        "dur": (end_ns - start_ns) / 1000,
+        "tid": tid,
+        "args": {k: _jsonable(v) for k, v in args.items()},
+    }
+    with _lock:  # 워커 스레드 구간과 상한 · 버린 수 · 스레드 이름을 함께 갱신
+        if not _enabled:
+            return
+        if len(_events) >= MAX_EVENTS:
+            _dropped += 1
+            return
+        if tid not in _thread_names:
+            _thread_names[tid] = threading.current_thread().name
+        _events.append(event)
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (tuple, list)):
+        return [_jsonable(v) for v in value]
+    return str(value)
+
+
+def span(name: str, cat: str = "simcut", **args: Any):
+    """구간 하나를 기록하는 컨텍스트 관리자. 같은 스레드의 구간은 시간으로 중첩됩니다."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, cat, args)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def start() -> None:
+    """기록을 시작합니다 (이전 기록은 버림)."""
+    global _enabled, _origin_ns, _dropped
+    with _lock:
+        _events.clear()
+        _thread_names.clear()
+        _dropped = 0
+        _origin_ns = time.perf_counter_ns()
+        _enabled = True
+
+
+def stop(path: Optional[str] = None) -> int:
+    """기록을 멈추고 path가 있으면 트레이스 JSON으로 저장합니다. 기록된 구간 수를 반환합니다."""
+    global _enabled
+    with _lock:
+        _enabled = False
+        events = list(_events)
+        names = dict(_thread_names)
+        dropped = _dropped
+    if path:
+        write_trace(path, events, names, dropped)
+    return len(events)
+
+
+def write_trace(
+    path: str, events: List[dict], thread_names: Dict[int, str], dropped: int = 0,
+) -> None:
+    pid = os.getpid()
+    metadata = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+        for tid, name in thread_names.items()
+    ]
+    trace = {
+        "traceEvents": metadata + [{**e, "pid": pid} for e in events],
+        "displayTimeUnit": "ms",
+        "otherData": {"dropped_events": dropped},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trace, f, ensure_ascii=False)
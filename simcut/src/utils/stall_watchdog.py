@@ -0,0 +1,159 @@
+"""GUI 스레드 멈춤 감시.
+
+이벤트 루프의 QTimer가 주기적으로 beat()를 호출하고, 감시 스레드는 마지막 beat 이후
+threshold를 넘기면 sys._current_frames()로 GUI 스레드의 Python 스택을 떠서 기록합니다.
+멈춤이 이어지는 동안에는 threshold마다 스택을 다시 떠서 어디에 머무는지 보여 줍니다.
+
+로그는 JSON 줄 형식이며 max_bytes를 넘으면 .1 파일로 넘기고 새로 씁니다.
+"""
+from __future__ import annotations
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, List, Optional
+
+STALL_THRESHOLD = 0.4      # 초
+HEARTBEAT_INTERVAL = 0.1   # 초 (QTimer 주기)
+MAX_LOG_BYTES = 1024 * 1024
+MAX_SAMPLES = 10           # 멈춤 하나당 스택 샘플 수 상한
+STALL_ENV = "SIMCUT_STALL_MS"  # 임계값 재지정 (0이면 끔)
+
+
+@dataclass
+class Stall:
+    started: float                 # 벽시계 시각 (time.time)
+    duration: float = 0.0          # 초 (진행 중이면 감지 시점까지)
+    stacks: List[List[str]] = field(default_factory=list)
+    ended: bool = False
+
+
+class StallWatchdog:
+    """beat()가 threshold 이상 끊기면 GUI 스레드 스택을 기록하는 감시 스레드."""
+
+    def __init__(
+        self,
+        log_path: Optional[str] = None,
+        threshold: float = STALL_THRESHOLD,
+        interval: float = HEARTBEAT_INTERVAL,
+        max_log_bytes: int = MAX_LOG_BYTES,
+        history: int = 50,
+    ) -> None:
+        self._log_path = log_path
+        self._threshold = threshold
+        self._interval = interval
+        self._max_log_bytes = max_log_bytes
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # GUI 스레드(resume)와 감시 스레드(stall)의 로그 쓰기 · 넘기기 직렬화
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._target = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._current: Optional[Stall] = None
+        self._stalls: Deque[Stall] = deque(maxlen=history)
+
+    @property
+    def threshold(self) -> float:
+        return self._threshold
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def stalls(self) -> List[Stall]:
+        with self._lock:
+            return list(self._stalls)
+
+    def start(self) -> None:
+        """감시 대상은 start()를 호출한 스레드 (GUI 스레드에서 호출)."""
+        if self._thread is not None:
+            return
+        self._target = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="simcut-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def beat(self) -> None:
+        """GUI 스레드 심장 박동. 멈춤이 끝났으면 그 길이를 기록합니다."""
+        now = time.monotonic()
+        with self._lock:
+            stall = self._current
+            if stall is not None:
+                stall.duration = now - self._last_beat
+                stall.ended = True
+                self._current = None
+            self._last_beat = now
+        if stall is not None:
+            self._write({"event": "resume", "started": stall.started,
+                         "duration_ms": round(stall.duration * 1000, 1)})
+
+    # ── 감시 스레드 ─────────────────────────────────────────────
+    def _run(self) -> None:
+        poll = min(self._interval, self._threshold / 2)
+        while not self._stop.wait(poll):
+            now = time.monotonic()
+            with self._lock:
+                blocked = now - self._last_beat
+                stall = self._current
+                if blocked < self._threshold:
+                    continue
+                if stall is None:
+                    stall = Stall(started=time.time() - blocked)
+                    self._current = stall
+                    self._stalls.append(stall)
+                elif len(stall.stacks) >= MAX_SAMPLES or \
+                        blocked < self._threshold * (len(stall.stacks) + 1):
+                    continue  # threshold마다 한 번씩만 다시 샘플링
+                stall.duration = blocked
+            stack = self._capture()
+            with self._lock:
+                if self._current is not stall:
+                    continue  # 캡처 도중 멈춤이 끝남
+                stall.stacks.append(stack)
+            self._write({"event": "stall", "started": stall.started,
+                         "blocked_ms": round(blocked * 1000, 1), "sample": len(stall.stacks),
+                         "stack": stack})
+
+    def _capture(self) -> List[str]:
+        frame = sys._current_frames().get(self._target)
+        if frame is None:
+            return []
+        return [line.rstrip("\n") for line in traceback.format_stack(frame)]
+
+    def _write(self, record: dict) -> None:
+        if not self._log_path:
+            return
+        record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), **record}
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._write_lock:
+            try:
+                if os.path.exists(self._log_path) and os.path.getsize(self._log_path) > self._max_log_bytes:
+                    os.replace(self._log_path, self._log_path + ".1")
+                with open(self._log_path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except OSError:
+                pass  # 로그 실패가 앱에 영향을 주지 않도록 무시
+
+
+def threshold_from_env(default: float = STALL_THRESHOLD) -> float:
+    """SIMCUT_STALL_MS 환경 변수 (ms). 잘못된 값이면 기본값."""
+    value = os.environ.get(STALL_ENV)
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value) / 1000)
+    except ValueError:
+        return default
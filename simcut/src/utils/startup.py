@@ -0,0 +1,164 @@
+"""앱 시작 시간 측정 (Qt 비의존).
+
+    SIMCUT_STARTUP=1 python -m src.main              # 보고서를 표준 에러로
+    SIMCUT_STARTUP=startup.txt python -m src.main    # 파일로
+
+단계별 시간(첫 페인트까지)과 -X importtime처럼 모듈별 import 시간(누적 · 자체)을 보고합니다.
+import 측정은 builtins.__import__를 감싸므로 환경 변수를 줬을 때만 켭니다.
+"""
+from __future__ import annotations
+import builtins
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+STARTUP_ENV = "SIMCUT_STARTUP"
+# 첫 페인트까지 목표 시간 (초). 넘으면 보고서에 표시합니다.
+TARGET_SECONDS = 0.3
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    name: str
+    cumulative: float  # 초 (하위 import 포함)
+    own: float         # 초 (하위 import 제외)
+
+
+def process_age() -> Optional[float]:
+    """프로세스 시작 후 경과 시간 (인터프리터 기동 포함, /proc이 없으면 None)."""
+    try:
+        with open("/proc/self/stat", "rb") as f:
+            fields = f.read().rsplit(b")", 1)[1].split()
+        with open("/proc/uptime", "rb") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class StartupTimer:
+    """mark(name)로 단계 경계를 기록합니다. 시각은 생성 시점 기준 초입니다."""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        # 타이머 생성 전(인터프리터 기동 · 첫 import)에 흐른 시간
+        self.before_origin = process_age()
+        self._marks: List[Tuple[str, float]] = []
+        self._imports: List[ImportTiming] = []
+        self._stack: List[float] = []  # 진행 중인 import의 하위 누적 시간
+        self._original_import = None
+        self._thread = threading.get_ident()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def mark(self, name: str) -> float:
+        now = self.elapsed()
+        self._marks.append((name, now))
+        return now
+
+    def seconds_to(self, name: str) -> Optional[float]:
+        for mark, at in self._marks:
+            if mark == name:
+                return at
+        return None
+
+    def phases(self) -> List[Tuple[str, float, float]]:
+        """(이름, 단계 시간, 누적 시간) 목록."""
+        result = []
+        previous = 0.0
+        for name, at in self._marks:
+            result.append((name, at - previous, at))
+            previous = at
+        return result
+
+    @property
+    def imports(self) -> List[ImportTiming]:
+        return list(self._imports)
+
+    # ── import 측정 ─────────────────────────────────────────────
+    def trace_imports(self) -> None:
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop_tracing(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        # 이미 읽은 모듈 · 다른 스레드의 import는 그대로 통과
+        if level or threading.get_ident() != self._thread:
+            return original(name, globals, locals, fromlist, level)
+        label = name
+        if name in sys.modules:
+            # from 패키지 import 하위모듈: 아직 읽지 않은 하위 모듈이 있으면 그 이름으로 측정
+            package = sys.modules[name]
+            missing = [f for f in fromlist or () if f != "*" and not hasattr(package, f)]
+            if not missing:
+                return original(name, globals, locals, fromlist, level)
+            label = ", ".join(f"{name}.{f}" for f in missing)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            self._imports.append(ImportTiming(label, total, total - children))
+
+    # ── 보고서 ──────────────────────────────────────────────────
+    def report(self, top: int = 20) -> str:
+        lines = ["simcut startup"]
+        if self.before_origin is not None:
+            lines.append(f"  {'(interpreter + early imports)':<28} {self.before_origin * 1000:8.1f} ms")
+        for name, duration, at in self.phases():
+            lines.append(f"  {name:<28} {duration * 1000:8.1f} ms  (t={at * 1000:.1f})")
+        first_paint = self.seconds_to("first_paint")
+        if first_paint is not None:
+            total = first_paint + (self.before_origin or 0.0)
+            verdict = "ok" if total <= TARGET_SECONDS else "SLOW"
+            lines.append(
+                f"  time to first paint          {total * 1000:8.1f} ms  "
+                f"(target {TARGET_SECONDS * 1000:.0f} ms: {verdict})"
+            )
+        if self._imports:
+            lines.append(f"imports (top {top} by cumulative)")
+            lines.append(f"  {'cumulative':>10} {'self':>9}  module")
+            for timing in sorted(self._imports, key=lambda t: t.cumulative, reverse=True)[:top]:
+                lines.append(f"  {timing.cumulative * 1000:8.1f}ms {timing.own * 1000:7.1f}ms  {timing.name}")
+        return "\n".join(lines)
+
+    def write_report(self, destination: str) -> None:
+        """destination이 "1"이면 표준 에러, 아니면 파일 경로."""
+        text = self.report()
+        if destination == "1":
+            print(text, file=sys.stderr, flush=True)
+            return
+        with open(destination, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+def warm_imports(modules: Iterable[str]) -> threading.Thread:
+    """첫 사용 때 읽을 무거운 모듈을 백그라운드 스레드에서 미리 읽습니다."""
+    names = list(modules)
+
+    def run() -> None:
+        import importlib
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+
+    thread = threading.Thread(target=run, name="simcut-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -200,7 +200,7 @@ QSplitter::handle:hover {{
 }}
 
 /* ── 리스트 위젯 (파일 탐색기) ───────────────── */
-QListWidget {{
+QListView {{
     background-color: {SURFACE};
     color: {TEXT_PRIMARY};
     border: none;
@@ -208,18 +208,18 @@ QListWidget {{
     outline: none;
     padding: 4px;
 }}
-QListWidget::item {{
+QListView::item {{
     background-color: transparent;
     color: {TEXT_PRIMARY};
     border-radius: 6px;
     padding: 6px 4px;
     margin: 2px 0;
 }}
-QListWidget::item:selected {{
+QListView::item:selected {{
     background-color: {ACCENT};
     color: white;
 }}
-QListWidget::item:hover:!selected {{
+QListView::item:hover:!selected {{
     background-color: {SURFACE_RAISED};
 }}
 
@@ -0,0 +1,95 @@
+import io
+import threading
+import zipfile
+import pytest
+from PIL import Image
+from src.core import archive
+from src.core.image_handler import ImageHandler
+from src.core.image_meta import read_meta
+
+
+def _png(size=(8, 4), color="red") -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    """b.png, a/c.png, notes.txt, 폴더, macOS 메타데이터가 든 ZIP."""
+    path = tmp_path / "shots.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("b.png", _png((8, 4)))
+        zf.writestr("a/c.png", _png((16, 9), "blue"))
+        zf.writestr("a/", b"")
+        zf.writestr("notes.txt", b"x")
+        zf.writestr("__MACOSX/a/._c.png", b"junk")
+    yield str(path)
+    archive.close_all()
+
+
+def test_split_member_only_for_zip_paths():
+    assert archive.split_member("/x/a.zip!/b/c.png") == ("/x/a.zip", "b/c.png")
+    assert archive.split_member("/x/a.png") is None
+    assert archive.split_member("/x/a!/b.png") is None
+    assert archive.is_archive("/x/A.ZIP") and not archive.is_archive("/x/a.zip!/b.zip")
+
+
+def test_list_images_skips_folders_and_metadata(bundle):
+    assert archive.list_images(bundle) == [archive.member_path(bundle, n) for n in ("a/c.png", "b.png")]
+
+
+def test_member_loads_and_reads_meta_without_extraction(bundle, tmp_path):
+    member = archive.member_path(bundle, "a/c.png")
+    meta = read_meta(member)
+    assert (meta.width, meta.height, meta.format, meta.file_size) == (16, 9, "PNG", len(_png((16, 9), "blue")))
+    image = ImageHandler().load(member)
+    assert image.size == (16, 9) and image.getpixel((0, 0))[:3] == (0, 0, 255)
+    assert archive.exists(member) and not archive.exists(archive.member_path(bundle, "gone.png"))
+    with pytest.raises(FileNotFoundError):
+        ImageHandler().load(archive.member_path(bundle, "gone.png"))
+    assert [p.name for p in tmp_path.iterdir()] == ["shots.zip"]  # 임시 파일 없음
+
+
+def test_open_archive_handles_are_reused_until_file_changes(bundle):
+    first = archive._zip(bundle)
+    assert archive._zip(bundle) is first
+    with zipfile.ZipFile(bundle, "a") as zf:
+        zf.writestr("d.png", _png())
+    assert archive._zip(bundle) is not first
+    assert archive.exists(archive.member_path(bundle, "d.png"))
+
+
+def test_zip_writer_stores_encoded_images_and_deflates_the_rest(tmp_path):
+    path = tmp_path / "out.zip"
+    writer = archive.ZipWriter(str(path), max_pending_bytes=64)  # 한 번에 하나씩만 대기
+    payloads = {f"{i}.png": _png() for i in range(5)}
+    payloads["raw.bmp"] = b"\0" * 4096
+    for name, data in payloads.items():
+        writer.add(name, data)
+    writer.close()
+    assert writer.written == 6
+    with zipfile.ZipFile(path) as zf:
+        assert zf.namelist() == list(payloads)
+        assert {zf.read(n) == d for n, d in payloads.items()} == {True}
+        assert zf.getinfo("0.png").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("raw.bmp").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_zip_writer_reraises_write_errors(tmp_path):
+    writer = archive.ZipWriter(str(tmp_path / "out.zip"))
+    failed = threading.Event()
+
+    def broken(*args):
+        failed.set()
+        raise OSError("disk full")
+
+    writer._zip.writestr = broken
+    writer.add("a.png", b"x")
+    assert failed.wait(5)
+    with pytest.raises(OSError, match="disk full"):
+        for _ in range(100):
+            writer.add("b.png", b"x")
+    with pytest.raises(OSError):
+        writer.close()
+    assert writer.written == 0
@@ -0,0 +1,32 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from src.core.batch_export import ExportTarget, encode_targets, extension_for
+from src.core.export_budget import ExportBudget
+
+
+def test_extension_for_jpeg_is_jpg():
+    assert extension_for("JPEG") == "jpg"
+    assert extension_for("PNG") == "png"
+    assert ExportTarget("WEBP").extension == "webp"
+
+
+def test_encode_targets_returns_one_result_per_format_in_order():
+    img = Image.new("RGB", (64, 48), (200, 100, 50))
+    targets = [ExportTarget("PNG"), ExportTarget("JPEG", options={"quality": 80}), ExportTarget("BMP")]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = encode_targets(img, targets, pool)
+    assert [r.format for r in results] == ["PNG", "JPEG", "BMP"]
+    for result in results:
+        decoded = Image.open(io.BytesIO(result.data))
+        assert decoded.size == (64, 48)
+    assert results[1].options == {"quality": 80}
+
+
+def test_encode_targets_applies_per_format_budget():
+    img = Image.effect_mandelbrot((200, 150), (-2, -1.5, 1, 1.5), 100).convert("RGB")
+    targets = [ExportTarget("PNG"), ExportTarget("JPEG", budget=ExportBudget(max_bytes=4000))]
+    with ThreadPoolExecutor(max_workers=2) as pool, ThreadPoolExecutor(max_workers=4) as search:
+        png, jpeg = encode_targets(img, targets, pool, search)
+    assert jpeg.size <= 4000 and jpeg.fits
+    assert "quality" not in png.options
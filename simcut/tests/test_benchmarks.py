@@ -0,0 +1,79 @@
+import json
+import pytest
+from PyQt6.QtWidgets import QApplication
+from benchmarks.harness import Case, compare, measure, percentile
+from benchmarks.synthetic import make_image, make_shapes, size_for
+
+
+@pytest.fixture(scope="session")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_percentile_interpolates():
+    values = [4.0, 1.0, 3.0, 2.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 2.5
+    assert percentile(values, 100) == 4.0
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA", "P"])
+def test_make_image_is_deterministic_and_sized(mode):
+    image = make_image(0.05, mode, seed=3)
+    assert image.mode == mode
+    assert image.size == size_for(0.05)
+    assert image.tobytes() == make_image(0.05, mode, seed=3).tobytes()
+
+
+def test_make_shapes_respects_bounds_and_mosaic_ratio():
+    shapes = make_shapes(40, (300, 200), mosaic_ratio=0.25, seed=1)
+    assert len(shapes) == 40
+    assert sum(1 for s in shapes if s.blur_radius > 0) == 10
+    assert all(s.x + s.width <= 300 and s.y + s.height <= 200 for s in shapes)
+
+
+def test_measure_reports_percentiles_and_skips_setup_time():
+    calls = []
+    case = Case("noop", lambda: calls.append("run"), {"n": 1}, setup=lambda: calls.append("setup"))
+    result = measure(case, repeat=3, warmup=1)
+    assert result["id"] == "noop[n=1]"
+    assert result["repeat"] == 3
+    assert calls == ["setup", "run"] * 4
+    assert result["min"] <= result["p50"] <= result["p99"] <= result["max"]
+    assert result["peak_rss_bytes"] > 0
+
+
+def test_compare_flags_only_slowdowns_over_threshold():
+    baseline = [
+        {"id": "a", "p50": 0.100},
+        {"id": "b", "p50": 0.100},
+        {"id": "c", "p50": 0.0001},
+    ]
+    results = [
+        {"id": "a", "p50": 0.130},   # 30% 느려짐
+        {"id": "b", "p50": 0.110},   # 임계값 이내
+        {"id": "c", "p50": 0.0010},  # 비율은 크지만 절대 차이가 잡음 수준
+        {"id": "d", "p50": 1.0},     # 기준 없음
+        {"id": "e", "error": "boom"},
+    ]
+    regressions = compare(results, baseline, threshold=0.2)
+    assert [r.id for r in regressions] == ["a"]
+    assert regressions[0].ratio == pytest.approx(1.3)
+
+
+def test_runner_writes_json_and_fails_on_regression(app, tmp_path):
+    from benchmarks.__main__ import EXIT_OK, EXIT_REGRESSION, main
+    out = tmp_path / "results.json"
+    args = ["--megapixels", "0.05", "--modes", "RGB", "-n", "1", "--warmup", "0", "-k", "thumbnail"]
+    assert main([*args, "-o", str(out)]) == EXIT_OK
+    data = json.loads(out.read_text())
+    assert [r["id"] for r in data["results"]] == ["main_window._make_thumbnail[mp=0.05,mode=RGB]"]
+    # 기준을 터무니없이 빠르게 조작하면 회귀로 판정
+    data["results"][0]["p50"] = 1e-9
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(data))
+    gate = ["--baseline", str(baseline), "--threshold", "0", "--min-delta-ms", "0"]
+    assert main([*args, *gate]) == EXIT_REGRESSION
+    assert main([*args, "--baseline", str(out), "--threshold", "1000"]) == EXIT_OK
@@ -767,3 +767,30 @@ def test_crop_handle_resize(app, sample_image):
     )
     canvas.mouseMoveEvent(move)
     assert canvas._crop_rect.width() < original_width
+
+
+def test_mosaic_cache_reuses_unchanged_regions(app, sample_image):
+    canvas = Canvas(ShapeManager())
+    canvas.load_image(sample_image)
+    canvas._shape_manager.add(Shape(ShapeType.RECTANGLE, 2, 2, 20, 20, None, 1, None, blur_radius=10))
+    canvas.grab()
+    canvas.grab()
+    assert (canvas._mosaic_hits, canvas._mosaic_misses) == (1, 1)
+    canvas.set_zoom(2.0)  # 표시 픽스맵이 바뀌면 다시 계산
+    canvas.grab()
+    assert canvas._mosaic_misses == 2
+
+
+def test_hud_lines_report_paint_display_and_provider(app, sample_image):
+    canvas = Canvas(ShapeManager())
+    canvas.load_image(sample_image)
+    canvas.set_hud_provider(lambda: ["slot 1.0 MB"])
+    canvas.hud_visible = True
+    canvas.set_zoom(2.0)
+    canvas.grab()
+    lines = canvas.hud_lines()
+    assert lines[0].startswith("paint ")
+    assert lines[1].startswith("rebuild ") and canvas._last_rebuild_seconds > 0
+    assert any(line.startswith("display ") and "/ source " in line for line in lines)
+    assert lines[-1] == "slot 1.0 MB"
+    assert canvas.paint_count == 1
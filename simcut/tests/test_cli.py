@@ -0,0 +1,87 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from PIL import Image
+from src import cli
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _write_recipe(tmp_path, data):
+    path = tmp_path / "recipe.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def _make_images(folder, names):
+    folder.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        Image.new("RGB", (40, 30), "red").save(folder / name)
+
+
+def test_expand_inputs_handles_dirs_globs_and_filters_extensions(tmp_path):
+    _make_images(tmp_path / "in", ["a.png", "b.jpg"])
+    _make_images(tmp_path / "in" / "sub", ["c.png"])
+    (tmp_path / "in" / "notes.txt").write_text("x")
+    flat = cli.expand_inputs([str(tmp_path / "in")])
+    assert [Path(p).name for p in flat] == ["a.png", "b.jpg"]
+    deep = cli.expand_inputs([str(tmp_path / "in")], recursive=True)
+    assert sorted(Path(p).name for p in deep) == ["a.png", "b.jpg", "c.png"]
+    globbed = cli.expand_inputs([str(tmp_path / "in" / "*.png"), str(tmp_path / "in" / "a.png")])
+    assert [Path(p).name for p in globbed] == ["a.png"]
+
+
+def test_main_applies_recipe_and_writes_every_output(tmp_path, capsys):
+    _make_images(tmp_path / "in", ["a.png", "b.png"])
+    recipe = _write_recipe(tmp_path, {
+        "crop": [0, 0, 20, 20], "blur": [[0, 0, 10, 10]],
+        "outputs": [{"format": "PNG"}, {"format": "JPEG", "quality": 70}],
+    })
+    out = tmp_path / "out"
+    code = cli.main([recipe, str(tmp_path / "in"), "-o", str(out), "-j", "1"])
+    assert code == cli.EXIT_OK
+    assert sorted(p.name for p in out.iterdir()) == ["a.jpg", "a.png", "b.jpg", "b.png"]
+    assert Image.open(out / "a.png").size == (20, 20)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("[1/2] OK")
+
+
+def test_main_exits_nonzero_when_a_file_fails(tmp_path, capsys):
+    _make_images(tmp_path / "in", ["good.png"])
+    (tmp_path / "in" / "bad.png").write_bytes(b"not an image")
+    recipe = _write_recipe(tmp_path, {})
+    code = cli.main([recipe, str(tmp_path / "in"), "-o", str(tmp_path / "out"), "-j", "1", "--json"])
+    assert code == cli.EXIT_FAILED
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert {e["source"].endswith("bad.png") for e in events if e["error"]} == {True}
+    assert (tmp_path / "out" / "good.png").exists()
+
+
+def test_main_rejects_output_name_collisions(tmp_path):
+    _make_images(tmp_path / "a", ["x.png"])
+    _make_images(tmp_path / "b", ["x.png"])
+    recipe = _write_recipe(tmp_path, {})
+    code = cli.main([recipe, str(tmp_path / "a"), str(tmp_path / "b"), "-o", str(tmp_path / "out")])
+    assert code == cli.EXIT_USAGE
+
+
+def test_main_rejects_invalid_recipe(tmp_path):
+    _make_images(tmp_path / "in", ["a.png"])
+    recipe = _write_recipe(tmp_path, {"crop": [1]})
+    assert cli.main([recipe, str(tmp_path / "in"), "-o", str(tmp_path / "out")]) == cli.EXIT_USAGE
+
+
+def test_cli_runs_with_worker_processes_without_importing_qt(tmp_path):
+    _make_images(tmp_path / "in", ["a.png", "b.png", "c.png"])
+    recipe = _write_recipe(tmp_path, {"blur": [[0, 0, 10, 10]]})
+    code = (
+        "import sys\n"
+        "from src import cli\n"
+        f"rc = cli.main([{recipe!r}, {str(tmp_path / 'in')!r}, '-o', {str(tmp_path / 'out')!r}, '-j', '2'])\n"
+        "assert 'PyQt6' not in sys.modules, 'PyQt6 imported'\n"
+        "sys.exit(rc)\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+    assert len(list((tmp_path / "out").iterdir())) == 3
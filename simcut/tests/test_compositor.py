@@ -0,0 +1,71 @@
+import pytest
+from PIL import Image
+from src.core.compositor import composite
+from src.core.resize import ResizeSpec, downscale
+from src.core.shape_manager import Shape, ShapeType
+
+
+def _rect(x, y, w, h, fill="#0000FF", blur=0):
+    return Shape(ShapeType.RECTANGLE, x, y, w, h, None, 1, fill, blur_radius=blur)
+
+
+def test_composite_does_not_modify_source():
+    img = Image.new("RGB", (100, 100), (255, 255, 255))
+    result = composite(img, [_rect(10, 10, 20, 20)], 1.0)
+    assert img.getpixel((15, 15)) == (255, 255, 255)
+    assert result.getpixel((15, 15)) == (0, 0, 255)
+
+
+def test_composite_maps_base_scale_to_original_pixels():
+    img = Image.new("RGB", (200, 200), (255, 255, 255))
+    # base_scale 0.5 → 도형 좌표 (10, 10) 은 원본 (20, 20)
+    result = composite(img, [_rect(10, 10, 10, 10)], 0.5)
+    assert result.getpixel((30, 30)) == (0, 0, 255)
+    assert result.getpixel((15, 15)) == (255, 255, 255)
+
+
+def test_composite_with_resize_draws_at_output_scale():
+    img = Image.new("RGB", (400, 200), (255, 255, 255))
+    result = composite(img, [_rect(200, 100, 100, 50)], 1.0, ResizeSpec(long_edge=200))
+    assert result.size == (200, 100)
+    assert result.getpixel((125, 62)) == (0, 0, 255)
+    assert result.getpixel((90, 40)) == (255, 255, 255)
+
+
+def test_resize_long_edge_never_upscales():
+    assert ResizeSpec(long_edge=1600).target_size((800, 600)) == (800, 600)
+    assert ResizeSpec(long_edge=1600).target_size((3200, 1800)) == (1600, 900)
+
+
+def test_resize_percent_and_exact():
+    assert ResizeSpec(percent=50).target_size((300, 201)) == (150, 100)
+    assert ResizeSpec(width=64, height=32).target_size((300, 200)) == (64, 32)
+
+
+def test_resize_spec_validation():
+    with pytest.raises(ValueError):
+        ResizeSpec()
+    with pytest.raises(ValueError):
+        ResizeSpec(long_edge=100, percent=50)
+    with pytest.raises(ValueError):
+        ResizeSpec(width=100)
+    with pytest.raises(ValueError):
+        ResizeSpec(percent=0)
+
+
+def test_downscale_returns_requested_size():
+    img = Image.new("RGB", (1000, 800), (10, 20, 30))
+    small = downscale(img, (125, 100))
+    assert small.size == (125, 100)
+    assert small.getpixel((50, 50)) == (10, 20, 30)
+
+
+def test_composite_palette_image_with_shapes():
+    img = Image.new("RGB", (100, 80), (200, 200, 200)).quantize(16)
+    shapes = [
+        Shape(ShapeType.RECTANGLE, 10, 10, 30, 30, "#FF0000", 2, None),
+        Shape(ShapeType.ELLIPSE, 50, 20, 30, 30, None, 1, None, blur_radius=10),
+    ]
+    result = composite(img, shapes, 1.0)
+    assert result.mode == "RGB"
+    assert result.getpixel((10, 10)) == (255, 0, 0)
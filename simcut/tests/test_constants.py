@@ -18,3 +18,9 @@ def test_default_pen_width_is_positive():
 
 def test_app_name():
     assert APP_NAME == "simcut"
+
+
+def test_open_file_extensions_match_filter():
+    from src.utils.constants import OPEN_FILE_FILTER, OPEN_FILE_EXTENSIONS
+    for ext in OPEN_FILE_EXTENSIONS:
+        assert f"*{ext}" in OPEN_FILE_FILTER
@@ -0,0 +1,67 @@
+import io
+import math
+import pytest
+from PIL import Image
+from src.core.export_budget import ExportBudget, encode_within_budget, psnr
+
+
+@pytest.fixture
+def photo():
+    return Image.effect_mandelbrot((320, 240), (-2, -1.5, 1, 1.5), 100).convert("RGB")
+
+
+def test_budget_requires_exactly_one_limit():
+    with pytest.raises(ValueError):
+        ExportBudget()
+    with pytest.raises(ValueError):
+        ExportBudget(max_bytes=1000, min_psnr=30.0)
+
+
+@pytest.mark.parametrize("fmt", ["JPEG", "WEBP", "PNG"])
+def test_max_bytes_result_fits(photo, fmt):
+    result = encode_within_budget(photo, fmt, ExportBudget(max_bytes=8000))
+    assert result.fits
+    assert result.size <= 8000
+    Image.open(io.BytesIO(result.data)).load()
+
+
+def test_jpeg_picks_highest_quality_within_budget(photo):
+    result = encode_within_budget(photo, "JPEG", ExportBudget(max_bytes=8000))
+    quality = result.options["quality"]
+    if quality < 95:
+        bigger = io.BytesIO()
+        photo.save(bigger, format="JPEG", quality=quality + 1, optimize=True)
+        assert len(bigger.getvalue()) > 8000
+
+
+def test_min_psnr_result_meets_quality(photo):
+    result = encode_within_budget(photo, "JPEG", ExportBudget(min_psnr=32.0))
+    assert result.fits
+    assert psnr(photo, result.data) >= 32.0
+
+
+def test_png_within_budget_stays_lossless(photo):
+    result = encode_within_budget(photo, "PNG", ExportBudget(max_bytes=10_000_000))
+    assert "colors" not in result.options
+    assert psnr(photo, result.data) == math.inf
+
+
+def test_impossible_budget_returns_smallest_candidate(photo):
+    result = encode_within_budget(photo, "JPEG", ExportBudget(max_bytes=10))
+    assert not result.fits
+    assert result.options["quality"] == 1
+
+
+def test_bmp_reports_over_budget(photo):
+    result = encode_within_budget(photo, "BMP", ExportBudget(max_bytes=100))
+    assert not result.fits
+    assert result.format == "BMP"
+
+
+@pytest.mark.parametrize("mode", ["L", "LA", "P"])
+def test_png_budget_quantizes_grayscale_and_palette_images(mode):
+    noise = Image.effect_noise((160, 120), 64)
+    image = noise.convert(mode) if mode != "P" else noise.convert("RGB").quantize(256)
+    result = encode_within_budget(image, "PNG", ExportBudget(max_bytes=5000))
+    assert "colors" in result.options
+    Image.open(io.BytesIO(result.data)).load()
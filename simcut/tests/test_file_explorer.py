@@ -42,7 +42,7 @@ def test_file_explorer_file_selected_signal(app):
 
     received = []
     explorer.file_selected.connect(received.append)
-    explorer._on_item_clicked(explorer._list.item(0))
+    explorer._on_item_clicked(explorer._model.index(0))
     assert received == [0]
 
 
@@ -54,7 +54,7 @@ def test_file_explorer_signal_correct_index(app):
 
     received = []
     explorer.file_selected.connect(received.append)
-    explorer._on_item_clicked(explorer._list.item(2))
+    explorer._on_item_clicked(explorer._model.index(2))
     assert received == [2]
 
 
@@ -63,7 +63,7 @@ def test_file_explorer_set_current(app):
     explorer.add_file("/a/a.png", _thumb())
     explorer.add_file("/a/b.png", _thumb())
     explorer.set_current(0)
-    assert explorer._list.currentRow() == 0
+    assert explorer.current_index() == 0
 
 
 # ── 파일 삭제 테스트 ──────────────────────────────────────────
@@ -120,3 +120,142 @@ def test_update_thumbnail(app):
     new_thumb = _thumb()
     explorer.update_thumbnail(0, new_thumb)
     assert explorer.count() == 1
+
+
+# ── 가상화 · 썸네일 캐시 ─────────────────────────────────────
+
+def test_add_file_makes_new_row_current(app):
+    explorer = FileExplorer()
+    explorer.add_file("/a/one.png")
+    explorer.add_file("/a/two.png")
+    assert explorer.current_index() == 1
+    assert explorer.selected_indices() == [1]
+
+
+def test_thumbnail_cache_is_bounded(app):
+    from src.ui.file_explorer import THUMBNAIL_CACHE_SIZE
+    explorer = FileExplorer()
+    for i in range(THUMBNAIL_CACHE_SIZE + 10):
+        explorer.add_file(f"/a/{i}.png", _thumb())
+    assert explorer.cached_thumbnail(0) is None
+    assert explorer.cached_thumbnail(THUMBNAIL_CACHE_SIZE + 9) is not None
+    assert len(explorer._model._thumbs) == THUMBNAIL_CACHE_SIZE
+
+
+def test_thumbnail_follows_file_after_removal(app):
+    explorer = FileExplorer()
+    thumbs = [_thumb() for _ in range(3)]
+    for i, thumb in enumerate(thumbs):
+        explorer.add_file(f"/a/{i}.png", thumb)
+    explorer.remove_file(0)
+    assert explorer.cached_thumbnail(0).cacheKey() == thumbs[1].cacheKey()
+
+
+def test_provider_builds_only_visible_thumbnails(app, qtbot):
+    explorer = FileExplorer()
+    explorer.resize(200, 600)
+    requested = []
+
+    def provider(row):
+        requested.append(row)
+        return _thumb()
+
+    explorer.set_thumbnail_provider(provider)
+    for i in range(5000):
+        explorer.add_file(f"/a/{i}.png")
+    explorer.show()
+    qtbot.waitUntil(lambda: bool(requested), timeout=2000)
+    assert min(requested) >= 4900 and len(requested) < 40  # 마지막 행이 보이는 위치
+    requested.clear()
+    explorer.set_current(0)
+    qtbot.waitUntil(lambda: bool(requested), timeout=2000)
+    assert max(requested) < 40
+    assert explorer.thumbnail(2500).isNull() is False  # 프로젝트 저장 등은 캐시 밖 행도 만듦
+    explorer.close()
+
+
+# ── 메타데이터 정렬 · 필터 ───────────────────────────────────
+
+def _sorted_explorer(tmp_path):
+    """크기가 다른 이미지 3개: 추가 순서 big, small, medium."""
+    explorer = FileExplorer()
+    for name, size in (("big.png", 60), ("small.png", 10), ("medium.png", 30)):
+        path = tmp_path / name
+        Image.new("RGB", (size, size), (size, 0, 0)).save(path)
+        explorer.add_file(str(path), _thumb())
+    assert explorer.wait_for_metadata(5)
+    return explorer
+
+
+def _shown(explorer):
+    return [explorer._model.entry(explorer._model.file_at(r)).name for r in range(explorer.shown_count())]
+
+
+def test_metadata_is_read_in_background(app, tmp_path):
+    explorer = _sorted_explorer(tmp_path)
+    meta = explorer.metadata(1)
+    assert (meta.width, meta.height, meta.format) == (10, 10, "PNG")
+    explorer.stop_scanning()
+
+
+def test_sort_keeps_file_indices(app, tmp_path):
+    explorer = _sorted_explorer(tmp_path)
+    explorer.set_sort("dimensions")
+    assert _shown(explorer) == ["small.png", "medium.png", "big.png"]
+    received = []
+    explorer.file_selected.connect(received.append)
+    explorer._on_item_clicked(explorer._model.index(0))
+    assert received == [1]  # 보이는 첫 행이지만 파일 인덱스는 추가 순서 그대로
+    explorer.set_current(0)
+    assert explorer.current_index() == 0 and explorer.selected_indices() == [0]
+    explorer.set_sort("dimensions", descending=True)
+    assert _shown(explorer) == ["big.png", "medium.png", "small.png"]
+    assert explorer.current_index() == 0  # 정렬을 바꿔도 현재 파일 유지
+    explorer.stop_scanning()
+
+
+def test_add_and_remove_while_sorted(app, tmp_path):
+    explorer = _sorted_explorer(tmp_path)
+    explorer.set_sort("name")
+    explorer.add_file("/x/aaa.png")
+    assert _shown(explorer) == ["aaa.png", "big.png", "medium.png", "small.png"]
+    explorer.remove_file(0)  # big.png
+    assert _shown(explorer) == ["aaa.png", "medium.png", "small.png"]
+    assert explorer.count() == 3 and explorer._model.entry(2).name == "aaa.png"
+    explorer.stop_scanning()
+
+
+def test_filter_narrows_incrementally_and_maps_indices(app, tmp_path):
+    explorer = _sorted_explorer(tmp_path)
+    explorer.set_filter("M")
+    assert _shown(explorer) == ["small.png", "medium.png"]
+    explorer.set_filter("me")
+    assert _shown(explorer) == ["medium.png"]
+    assert explorer.count() == 3 and explorer.shown_count() == 1
+    explorer.update_thumbnail(0, _thumb())  # 숨겨진 파일도 인덱스로 갱신 가능
+    explorer.set_filter("")
+    assert _shown(explorer) == ["big.png", "small.png", "medium.png"]
+    explorer.stop_scanning()
+
+
+def test_typing_in_list_goes_to_filter(app):
+    explorer = FileExplorer()
+    explorer.add_file("/a/cat.png")
+    explorer.add_file("/a/dog.png")
+    key_event = QKeyEvent(QEvent.Type.KeyPress, Qt.Key.Key_D, Qt.KeyboardModifier.NoModifier, "d")
+    assert explorer.eventFilter(explorer._list, key_event)
+    assert explorer.shown_count() == 1
+
+
+def test_add_files_inserts_batch_with_known_metadata(app, tmp_path):
+    from src.core.image_meta import ImageMeta
+
+    explorer = FileExplorer()
+    metas = [ImageMeta(30, 30, "PNG", 10, 1.0), ImageMeta(10, 10, "PNG", 10, 1.0)]
+    explorer.add_files(["/a/big.png", "/a/small.png"], metas)
+    assert explorer.count() == 2 and explorer.metadata(1) is metas[1]
+    assert explorer.current_index() == -1  # 현재 항목은 호출한 쪽이 정함
+    explorer.set_sort("dimensions")
+    explorer.add_files(["/a/medium.png"], [ImageMeta(20, 20, "PNG", 10, 1.0)])
+    assert _shown(explorer) == ["small.png", "medium.png", "big.png"]
+    explorer.stop_scanning()
@@ -0,0 +1,62 @@
+import os
+import threading
+import pytest
+from PIL import Image
+from src.core.folder_scan import FolderScan, iter_images
+
+
+def _tree(tmp_path):
+    """root/{b.png, a.JPG, notes.txt, sub/c.png, sub/deeper/d.webp, .hidden/e.png}"""
+    for rel in ("b.png", "a.JPG", "sub/c.png", "sub/deeper/d.webp", ".hidden/e.png"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        Image.new("RGB", (8, 4)).save(path, format="JPEG" if rel.endswith("JPG") else None)
+    (tmp_path / "notes.txt").write_text("x")
+    return tmp_path
+
+
+def test_iter_images_walks_depth_first_in_name_order(tmp_path):
+    root = _tree(tmp_path)
+    found = [os.path.relpath(p, root) for p in iter_images(str(root))]
+    assert found == ["a.JPG", "b.png", os.path.join("sub", "c.png"), os.path.join("sub", "deeper", "d.webp")]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="no symlinks")
+def test_iter_images_does_not_follow_directory_links(tmp_path):
+    root = _tree(tmp_path)
+    try:
+        os.symlink(root, root / "sub" / "loop")
+    except OSError:
+        pytest.skip("symlinks not permitted")
+    assert len(list(iter_images(str(root)))) == 4
+
+
+def test_scan_streams_batches_and_skips_unreadable(tmp_path):
+    root = _tree(tmp_path)
+    (root / "sub" / "broken.png").write_bytes(b"not an image")
+    batches, done = [], []
+    scan = FolderScan(str(root), on_batch=batches.append, on_done=lambda *r: done.append(r), batch_size=2)
+    scan.start()
+    assert scan.wait(5)
+    assert all(len(batch) <= 2 for batch in batches)
+    items = [item for batch in batches for item in batch]
+    assert [os.path.basename(p) for p, _ in items] == ["a.JPG", "b.png", "c.png", "d.webp"]
+    assert {(m.width, m.height) for _, m in items} == {(8, 4)}
+    assert done == [(4, 1, False)]
+
+
+def test_scan_cancel_stops_after_current_batch(tmp_path):
+    root = _tree(tmp_path)
+    release = threading.Event()
+    batches, done = [], []
+
+    def on_batch(batch):
+        batches.append(batch)
+        release.wait(5)
+
+    scan = FolderScan(str(root), on_batch=on_batch, on_done=lambda *r: done.append(r), batch_size=1)
+    scan.start()
+    scan.cancel()
+    release.set()
+    assert scan.wait(5)
+    assert len(batches) <= 1 and done[0][2] is True
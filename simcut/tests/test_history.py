@@ -0,0 +1,93 @@
+import pytest
+from src.core.history import EditHistory
+from src.core.shape_manager import Shape, ShapeManager, ShapeState, ShapeType
+
+
+def _shape(x):
+    return Shape(ShapeType.RECTANGLE, x, 0, 10, 10, "#FF0000", 2, None)
+
+
+def _tracked(every=4):
+    sm = ShapeManager()
+    history = EditHistory(sm.state(), checkpoint_every=every)
+    sm.set_listener(lambda manager, op, args: history.record(op, args, manager.state()))
+    return sm, history
+
+
+def _edit(sm, count):
+    states = [sm.state()]
+    for i in range(count):
+        if i % 5 == 4:
+            sm.undo()
+        elif i % 7 == 6:
+            sm.remove(0)
+        else:
+            sm.add(_shape(i))
+        states.append(sm.state())
+    return states
+
+
+def test_state_at_matches_every_recorded_state():
+    sm, history = _tracked(every=4)
+    states = _edit(sm, 30)
+    assert len(history) == 30
+    for position, expected in enumerate(states):
+        assert history.state_at(position) == expected
+
+
+def test_seek_replays_at_most_k_minus_one_ops(monkeypatch):
+    import src.core.history as history_module
+    sm, history = _tracked(every=8)
+    _edit(sm, 40)
+    applied = []
+    original = history_module._apply
+    monkeypatch.setattr(history_module, "_apply", lambda m, e: (applied.append(e), original(m, e)))
+    for position in range(41):
+        applied.clear()
+        history.state_at(position)
+        assert len(applied) == position % 8
+
+
+def test_recording_after_seek_truncates_future():
+    sm, history = _tracked(every=4)
+    states = _edit(sm, 10)
+    listener = sm._listener
+    sm.set_listener(None)  # 이동 자체는 기록하지 않음 (MainWindow와 동일)
+    sm.restore(history.seek(3))
+    sm.set_listener(listener)
+    sm.add(_shape(99))
+    assert len(history) == 4
+    assert history.position == 4
+    assert history.state_at(4) == sm.state()
+    assert history.state_at(3) == states[3]
+
+
+def test_consecutive_replaces_of_same_shape_coalesce():
+    sm, history = _tracked(every=2)
+    sm.add(_shape(0))
+    for x in range(1, 20):
+        sm.replace(0, _shape(x))  # 드래그
+    sm.replace(0, _shape(50))
+    assert [e.op for e in history.entries] == ["add", "replace"]
+    assert history.state_at(2) == sm.state()
+    sm.add(_shape(7))
+    sm.replace(1, _shape(8))
+    sm.replace(0, _shape(9))
+    assert [e.op for e in history.entries] == ["add", "replace", "add", "replace", "replace"]
+    assert history.state_at(len(history)) == sm.state()
+
+
+def test_out_of_range_position_raises():
+    history = EditHistory()
+    with pytest.raises(IndexError):
+        history.seek(1)
+
+
+def test_approx_bytes_counts_shared_shapes_once():
+    history = EditHistory(checkpoint_every=2)
+    shape = _shape(1)
+    empty = history.approx_bytes()
+    history.record("add", (shape,), ShapeState((shape,)))
+    history.record("add", (shape,), ShapeState((shape, shape)))
+    seen = {id(shape)}
+    assert history.approx_bytes() > history.approx_bytes(seen) > empty
@@ -83,3 +83,20 @@ def test_get_image_info():
     assert info["width"] == 100
     assert info["height"] == 100
     assert info["mode"] == "RGB"
+
+
+def test_save_passes_encoder_options():
+    handler = ImageHandler()
+    img = handler.load(str(FIXTURE_PATH))
+    out = OUTPUT_BASE / "output.jpg"
+    handler.save(img, str(out), format="JPEG", quality=10)
+    low = out.stat().st_size
+    handler.save(img, str(out), format="JPEG", quality=95)
+    assert out.stat().st_size > low
+
+
+def test_encode_returns_bytes_without_writing():
+    handler = ImageHandler()
+    img = handler.load(str(FIXTURE_PATH))
+    data = handler.encode(img, "PNG")
+    assert data.startswith(b"\x89PNG")
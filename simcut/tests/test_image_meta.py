@@ -0,0 +1,49 @@
+import os
+import pytest
+from PIL import Image, ImageFile
+from src.core.image_meta import ImageMeta, MetadataScanner, read_meta, sort_key
+
+
+def test_read_meta_uses_header_only(tmp_path, monkeypatch):
+    path = tmp_path / "a.png"
+    Image.new("RGB", (64, 48), "red").save(path)
+
+    def no_decode(self):
+        raise AssertionError("pixels decoded")
+
+    monkeypatch.setattr(ImageFile.ImageFile, "load", no_decode)
+    meta = read_meta(str(path))
+    assert (meta.width, meta.height, meta.format) == (64, 48, "PNG")
+    assert meta.file_size == os.path.getsize(path)
+    assert meta.modified == os.stat(path).st_mtime
+
+
+def test_sort_key_puts_unknown_metadata_last():
+    small = ImageMeta(10, 10, "PNG", 100, 1.0)
+    big = ImageMeta(100, 100, "JPEG", 50, 2.0)
+    names = {"b.png": small, "a.jpg": big, "c.png": None}
+    by = lambda field: sorted(names, key=lambda n: sort_key(field, n, names[n]))  # noqa: E731
+    assert by("name") == ["a.jpg", "b.png", "c.png"]
+    assert by("dimensions") == ["b.png", "a.jpg", "c.png"]
+    assert by("file_size") == ["a.jpg", "b.png", "c.png"]
+    assert by("format") == ["a.jpg", "b.png", "c.png"]
+    with pytest.raises(ValueError):
+        sort_key("colour", "a.png", small)
+
+
+def test_scanner_reports_in_batches_including_failures(tmp_path):
+    paths = []
+    for i in range(5):
+        paths.append(str(tmp_path / f"{i}.png"))
+        Image.new("L", (i + 1, 2)).save(paths[-1])
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+    batches = []
+    scanner = MetadataScanner(on_batch=batches.append, batch_size=2)
+    scanner.submit(paths + [str(broken)])
+    assert scanner.flush(5)
+    scanner.close()
+    results = dict(item for batch in batches for item in batch)
+    assert all(len(batch) <= 2 for batch in batches)
+    assert [results[p].width for p in paths] == [1, 2, 3, 4, 5]
+    assert results[str(broken)] is None
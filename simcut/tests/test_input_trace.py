@@ -0,0 +1,81 @@
+import pytest
+from PyQt6.QtCore import QEvent, QPoint, QPointF, Qt
+from PyQt6.QtGui import QMouseEvent, QWheelEvent
+from PyQt6.QtWidgets import QApplication
+from src.core.shape_manager import ShapeType
+from src.ui.input_trace import (
+    InputRecorder, decode_event, encode_event, load_trace, replayable_actions, save_trace,
+)
+from src.ui.main_window import MainWindow
+
+
+@pytest.fixture(scope="session")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def _mouse(kind, x, y, buttons=Qt.MouseButton.LeftButton):
+    button = Qt.MouseButton.NoButton if kind == QEvent.Type.MouseMove else Qt.MouseButton.LeftButton
+    return QMouseEvent(kind, QPointF(x, y), QPointF(x, y), button, buttons, Qt.KeyboardModifier.NoModifier)
+
+
+def test_encode_decode_roundtrip(app):
+    wheel = QWheelEvent(
+        QPointF(5, 6), QPointF(5, 6), QPoint(0, 0), QPoint(0, -120), Qt.MouseButton.NoButton,
+        Qt.KeyboardModifier.ControlModifier, Qt.ScrollPhase.NoScrollPhase, False,
+    )
+    entry = encode_event(wheel)
+    decoded = decode_event(entry)
+    assert decoded.angleDelta().y() == -120
+    assert decoded.modifiers() == Qt.KeyboardModifier.ControlModifier
+    press = decode_event(encode_event(_mouse(QEvent.Type.MouseButtonPress, 10.5, 20)))
+    assert press.type() == QEvent.Type.MouseButtonPress
+    assert press.position() == QPointF(10.5, 20)
+    assert press.button() == Qt.MouseButton.LeftButton
+
+
+def test_recorded_trace_replays_to_same_state(app, tmp_path):
+    """기록한 입력을 새 창에 재생하면 같은 도형이 만들어지고 지연 통계가 나온다."""
+    from PIL import Image
+    from benchmarks.replay import replay, summarize
+
+    path = tmp_path / "a.png"
+    Image.new("RGB", (400, 300), "white").save(path)
+    window = MainWindow()
+    window.resize(900, 660)
+    recorder = InputRecorder(window)
+    recorder.start()
+    window.open_paths([str(path)])
+    canvas = window.canvas
+    window.toolbar.tool_changed.emit(ShapeType.ELLIPSE)
+    QApplication.sendEvent(canvas, _mouse(QEvent.Type.MouseButtonPress, 10, 10))
+    for x in range(12, 60, 4):
+        QApplication.sendEvent(canvas, _mouse(QEvent.Type.MouseMove, x, x))
+    QApplication.sendEvent(canvas, _mouse(QEvent.Type.MouseButtonRelease, 60, 60, Qt.MouseButton.NoButton))
+    window.toolbar.tool_changed.emit(None)
+    QApplication.sendEvent(canvas, _mouse(QEvent.Type.MouseButtonPress, 30, 30))
+    QApplication.sendEvent(canvas, _mouse(QEvent.Type.MouseMove, 50, 40))
+    QApplication.sendEvent(canvas, _mouse(QEvent.Type.MouseButtonRelease, 50, 40, Qt.MouseButton.NoButton))
+    expected = window._file_slots[0].shape_manager.shapes
+    trace = recorder.stop()
+    assert len(expected) == 1 and expected[0].shape_type == ShapeType.ELLIPSE
+
+    save_trace(str(tmp_path / "trace.json"), trace)
+    loaded = load_trace(str(tmp_path / "trace.json"))
+    assert [e["type"] for e in loaded.events][:3] == ["open", "signal", "mouse_press"]
+
+    fresh = MainWindow()
+    samples = replay(fresh, loaded)
+    assert fresh._file_slots[0].shape_manager.shapes == expected
+    assert len(samples["event"]) == len(loaded.events)
+    assert samples["paint"]
+    ids = [r["id"] for r in summarize(samples, "t")]
+    assert "replay.paint[trace=t]" in ids and "replay.event.mouse_move[trace=t]" in ids
+    fresh.close()
+    window.close()
+
+
+def test_replay_skips_actions_that_open_dialogs(app):
+    actions = replayable_actions(MainWindow())
+    assert "Record Profile" not in actions and "Open…" not in actions
+    assert "Undo" in actions and "Edit History" in actions
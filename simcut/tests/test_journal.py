@@ -0,0 +1,116 @@
+import json
+from src.core.journal import (
+    CHECKPOINT_FILE, JOURNAL_FILE, EditJournal, SlotState, orphaned_sessions, replay,
+)
+from src.core.shape_manager import Shape, ShapeType
+
+
+def _shape(x):
+    return Shape(ShapeType.RECTANGLE, x, 0, 10, 10, "#FF0000", 2, None)
+
+
+def _record_ops(journal):
+    journal.record_slot(0, "/a.png", 0.5, None, [])
+    journal.record_slot(1, "/b.png", 1.0, (0, 0, 50, 50), [_shape(1)])
+    journal.record_shapes(0, "add", (_shape(2),))
+    journal.record_shapes(0, "add", (_shape(3),))
+    journal.record_shapes(0, "undo", ())
+    journal.record_shapes(0, "replace", (0, _shape(9),))
+    journal.record_shapes(1, "extend", ([_shape(4), _shape(5)],))
+    journal.record_shapes(1, "remove", (0,))
+
+
+def test_replay_reproduces_recorded_edits(tmp_path):
+    journal = EditJournal(str(tmp_path))
+    _record_ops(journal)
+    journal.flush()
+    slots = replay(str(tmp_path))
+    assert [s.path for s in slots] == ["/a.png", "/b.png"]
+    assert [s.x for s in slots[0].shape_manager.shapes] == [9]
+    assert [s.x for s in slots[1].shape_manager.shapes] == [4, 5]
+    assert slots[1].crop_box == (0, 0, 50, 50)
+    journal.close()
+
+
+def test_delete_and_reset_records(tmp_path):
+    journal = EditJournal(str(tmp_path))
+    _record_ops(journal)
+    journal.record_delete(0)
+    journal.flush()
+    assert [s.path for s in replay(str(tmp_path))] == ["/b.png"]
+    journal.record_reset()
+    journal.close()
+    assert replay(str(tmp_path)) == []
+
+
+def test_checkpoint_compacts_journal_and_ignores_stale_log(tmp_path):
+    journal = EditJournal(str(tmp_path), checkpoint_every=3)
+    _record_ops(journal)
+    assert journal.needs_checkpoint
+    journal.flush()
+    journal.checkpoint(replay(str(tmp_path)))
+    journal.record_shapes(0, "clear", ())
+    journal.flush()
+    assert not journal.needs_checkpoint
+    lines = (tmp_path / JOURNAL_FILE).read_text().splitlines()
+    assert [json.loads(line)["op"] for line in lines] == ["begin", "clear"]
+    state = replay(str(tmp_path))
+    assert state[0].shape_manager.shapes == []
+    assert [s.x for s in state[1].shape_manager.shapes] == [4, 5]
+    journal.close()
+
+    # 체크포인트만 교체되고 저널은 이전 세대로 남은 경우: 저널을 다시 적용하지 않음
+    (tmp_path / JOURNAL_FILE).write_text(json.dumps({"op": "delete", "i": 0}) + "\n")
+    assert len(replay(str(tmp_path))) == 2
+    assert (tmp_path / CHECKPOINT_FILE).exists()
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    journal = EditJournal(str(tmp_path))
+    journal.record_slot(0, "/a.png", 1.0, None, [_shape(1)])
+    journal.close()
+    with open(tmp_path / JOURNAL_FILE, "a") as f:
+        f.write('{"op":"add","i":0,"sha')
+    slots = replay(str(tmp_path))
+    assert len(slots[0].shape_manager.shapes) == 1
+
+
+def test_close_with_discard_removes_session_and_orphans_are_found(tmp_path):
+    live = EditJournal(str(tmp_path / "1-999999999"))
+    live.close()
+    assert orphaned_sessions(str(tmp_path)) == [str(tmp_path / "1-999999999")]
+    journal = EditJournal(str(tmp_path / "2-1"))
+    journal.close(discard=True)
+    assert not (tmp_path / "2-1").exists()
+
+
+def test_sessions_of_other_live_instances_are_not_orphaned(tmp_path):
+    import subprocess
+    import sys
+    other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        (tmp_path / f"1-{other.pid}").mkdir()
+        assert orphaned_sessions(str(tmp_path)) == []
+    finally:
+        other.kill()
+        other.wait()
+    assert orphaned_sessions(str(tmp_path)) == [str(tmp_path / f"1-{other.pid}")]
+
+
+def test_slot_state_roundtrip():
+    state = SlotState("/a.png", 0.5)
+    state.shape_manager.add(_shape(1))
+    assert state.to_dict()["shapes"][0]["x"] == 1
+
+
+def test_restore_record_replays_full_state(tmp_path):
+    from src.core.shape_manager import ShapeState
+    journal = EditJournal(str(tmp_path))
+    journal.record_slot(0, "/a.png", 1.0, None, [_shape(1), _shape(2)])
+    journal.record_shapes(0, "restore", (ShapeState((_shape(1),), (_shape(2),)),))
+    journal.flush()
+    sm = replay(str(tmp_path))[0].shape_manager
+    assert [s.x for s in sm.shapes] == [1]
+    sm.redo()
+    assert [s.x for s in sm.shapes] == [1, 2]
+    journal.close()
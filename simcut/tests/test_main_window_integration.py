@@ -105,3 +105,653 @@ def test_multiple_slots_independent_shapes(app, tmp_path):
 
     window._switch_to_file(1)
     assert len(window.canvas._shape_manager.shapes) == 0
+
+
+def test_save_then_undo_restores_file_from_snapshot(app, tmp_path):
+    """저장 되돌리기는 디스크 스냅샷에서 원본 파일과 슬롯을 복원한다."""
+    from PIL import Image
+    from src.core.shape_manager import Shape, ShapeType
+
+    path = tmp_path / "red.png"
+    Image.new("RGB", (60, 40), (255, 0, 0)).save(str(path))
+    original = path.read_bytes()
+
+    window = MainWindow()
+    window._file_slots.append(window._build_slot(str(path), None))
+    window._switch_to_file(0)
+    window._file_slots[0].shape_manager.add(
+        Shape(ShapeType.RECTANGLE, 0, 0, 20, 20, None, 1, "#0000FF")
+    )
+
+    window._save_file()
+    window._save_queue.flush()
+    assert path.read_bytes() != original
+    assert 0 in window._pre_save_slots
+
+    window._undo_save()
+    window._save_queue.flush()
+    assert path.read_bytes() == original
+    assert window._file_slots[0].image.getpixel((5, 5)) == (255, 0, 0)
+    assert len(window._file_slots[0].shape_manager.shapes) == 1
+    assert 0 not in window._pre_save_slots
+    window.close()
+
+
+def _recipe_slot(path, size, scale):
+    from PIL import Image
+    from src.ui.canvas import _pil_to_pixmap
+    from src.ui.main_window import _FileSlot
+    from src.core.shape_manager import ShapeManager
+
+    img = Image.new("RGB", size, (0, 128, 0))
+    return _FileSlot(path=path, image=img, scale=scale,
+                     pixmap=_pil_to_pixmap(img), shape_manager=ShapeManager())
+
+
+def test_apply_recipe_rescales_shapes_for_each_slot(app):
+    """레시피는 원본 픽셀 기준으로 저장되어 슬롯마다 scale에 맞게 적용된다."""
+    from src.core.shape_manager import Shape, ShapeType
+
+    window = MainWindow()
+    source = _recipe_slot("/fake/a.png", (400, 200), 0.5)
+    source.shape_manager.add(Shape(ShapeType.RECTANGLE, 10, 10, 20, 20, None, 1, None, blur_radius=10))
+    window._file_slots.extend([source, _recipe_slot("/fake/b.png", (400, 200), 1.0),
+                               _recipe_slot("/fake/c.png", (400, 200), 0.25)])
+    window._switch_to_file(0)
+
+    window._copy_recipe()
+    assert window._apply_recipe_to(range(3)) == 2
+
+    assert len(window._file_slots[0].shape_manager.shapes) == 1
+    b = window._file_slots[1].shape_manager.shapes[0]
+    c = window._file_slots[2].shape_manager.shapes[0]
+    assert (b.x, b.y, b.width, b.height, b.blur_radius) == (20, 20, 40, 40, 20)
+    assert (c.x, c.y, c.width, c.height) == (5, 5, 10, 10)
+
+
+def test_apply_recipe_crops_slots_in_file_pixel_space(app):
+    """레시피의 자르기 영역은 파일 기준 좌표로 각 슬롯에 적용된다."""
+    window = MainWindow()
+    source = _recipe_slot("/fake/a.png", (100, 50), 1.0)
+    source.crop_box = (10, 10, 110, 60)
+    window._file_slots.extend([source, _recipe_slot("/fake/b.png", (200, 100), 1.0)])
+    window._switch_to_file(0)
+
+    window._copy_recipe()
+    window._apply_recipe_to([1])
+
+    target = window._file_slots[1]
+    assert target.image.size == (100, 50)
+    assert target.crop_box == (10, 10, 110, 60)
+    assert target.synced is False
+
+
+def test_apply_recipe_skips_only_the_copied_slot(app):
+    """같은 파일을 보여 주는 다른 슬롯에는 레시피를 적용한다."""
+    from src.core.shape_manager import Shape, ShapeType
+
+    window = MainWindow()
+    source = _recipe_slot("/fake/a.png", (100, 50), 1.0)
+    source.shape_manager.add(Shape(ShapeType.RECTANGLE, 1, 1, 5, 5, None, 1, None))
+    window._file_slots.extend([source, _recipe_slot("/fake/a.png", (100, 50), 1.0)])
+    window._switch_to_file(0)
+
+    window._copy_recipe()
+    assert window._apply_recipe_to(range(2)) == 1
+    assert len(window._file_slots[0].shape_manager.shapes) == 1
+    assert len(window._file_slots[1].shape_manager.shapes) == 1
+
+
+def test_apply_crop_recipe_defers_unviewed_slots(app, tmp_path):
+    """읽지 않은 슬롯은 자르기 영역만 기록하고 처음 볼 때 잘라 읽는다."""
+    from PIL import Image
+    from PyQt6.QtCore import QCoreApplication
+    from src.core.image_meta import read_meta
+    from src.core.recipe import Recipe
+
+    paths = []
+    for i in range(3):
+        image = Image.new("RGB", (400, 300), "white")
+        image.paste((255, 0, 0), (100, 0, 300, 100))
+        paths.append(str(tmp_path / f"{i}.png"))
+        image.save(paths[-1])
+    window = MainWindow()
+    window._append_lazy_slots([(path, read_meta(path)) for path in paths])
+    assert window._apply_recipe_to(range(3), Recipe(crop=(100, 0, 300, 100))) == 3
+    assert not any(slot.pixels_loaded for slot in window._file_slots)
+    assert {slot.crop_box for slot in window._file_slots} == {(100, 0, 300, 100)}
+    assert window._thumbnails.wait(5)
+    QCoreApplication.sendPostedEvents()
+    assert window.file_explorer.cached_thumbnail(1).toImage().pixelColor(60, 30).red() == 255
+    window._switch_to_file(1)
+    assert window.canvas.image.size == (200, 100)
+    assert window.canvas.image.getpixel((199, 99))[:3] == (255, 0, 0)
+
+
+def test_propagate_selected_shape_adds_blur_where_patch_is_found(app):
+    """선택한 도형 영역을 다른 파일에서 찾아 블러 도형을 추가한다."""
+    pytest.importorskip("numpy")
+    from PIL import Image, ImageDraw
+    from src.core.shape_manager import Shape, ShapeType
+
+    def scene(path, offset, scale):
+        slot = _recipe_slot(path, (300, 200), scale)
+        img = Image.effect_noise((300, 200), 20).convert("RGB")
+        x, y = offset
+        ImageDraw.Draw(img).ellipse([x, y, x + 40, y + 40], fill=(250, 200, 30), outline=(0, 0, 0), width=3)
+        slot.image = img
+        return slot
+
+    window = MainWindow()
+    source = scene("/fake/a.png", (50, 60), 0.5)
+    source.shape_manager.add(Shape(ShapeType.RECTANGLE, 25, 30, 20, 20, "#FF0000", 2, None))
+    blank = _recipe_slot("/fake/c.png", (300, 200), 1.0)
+    window._file_slots.extend([source, scene("/fake/b.png", (120, 90), 1.0), blank])
+    window._switch_to_file(0)
+    window.canvas._selected_index = 0
+
+    assert window._propagate_selected_shape() == 1
+    added = window._file_slots[1].shape_manager.shapes
+    assert len(added) == 1
+    assert (added[0].x, added[0].y, added[0].width, added[0].height) == (120, 90, 40, 40)
+    assert added[0].blur_radius > 0
+    assert window._file_slots[2].shape_manager.shapes == []
+
+
+def test_project_roundtrip_opens_from_proxies_and_loads_pixels_lazily(app, tmp_path):
+    """프로젝트를 열면 프록시로 즉시 표시하고 원본은 필요할 때 읽는다."""
+    from PIL import Image
+    from src.core.shape_manager import Shape, ShapeType
+
+    paths = []
+    for i, color in enumerate(["red", "blue"]):
+        path = tmp_path / f"{i}.png"
+        Image.new("RGB", (120, 80), color).save(path)
+        paths.append(str(path))
+
+    window = MainWindow()
+    for path in paths:
+        window._file_slots.append(window._build_slot(path, (60, 40)))
+        window._explorer.add_file(path, window._make_thumbnail(window._file_slots[-1].image))
+    window._file_slots[1].shape_manager.add(Shape(ShapeType.RECTANGLE, 1, 2, 10, 10, "#FF0000", 2, None))
+    window._file_slots[1].crop_box = (0, 0, 100, 80)
+    window._switch_to_file(1)
+    project = str(tmp_path / "session.simcut")
+    window._save_project(project)
+    window.close()
+
+    reopened = MainWindow()
+    reopened._open_project(project)
+    assert reopened.file_count == 2
+    assert reopened.file_explorer.count() == 2
+    assert reopened._current_slot_index == 1
+    slot = reopened._file_slots[1]
+    assert slot.shape_manager.shapes[0].width == 10
+    assert reopened.canvas._pixmap.width() == 60
+    assert not slot.pixels_loaded
+    assert reopened.canvas.image.size == (100, 80)
+    assert slot.pixels_loaded
+    assert not reopened._file_slots[0].pixels_loaded
+    reopened.close()
+
+
+def test_project_with_changed_source_drops_stored_crop_and_warns(app, tmp_path, monkeypatch):
+    """저장 이후 바뀐 원본에는 저장된 자르기를 적용하지 않고 사용자에게 알린다."""
+    from PIL import Image
+    from PyQt6.QtCore import QCoreApplication
+    from src.ui import main_window as main_window_module
+
+    path = tmp_path / "a.png"
+    Image.new("RGB", (120, 80), "red").save(path)
+    window = MainWindow()
+    window._file_slots.append(window._build_slot(str(path), (60, 40)))
+    window._explorer.add_file(str(path), window._make_thumbnail(window._file_slots[-1].image))
+    window._file_slots[0].crop_box = (0, 0, 100, 80)
+    window._switch_to_file(0)
+    project = str(tmp_path / "session.simcut")
+    window._save_project(project)
+    window.close()
+    Image.new("RGB", (130, 90), "green").save(path)
+
+    warnings = []
+    monkeypatch.setattr(main_window_module.QMessageBox, "warning", lambda *a: warnings.append(a[2]))
+    reopened = MainWindow()
+    reopened._open_project(project)
+    reopened._project_check.join(5)
+    QCoreApplication.sendPostedEvents()
+    slot = reopened._file_slots[0]
+    assert warnings and str(path) in warnings[0]
+    assert slot.crop_box is None and slot.synced and slot.sha256 is None
+    assert reopened.canvas.image.size == (130, 90)
+    assert reopened.canvas.image.getpixel((0, 0))[:3] == (0, 128, 0)
+    reopened.close()
+
+
+def test_save_project_does_not_decode_unviewed_slots_and_keeps_proxy_alpha(app, tmp_path):
+    """보지 않은 슬롯은 픽셀을 읽지 않고 저장하고, 투명한 슬롯의 프록시는 알파를 유지한다."""
+    from PIL import Image
+    from src.core.image_meta import read_meta
+
+    opened = str(tmp_path / "glass.png")
+    Image.new("RGBA", (120, 80), (255, 0, 0, 100)).save(opened)
+    lazy = []
+    for i in range(5):
+        lazy.append(str(tmp_path / f"{i}.png"))
+        Image.new("RGB", (120, 80), "blue").save(lazy[-1])
+    window = MainWindow()
+    window.open_paths([opened])
+    window._append_lazy_slots([(path, read_meta(path)) for path in lazy])
+    window._switch_to_file(0)
+    project = str(tmp_path / "session.simcut")
+    window._save_project(project)
+    assert not any(slot.__dict__.get("_pixmap") for slot in window._file_slots[1:])
+    window.close()
+
+    reopened = MainWindow()
+    reopened._open_project(project)
+    assert reopened.file_count == 6
+    assert reopened.canvas._pixmap.toImage().pixelColor(0, 0).alpha() == 100
+    reopened._switch_to_file(3)  # 프록시 없이 저장된 슬롯은 원본에서 만듦
+    assert reopened.canvas._pixmap.toImage().pixelColor(0, 0).blue() == 255
+    reopened.close()
+
+
+def test_edit_journal_recovers_slots_after_crash(app, tmp_path):
+    """편집 저널을 재생하면 비정상 종료 전의 슬롯/도형/자르기 상태가 복원된다."""
+    from PIL import Image
+    from src.core.shape_manager import Shape, ShapeType
+
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"{i}.png"
+        Image.new("RGB", (100, 80), (i * 100, 0, 0)).save(path)
+        paths.append(str(path))
+
+    window = MainWindow(recovery_dir=str(tmp_path / "recovery"))
+    for path in paths:
+        window._file_slots.append(window._build_slot(path, None))
+        window._explorer.add_file(path, window._make_thumbnail(window._file_slots[-1].image))
+        window._track_slot(len(window._file_slots) - 1)
+    window._switch_to_file(0)
+    window.canvas._shape_manager.add(Shape(ShapeType.RECTANGLE, 5, 5, 20, 20, "#FF0000", 2, None))
+    window._on_crop_performed({
+        "image": window._file_slots[0].image.crop((10, 10, 60, 50)),
+        "crop_box": (10, 10, 60, 50),
+        "crop_box_base_scale": (10, 10),
+    })
+    window._file_slots[1].shape_manager.add(Shape(ShapeType.ELLIPSE, 1, 1, 5, 5, None, 1, None))
+    window._delete_file(1)
+    window._journal.flush()
+    session = window._journal.directory  # close 없이 종료된 것으로 간주
+
+    restored = MainWindow()
+    assert restored._recover_session(session) == 1
+    slot = restored._file_slots[0]
+    assert slot.image.size == (50, 40)
+    assert slot.crop_box == (10, 10, 60, 50)
+    assert [(s.x, s.y) for s in slot.shape_manager.shapes] == [(0, 0)]
+    window._journal.close()
+
+
+def test_recovered_slots_stay_lazy_until_viewed(app, tmp_path, monkeypatch):
+    """복구한 슬롯은 원본을 읽지 않고 추가하고, 원본이 사라진 파일은 제외한다."""
+    from PIL import Image
+    from src.core.image_meta import read_meta
+    from src.ui import main_window as main_window_module
+
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"{i}.png"
+        Image.new("RGB", (100, 80), (i * 60, 0, 0)).save(path)
+        paths.append(str(path))
+    window = MainWindow(recovery_dir=str(tmp_path / "recovery"))
+    window._journal._checkpoint_every = 2  # 체크포인트는 쓰기 스레드에서 직렬화
+    window._append_lazy_slots([(path, read_meta(path)) for path in paths])
+    window._journal.flush()
+    session = window._journal.directory
+    (tmp_path / "3.png").unlink()
+
+    warnings = []
+    monkeypatch.setattr(main_window_module.QMessageBox, "warning", lambda *a: warnings.append(a[2]))
+    restored = MainWindow()
+    assert restored._recover_session(session) == 3
+    assert warnings and paths[3] in warnings[0]
+    assert [slot.path for slot in restored._file_slots] == paths[:3]
+    assert not any(slot.pixels_loaded or slot.__dict__.get("_pixmap") for slot in restored._file_slots[:2])
+    restored._switch_to_file(1)
+    assert restored.canvas.image.getpixel((0, 0)) == (60, 0, 0)
+    window._journal.close()
+
+
+def test_history_panel_jumps_to_any_point_with_one_repaint(app, tmp_path, monkeypatch):
+    """타임라인 항목으로 이동하면 그 시점의 도형 상태가 되고 캔버스는 한 번만 다시 그린다."""
+    from PIL import Image
+    from src.core.shape_manager import Shape, ShapeType
+
+    path = tmp_path / "a.png"
+    Image.new("RGB", (100, 80), "white").save(path)
+    window = MainWindow(recovery_dir=str(tmp_path / "recovery"))
+    window._file_slots.append(window._build_slot(str(path), None))
+    window._explorer.add_file(str(path), window._make_thumbnail(window._file_slots[-1].image))
+    window._track_slot(0)
+    window._switch_to_file(0)
+    window._history_action.setChecked(True)
+    sm = window._file_slots[0].shape_manager
+    for x in range(50):
+        sm.add(Shape(ShapeType.RECTANGLE, x, 0, 10, 10, "#FF0000", 2, None))
+    assert window._history_panel.count() == 51
+
+    repaints = []
+    monkeypatch.setattr(window.canvas, "update", lambda *a: repaints.append(a))
+    window._history_panel.position_requested.emit(10)
+    assert [s.x for s in sm.shapes] == list(range(10))
+    assert len(repaints) == 1
+    assert window._history_panel.current_row() == 10
+    assert len(window._file_slots[0].history) == 50  # 이동은 기록을 늘리지 않음
+
+    window._seek_history(50)
+    assert len(sm.shapes) == 50
+    window._seek_history(5)
+    sm.add(Shape(ShapeType.ELLIPSE, 1, 1, 5, 5, None, 1, None))
+    assert window._history_panel.count() == 7  # 이동한 뒤 새 편집 → 이후 기록 버림
+
+    window._journal.flush()
+    from src.core.journal import replay
+    assert [s.x for s in replay(window._journal.directory)[0].shape_manager.shapes] == [0, 1, 2, 3, 4, 1]
+    window._journal.close(discard=True)
+
+
+def test_hud_reports_current_slot_resident_bytes(app, tmp_path):
+    from PIL import Image
+
+    path = tmp_path / "a.png"
+    Image.new("RGB", (1000, 500), "white").save(path)
+    window = MainWindow()
+    assert window._hud_lines() == []
+    window.open_paths([str(path)])
+    line = window._hud_lines()[0]
+    assert line.startswith("slot ") and "source 1.4 MB" in line
+    assert window.canvas._hud_provider == window._hud_lines
+
+
+def test_resource_report_and_drop_caches_reload_from_file(app, tmp_path):
+    """캐시를 비운 슬롯은 픽셀을 해제하고, 다시 필요할 때 파일에서 같은 픽셀을 읽는다."""
+    from PIL import Image
+    from src.core.shape_manager import Shape, ShapeType
+
+    paths = []
+    for name, color in (("a.png", "red"), ("b.png", "blue")):
+        paths.append(str(tmp_path / name))
+        Image.new("RGB", (400, 300), color).save(paths[-1])
+    window = MainWindow()
+    window.open_paths(paths)
+    window.file_explorer._fulfill_requests()  # 보이는 행의 썸네일 생성
+    window._file_slots[0].shape_manager.add(Shape(ShapeType.RECTANGLE, 1, 1, 5, 5, "#FF0000", 2, None))
+    report = window.resource_report()
+    assert [s.name for s in report.slots] == ["a.png", "b.png"]
+    first = report.slots[0]
+    assert first.source == 400 * 300 * 3 and first.pixmap > 0 and first.thumbnail > 0
+    assert first.shapes > report.slots[1].shapes
+    assert report.rss >= report.total > 0
+
+    freed = window.drop_slot_caches([0, 1])
+    assert freed >= 2 * 400 * 300 * 3
+    after = window.resource_report()
+    assert after.slots[0].source == after.slots[0].pixmap == 0
+    assert after.slots[1].source == 0 and after.slots[1].pixmap > 0  # 현재 슬롯은 표시 픽스맵 유지
+    assert window.canvas.image.getpixel((0, 0)) == (0, 0, 255)
+
+    window._switch_to_file(0)
+    assert window.canvas.image.getpixel((0, 0)) == (255, 0, 0)
+    assert len(window._file_slots[0].shape_manager.shapes) == 1
+
+
+def test_drop_caches_keeps_pixels_that_differ_from_file(app, tmp_path):
+    from PIL import Image
+
+    path = str(tmp_path / "a.png")
+    Image.new("RGB", (400, 300), "white").save(path)
+    window = MainWindow()
+    window.open_paths([path])
+    window._file_slots[0].synced = False
+    assert window.drop_slot_caches([0]) == 0
+    assert window.resource_report().slots[0].source == 400 * 300 * 3
+
+
+def test_drop_caches_skips_slots_with_a_pending_save(app, tmp_path, monkeypatch):
+    from PIL import Image
+
+    path = str(tmp_path / "a.png")
+    Image.new("RGB", (400, 300), "white").save(path)
+    window = MainWindow()
+    window.open_paths([path])
+    monkeypatch.setattr(window._save_queue, "is_pending", lambda p: p == path)
+    window.drop_slot_caches([0])
+    assert window.resource_report().slots[0].source == 400 * 300 * 3  # 저장 전 파일을 다시 읽지 않음
+
+
+def test_resource_inspector_lists_slots_and_drops_selected(app, tmp_path):
+    from PIL import Image
+    from src.ui.resource_inspector import ResourceInspector
+
+    paths = []
+    for name in ("a.png", "b.png"):
+        paths.append(str(tmp_path / name))
+        Image.new("RGB", (200, 100), "white").save(paths[-1])
+    window = MainWindow()
+    window.open_paths(paths)
+    dropped = []
+    inspector = ResourceInspector(window.resource_report, lambda idx: dropped.append(idx) or 0)
+    inspector.refresh()
+    assert inspector._table.rowCount() == 2
+    assert inspector._table.item(1, 0).text() == "b.png"
+    assert "RSS" in inspector._summary.text()
+    inspector.select_rows([0])
+    inspector._drop_btn.click()
+    assert dropped == [[0]]
+
+
+def test_deferred_startup_opens_journal_with_existing_slots(app, tmp_path):
+    from PIL import Image
+    from src.core.journal import replay
+
+    path = str(tmp_path / "a.png")
+    Image.new("RGB", (40, 30), "white").save(path)
+    window = MainWindow(recovery_dir=str(tmp_path / "recovery"), defer_startup=True)
+    assert window._journal is None and window._history_panel is None
+    window.open_paths([path])
+    window.finish_startup()
+    window.finish_startup()
+    window._journal.flush()
+    assert [s.path for s in replay(window._journal.directory)] == [path]
+    window._journal.close(discard=True)
+    window._history_action.setChecked(True)
+    assert window._history_panel._history is window._file_slots[0].history
+
+
+def test_open_folder_streams_lazy_slots(app, tmp_path):
+    from PIL import Image
+    from PyQt6.QtCore import QCoreApplication
+
+    for rel in ("a.png", "sub/b.png", "sub/c.txt"):
+        path = tmp_path / rel
+        path.parent.mkdir(exist_ok=True)
+        if rel.endswith(".png"):
+            Image.new("RGB", (400, 300), "red").save(path)
+        else:
+            path.write_text("x")
+    window = MainWindow()
+    scan = window.open_folder(str(tmp_path))
+    assert scan.wait(5)
+    QCoreApplication.sendPostedEvents()  # 워커가 보낸 큐 시그널 전달
+    assert [slot.path.split("/")[-1] for slot in window._file_slots] == ["a.png", "b.png"]
+    assert window.file_explorer.count() == 2 and window.file_explorer.metadata(1).width == 400
+    assert window._current_slot_index == 0 and "2개 파일" in window._status_label.text()
+    assert not window._file_slots[1].pixels_loaded  # 보기 전에는 디코딩하지 않음
+    assert not window._file_slots[1].__dict__.get("_pixmap")
+    assert window._slot_thumbnail(1) is None  # 워커가 만들어 나중에 전달
+    assert window._thumbnails.wait(5)
+    QCoreApplication.sendPostedEvents()
+    assert window.file_explorer.cached_thumbnail(1).height() == 80
+    assert not window._file_slots[1].pixels_loaded  # 썸네일도 슬롯에 원본을 남기지 않음
+    window._switch_to_file(1)
+    assert window.canvas.image.getpixel((0, 0)) == (255, 0, 0)
+
+
+def test_watch_folder_appends_new_files_applies_recipe_and_exports(app, tmp_path):
+    from PIL import Image
+    from src.core.recipe import Recipe, save_recipe
+    from src.core.shape_manager import Shape, ShapeType
+
+    watched, out = tmp_path / "inbox", tmp_path / "out"
+    watched.mkdir()
+    out.mkdir()
+    Image.new("RGB", (400, 300), "white").save(watched / "old.png")
+    recipe_path = str(tmp_path / "redact.json")
+    save_recipe(Recipe(shapes=(Shape(ShapeType.RECTANGLE, 10, 10, 50, 50, "#000000", 2, "#000000"),)), recipe_path)
+    window = MainWindow()
+    with pytest.raises(ValueError):
+        window.watch_folder(str(watched), output_dir=str(watched))
+    watch = window.watch_folder(str(watched), recipe_path, str(out))
+    assert watch.wait_idle(5)
+    assert window.file_count == 0  # 이미 있던 파일은 제외
+    Image.new("RGB", (400, 300), "white").save(watched / "new.png")
+    watch._watcher.notify()
+    assert watch.wait_idle(5)
+    assert [slot.path for slot in window._file_slots] == [str(watched / "new.png")]
+    slot = window._file_slots[0]
+    assert len(slot.shape_manager.shapes) == 1 and not slot.pixels_loaded
+    assert window.file_explorer.cached_thumbnail(0) is not None  # 썸네일은 감시 스레드에서 만듦
+    assert window._current_slot_index == 0
+    window.stop_watching()  # 진행 중인 내보내기를 마칠 때까지 기다림
+    assert not window._watch_action.isChecked()
+    with Image.open(out / "new.png") as exported:
+        assert exported.getpixel((30, 30)) == (0, 0, 0)
+
+
+def test_watch_folder_crop_recipe_is_deferred_until_the_slot_is_viewed(app, tmp_path):
+    from PIL import Image
+    from src.core.recipe import Recipe, save_recipe
+    from src.core.shape_manager import Shape, ShapeType
+
+    watched = tmp_path / "inbox"
+    watched.mkdir()
+    opened = []
+    for name in ("a.png", "b.png"):
+        opened.append(str(tmp_path / name))
+        Image.new("RGB", (40, 30), "blue").save(opened[-1])
+    recipe_path = str(tmp_path / "crop.json")
+    shape = Shape(ShapeType.RECTANGLE, 10, 10, 50, 50, "#000000", 2, "#000000")
+    save_recipe(Recipe(shapes=(shape,), crop=(100, 0, 300, 100)), recipe_path)
+    window = MainWindow()
+    window.open_paths(opened)
+    window._switch_to_file(0)  # 새 파일을 따라가지 않도록
+    watch = window.watch_folder(str(watched), recipe_path)
+    assert watch.wait_idle(5)
+    image = Image.new("RGB", (400, 300), "white")
+    image.paste((255, 0, 0), (100, 0, 300, 100))
+    image.save(watched / "new.png")
+    Image.new("RGB", (50, 50), "white").save(watched / "small.png")  # 자르기 영역 밖
+    watch._watcher.notify()
+    assert watch.wait_idle(5)
+    window.stop_watching()
+    cropped, small = window._file_slots[2:]
+    assert not cropped.pixels_loaded and not small.pixels_loaded  # GUI 스레드에서 디코딩하지 않음
+    assert cropped.crop_box == (100, 0, 300, 100) and not cropped.synced
+    assert len(cropped.shape_manager.shapes) == 1
+    assert small.crop_box is None and not small.shape_manager.shapes
+    thumbnail = window.file_explorer.cached_thumbnail(2).toImage()
+    assert thumbnail.width() == 120 and thumbnail.pixelColor(60, 30).red() == 255  # 자른 영역의 썸네일
+    window._switch_to_file(2)
+    assert window.canvas.image.size == (200, 100)
+    assert window.canvas.image.getpixel((0, 0))[:3] == (255, 0, 0)
+
+
+def test_open_zip_adds_lazy_member_slots_and_refuses_saving_into_it(app, tmp_path, monkeypatch):
+    import io
+    import zipfile
+    from PIL import Image
+    from PyQt6.QtCore import QCoreApplication
+    from src.core import archive
+    from src.ui import main_window as main_window_module
+
+    path = tmp_path / "shots.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, color in (("b.png", "red"), ("a/c.png", "blue")):
+            buf = io.BytesIO()
+            Image.new("RGB", (400, 300), color).save(buf, format="PNG")
+            zf.writestr(name, buf.getvalue())
+        zf.writestr("notes.txt", b"x")
+    window = MainWindow()
+    assert window.open_paths([str(path)]) == 2
+    assert [slot.path for slot in window._file_slots] == archive.list_images(str(path))
+    assert window.file_explorer.metadata(0).width == 400
+    assert not window._file_slots[0].pixels_loaded  # 보기 전에는 멤버 압축을 풀지 않음
+    assert window._slot_thumbnail(0) is None and window._thumbnails.wait(5)
+    QCoreApplication.sendPostedEvents()
+    assert window.file_explorer.cached_thumbnail(0) is not None and not window._file_slots[0].pixels_loaded
+    composite = window._render_slot_to_image(window._file_slots[0])  # 일괄 내보내기 합성
+    assert composite.getpixel((0, 0))[:3] == (0, 0, 255) and not window._file_slots[0].pixels_loaded
+    assert window._current_slot_index == 1
+    assert window.canvas.image.getpixel((0, 0))[:3] == (255, 0, 0)
+    messages = []
+    monkeypatch.setattr(main_window_module.QMessageBox, "information", lambda *a: messages.append(a[2]))
+    window._save_file()
+    assert messages and "ZIP" in messages[0]
+    assert window.drop_slot_caches([1]) > 0  # 멤버에서 다시 읽을 수 있는 슬롯
+    window._switch_to_file(0)
+    window._switch_to_file(1)
+    assert window.canvas.image.getpixel((0, 0))[:3] == (255, 0, 0)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["shots.zip"]
+    window.close()
+
+
+def test_propagate_selected_shape_does_not_keep_target_pixels(app, tmp_path):
+    """보지 않은 파일은 워커에서 읽고 슬롯에 픽셀을 남기지 않는다."""
+    pytest.importorskip("numpy")
+    from PIL import Image, ImageDraw
+    from src.core.image_meta import read_meta
+    from src.core.shape_manager import Shape, ShapeType
+
+    for i, (x, y) in enumerate([(50, 60), (120, 90)]):
+        img = Image.effect_noise((300, 200), 20).convert("RGB")
+        ImageDraw.Draw(img).ellipse([x, y, x + 40, y + 40], fill=(250, 200, 30), outline=(0, 0, 0), width=3)
+        img.save(tmp_path / f"{i}.png")
+    window = MainWindow()
+    window.open_paths([str(tmp_path / "0.png")])
+    target = str(tmp_path / "1.png")
+    gone = tmp_path / "gone.png"
+    Image.new("RGB", (300, 200)).save(gone)
+    window._append_lazy_slots([(target, read_meta(target)), (str(gone), read_meta(str(gone)))])
+    gone.unlink()  # 읽기 실패는 건너뛰고 알림
+    window._switch_to_file(0)
+    scale = window._file_slots[0].scale
+    window._file_slots[0].shape_manager.add(
+        Shape(ShapeType.RECTANGLE, int(50 * scale), int(60 * scale), int(40 * scale), int(40 * scale), "#FF0000", 2, None)
+    )
+    window.canvas._selected_index = 0
+    assert window._propagate_selected_shape() == 1
+    assert len(window._file_slots[1].shape_manager.shapes) == 1
+    assert not window._file_slots[1].pixels_loaded
+    assert "읽을 수 없는 파일 1개" in window._status_label.text()
+
+
+def test_shape_edits_reach_the_right_history_after_deletes(app, tmp_path):
+    """도형 변경은 맵으로 슬롯을 찾고, 삭제 뒤에도 올바른 슬롯 타임라인에 기록된다."""
+    from PIL import Image
+    from src.core.shape_manager import Shape, ShapeType
+
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.png"
+        Image.new("RGB", (40, 30)).save(path)
+        paths.append(str(path))
+    window = MainWindow()
+    window.open_paths(paths)
+    window._delete_file(0)
+    last = window._file_slots[1]
+    before = len(last.history)
+    last.shape_manager.add(Shape(ShapeType.RECTANGLE, 1, 1, 5, 5, "#FF0000", 2, None))
+    assert len(last.history) == before + 1
+    assert len(window._file_slots[0].history) == 0
+    assert window._slot_index_of(last.shape_manager) == 1
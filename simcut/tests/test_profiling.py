@@ -0,0 +1,92 @@
+import json
+import threading
+import pytest
+from src.utils import profiling
+
+
+@pytest.fixture(autouse=True)
+def _stop_profiling():
+    yield
+    profiling.stop()
+
+
+def test_disabled_span_is_shared_noop():
+    assert not profiling.is_enabled()
+    first = profiling.span("a", x=1)
+    assert first is profiling.span("b")
+    with first as args:
+        args["ignored"] = 1
+    assert profiling.stop() == 0
+
+
+def test_nested_spans_written_as_chrome_trace(tmp_path):
+    profiling.start()
+    with profiling.span("outer", slot=2) as args:
+        with profiling.span("inner", size=(4, 3)):
+            pass
+        args["shapes"] = 5
+
+    def work():
+        with profiling.span("encode", format="PNG"):
+            pass
+
+    worker = threading.Thread(target=work, name="saver")
+    worker.start()
+    worker.join()
+    path = tmp_path / "trace.json"
+    assert profiling.stop(str(path)) == 3
+    data = json.loads(path.read_text())
+    spans = {e["name"]: e for e in data["traceEvents"] if e["ph"] == "X"}
+    outer, inner = spans["outer"], spans["inner"]
+    assert outer["args"] == {"slot": 2, "shapes": 5}
+    assert inner["args"] == {"size": [4, 3]}
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    names = {e["tid"]: e["args"]["name"] for e in data["traceEvents"] if e["ph"] == "M"}
+    assert names[spans["encode"]["tid"]] == "saver"
+    assert spans["encode"]["tid"] != outer["tid"]
+
+
+def test_event_cap_counts_every_dropped_span_across_threads(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "MAX_EVENTS", 100)
+    profiling.start()
+
+    def work():
+        for _ in range(200):
+            with profiling.span("tick"):
+                pass
+
+    workers = [threading.Thread(target=work) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    path = tmp_path / "trace.json"
+    assert profiling.stop(str(path)) == 100
+    assert json.loads(path.read_text())["otherData"]["dropped_events"] == 700
+
+
+def test_open_paths_records_pipeline_spans_with_slot(app, tmp_path):
+    from PIL import Image
+    from src.ui.main_window import MainWindow
+
+    path = tmp_path / "a.png"
+    Image.new("RGB", (1600, 1200), "white").save(path)
+    window = MainWindow()
+    profiling.start()
+    window.open_paths([str(path)])
+    window.file_explorer._fulfill_requests()  # 썸네일은 목록에 보일 때 만듦
+    out = tmp_path / "profile.json"
+    profiling.stop(str(out))
+    events = [e for e in json.loads(out.read_text())["traceEvents"] if e["ph"] == "X"]
+    names = {e["name"] for e in events}
+    assert {"open_slot", "decode", "resize", "pil_to_pixmap", "thumbnail", "switch_slot"} <= names
+    decode = next(e for e in events if e["name"] == "decode")
+    assert decode["args"]["size"] == [1600, 1200]
+    assert next(e for e in events if e["name"] == "open_slot")["args"]["slot"] == 0
+    window.close()
+
+
+@pytest.fixture(scope="module")
+def app():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,54 @@
+import pytest
+from PIL import Image
+from src.core.project import (
+    Project, ProjectError, ProjectReader, SlotRecord, file_sha256, save_project,
+)
+from src.core.shape_manager import Shape, ShapeType
+
+
+def _record(path, **kwargs):
+    return SlotRecord(path=str(path), sha256=file_sha256(str(path)), scale=0.5, **kwargs)
+
+
+def test_roundtrip_keeps_shapes_crop_and_members(tmp_path):
+    src = tmp_path / "a.png"
+    Image.new("RGB", (80, 60), "red").save(src)
+    shape = Shape(ShapeType.ELLIPSE, 1, 2, 3, 4, "#FF0000", 2, None, blur_radius=5)
+    record = _record(src, zoom=2.0, crop_box=(10, 10, 50, 40), shapes=(shape,),
+                     thumbnail=b"thumb", proxy=b"proxy")
+    path = tmp_path / "p.simcut"
+    save_project(str(path), Project(slots=(record,), current=0))
+
+    reader = ProjectReader(str(path))
+    loaded = reader.records[0]
+    assert loaded.shapes == (shape,)
+    assert loaded.crop_box == (10, 10, 50, 40)
+    assert (loaded.scale, loaded.zoom, reader.current) == (0.5, 2.0, 0)
+    assert reader.thumbnail(0) == b"thumb" and reader.proxy(0) == b"proxy"
+    image = reader.load_pixels(0)
+    assert image.size == (40, 30) and reader.source_matches(0)
+    reader.close()
+
+
+def test_changed_source_skips_stored_crop_and_missing_files_are_reported(tmp_path):
+    src = tmp_path / "a.png"
+    gone = tmp_path / "b.png"
+    Image.new("RGB", (20, 20), "red").save(src)
+    Image.new("RGB", (20, 20), "blue").save(gone)
+    path = tmp_path / "p.simcut"
+    save_project(str(path), Project(slots=(_record(src, crop_box=(0, 0, 10, 10)), _record(gone))))
+    Image.new("RGB", (20, 20), "green").save(src)
+    gone.unlink()
+
+    reader = ProjectReader(str(path))
+    assert reader.missing_sources() == [1]
+    assert reader.changed_sources([0, 1]) == [0]
+    assert reader.load_pixels(0).size == (20, 20)  # 바뀐 픽셀에 저장된 자르기를 적용하지 않음
+    reader.close()
+
+
+def test_invalid_project_raises(tmp_path):
+    path = tmp_path / "bad.simcut"
+    path.write_bytes(b"not a zip")
+    with pytest.raises(ProjectError):
+        ProjectReader(str(path))
@@ -0,0 +1,77 @@
+import pytest
+from PIL import Image
+from src.core.recipe import Recipe, load_recipe, save_recipe
+from src.core.shape_manager import ShapeType
+
+
+def test_from_dict_parses_shapes_blur_crop_and_outputs():
+    recipe = Recipe.from_dict({
+        "crop": [10, 10, 110, 90],
+        "shapes": [{"type": "ellipse", "x": 1, "y": 2, "width": 30, "height": 20,
+                    "pen_color": "#FF0000", "pen_width": 3}],
+        "blur": [[0, 0, 20, 20], {"x": 40, "y": 40, "width": 10, "height": 10, "radius": 6}],
+        "resize": {"long_edge": 50},
+        "outputs": [{"format": "jpg", "quality": 80}, {"format": "png", "max_bytes": 5000}],
+    })
+    assert recipe.crop == (10, 10, 110, 90)
+    assert recipe.shapes[0].shape_type == ShapeType.ELLIPSE
+    assert recipe.shapes[1].blur_radius == 10 and recipe.shapes[1].pen_color is None
+    assert recipe.shapes[2].blur_radius == 6
+    assert recipe.resize.long_edge == 50
+    assert recipe.targets[0].format == "JPG" and recipe.targets[0].options == {"quality": 80}
+    assert recipe.targets[1].budget.max_bytes == 5000
+
+
+def test_default_output_is_png():
+    assert [t.format for t in Recipe.from_dict({}).targets] == ["PNG"]
+
+
+@pytest.mark.parametrize("data", [
+    {"crop": [1, 2, 3]},
+    {"shapes": [{"x": 1}]},
+    {"blur": [[1, 2]]},
+    {"outputs": [{"quality": 80}]},
+    {"outputs": []},
+    {"version": 99},
+])
+def test_invalid_recipe_raises_value_error(data):
+    with pytest.raises(ValueError):
+        Recipe.from_dict(data)
+
+
+def test_apply_crops_then_blurs_in_cropped_pixel_space():
+    img = Image.new("RGB", (100, 100), "white")
+    img.paste((0, 0, 0), (50, 50, 100, 100))
+    recipe = Recipe.from_dict({"crop": [40, 40, 100, 100], "blur": [[0, 0, 60, 60]]})
+    result = recipe.apply(img)
+    assert result.size == (60, 60)
+    assert img.getpixel((0, 0)) == (255, 255, 255)
+
+
+def test_apply_rejects_crop_outside_image():
+    recipe = Recipe.from_dict({"crop": [200, 200, 300, 300]})
+    with pytest.raises(ValueError):
+        recipe.apply(Image.new("RGB", (50, 50)))
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    recipe = Recipe.from_dict({
+        "crop": [0, 0, 10, 10], "blur": [[1, 1, 5, 5]], "resize": {"percent": 50},
+        "outputs": [{"format": "WEBP", "min_psnr": 35}],
+    })
+    path = tmp_path / "recipe.json"
+    save_recipe(recipe, str(path))
+    assert load_recipe(str(path)) == recipe
+
+
+def test_capture_normalizes_to_original_pixels_and_shapes_at_rescales():
+    from src.core.shape_manager import Shape
+    shape = Shape(ShapeType.RECTANGLE, 10, 20, 30, 40, "#FF0000", 2, None, blur_radius=10)
+    recipe = Recipe.capture([shape], scale=0.5, crop=(5, 5, 100, 100))
+    orig = recipe.shapes[0]
+    assert (orig.x, orig.y, orig.width, orig.height) == (20, 40, 60, 80)
+    assert (orig.pen_width, orig.blur_radius) == (4, 20)
+    assert recipe.crop == (5, 5, 100, 100)
+    display = recipe.shapes_at(0.25)[0]
+    assert (display.x, display.y, display.width, display.height) == (5, 10, 15, 20)
+    assert display.blur_radius == 5
@@ -0,0 +1,79 @@
+import threading
+from concurrent.futures import Future
+from PIL import Image
+import pytest
+from src.core.save_queue import SaveQueue, atomic_write
+
+
+def test_save_image_writes_file(tmp_path):
+    out = tmp_path / "out.png"
+    queue = SaveQueue()
+    queue.save_image(Image.new("RGB", (10, 10), (0, 255, 0)), str(out))
+    queue.flush()
+    assert Image.open(out).getpixel((0, 0)) == (0, 255, 0)
+    queue.close()
+
+
+def test_save_image_unsupported_format_raises_immediately(tmp_path):
+    queue = SaveQueue()
+    with pytest.raises(ValueError, match="Unsupported format"):
+        queue.save_image(Image.new("RGB", (4, 4)), str(tmp_path / "out.xyz"))
+    queue.close()
+
+
+def test_pending_saves_for_same_path_collapse(tmp_path):
+    out = tmp_path / "out.png"
+    gate: Future = Future()
+    writes = []
+    queue = SaveQueue(on_complete=lambda path, error: writes.append(error))
+    # 첫 작업이 gate에서 대기하는 동안 같은 경로로 두 번 더 저장
+    queue.save_image(Image.new("RGB", (4, 4), (1, 1, 1)), str(tmp_path / "other.png"), after=gate)
+    queue.save_image(Image.new("RGB", (4, 4), (2, 2, 2)), str(out))
+    queue.save_image(Image.new("RGB", (4, 4), (3, 3, 3)), str(out))
+    assert queue.is_pending(str(out))
+    gate.set_result(None)
+    queue.flush()
+    assert len(writes) == 2
+    assert Image.open(out).getpixel((0, 0)) == (3, 3, 3)
+    assert not queue.is_pending(str(out))
+    queue.close()
+
+
+def test_superseded_job_runs_on_done(tmp_path):
+    gate: Future = Future()
+    done = threading.Event()
+    queue = SaveQueue()
+    queue.save_image(Image.new("RGB", (4, 4)), str(tmp_path / "a.png"), after=gate)
+    queue.save_image(Image.new("RGB", (4, 4)), str(tmp_path / "b.png"), on_done=done.set)
+    queue.save_image(Image.new("RGB", (4, 4)), str(tmp_path / "b.png"))
+    assert done.is_set()
+    gate.set_result(None)
+    queue.close()
+
+
+def test_failed_dependency_reports_error_and_keeps_original(tmp_path):
+    out = tmp_path / "out.png"
+    out.write_bytes(b"original")
+    gate: Future = Future()
+    gate.set_exception(OSError("backup failed"))
+    errors = []
+    queue = SaveQueue(on_complete=lambda path, error: errors.append(error))
+    queue.save_image(Image.new("RGB", (4, 4)), str(out), after=gate)
+    queue.flush()
+    assert isinstance(errors[0], OSError)
+    assert out.read_bytes() == b"original"
+    queue.close()
+
+
+def test_atomic_write_leaves_no_temp_file_on_error(tmp_path):
+    out = tmp_path / "out.png"
+    out.write_bytes(b"original")
+
+    def failing_write(tmp):
+        open(tmp, "wb").write(b"partial")
+        raise RuntimeError("encode failed")
+
+    with pytest.raises(RuntimeError):
+        atomic_write(str(out), failing_write)
+    assert out.read_bytes() == b"original"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.png"]
@@ -0,0 +1,85 @@
+import base64
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+import pytest
+from PIL import Image
+from src.server import INVALID_PARAMS, METHOD_NOT_FOUND, RenderServer, RenderService
+
+
+@pytest.fixture
+def server():
+    service = RenderService(workers=2)
+    srv = RenderServer(service, port=0, quiet=True)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+    service.close()
+
+
+def _call(srv, payload, **headers):
+    headers = {"Content-Type": "application/json", "Authorization": f"Bearer {srv.token}", **headers}
+    req = urllib.request.Request(
+        f"http://127.0.0.1:{srv.port}/", data=json.dumps(payload).encode(),
+        headers={k: v for k, v in headers.items() if v is not None},
+    )
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        return json.loads(resp.read())
+
+
+def _rpc(method, params, req_id=1):
+    return {"jsonrpc": "2.0", "id": req_id, "method": method, "params": params}
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "shot.png"
+    Image.new("RGB", (80, 60), "green").save(path)
+    return str(path)
+
+
+def test_render_returns_encoded_outputs_and_reuses_decoded_source(server, source):
+    recipe = {"blur": [[0, 0, 20, 20]], "outputs": [{"format": "PNG"}, {"format": "JPEG", "quality": 60}]}
+    first = _call(server, _rpc("render", {"source": source, "recipe": recipe}))
+    outputs = first["result"]["outputs"]
+    assert [o["format"] for o in outputs] == ["PNG", "JPEG"]
+    assert Image.open(io.BytesIO(base64.b64decode(outputs[0]["data"]))).size == (80, 60)
+    _call(server, _rpc("render", {"source": source, "recipe": recipe}))
+    stats = _call(server, _rpc("stats", {}))["result"]["cache"]
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_batch_requests_run_and_answer_in_order(server, source, tmp_path):
+    batch = [
+        _rpc("export", {"source": source, "recipe": {"crop": [0, 0, 40, 30]}, "output_dir": str(tmp_path / "out")}, 1),
+        _rpc("ping", {}, 2),
+        {"jsonrpc": "2.0", "method": "ping"},  # 알림: 응답 없음
+    ]
+    responses = _call(server, batch)
+    assert [r["id"] for r in responses] == [1, 2]
+    path = responses[0]["result"]["outputs"][0]["path"]
+    assert Image.open(path).size == (40, 30)
+
+
+def test_errors_use_json_rpc_codes(server, source):
+    assert _call(server, _rpc("nope", {}))["error"]["code"] == METHOD_NOT_FOUND
+    bad = _call(server, _rpc("render", {"source": source, "recipe": {"crop": [1]}}))
+    assert bad["error"]["code"] == INVALID_PARAMS
+
+
+@pytest.mark.parametrize("headers", [
+    {"Content-Type": "text/plain"},               # 브라우저 단순 요청 (사전 요청 없음)
+    {"Host": "evil.example:8765"},               # DNS 리바인딩
+    {"Authorization": None},
+    {"Authorization": "Bearer wrong"},
+])
+def test_requests_from_web_pages_are_refused(server, tmp_path, source, headers):
+    out = tmp_path / "out"
+    with pytest.raises(urllib.error.HTTPError) as e:
+        _call(server, _rpc("export", {"source": source, "output_dir": str(out)}), **headers)
+    assert e.value.code in (401, 403, 415)
+    assert not out.exists()
@@ -0,0 +1,97 @@
+import socket
+import pytest
+from PyQt6.QtWidgets import QApplication
+from src.ui.single_instance import InstanceServer, file_arguments, forward_to_running
+
+
+@pytest.fixture(scope="session")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def server(app, tmp_path):
+    server = InstanceServer()
+    name = str(tmp_path / "simcut.sock")
+    assert server.listen(name)
+    yield server, name
+    server.close()
+
+
+def test_file_arguments_keeps_existing_files_only(tmp_path, monkeypatch):
+    (tmp_path / "a.png").write_bytes(b"x")
+    monkeypatch.chdir(tmp_path)
+    assert file_arguments(["a.png", "-platform", "missing.png", str(tmp_path)]) == [str(tmp_path / "a.png")]
+
+
+def test_second_launch_forwards_paths(server, qtbot):
+    instance, name = server
+    with qtbot.waitSignal(instance.paths_received, timeout=2000) as blocker:
+        assert forward_to_running(["/shots/a.png", "/shots/b.png"], name)
+    assert blocker.args == [["/shots/a.png", "/shots/b.png"]]
+
+
+def test_forward_without_files_still_reaches_window(server, qtbot):
+    instance, name = server
+    with qtbot.waitSignal(instance.paths_received, timeout=2000) as blocker:
+        assert forward_to_running([], name)
+    assert blocker.args == [[]]
+
+
+def test_forward_fails_when_nothing_listens(app, tmp_path):
+    assert not forward_to_running(["/a.png"], str(tmp_path / "none.sock"))
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix 도메인 소켓 전용")
+def test_listen_replaces_stale_socket_file(app, tmp_path):
+    name = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(name)  # 비정상 종료로 남은 소켓 파일 (listen 하지 않음)
+    stale.close()
+    server = InstanceServer()
+    try:
+        assert server.listen(name)
+    finally:
+        server.close()
+
+
+def test_listen_does_not_take_the_name_from_a_live_instance(server, qtbot):
+    instance, name = server
+    second = InstanceServer()
+    try:
+        assert not second.listen(name)
+    finally:
+        second.close()
+    with qtbot.waitSignal(instance.paths_received, timeout=2000) as blocker:
+        assert forward_to_running(["/a.png"], name)  # 처음 인스턴스가 그대로 받음
+    assert blocker.args == [["/a.png"]]
+
+
+def test_malformed_message_is_ignored(server, qtbot):
+    from PyQt6.QtNetwork import QLocalSocket
+    instance, name = server
+    received = []
+    instance.paths_received.connect(received.append)
+    client = QLocalSocket()
+    client.connectToServer(name)
+    assert client.waitForConnected(1000)
+    client.write(b"not json\n")
+    client.waitForBytesWritten(1000)
+    with qtbot.waitSignal(instance.paths_received, timeout=2000):
+        forward_to_running(["/ok.png"], name)
+    client.disconnectFromServer()
+    assert received == [["/ok.png"]]
+
+
+def test_main_hands_off_to_running_instance(server, qtbot, tmp_path, monkeypatch):
+    from src import main as entry
+    from src.ui import single_instance
+    instance, name = server
+    image = tmp_path / "shot.png"
+    image.write_bytes(b"x")
+    monkeypatch.setattr(single_instance, "server_name", lambda: name)
+    monkeypatch.delenv(single_instance.NEW_INSTANCE_ENV, raising=False)
+    monkeypatch.setattr("sys.argv", ["simcut", str(image)])
+    with qtbot.waitSignal(instance.paths_received, timeout=2000) as blocker:
+        entry.main()  # 창을 만들지 않고 바로 반환
+    assert blocker.args == [[str(image)]]
@@ -0,0 +1,70 @@
+from PIL import Image
+from src.core.snapshot_store import SnapshotStore
+
+
+def _write_png(path, color):
+    Image.new("RGB", (40, 30), color).save(str(path))
+    return str(path)
+
+
+def test_spill_synced_copies_original_bytes(tmp_path):
+    src = _write_png(tmp_path / "a.png", (255, 0, 0))
+    original = open(src, "rb").read()
+    store = SnapshotStore(root=str(tmp_path))
+    snap = store.spill(Image.open(src).copy(), src, synced=True)
+    snap.wait()
+    assert snap.image_path == snap.backup_path
+    assert open(snap.backup_path, "rb").read() == original
+    store.close()
+
+
+def test_spill_unsynced_writes_lossless_pixels(tmp_path):
+    src = _write_png(tmp_path / "a.png", (255, 0, 0))
+    store = SnapshotStore(root=str(tmp_path))
+    edited = Image.new("RGB", (20, 10), (1, 2, 3))
+    snap = store.spill(edited, src, synced=False)
+    snap.wait()
+    assert snap.backup_path is None
+    assert Image.open(snap.image_path).getpixel((5, 5)) == (1, 2, 3)
+    store.close()
+
+
+def test_disk_bytes_counts_shared_backup_once(tmp_path):
+    import os
+    src = _write_png(tmp_path / "a.png", (255, 0, 0))
+    store = SnapshotStore(root=str(tmp_path))
+    snap = store.spill(Image.open(src).copy(), src, synced=True)
+    snap.wait()
+    assert store.disk_bytes(snap) == os.path.getsize(src)
+    store.close()
+    assert store.disk_bytes(snap) == 0
+
+
+def test_load_returns_snapshot_pixels(tmp_path):
+    src = _write_png(tmp_path / "a.png", (255, 0, 0))
+    store = SnapshotStore(root=str(tmp_path))
+    snap = store.spill(Image.open(src).copy(), src, synced=True)
+    snap.wait()
+    _write_png(tmp_path / "a.png", (0, 0, 255))
+    image = store.load(snap)
+    assert image.getpixel((0, 0)) == (255, 0, 0)
+    store.close()
+
+
+def test_discard_removes_snapshot_files(tmp_path):
+    src = _write_png(tmp_path / "a.png", (255, 0, 0))
+    store = SnapshotStore(root=str(tmp_path))
+    snap = store.spill(Image.new("RGB", (4, 4)), src, synced=False)
+    store.discard(snap)
+    store.close()
+    assert not (tmp_path / snap.image_path).exists()
+
+
+def test_close_removes_session_directory(tmp_path):
+    src = _write_png(tmp_path / "a.png", (255, 0, 0))
+    store = SnapshotStore(root=str(tmp_path))
+    store.spill(Image.open(src).copy(), src, synced=True)
+    session_dir = store.directory
+    assert session_dir is not None and session_dir.exists()
+    store.close()
+    assert not session_dir.exists()
@@ -0,0 +1,72 @@
+import os
+import threading
+from unittest.mock import patch
+from PIL import Image
+from src.core.image_handler import ImageHandler
+from src.core.source_cache import SourceCache
+
+
+def _save(path, color, size=(20, 10)):
+    Image.new("RGB", size, color).save(path)
+
+
+def test_second_get_is_a_hit(tmp_path):
+    path = tmp_path / "a.png"
+    _save(path, "red")
+    cache = SourceCache()
+    first = cache.get(str(path))
+    assert cache.get(str(path)) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_file_is_decoded_again_and_replaces_old_entry(tmp_path):
+    path = tmp_path / "a.png"
+    _save(path, "red")
+    cache = SourceCache()
+    cache.get(str(path))
+    _save(path, "blue", size=(30, 10))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.get(str(path)).size == (30, 10)
+    assert len(cache) == 1
+
+
+def test_lru_eviction_respects_byte_budget(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.png"
+        _save(path, "red")  # 20*10*3 = 600 bytes
+        paths.append(str(path))
+    cache = SourceCache(max_bytes=1300)
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])          # 0을 최근으로
+    cache.get(paths[2])          # 1이 제거됨
+    assert cache.size_bytes == 1200
+    cache.get(paths[0])
+    assert cache.misses == 3
+
+
+def test_concurrent_gets_decode_once(tmp_path):
+    path = tmp_path / "a.png"
+    _save(path, "red")
+    cache = SourceCache()
+    calls = []
+    gate = threading.Event()
+    real_load = ImageHandler.load
+
+    def slow_load(self, p):
+        calls.append(p)
+        gate.wait(2)
+        return real_load(self, p)
+
+    with patch.object(ImageHandler, "load", slow_load):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get(str(path)))) for _ in range(4)]
+        for t in threads:
+            t.start()
+        gate.set()
+        for t in threads:
+            t.join()
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
@@ -0,0 +1,72 @@
+import json
+import threading
+import time
+from src.utils.stall_watchdog import StallWatchdog, threshold_from_env
+
+
+def _freeze_gui(seconds):
+    time.sleep(seconds)
+
+
+def test_stall_captures_blocked_thread_stack(tmp_path):
+    log = tmp_path / "stalls.log"
+    watchdog = StallWatchdog(str(log), threshold=0.05, interval=0.01)
+    watchdog.start()
+    try:
+        watchdog.beat()
+        _freeze_gui(0.25)
+        watchdog.beat()
+    finally:
+        watchdog.stop()
+    stalls = watchdog.stalls
+    assert len(stalls) == 1
+    stall = stalls[0]
+    assert stall.ended and stall.duration >= 0.2
+    assert 2 <= len(stall.stacks) <= 5  # threshold마다 재샘플링
+    assert any("_freeze_gui" in line for line in stall.stacks[0])
+    records = [json.loads(line) for line in log.read_text().splitlines()]
+    assert records[0]["event"] == "stall" and records[0]["blocked_ms"] >= 50
+    assert records[-1]["event"] == "resume" and records[-1]["duration_ms"] >= 200
+
+
+def test_no_stall_while_heartbeating():
+    watchdog = StallWatchdog(None, threshold=0.1, interval=0.01)
+    watchdog.start()
+    for _ in range(20):
+        watchdog.beat()
+        time.sleep(0.01)
+    watchdog.stop()
+    assert watchdog.stalls == []
+
+
+def test_log_rolls_over(tmp_path):
+    log = tmp_path / "stalls.log"
+    log.write_text("x" * 200)
+    watchdog = StallWatchdog(str(log), max_log_bytes=100)
+    watchdog._write({"event": "resume"})
+    assert (tmp_path / "stalls.log.1").read_text() == "x" * 200
+    assert json.loads(log.read_text())["event"] == "resume"
+
+
+def test_log_writes_from_both_threads_stay_whole(tmp_path):
+    log = tmp_path / "stalls.log"
+    watchdog = StallWatchdog(str(log), max_log_bytes=2000)
+
+    def write(event):
+        for i in range(100):
+            watchdog._write({"event": event, "sample": i, "stack": ["x" * 50]})
+
+    writers = [threading.Thread(target=write, args=(e,)) for e in ("stall", "resume")]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    lines = log.read_text().splitlines() + (tmp_path / "stalls.log.1").read_text().splitlines()
+    assert all(json.loads(line)["event"] in ("stall", "resume") for line in lines)
+
+
+def test_threshold_from_env(monkeypatch):
+    monkeypatch.setenv("SIMCUT_STALL_MS", "250")
+    assert threshold_from_env() == 0.25
+    monkeypatch.setenv("SIMCUT_STALL_MS", "bogus")
+    assert threshold_from_env(0.4) == 0.4
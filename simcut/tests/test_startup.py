@@ -0,0 +1,62 @@
+import subprocess
+import sys
+from src.utils import startup
+
+
+def test_phases_are_relative_to_previous_mark():
+    timer = startup.StartupTimer()
+    timer.mark("a")
+    timer.mark("b")
+    (name_a, dur_a, at_a), (name_b, dur_b, at_b) = timer.phases()
+    assert (name_a, name_b) == ("a", "b")
+    assert dur_a == at_a and abs(at_a + dur_b - at_b) < 1e-9
+    assert timer.seconds_to("b") == at_b and timer.seconds_to("missing") is None
+
+
+def test_import_tracing_records_cumulative_and_own_time(tmp_path, monkeypatch):
+    (tmp_path / "startup_probe_outer.py").write_text("import startup_probe_inner\n")
+    (tmp_path / "startup_probe_inner.py").write_text("import time\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    timer = startup.StartupTimer()
+    timer.trace_imports()
+    try:
+        import startup_probe_outer  # noqa: F401
+    finally:
+        timer.stop_tracing()
+        sys.modules.pop("startup_probe_outer", None)
+        sys.modules.pop("startup_probe_inner", None)
+    timings = {t.name: t for t in timer.imports}
+    outer, inner = timings["startup_probe_outer"], timings["startup_probe_inner"]
+    assert inner.cumulative >= 0.02
+    assert outer.cumulative >= inner.cumulative and outer.own < inner.cumulative
+    assert "startup_probe_outer" in timer.report()
+
+
+def test_report_flags_slow_first_paint(tmp_path):
+    timer = startup.StartupTimer()
+    timer.before_origin = startup.TARGET_SECONDS
+    timer.mark("first_paint")
+    path = tmp_path / "startup.txt"
+    timer.write_report(str(path))
+    assert "time to first paint" in path.read_text() and "SLOW" in path.read_text()
+
+
+def test_warm_imports_loads_modules_in_background():
+    thread = startup.warm_imports(["json", "no_such_module_for_simcut"])
+    thread.join(5)
+    assert not thread.is_alive() and "json" in sys.modules
+
+
+def test_main_window_import_defers_pillow_and_dialog_modules():
+    """창 모듈만 읽어서는 Pillow · 내보내기 · 프로젝트 · 저널 모듈을 읽지 않는다."""
+    code = (
+        "import sys, src.ui.main_window; "
+        "heavy = ['PIL', 'src.core.compositor', 'src.core.export_budget', 'src.core.project', "
+        "'src.core.journal', 'src.ui.export_options']; "
+        "print(','.join(m for m in heavy if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        env={**__import__("os").environ, "QT_QPA_PLATFORM": "offscreen"},
+    )
+    assert result.stdout.strip() == ""
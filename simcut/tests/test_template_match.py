@@ -0,0 +1,49 @@
+import pytest
+from PIL import Image, ImageDraw
+
+np = pytest.importorskip("numpy")
+
+from src.core.template_match import TemplateMatcher, find_template, ncc  # noqa: E402
+
+
+def _scene(size, offset, seed=0):
+    """배경 잡음 위에 고유한 패턴(아바타 대용)을 offset 위치에 그립니다."""
+    rng = np.random.default_rng(seed)
+    noise = rng.integers(90, 140, size=(size[1], size[0]), dtype=np.uint8)
+    img = Image.fromarray(noise).convert("RGB")
+    draw = ImageDraw.Draw(img)
+    x, y = offset
+    draw.ellipse([x, y, x + 60, y + 60], fill=(250, 200, 30))
+    draw.rectangle([x + 15, y + 20, x + 25, y + 30], fill=(10, 10, 10))
+    draw.rectangle([x + 35, y + 20, x + 45, y + 30], fill=(10, 10, 10))
+    draw.line([x + 15, y + 45, x + 45, y + 45], fill=(120, 0, 0), width=4)
+    return img
+
+
+def test_ncc_peaks_at_exact_location():
+    rng = np.random.default_rng(1)
+    image = rng.random((50, 60))
+    template = image[10:20, 30:45].copy()
+    score = ncc(image, template)
+    assert score.shape == (41, 46)
+    y, x = np.unravel_index(np.argmax(score), score.shape)
+    assert (x, y) == (30, 10)
+    assert score[y, x] == pytest.approx(1.0, abs=1e-6)
+
+
+def test_finds_moved_patch_via_proxy_and_refinement():
+    source = _scene((1600, 1200), (400, 300))
+    template = source.crop((400, 300, 461, 361))
+    target = _scene((1600, 1200), (437, 329), seed=2)
+    match = TemplateMatcher(template).find(target)
+    assert match is not None
+    assert (match.x, match.y) == (437, 329)
+    assert match.score > 0.9
+
+
+def test_returns_none_below_threshold_or_when_template_too_large():
+    source = _scene((400, 300), (100, 100))
+    template = source.crop((100, 100, 161, 161))
+    blank = Image.new("RGB", (400, 300), (120, 120, 120))
+    assert find_template(blank, template) is None
+    assert find_template(Image.new("RGB", (40, 40)), template) is None
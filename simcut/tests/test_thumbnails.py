@@ -0,0 +1,38 @@
+import threading
+from PIL import Image
+from src.core.thumbnails import ThumbnailLoader, make_thumbnail
+
+
+def test_make_thumbnail_fits_size(tmp_path):
+    path = tmp_path / "a.png"
+    Image.new("RGB", (400, 100), "red").save(path)
+    thumb = make_thumbnail(str(path), (120, 80))
+    assert thumb.size == (120, 30) and thumb.mode == "RGBA"
+
+
+def test_loader_builds_newest_requests_first_and_drops_overflow(tmp_path):
+    paths = []
+    for i in range(4):
+        paths.append(str(tmp_path / f"{i}.png"))
+        Image.new("RGB", (40, 30)).save(paths[-1])
+    (tmp_path / "broken.png").write_bytes(b"x")
+    entered, release = threading.Event(), threading.Event()
+    delivered = []
+
+    def on_batch(batch):
+        entered.set()
+        release.wait(5)
+        delivered.extend(value for value, _ in batch)
+
+    loader = ThumbnailLoader(on_batch, (20, 20), max_pending=2, interval=0)
+    loader.request("first", "first", paths[0])
+    assert entered.wait(5)  # 워커가 첫 요청을 알리는 중에 나머지를 쌓음
+    for key in ("a", "b", "c"):
+        loader.request(key, key, paths[1])
+    loader.request("b", "b", paths[2])             # 대기 중인 요청은 순서만 앞당김
+    loader.request("bad", "bad", str(tmp_path / "broken.png"))
+    release.set()
+    assert loader.wait(5)
+    loader.close()
+    # 넘친 오래된 요청(a, c)은 버리고, 읽지 못한 파일은 알리지 않음
+    assert delivered[0] == "first" and sorted(delivered[1:]) == ["b"]
@@ -0,0 +1,92 @@
+import io
+import threading
+import time
+from PIL import Image
+from src.core.watch_folder import FolderWatcher
+
+
+def _png_bytes(size=(64, 48), color="red"):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _watcher(tmp_path, arrivals, **options):
+    watcher = FolderWatcher(
+        str(tmp_path), on_arrival=arrivals.extend, thumbnail_size=(16, 16), settle=0.2, poll=0.05, **options,
+    )
+    watcher.start()
+    assert watcher.wait_idle(5)
+    return watcher
+
+
+def test_reports_only_new_files_with_meta_and_thumbnail(tmp_path):
+    (tmp_path / "old.png").write_bytes(_png_bytes())
+    arrivals = []
+    watcher = _watcher(tmp_path, arrivals)
+    (tmp_path / "new.png").write_bytes(_png_bytes((64, 48)))
+    (tmp_path / "notes.txt").write_text("x")
+    watcher.notify()
+    assert watcher.wait_idle(5)
+    watcher.close()
+    assert [a.path for a in arrivals] == [str(tmp_path / "new.png")]
+    arrival = arrivals[0]
+    assert (arrival.meta.width, arrival.meta.height, arrival.meta.format) == (64, 48, "PNG")
+    assert arrival.thumbnail.size == (16, 12) and arrival.thumbnail.mode == "RGBA"
+
+
+def test_waits_until_partially_written_file_is_stable(tmp_path):
+    arrivals = []
+    watcher = _watcher(tmp_path, arrivals)
+    data = _png_bytes((200, 200), "blue")
+    path = tmp_path / "shot.png"
+    with open(path, "wb") as f:
+        for start in range(0, len(data), max(1, len(data) // 5)):
+            f.write(data[start:start + max(1, len(data) // 5)])
+            f.flush()
+            watcher.notify()
+            time.sleep(0.08)  # settle보다 짧은 간격으로 이어 씀
+            assert arrivals == []
+    assert watcher.wait_idle(5)
+    watcher.close()
+    assert len(arrivals) == 1 and arrivals[0].meta.file_size == len(data)
+
+
+def test_processes_each_arrival_off_the_watch_thread(tmp_path):
+    arrivals, processed = [], []
+    done = threading.Event()
+
+    def on_processed(path, result):
+        processed.append((path, result))
+        done.set()
+
+    watcher = _watcher(
+        tmp_path, arrivals,
+        process=lambda path: (threading.current_thread().name, path), on_processed=on_processed,
+    )
+    (tmp_path / "a.png").write_bytes(_png_bytes())
+    watcher.notify()
+    assert done.wait(5)
+    watcher.close()
+    (path, (thread, processed_path)), = processed
+    assert path == processed_path == str(tmp_path / "a.png")
+    assert thread.startswith("simcut-watch-process")
+
+
+def test_empty_file_does_not_keep_the_watcher_busy(tmp_path):
+    arrivals = []
+    watcher = FolderWatcher(str(tmp_path), on_arrival=arrivals.extend, thumbnail_size=(16, 16), settle=0.05, poll=1.0)
+    watcher.start()
+    assert watcher.wait_idle(5)
+    path = tmp_path / "empty.png"
+    path.touch()
+    watcher.notify()
+    assert watcher.wait_idle(5)  # 몇 번 기다린 뒤 제외
+    scans = watcher._scans
+    time.sleep(0.5)
+    assert watcher._scans - scans <= 1  # 다시 훑기는 poll 간격으로만
+    path.write_bytes(_png_bytes())     # 나중에 내용이 생기면 받아들임
+    watcher.notify()
+    assert watcher.wait_idle(5)
+    watcher.close()
+    assert [a.path for a in arrivals] == [str(path)]